@@ -0,0 +1,154 @@
+"""Shows that listing recent budgets does not slow down as history grows.
+
+Creates a workspace with ``--categories`` categories and one budget per
+category and month of the current year, then adds past years of budgets in
+steps (``--history``, cumulative) and after each step times the current
+year's budget list, count included, over ``--requests`` sequential calls
+through ``SQLBudgetRepository``. The last column is the number of budget
+partitions the query plan reads. Run from ``backend/`` with
+``DATABASE_URL`` set and the schema migrated::
+
+    python benchmarks/budget_partitions.py --history 0 10 40
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import and_, delete, select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+from src.domain.auth.models import User  # noqa: E402
+from src.domain.auth.value_objects import Email  # noqa: E402
+from src.domain.budget.models import Category  # noqa: E402
+from src.domain.workspace.models import Workspace  # noqa: E402
+from src.infrastructure.auth.models import UserORM  # noqa: E402
+from src.infrastructure.auth.repositories import SQLUserRepository  # noqa: E402
+from src.infrastructure.budget.models import BudgetORM  # noqa: E402
+from src.infrastructure.budget.partitions import ensure_partitions  # noqa: E402
+from src.infrastructure.budget.repositories import (  # noqa: E402
+    SQLBudgetRepository,
+    SQLCategoryRepository,
+)
+from src.infrastructure.database import DATABASE_URL  # noqa: E402
+from src.infrastructure.workspace.models import WorkspaceORM  # noqa: E402
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository  # noqa: E402
+
+_INSERT_YEARS = text(
+    "INSERT INTO budgets (id, workspace_id, owner_id, category_id, limit_amount,"
+    " month, year, created_at, updated_at) "
+    "SELECT gen_random_uuid(), :workspace_id, :owner_id, c.id, 100, m, y, now(), now() "
+    "FROM categories c, generate_series(1, 12) m, "
+    "generate_series(CAST(:first AS integer), CAST(:last AS integer)) y "
+    "WHERE c.workspace_id = :workspace_id"
+)
+
+
+async def _seed(session: AsyncSession, categories: int) -> Dict[str, uuid.UUID]:
+    user = User(
+        email=Email(f"bench-{uuid.uuid4().hex[:8]}@example.com"),
+        password_hash="-",
+        full_name="Benchmark",
+    )
+    await SQLUserRepository(session).add(user)
+    workspace = Workspace(name=f"Bench {uuid.uuid4().hex[:8]}", owner_id=user.id)
+    await SQLWorkspaceRepository(session).add(workspace)
+    await session.flush()
+    for i in range(categories):
+        await SQLCategoryRepository(session).add(
+            Category(name=f"Bench {i}", workspace_id=workspace.id)
+        )
+    await session.commit()
+    return {"workspace_id": workspace.id, "owner_id": user.id}
+
+
+async def _add_years(
+    session: AsyncSession, seed: Dict[str, uuid.UUID], first: int, last: int
+) -> None:
+    await ensure_partitions(await session.connection(), range(first, last + 1))
+    await session.execute(_INSERT_YEARS, {**seed, "first": first, "last": last})
+    await session.commit()
+    await session.execute(text("ANALYZE budgets"))
+
+
+async def _partitions_read(
+    session: AsyncSession, workspace_id: uuid.UUID, year: int
+) -> int:
+    filters = SQLBudgetRepository._list_filters(
+        workspace_id, None, None, year, None, None, None, None
+    )
+    compiled = (
+        select(BudgetORM.id)
+        .where(and_(*filters))
+        .compile(dialect=session.bind.dialect, compile_kwargs={"literal_binds": True})
+    )
+    plan = await session.execute(text(f"EXPLAIN {compiled}"))
+    return sum(" on budgets_" in row[0] for row in plan)
+
+
+async def _measure(
+    repo: SQLBudgetRepository, workspace_id: uuid.UUID, year: int, count: int
+) -> Dict[str, float]:
+    # Not timed: fills the compiled-statement cache for this shape
+    await repo.list_by_workspace(workspace_id, year=year)
+    latencies: List[float] = []
+    for _ in range(count):
+        start = time.perf_counter()
+        await repo.list_by_workspace(workspace_id, year=year)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return {
+        "p50": statistics.median(latencies),
+        "p99": statistics.quantiles(latencies, n=100)[98],
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--categories", type=int, default=100)
+    parser.add_argument("--history", type=int, nargs="+", default=[0, 10, 40])
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_async_engine(DATABASE_URL)
+    year = datetime.now(timezone.utc).year
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        seed = await _seed(session, args.categories)
+        await _add_years(session, seed, year, year)
+        repo = SQLBudgetRepository(session)
+        history = 0
+        print(f"{args.categories * 12} budgets per year, {args.requests} requests, ms")
+        print(
+            f"{'past years':>10} {'rows':>8} {'p50':>7} {'p99':>7} {'partitions':>10}"
+        )
+        try:
+            for target in sorted(args.history):
+                if target > history:
+                    await _add_years(session, seed, year - target, year - history - 1)
+                    history = target
+                row = await _measure(repo, seed["workspace_id"], year, args.requests)
+                partitions = await _partitions_read(session, seed["workspace_id"], year)
+                rows = args.categories * 12 * (history + 1)
+                print(
+                    f"{history:>10} {rows:>8} {row['p50']:>7.2f} {row['p99']:>7.2f} "
+                    f"{partitions:>10}"
+                )
+        finally:
+            await session.rollback()
+            # Budgets and categories go with the workspace
+            await session.execute(
+                delete(WorkspaceORM).where(WorkspaceORM.id == seed["workspace_id"])
+            )
+            await session.execute(delete(UserORM).where(UserORM.id == seed["owner_id"]))
+            await session.commit()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
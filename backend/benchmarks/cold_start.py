@@ -0,0 +1,144 @@
+"""Measures the first requests a fresh worker serves, with and without warmup.
+
+Creates a user with a workspace and a budget, then starts a single-worker
+server once with ``DB_POOL_WARM=0`` (cold) and once with the configured
+warmup, and times the first ``--requests`` sequential requests against the
+authenticated list endpoints. Run from ``backend/`` with ``DATABASE_URL``
+and ``SECRET_KEY`` set and the schema migrated::
+
+    python benchmarks/cold_start.py --runs 5
+"""
+import argparse
+import asyncio
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from serve_modes import free_port, wait_ready  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+from src.domain.auth.models import User  # noqa: E402
+from src.domain.auth.value_objects import Email  # noqa: E402
+from src.domain.budget.models import Budget  # noqa: E402
+from src.domain.workspace.models import Workspace  # noqa: E402
+from src.infrastructure.auth.repositories import SQLUserRepository  # noqa: E402
+from src.infrastructure.auth.services.jwt import JWTService  # noqa: E402
+from src.infrastructure.budget.repositories import (  # noqa: E402
+    SQLBudgetRepository,
+    SQLCategoryRepository,
+)
+from src.infrastructure.database import DATABASE_URL  # noqa: E402
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository  # noqa: E402
+
+
+async def _seed() -> Dict[str, str]:
+    engine = create_async_engine(DATABASE_URL)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        user = User(
+            email=Email(f"bench-{uuid.uuid4().hex[:8]}@example.com"),
+            password_hash="-",
+            full_name="Benchmark",
+        )
+        await SQLUserRepository(session).add(user)
+        workspace = Workspace(name=f"Bench {uuid.uuid4().hex[:8]}", owner_id=user.id)
+        await SQLWorkspaceRepository(session).add(workspace)
+        await session.flush()
+        category = (await SQLCategoryRepository(session).list_defaults())[0]
+        await SQLBudgetRepository(session).add(
+            Budget(
+                workspace_id=workspace.id,
+                owner_id=user.id,
+                category_id=category.id,
+                limit_amount=100.0,
+                month=1,
+                year=2024,
+            )
+        )
+        await session.commit()
+    await engine.dispose()
+    return {
+        "token": JWTService.create_token({"sub": str(user.id)}, token_type="access"),
+        "workspace_id": str(workspace.id),
+    }
+
+
+async def _first_requests(warm: int, seed: Dict[str, str], count: int) -> List[float]:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    env = dict(os.environ, DB_POOL_WARM=str(warm), DB_ECHO="false", JOB_WORKERS="0")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.api.main:app", "--port", str(port)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    workspace_id = seed["workspace_id"]
+    paths = [
+        "/api/workspaces",
+        f"/api/workspaces/{workspace_id}",
+        f"/api/budgets?workspace_id={workspace_id}",
+        "/api/budgets/categories",
+    ]
+    try:
+        # /health does not touch the database, so the pool stays as the
+        # lifespan left it
+        await wait_ready(base_url)
+        headers = {"Authorization": f"Bearer {seed['token']}"}
+        latencies = []
+        async with httpx.AsyncClient(base_url=base_url, headers=headers) as client:
+            for i in range(count):
+                start = time.perf_counter()
+                response = await client.get(paths[i % len(paths)])
+                latencies.append((time.perf_counter() - start) * 1000)
+                response.raise_for_status()
+        return latencies
+    finally:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=60)
+
+
+def _summary(latencies: List[float]) -> Dict[str, float]:
+    return {
+        "first": latencies[0],
+        "first10": statistics.mean(latencies[:10]),
+        "mean": statistics.mean(latencies),
+        "p50": statistics.median(latencies),
+        "total": sum(latencies),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--warm", type=int, default=int(os.getenv("DB_POOL_WARM", "2")))
+    args = parser.parse_args()
+
+    seed = await _seed()
+    print(f"median of {args.runs} runs, first {args.requests} requests, ms")
+    print(f"{'':<10} {'first':>8} {'first 10':>9} {'mean':>7} {'p50':>7} {'total':>8}")
+    for label, warm in (("cold", 0), (f"warm ({args.warm})", args.warm)):
+        runs = [
+            _summary(await _first_requests(warm, seed, args.requests))
+            for _ in range(args.runs)
+        ]
+        row = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+        print(
+            f"{label:<10} {row['first']:>8.1f} {row['first10']:>9.1f} "
+            f"{row['mean']:>7.1f} {row['p50']:>7.1f} {row['total']:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""Compares bytes on the wire and encode CPU per response format.
+
+Builds budget list pages shaped like the API output and encodes each one as
+JSON and MessagePack, uncompressed and with the gzip and brotli settings the
+compression middleware uses. Times only the encoding, in process, so the
+numbers are the CPU a worker spends per response. Run from ``backend/``::
+
+    python benchmarks/response_formats.py --repeat 200
+"""
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import msgpack  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from src.api.middleware.compression import (  # noqa: E402
+    COMPRESSION_MIN_SIZE,
+    compress,
+)
+
+ENCODERS: Dict[str, Callable[[Any], bytes]] = {
+    "json": JSONResponse(None).render,
+    "msgpack": msgpack.packb,
+}
+
+
+def _page(size: int) -> Dict[str, Any]:
+    workspace_id, owner_id = uuid.uuid4(), uuid.uuid4()
+    now = datetime.now(timezone.utc)
+    items = [
+        {
+            "id": uuid.uuid4(),
+            "workspace_id": workspace_id,
+            "owner_id": owner_id,
+            "category_id": uuid.uuid4(),
+            "limit_amount": 100.0 + i * 12.5,
+            "month": i % 12 + 1,
+            "year": 2020 + i // 12,
+            "spent_amount": 42.0 + i,
+            "progress_percentage": round((42.0 + i) / (100.0 + i * 12.5) * 100, 2),
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(size)
+    ]
+    return jsonable_encoder({"items": items, "total": size, "page": 1, "size": size})
+
+
+def _time_us(encode: Callable[[], bytes], repeat: int) -> float:
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        encode()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 20, 100])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"median encode time over {args.repeat} runs; min size {COMPRESSION_MIN_SIZE} B")
+    print(f"{'items':>5} {'format':<14} {'bytes':>7} {'ratio':>6} {'encode us':>10}")
+    for size in args.sizes:
+        page = _page(size)
+        baseline = len(ENCODERS["json"](page))
+        for name, encoder in ENCODERS.items():
+            for encoding in (None, "gzip", "br"):
+                if encoding is None:
+                    run = lambda: encoder(page)  # noqa: E731
+                else:
+                    run = lambda: compress(encoder(page), encoding)  # noqa: E731
+                body = run()
+                label = name if encoding is None else f"{name}+{encoding}"
+                print(
+                    f"{size:>5} {label:<14} {len(body):>7} "
+                    f"{len(body) / baseline:>6.2f} {_time_us(run, args.repeat):>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
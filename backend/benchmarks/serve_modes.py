@@ -0,0 +1,149 @@
+"""Compares the development server with the production serve mode.
+
+Starts the app once per mode on a free local port, drives it with a fixed
+number of concurrent keep-alive clients and prints throughput and latency
+percentiles. Run from ``backend/`` with the same environment the app uses
+(``DATABASE_URL``, ``SECRET_KEY``)::
+
+    python benchmarks/serve_modes.py --duration 20 --concurrency 64
+    python benchmarks/serve_modes.py --path /api/workspaces \\
+        --header "Authorization: Bearer <token>"
+
+The load generator shares the machine with the server, so absolute numbers
+understate what a dedicated host would do; compare the modes, not the totals.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+MODES = {
+    "development": [
+        sys.executable, "-m", "uvicorn", "src.api.main:app",
+        "--host", "127.0.0.1", "--port", "{port}", "--reload",
+    ],
+    "production": [
+        sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py",
+        "--bind", "127.0.0.1:{port}", "src.api.main:app",
+    ],
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start(mode: str, port: int) -> subprocess.Popen:
+    command = [part.format(port=port) for part in MODES[mode]]
+    env = dict(os.environ)
+    if mode == "production":
+        env.setdefault("DB_ECHO", "false")
+    return subprocess.Popen(
+        command,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+async def wait_ready(base_url: str, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become ready")
+
+
+async def _load(
+    base_url: str,
+    paths: List[str],
+    headers: Dict[str, str],
+    concurrency: int,
+    duration: float,
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits) as client:
+        deadline = time.monotonic() + duration
+
+        async def client_loop(offset: int) -> None:
+            nonlocal errors
+            i = offset
+            while time.monotonic() < deadline:
+                start = time.perf_counter()
+                try:
+                    response = await client.get(paths[i % len(paths)])
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.TransportError:
+                    errors += 1
+                latencies.append(time.perf_counter() - start)
+                i += 1
+
+        started = time.monotonic()
+        await asyncio.gather(*(client_loop(i) for i in range(concurrency)))
+        elapsed = time.monotonic() - started
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+    }
+
+
+async def _run_mode(mode: str, args: argparse.Namespace) -> Dict[str, float]:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    process = _start(mode, port)
+    try:
+        await wait_ready(base_url)
+        headers = dict(h.split(": ", 1) for h in args.header)
+        # Warm every worker's pool and caches before measuring
+        await _load(base_url, args.path, headers, args.concurrency, min(args.duration, 3))
+        return await _load(base_url, args.path, headers, args.concurrency, args.duration)
+    finally:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=60)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=sorted(MODES), action="append")
+    parser.add_argument("--path", action="append", default=None)
+    parser.add_argument("--header", action="append", default=[])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=15)
+    args = parser.parse_args()
+    args.path = args.path or ["/health"]
+
+    print(f"{'mode':<12} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for mode in args.mode or ["development", "production"]:
+        result = await _run_mode(mode, args)
+        print(
+            f"{mode:<12} {result['requests']:>9} {result['errors']:>7} "
+            f"{result['rps']:>9.0f} {result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,147 @@
+"""Compares full list responses with sparse fieldsets.
+
+Creates a user with a workspace holding ``--budgets`` budgets, starts a
+single-worker server and requests the budget list (one page holding every
+budget) with each ``fields`` variant, printing the body size and the
+latency over ``--requests`` sequential requests. Run from ``backend/`` with
+``DATABASE_URL`` and ``SECRET_KEY`` set and the schema migrated::
+
+    python benchmarks/sparse_fields.py --requests 300
+"""
+import argparse
+import asyncio
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from serve_modes import free_port, wait_ready  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine  # noqa: E402
+
+from src.domain.auth.models import User  # noqa: E402
+from src.domain.auth.value_objects import Email  # noqa: E402
+from src.domain.budget.models import Budget, Category  # noqa: E402
+from src.domain.workspace.models import Workspace  # noqa: E402
+from src.infrastructure.auth.repositories import SQLUserRepository  # noqa: E402
+from src.infrastructure.auth.services.jwt import JWTService  # noqa: E402
+from src.infrastructure.budget.repositories import (  # noqa: E402
+    SQLBudgetRepository,
+    SQLCategoryRepository,
+)
+from src.infrastructure.database import DATABASE_URL  # noqa: E402
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository  # noqa: E402
+
+VARIANTS = [
+    None,
+    "id,category_id,limit_amount,month,year",
+    "id,limit_amount",
+    "id,spent_amount,progress_percentage",
+]
+
+
+async def _seed(budgets: int) -> Dict[str, str]:
+    engine = create_async_engine(DATABASE_URL)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        user = User(
+            email=Email(f"bench-{uuid.uuid4().hex[:8]}@example.com"),
+            password_hash="-",
+            full_name="Benchmark",
+        )
+        await SQLUserRepository(session).add(user)
+        workspace = Workspace(name=f"Bench {uuid.uuid4().hex[:8]}", owner_id=user.id)
+        await SQLWorkspaceRepository(session).add(workspace)
+        await session.flush()
+        repo = SQLBudgetRepository(session)
+        category = None
+        for i in range(budgets):
+            # A budget is unique per category and period: 12 months x 10 years each
+            if i % 120 == 0:
+                category = Category(name=f"Bench {i}", workspace_id=workspace.id)
+                await SQLCategoryRepository(session).add(category)
+                await session.flush()
+            await repo.add(
+                Budget(
+                    workspace_id=workspace.id,
+                    owner_id=user.id,
+                    category_id=category.id,
+                    limit_amount=100.0 + i,
+                    month=i % 12 + 1,
+                    year=2020 + (i // 12) % 10,
+                )
+            )
+        await session.commit()
+    await engine.dispose()
+    return {
+        "token": JWTService.create_token({"sub": str(user.id)}, token_type="access"),
+        "workspace_id": str(workspace.id),
+    }
+
+
+async def _measure(
+    client: httpx.AsyncClient, path: str, fields: Optional[str], count: int
+) -> Dict[str, float]:
+    params = {"fields": fields} if fields else {}
+    # Not timed: fills the compiled-statement cache for this shape
+    response = await client.get(path, params=params)
+    response.raise_for_status()
+    latencies: List[float] = []
+    for _ in range(count):
+        start = time.perf_counter()
+        response = await client.get(path, params=params)
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return {
+        "bytes": len(response.content),
+        "mean": statistics.mean(latencies),
+        "p50": statistics.median(latencies),
+        "p99": statistics.quantiles(latencies, n=100)[98],
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budgets", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    seed = await _seed(args.budgets)
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    env = dict(os.environ, DB_ECHO="false", JOB_WORKERS="0")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.api.main:app", "--port", str(port)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    page_size = min(args.budgets, 100)
+    path = f"/api/budgets?workspace_id={seed['workspace_id']}&size={page_size}"
+    try:
+        await wait_ready(base_url)
+        headers = {"Authorization": f"Bearer {seed['token']}"}
+        async with httpx.AsyncClient(base_url=base_url, headers=headers) as client:
+            print(f"{page_size} budgets per page, {args.requests} requests, ms")
+            print(f"{'fields':<42} {'bytes':>7} {'mean':>7} {'p50':>7} {'p99':>7}")
+            for fields in VARIANTS:
+                row = await _measure(client, path, fields, args.requests)
+                print(
+                    f"{fields or '(all)':<42} {row['bytes']:>7} {row['mean']:>7.2f} "
+                    f"{row['p50']:>7.2f} {row['p99']:>7.2f}"
+                )
+    finally:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,9 +1,21 @@
 #!/bin/bash
 set -e
 
-# Run migrations
-echo "Running database migrations..."
-alembic upgrade head
+# Run migrations; an embedded SQLite database gets its schema on startup
+if [[ "$DATABASE_URL" == sqlite* ]]; then
+    echo "Embedded SQLite database, skipping migrations"
+else
+    echo "Running database migrations..."
+    alembic upgrade head
+fi
+
+# Every shard carries the full schema and the primary's default categories
+if [ -n "$DATABASE_SHARD_URLS" ]; then
+    for url in ${DATABASE_SHARD_URLS//,/ }; do
+        DATABASE_URL="$url" alembic upgrade head
+    done
+    python -m src.infrastructure.sharding sync-defaults
+fi
 
 # Check for seeding flags
 if [ "$RESET_DB" = "true" ]; then
@@ -21,5 +33,16 @@ if [ $# -gt 0 ]; then
 fi
 
 # Start the application
-echo "Starting application..."
+if [ "$SERVER_MODE" = "production" ]; then
+    # Metrics from every worker are aggregated through this directory; stale
+    # files from a previous run would be summed in, so start empty.
+    export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/wiselab-metrics}"
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+    export DB_ECHO="${DB_ECHO:-false}"
+    echo "Starting application (production)..."
+    exec gunicorn -c gunicorn.conf.py src.api.main:app
+fi
+
+echo "Starting application (development)..."
 exec uvicorn src.api.main:app --host 0.0.0.0 --port 8000 --reload
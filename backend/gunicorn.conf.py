@@ -0,0 +1,35 @@
+"""Gunicorn settings for ``SERVER_MODE=production`` (see entrypoint.sh)."""
+import os
+
+from src.infrastructure.observability import mark_worker_dead
+
+
+def _cpu_count() -> int:
+    # Respects CPU affinity (taskset, cpusets) where the platform supports it
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+# One event loop per core; async workers do not benefit from 2n+1
+workers = int(os.getenv("WEB_CONCURRENCY") or _cpu_count())
+worker_class = "src.api.server.ProductionWorker"
+
+# Longer than a typical load balancer idle timeout so the proxy closes first
+keepalive = int(os.getenv("SERVER_KEEPALIVE", "75"))
+backlog = int(os.getenv("SERVER_BACKLOG", "2048"))
+timeout = int(os.getenv("SERVER_TIMEOUT", "60"))
+# On SIGTERM workers stop accepting and finish in-flight requests for up to
+# this long before they are killed
+graceful_timeout = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", "30"))
+max_requests = int(os.getenv("SERVER_MAX_REQUESTS", "0"))
+max_requests_jitter = max_requests // 10
+
+accesslog = os.getenv("SERVER_ACCESS_LOG") or None
+errorlog = "-"
+
+
+def child_exit(server, worker):
+    mark_worker_dead(worker.pid)
@@ -81,7 +81,7 @@ async def seed(reset: bool = False):
                 user = UserORM(
                     id=uuid.uuid4(),
                     email=email,
-                    password_hash=Hasher.get_password_hash("password123"),
+                    password_hash=await Hasher.get_password_hash("password123"),
                     full_name=fake.name(),
                     is_active=True
                 )
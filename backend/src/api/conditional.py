@@ -0,0 +1,39 @@
+import hashlib
+import os
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import Response, status
+
+CATEGORY_CATALOG_MAX_AGE = int(os.getenv("CATEGORY_CATALOG_MAX_AGE", "3600"))
+
+# Per-user lists may be stored by the browser but must be revalidated.
+REVALIDATE = "private, no-cache"
+CATALOG_CACHE_CONTROL = f"public, max-age={CATEGORY_CATALOG_MAX_AGE}"
+
+
+def weak_etag(last_updated: Optional[datetime], total: int, *scope: Any) -> str:
+    """Builds a weak ETag from a list version and the scope it was taken for."""
+    stamp = last_updated.isoformat() if last_updated else "-"
+    raw = ":".join([stamp, str(total), *(str(part) for part in scope)])
+    return f'W/"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` header."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
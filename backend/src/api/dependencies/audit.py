@@ -0,0 +1,20 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases.audit.recorder import AuditRecorder
+from src.infrastructure.audit.repositories import SQLAuditEventRepository
+from src.infrastructure.audit.services import buffer
+from src.infrastructure.audit.services.recorder import SessionAuditRecorder
+from src.infrastructure.database import get_db
+
+
+async def get_audit_repository(
+    session: AsyncSession = Depends(get_db),
+) -> SQLAuditEventRepository:
+    return SQLAuditEventRepository(session)
+
+
+async def get_audit_recorder(
+    session: AsyncSession = Depends(get_db),
+) -> AuditRecorder:
+    return SessionAuditRecorder(session, buffer.audit_buffer)
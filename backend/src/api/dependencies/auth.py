@@ -1,4 +1,5 @@
 import uuid
+from typing import Any, Dict
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -6,8 +7,15 @@ from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.auth.models import User
-from src.infrastructure.auth.repositories import SQLUserRepository
+from src.domain.auth.repositories import UserRepository
+from src.infrastructure.auth.repositories import (
+    SQLRevokedTokenRepository,
+    SQLUserRepository,
+)
+from src.infrastructure.auth.services import revocation
 from src.infrastructure.auth.services.jwt import JWTService
+from src.infrastructure.auth.services.revocation import RevocationList
+from src.infrastructure.cache import USER_POLICY, cached
 from src.infrastructure.database import get_db
 
 security = HTTPBearer()
@@ -15,33 +23,57 @@ security = HTTPBearer()
 
 async def get_user_repository(
     session: AsyncSession = Depends(get_db),
-) -> SQLUserRepository:
-    return SQLUserRepository(session)
+) -> UserRepository:
+    return cached(SQLUserRepository(session), USER_POLICY, session)
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+async def get_revoked_token_repository(
     session: AsyncSession = Depends(get_db),
-) -> User:
-    credentials_exception = HTTPException(
+) -> SQLRevokedTokenRepository:
+    return SQLRevokedTokenRepository(session)
+
+
+def get_revocation_list() -> RevocationList:
+    return revocation.revocation_list
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _access_token_claims(token: str) -> Dict[str, Any]:
     try:
-        token = credentials.credentials
         payload = JWTService.decode_token(token)
-        user_id: str = payload.get("sub")
-        token_type: str = payload.get("type")
-        if user_id is None or token_type != "access":
-            raise credentials_exception
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
+    if payload.get("sub") is None or payload.get("type") != "access":
+        raise _credentials_exception()
+    # A dictionary lookup in the mirrored revocation list, not a query
+    if get_revocation_list().is_revoked(payload.get("jti")):
+        raise _credentials_exception()
+    return payload
+
+
+async def get_access_token_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> Dict[str, Any]:
+    return _access_token_claims(credentials.credentials)
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: AsyncSession = Depends(get_db),
+) -> User:
+    claims = _access_token_claims(credentials.credentials)
 
-    user_repo = SQLUserRepository(session)
-    user = await user_repo.get_by_id(uuid.UUID(user_id))
+    user_repo = await get_user_repository(session)
+    user = await user_repo.get_by_id(uuid.UUID(claims["sub"]))
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     if not user.is_active:
         raise HTTPException(
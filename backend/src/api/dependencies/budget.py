@@ -10,19 +10,20 @@ from src.infrastructure.budget.repositories import (
     SQLBudgetRepository,
     SQLCategoryRepository,
 )
+from src.infrastructure.cache import BUDGET_POLICY, CATEGORY_POLICY, cached
 from src.infrastructure.database import get_db
 
 
 async def get_budget_repository(
     session: AsyncSession = Depends(get_db),
 ) -> BudgetRepository:
-    return SQLBudgetRepository(session)
+    return cached(SQLBudgetRepository(session), BUDGET_POLICY, session)
 
 
 async def get_category_repository(
     session: AsyncSession = Depends(get_db),
 ) -> CategoryRepository:
-    return SQLCategoryRepository(session)
+    return cached(SQLCategoryRepository(session), CATEGORY_POLICY, session)
 
 
 async def get_movement_service() -> MovementService:
@@ -0,0 +1,11 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database import get_db
+from src.infrastructure.jobs.repositories import SQLJobRepository
+
+
+async def get_job_repository(
+    session: AsyncSession = Depends(get_db),
+) -> SQLJobRepository:
+    return SQLJobRepository(session)
@@ -0,0 +1,27 @@
+import math
+
+from fastapi import Depends, HTTPException, Request, status
+
+from src.application.use_cases.auth.login.dtos import LoginUserRequestDto
+from src.infrastructure.rate_limit import LoginRateLimiter
+from src.infrastructure.rate_limit import limiter
+
+
+def get_login_rate_limiter() -> LoginRateLimiter:
+    return limiter.login_rate_limiter
+
+
+async def enforce_login_rate_limit(
+    request: Request,
+    data: LoginUserRequestDto,
+    rate_limiter: LoginRateLimiter = Depends(get_login_rate_limiter),
+) -> None:
+    """Rejects login attempts over budget before any lookup or hashing."""
+    ip = request.client.host if request.client else "unknown"
+    wait = await rate_limiter.check(ip, data.email)
+    if wait:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, try again later",
+            headers={"Retry-After": str(math.ceil(wait))},
+        )
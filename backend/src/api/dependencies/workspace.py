@@ -1,11 +1,13 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.domain.workspace.repositories import WorkspaceRepository
+from src.infrastructure.cache import WORKSPACE_POLICY, cached
 from src.infrastructure.database import get_db
 from src.infrastructure.workspace.repositories import SQLWorkspaceRepository
 
 
 async def get_workspace_repository(
     session: AsyncSession = Depends(get_db),
-) -> SQLWorkspaceRepository:
-    return SQLWorkspaceRepository(session)
+) -> WorkspaceRepository:
+    return cached(SQLWorkspaceRepository(session), WORKSPACE_POLICY, session)
@@ -0,0 +1,52 @@
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Type
+
+from fastapi import HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from src.api.negotiation import NegotiatedResponse
+
+
+def sparse_fields(
+    model: Type[BaseModel],
+) -> Callable[..., Optional[Tuple[str, ...]]]:
+    """Dependency reading a ``fields`` query parameter for responses of ``model``.
+
+    Resolves to ``None`` when the parameter is absent, otherwise to the
+    requested field names in the model's declaration order.
+    """
+    names = tuple(model.model_fields)
+
+    def dependency(
+        fields: Optional[str] = Query(
+            None, description=f"Comma-separated subset of: {', '.join(names)}"
+        ),
+    ) -> Optional[Tuple[str, ...]]:
+        if fields is None:
+            return None
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = sorted(requested.difference(names))
+        if unknown or not requested:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}"
+                if unknown
+                else "fields must name at least one field",
+            )
+        return tuple(name for name in names if name in requested)
+
+    return dependency
+
+
+def pick(
+    model: Type[BaseModel], items: Iterable[Any], fields: Tuple[str, ...]
+) -> list:
+    """Serializes ``items`` through ``model`` keeping only ``fields``."""
+    include = set(fields)
+    return [model.model_validate(item).model_dump(include=include) for item in items]
+
+
+def sparse_response(content: Any, headers: Dict[str, str]) -> NegotiatedResponse:
+    # The route's response_model describes the full shape, so a partial body
+    # is returned directly instead of being validated against it.
+    return NegotiatedResponse(jsonable_encoder(content), headers=headers)
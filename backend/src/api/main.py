@@ -1,13 +1,56 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.api.routes import auth, budget, workspace
+from src.api.middleware import (
+    CompressionMiddleware,
+    ContentNegotiationMiddleware,
+    ProfilingMiddleware,
+    TimingMiddleware,
+)
+from src.api.routes import auth, budget, jobs, workspace
+from src.infrastructure.audit.services.buffer import running_audit_flush
+from src.infrastructure.auth.services.revocation import running_revocation_sync
+from src.infrastructure.budget.partitions import ensure_budget_partitions
+from src.infrastructure.cache import running_cache_invalidation
+from src.infrastructure.database import close_pool, open_pool
+from src.infrastructure.embedded import create_embedded_schema
+from src.infrastructure.jobs.worker import running_workers
+from src.infrastructure import readiness
+from src.infrastructure.observability import CONTENT_TYPE_LATEST, render_metrics
+from src.infrastructure.warmup import warm_up
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await open_pool()
+    # PostgreSQL is migrated by entrypoint.sh; an embedded SQLite database
+    # gets its schema on first start
+    await create_embedded_schema()
+    # Pay for connections and statement preparation before the first request
+    await warm_up()
+    # This year's and the coming years' budget partitions exist before use
+    await ensure_budget_partitions()
+    try:
+        # JOB_WORKERS=0 leaves jobs to a separate `python -m src.infrastructure.jobs.worker`
+        async with running_revocation_sync(), running_cache_invalidation():
+            async with running_workers():
+                # Writes the audit events still buffered before the pool closes
+                async with running_audit_flush():
+                    yield
+    finally:
+        # Runs after the server has drained in-flight requests
+        await close_pool()
+
 
 app = FastAPI(
     title="WiseLab Financial Planning API",
     description="Backend for the Personal Financial Planning System",
     version="0.1.0",
     swagger_ui_parameters={"persistAuthorization": True},
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -16,15 +59,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-Profile-File"],
 )
+app.add_middleware(ContentNegotiationMiddleware)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(TimingMiddleware)
 
-from src.api.routes import auth, budget, workspace
+from src.api.routes import auth, budget, jobs, workspace
 from fastapi import APIRouter
 
 api_router = APIRouter(prefix="/api")
 api_router.include_router(auth.router)
 api_router.include_router(workspace.router)
 api_router.include_router(budget.router)
+api_router.include_router(jobs.router)
 
 app.include_router(api_router)
 
@@ -37,3 +86,19 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/ready")
+async def readiness_check():
+    report = await readiness.readiness_probe.report()
+    ready = report["status"] == "ready"
+    return JSONResponse(
+        report,
+        status_code=status.HTTP_200_OK if ready else status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Cache-Control": "no-store"},
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,11 @@
+from .compression import CompressionMiddleware
+from .negotiation import ContentNegotiationMiddleware
+from .profiling import ProfilingMiddleware
+from .timing import TimingMiddleware
+
+__all__ = [
+    "CompressionMiddleware",
+    "ContentNegotiationMiddleware",
+    "ProfilingMiddleware",
+    "TimingMiddleware",
+]
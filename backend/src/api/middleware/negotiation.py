@@ -0,0 +1,26 @@
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.api.negotiation import request_accept
+
+
+class ContentNegotiationMiddleware:
+    """Exposes the request's ``Accept`` header to ``NegotiatedResponse``.
+
+    FastAPI builds the response class from the serialized content alone, so
+    the header travels through a context variable instead.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_accept.set(Headers(scope=scope).get("accept"))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_accept.reset(token)
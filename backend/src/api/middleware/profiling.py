@@ -0,0 +1,100 @@
+import asyncio
+import hmac
+import logging
+import os
+import re
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.observability.profiler import TaskSampler
+
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN")
+PROFILING_DIR = os.getenv("PROFILING_DIR", "/tmp/wiselab-profiles")
+PROFILING_MAX_PER_MINUTE = int(os.getenv("PROFILING_MAX_PER_MINUTE", "6"))
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "5"))
+
+PROFILE_HEADER = "x-profile-token"
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE = re.compile(r"[^A-Za-z0-9]+")
+
+
+class ProfilingMiddleware:
+    """Profiles requests that carry a valid ``X-Profile-Token`` header.
+
+    Disabled unless ``PROFILING_TOKEN`` is set. Each worker profiles one
+    request at a time and at most ``max_per_minute`` per minute; requests
+    over the limit are served normally. Profiles are written to
+    ``output_dir`` as collapsed stacks and the file name is returned in the
+    ``X-Profile-File`` response header.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        token: Optional[str] = PROFILING_TOKEN,
+        output_dir: str = PROFILING_DIR,
+        max_per_minute: int = PROFILING_MAX_PER_MINUTE,
+        interval_ms: float = PROFILING_INTERVAL_MS,
+    ):
+        self.app = app
+        self._token = token.encode() if token else None
+        self._output_dir = Path(output_dir)
+        self._max_per_minute = max_per_minute
+        self._interval = interval_ms / 1000
+        self._recent: deque = deque()
+        self._busy = False
+
+    def _authorized(self, scope: Scope) -> bool:
+        if self._token is None:
+            return False
+        supplied = Headers(scope=scope).get(PROFILE_HEADER)
+        return supplied is not None and hmac.compare_digest(
+            supplied.encode(), self._token
+        )
+
+    def _acquire(self) -> bool:
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] > 60:
+            self._recent.popleft()
+        if self._busy or len(self._recent) >= self._max_per_minute:
+            return False
+        self._recent.append(now)
+        self._busy = True
+        return True
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._authorized(scope):
+            await self.app(scope, receive, send)
+            return
+        if not self._acquire():
+            logger.info("Profiling skipped for %s: rate limited", scope["path"])
+            await self.app(scope, receive, send)
+            return
+
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        slug = _UNSAFE.sub("_", scope["path"]).strip("_") or "root"
+        filename = f"{stamp}-{scope['method']}-{slug}-{os.getpid()}.folded"
+
+        async def send_with_profile(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Profile-File", filename)
+            await send(message)
+
+        sampler = TaskSampler(asyncio.current_task(), self._interval)
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            sampler.stop()
+            self._busy = False
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+            (self._output_dir / filename).write_text(sampler.folded())
+            logger.info("Wrote request profile %s", filename)
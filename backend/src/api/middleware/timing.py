@@ -0,0 +1,80 @@
+import logging
+import os
+from contextlib import nullcontext
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.observability import (
+    begin_request,
+    count_queries,
+    current_timings,
+    end_request,
+)
+from src.infrastructure.observability.metrics import (
+    REQUEST_LATENCY,
+    REQUESTS_IN_PROGRESS,
+)
+from src.infrastructure.observability.queries import QUERY_DEBUG
+
+SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "true").lower() == "true"
+
+logger = logging.getLogger(__name__)
+
+
+class TimingMiddleware:
+    """Records handler, SQL, hashing and JWT time for every HTTP request.
+
+    Implemented as a plain ASGI middleware so it adds no extra task or
+    response buffering on top of the route stack. Latency is also exported
+    to Prometheus labelled by route template, so unmatched paths collapse
+    into a single ``unmatched`` series.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = begin_request()
+        timings = current_timings()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if SERVER_TIMING_HEADER:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing", timings.server_timing(timings.total_ms())
+                    )
+            await send(message)
+
+        request_scope = (
+            count_queries(f"{scope['method']} {scope['path']}")
+            if QUERY_DEBUG
+            else nullcontext()
+        )
+        REQUESTS_IN_PROGRESS.inc()
+        try:
+            with request_scope:
+                await self.app(scope, receive, send_with_timing)
+        finally:
+            REQUESTS_IN_PROGRESS.dec()
+            total_ms = timings.total_ms()
+            route = scope.get("route")
+            REQUEST_LATENCY.labels(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                status_code,
+            ).observe(total_ms / 1000)
+            fields = timings.as_log_fields(total_ms)
+            fields.update(
+                method=scope["method"], path=scope["path"], status=status_code
+            )
+            logger.info("request completed", extra=fields)
+            end_request(token)
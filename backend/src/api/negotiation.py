@@ -0,0 +1,67 @@
+from contextvars import ContextVar
+from typing import Any, Dict, Mapping, Optional
+
+import msgpack
+from fastapi.responses import JSONResponse
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+# Accept header of the request being served, set by ContentNegotiationMiddleware
+request_accept: ContextVar[Optional[str]] = ContextVar("request_accept", default=None)
+
+
+def _qualities(accept: str) -> Dict[str, float]:
+    qualities: Dict[str, float] = {}
+    for part in accept.split(","):
+        media_type, *params = (item.strip() for item in part.split(";"))
+        media_type = media_type.lower()
+        if not media_type:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[media_type] = max(quality, qualities.get(media_type, 0.0))
+    return qualities
+
+
+def wants_msgpack(accept: Optional[str]) -> bool:
+    """Whether ``accept`` names MessagePack at least as preferred as JSON.
+
+    Only explicit MessagePack entries count, so wildcards such as a
+    browser's ``*/*`` keep receiving JSON.
+    """
+    if not accept:
+        return False
+    qualities = _qualities(accept)
+    msgpack_q = max((qualities.get(m, 0.0) for m in MSGPACK_MEDIA_TYPES), default=0.0)
+    return msgpack_q > 0 and msgpack_q >= qualities.get("application/json", 0.0)
+
+
+class NegotiatedResponse(JSONResponse):
+    """JSON by default, MessagePack when the request's ``Accept`` prefers it.
+
+    The content is already JSON-compatible when it reaches the response, so
+    both encodings carry the same values: identifiers and dates as strings.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        **kwargs: Any,
+    ):
+        if wants_msgpack(request_accept.get()):
+            self.media_type = MSGPACK_MEDIA_TYPES[0]
+        super().__init__(content, status_code, headers, **kwargs)
+        self.headers.add_vary_header("Accept")
+
+    def render(self, content: Any) -> bytes:
+        if self.media_type in MSGPACK_MEDIA_TYPES:
+            return msgpack.packb(content)
+        return super().render(content)
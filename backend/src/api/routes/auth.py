@@ -1,11 +1,22 @@
+from typing import Any, Dict
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.dependencies.auth import (
+    get_access_token_claims,
+    get_revocation_list,
+    get_revoked_token_repository,
+    get_user_repository,
+)
+from src.api.dependencies.rate_limit import enforce_login_rate_limit
 from src.application.use_cases.auth import LoginUser, RegisterUser
 from src.application.use_cases.auth.login.dtos import (
     LoginUserRequestDto,
     LoginUserResponseDto,
 )
+from src.application.use_cases.auth.logout.dtos import LogoutRequestDto
+from src.application.use_cases.auth.logout.index import Logout
 from src.application.use_cases.auth.refresh.dtos import RefreshTokenRequestDto
 from src.application.use_cases.auth.refresh.index import RefreshToken
 from src.application.use_cases.auth.register.dtos import (
@@ -13,18 +24,16 @@ from src.application.use_cases.auth.register.dtos import (
     RegisterUserResponseDto,
 )
 from src.domain.errors import UnauthorizedError, ValidationError
-from src.infrastructure.auth.repositories import SQLUserRepository
+from src.infrastructure.auth.repositories import (
+    SQLRevokedTokenRepository,
+    SQLUserRepository,
+)
+from src.infrastructure.auth.services.revocation import RevocationList
 from src.infrastructure.database import get_db
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
-async def get_user_repository(
-    session: AsyncSession = Depends(get_db),
-) -> SQLUserRepository:
-    return SQLUserRepository(session)
-
-
 @router.post(
     "/register",
     response_model=RegisterUserResponseDto,
@@ -50,7 +59,11 @@ async def register(
         )
 
 
-@router.post("/login", response_model=LoginUserResponseDto)
+@router.post(
+    "/login",
+    response_model=LoginUserResponseDto,
+    dependencies=[Depends(enforce_login_rate_limit)],
+)
 async def login(
     data: LoginUserRequestDto,
     user_repo: SQLUserRepository = Depends(get_user_repository),
@@ -70,8 +83,11 @@ async def login(
 async def refresh(
     data: RefreshTokenRequestDto,
     user_repo: SQLUserRepository = Depends(get_user_repository),
+    revoked_token_repo: SQLRevokedTokenRepository = Depends(
+        get_revoked_token_repository
+    ),
 ):
-    use_case = RefreshToken(user_repo)
+    use_case = RefreshToken(user_repo, revoked_token_repo)
     try:
         return await use_case.execute(data)
     except UnauthorizedError as e:
@@ -80,3 +96,29 @@ async def refresh(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
         )
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    data: LogoutRequestDto,
+    claims: Dict[str, Any] = Depends(get_access_token_claims),
+    session: AsyncSession = Depends(get_db),
+    revoked_token_repo: SQLRevokedTokenRepository = Depends(
+        get_revoked_token_repository
+    ),
+    revocations: RevocationList = Depends(get_revocation_list),
+):
+    use_case = Logout(revoked_token_repo)
+    try:
+        revoked = await use_case.execute(claims, data)
+        await session.commit()
+    except UnauthorizedError as e:
+        await session.rollback()
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
+    # Other workers pick the revocation up on their next poll
+    revocations.add(revoked)
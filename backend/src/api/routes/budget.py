@@ -1,9 +1,25 @@
 import logging
-from typing import Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    status,
+)
 
+from src.api.conditional import (
+    CATALOG_CACHE_CONTROL,
+    REVALIDATE,
+    etag_matches,
+    not_modified,
+    weak_etag,
+)
+from src.api.dependencies.audit import get_audit_recorder
 from src.api.dependencies.auth import get_current_user
 from src.api.dependencies.budget import (
     get_budget_repository,
@@ -11,6 +27,8 @@ from src.api.dependencies.budget import (
     get_movement_service,
 )
 from src.api.dependencies.workspace import get_workspace_repository
+from src.api.fields import sparse_fields, sparse_response
+from src.api.negotiation import NegotiatedResponse
 from src.infrastructure.database import get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.application.use_cases.budget.create.dtos import (
@@ -21,12 +39,21 @@ from src.application.use_cases.budget.create.dtos import (
 from src.application.use_cases.budget.create.index import CreateBudget
 from src.application.use_cases.budget.delete.index import DeleteBudget
 from src.application.use_cases.budget.get.index import GetBudget
+from src.application.use_cases.budget.get_many.dtos import (
+    BUDGET_BATCH_MAX_IDS,
+    GetBudgetsResponseDto,
+)
+from src.application.use_cases.budget.get_many.index import GetBudgets
 from src.application.use_cases.budget.list.dtos import ListBudgetsResponseDto
 from src.application.use_cases.budget.list.index import ListBudgets
+from src.application.use_cases.budget.list_fields.index import ListBudgetFields
 from src.application.use_cases.budget.update.dtos import UpdateBudgetRequestDto
 from src.application.use_cases.budget.update.index import UpdateBudget
+from src.application.use_cases.budget.version.index import GetBudgetListVersion
 from src.domain.auth.models import User
+from src.domain.budget.value_objects import BudgetSort, period_key
 from src.domain.errors import (
+    ArchivedError,
     ConflictError,
     NotFoundError,
     UnauthorizedError,
@@ -36,6 +63,16 @@ from src.domain.errors import (
 router = APIRouter(prefix="/budgets", tags=["budgets"])
 logger = logging.getLogger(__name__)
 
+PERIOD_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])$"
+
+
+def _period(value: Optional[str]) -> Optional[int]:
+    """Turns a validated ``YYYY-MM`` query value into a period key."""
+    if value is None:
+        return None
+    year, month = value.split("-")
+    return period_key(int(year), int(month))
+
 
 @router.post("", response_model=BudgetResponseDto, status_code=status.HTTP_201_CREATED)
 async def create_budget(
@@ -44,10 +81,11 @@ async def create_budget(
     budget_repo=Depends(get_budget_repository),
     category_repo=Depends(get_category_repository),
     workspace_repo=Depends(get_workspace_repository),
+    audit=Depends(get_audit_recorder),
     session: AsyncSession = Depends(get_db),
 ):
     try:
-        use_case = CreateBudget(budget_repo, workspace_repo, category_repo)
+        use_case = CreateBudget(budget_repo, workspace_repo, category_repo, audit)
         budget = await use_case.execute(current_user, data)
         await session.commit()
         return {
@@ -78,7 +116,9 @@ async def create_budget(
 
 @router.get("/categories", response_model=list[CategoryResponseDto])
 async def list_categories(
+    response: Response,
     workspace_id: Optional[UUID] = Query(None),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     category_repo=Depends(get_category_repository),
     workspace_repo=Depends(get_workspace_repository),
@@ -91,11 +131,20 @@ async def list_categories(
                 workspace = await workspace_repo.get_by_id(workspace_id)
                 if not workspace or workspace.owner_id != current_user.id:
                     raise UnauthorizedError("You do not have access to this workspace")
-            
+
+        cache_control = REVALIDATE if workspace_id else CATALOG_CACHE_CONTROL
+        version = await category_repo.get_list_version(workspace_id)
+        etag = weak_etag(*version, workspace_id)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, cache_control)
+
+        if workspace_id:
             categories = await category_repo.list_by_workspace(workspace_id)
         else:
             categories = await category_repo.list_defaults()
-            
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = cache_control
         return [
             CategoryResponseDto(
                 id=c.id,
@@ -116,6 +165,50 @@ async def list_categories(
         )
 
 
+@router.get("/batch", response_model=GetBudgetsResponseDto)
+async def get_budgets(
+    # Not required at the Query level: FastAPI 0.109 fails to render the
+    # validation error for a missing list parameter
+    ids: List[UUID] = Query([], max_length=BUDGET_BATCH_MAX_IDS),
+    current_user: User = Depends(get_current_user),
+    budget_repo=Depends(get_budget_repository),
+    workspace_repo=Depends(get_workspace_repository),
+    movement_service=Depends(get_movement_service),
+):
+    if not ids:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="At least one budget id is required",
+        )
+    try:
+        use_case = GetBudgets(budget_repo, workspace_repo, movement_service)
+        results, missing = await use_case.execute(ids, current_user)
+
+        items = [
+            {
+                "id": budget.id,
+                "workspace_id": budget.workspace_id,
+                "owner_id": budget.owner_id,
+                "category_id": budget.category_id,
+                "limit_amount": budget.limit_amount,
+                "month": budget.month,
+                "year": budget.year,
+                "spent_amount": spent,
+                "progress_percentage": progress,
+                "created_at": budget.created_at,
+                "updated_at": budget.updated_at,
+            }
+            for budget, spent, progress in results
+        ]
+        return {"items": items, "missing": missing}
+    except Exception as e:
+        logger.error(f"Error getting budgets: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
+
+
 @router.get("/{id}", response_model=BudgetResponseDto)
 async def get_budget(
     id: UUID,
@@ -154,23 +247,99 @@ async def get_budget(
         )
 
 
-@router.get("", response_model=ListBudgetsResponseDto)
+@router.get(
+    "", response_model=ListBudgetsResponseDto, response_class=NegotiatedResponse
+)
 async def list_budgets(
+    response: Response,
     workspace_id: UUID = Query(...),
     category_id: Optional[UUID] = Query(None),
     month: Optional[int] = Query(None, ge=1, le=12),
     year: Optional[int] = Query(None, ge=2000),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    period_from: Optional[str] = Query(
+        None, alias="from", pattern=PERIOD_PATTERN, description="First period, YYYY-MM"
+    ),
+    period_to: Optional[str] = Query(
+        None, alias="to", pattern=PERIOD_PATTERN, description="Last period, YYYY-MM"
+    ),
+    min_limit: Optional[float] = Query(None, ge=0),
+    max_limit: Optional[float] = Query(None, ge=0),
+    sort: Optional[BudgetSort] = Query(None),
+    fields: Optional[Tuple[str, ...]] = Depends(sparse_fields(BudgetResponseDto)),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     budget_repo=Depends(get_budget_repository),
     workspace_repo=Depends(get_workspace_repository),
     movement_service=Depends(get_movement_service),
 ):
+    first, last = _period(period_from), _period(period_to)
+    if first is not None and last is not None and first > last:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' must not be after 'to'",
+        )
+    if min_limit is not None and max_limit is not None and min_limit > max_limit:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="min_limit must not be greater than max_limit",
+        )
+    filters = dict(
+        period_from=first,
+        period_to=last,
+        min_limit=min_limit,
+        max_limit=max_limit,
+        sort=sort,
+    )
+
     try:
-        use_case = ListBudgets(budget_repo, workspace_repo, movement_service)
+        # The version is read before the page, so a concurrent write can only
+        # make the ETag older than the body and never the other way round.
+        version, access = await GetBudgetListVersion(
+            budget_repo, workspace_repo
+        ).execute(
+            current_user,
+            workspace_id,
+            category_id,
+            month,
+            year,
+            period_from=first,
+            period_to=last,
+        )
+        etag = weak_etag(
+            *version,
+            workspace_id,
+            category_id,
+            month,
+            year,
+            page,
+            size,
+            fields,
+            *filters.values(),
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, REVALIDATE)
+
+        if fields:
+            rows, total = await ListBudgetFields(budget_repo, movement_service).execute(
+                access,
+                fields,
+                category_id,
+                month,
+                year,
+                page,
+                size,
+                **filters,
+            )
+            return sparse_response(
+                {"items": rows, "total": total, "page": page, "size": size},
+                {"ETag": etag, "Cache-Control": REVALIDATE},
+            )
+
+        use_case = ListBudgets(budget_repo, movement_service)
         results, total = await use_case.execute(
-            current_user, workspace_id, category_id, month, year, page, size
+            access, category_id, month, year, page, size, **filters
         )
 
         items = []
@@ -191,6 +360,8 @@ async def list_budgets(
                 }
             )
 
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = REVALIDATE
         return {"items": items, "total": total, "page": page, "size": size}
     except UnauthorizedError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
@@ -210,10 +381,11 @@ async def update_budget(
     budget_repo=Depends(get_budget_repository),
     workspace_repo=Depends(get_workspace_repository),
     movement_service=Depends(get_movement_service),
+    audit=Depends(get_audit_recorder),
     session: AsyncSession = Depends(get_db),
 ):
     try:
-        use_case = UpdateBudget(budget_repo, workspace_repo, movement_service)
+        use_case = UpdateBudget(budget_repo, workspace_repo, movement_service, audit)
         budget, spent, progress = await use_case.execute(
             id, current_user, data.limit_amount
         )
@@ -232,6 +404,9 @@ async def update_budget(
             "created_at": budget.created_at,
             "updated_at": budget.updated_at,
         }
+    except ArchivedError as e:
+        await session.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except NotFoundError as e:
         await session.rollback()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -256,12 +431,16 @@ async def delete_budget(
     current_user: User = Depends(get_current_user),
     budget_repo=Depends(get_budget_repository),
     workspace_repo=Depends(get_workspace_repository),
+    audit=Depends(get_audit_recorder),
     session: AsyncSession = Depends(get_db),
 ):
     try:
-        use_case = DeleteBudget(budget_repo, workspace_repo)
+        use_case = DeleteBudget(budget_repo, workspace_repo, audit)
         await use_case.execute(id, current_user)
         await session.commit()
+    except ArchivedError as e:
+        await session.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except NotFoundError as e:
         await session.rollback()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
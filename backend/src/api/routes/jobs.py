@@ -0,0 +1,30 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from src.api.dependencies.auth import get_current_user
+from src.api.dependencies.jobs import get_job_repository
+from src.application.use_cases.jobs.get.dtos import JobResponseDto
+from src.application.use_cases.jobs.get.index import GetJob
+from src.domain.auth.models import User
+from src.domain.errors import NotFoundError
+from src.infrastructure.jobs.repositories import SQLJobRepository
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get("/{id}", response_model=JobResponseDto)
+async def get_job(
+    id: UUID,
+    current_user: User = Depends(get_current_user),
+    repo: SQLJobRepository = Depends(get_job_repository),
+):
+    use_case = GetJob(repo)
+    try:
+        return await use_case.execute(id, current_user)
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
@@ -1,17 +1,36 @@
-from typing import List
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.exc import IntegrityError
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.conditional import REVALIDATE, etag_matches, not_modified, weak_etag
+from src.api.dependencies.audit import get_audit_recorder, get_audit_repository
 from src.api.dependencies.auth import get_current_user, get_user_repository
+from src.api.dependencies.jobs import get_job_repository
 from src.api.dependencies.workspace import get_workspace_repository
+from src.api.fields import pick, sparse_fields, sparse_response
+from src.api.negotiation import NegotiatedResponse
+from src.application.use_cases.audit.list.dtos import (
+    AUDIT_PAGE_MAX_SIZE,
+    AUDIT_PAGE_SIZE,
+    ListAuditEventsResponseDto,
+)
+from src.application.use_cases.audit.list.index import ListAuditEvents
+from src.application.use_cases.audit.recorder import AuditRecorder
+from src.application.use_cases.jobs.get.dtos import JobResponseDto
 from src.application.use_cases.workspace.create.dtos import CreateWorkspaceRequestDto
 from src.application.use_cases.workspace.create.index import CreateWorkspace
 from src.application.use_cases.workspace.delete.index import DeleteWorkspace
 from src.application.use_cases.workspace.get.index import GetWorkspace
 from src.application.use_cases.workspace.list.index import ListWorkspaces
+from src.application.use_cases.workspace.members.bulk_invite.dtos import (
+    BulkInviteMembersRequestDto,
+    BulkInviteMembersResponseDto,
+)
+from src.application.use_cases.workspace.members.bulk_invite.index import (
+    BulkInviteMembers,
+)
 from src.application.use_cases.workspace.members.invite.dtos import (
     InviteMemberRequestDto,
 )
@@ -28,6 +47,7 @@ from src.application.use_cases.workspace.shared_dtos import (
 )
 from src.application.use_cases.workspace.update.dtos import UpdateWorkspaceRequestDto
 from src.application.use_cases.workspace.update.index import UpdateWorkspace
+from src.application.use_cases.workspace.version.index import GetWorkspaceListVersion
 from src.domain.auth.models import User
 from src.domain.errors import (
     ConflictError,
@@ -37,8 +57,10 @@ from src.domain.errors import (
     ValidationError,
     WorkspaceNotFoundError,
 )
+from src.infrastructure.audit.repositories import SQLAuditEventRepository
 from src.infrastructure.auth.repositories import SQLUserRepository
 from src.infrastructure.database import get_db
+from src.infrastructure.jobs.repositories import SQLJobRepository
 from src.infrastructure.workspace.repositories import SQLWorkspaceRepository
 
 router = APIRouter(prefix="/workspaces", tags=["workspaces"])
@@ -71,14 +93,32 @@ async def create_workspace(
         )
 
 
-@router.get("", response_model=List[WorkspaceResponseDto])
+@router.get(
+    "", response_model=List[WorkspaceResponseDto], response_class=NegotiatedResponse
+)
 async def list_workspaces(
+    response: Response,
+    fields: Optional[Tuple[str, ...]] = Depends(sparse_fields(WorkspaceResponseDto)),
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     repo: SQLWorkspaceRepository = Depends(get_workspace_repository),
 ):
     use_case = ListWorkspaces(repo)
     try:
-        return await use_case.execute(current_user)
+        version = await GetWorkspaceListVersion(repo).execute(current_user)
+        etag = weak_etag(*version, current_user.id, fields)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag, REVALIDATE)
+
+        workspaces = await use_case.execute(current_user)
+        if fields:
+            return sparse_response(
+                pick(WorkspaceResponseDto, workspaces, fields),
+                {"ETag": etag, "Cache-Control": REVALIDATE},
+            )
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = REVALIDATE
+        return workspaces
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -136,31 +176,30 @@ async def update_workspace(
         )
 
 
-@router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{id}", response_model=JobResponseDto, status_code=status.HTTP_202_ACCEPTED
+)
 async def delete_workspace(
     id: UUID,
+    response: Response,
     current_user: User = Depends(get_current_user),
     repo: SQLWorkspaceRepository = Depends(get_workspace_repository),
+    job_repo: SQLJobRepository = Depends(get_job_repository),
+    audit: AuditRecorder = Depends(get_audit_recorder),
     session: AsyncSession = Depends(get_db),
 ):
-    use_case = DeleteWorkspace(repo)
+    use_case = DeleteWorkspace(repo, job_repo, audit)
     try:
-        await use_case.execute(id, current_user)
+        job = await use_case.execute(id, current_user)
         await session.commit()
+        response.headers["Location"] = f"/api/jobs/{job.id}"
+        return job
     except WorkspaceNotFoundError as e:
         await session.rollback()
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except UnauthorizedError as e:
         await session.rollback()
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
-    except IntegrityError:
-        await session.rollback()
-        # Foreign key constraint violation - workspace has existing members
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Cannot delete workspace: The workspace still has associated members. "
-            "Please remove all workspace members before attempting to delete the workspace.",
-        )
     except Exception as e:
         await session.rollback()
         raise HTTPException(
@@ -182,9 +221,10 @@ async def invite_member(
     current_user: User = Depends(get_current_user),
     workspace_repo: SQLWorkspaceRepository = Depends(get_workspace_repository),
     user_repo: SQLUserRepository = Depends(get_user_repository),
+    audit: AuditRecorder = Depends(get_audit_recorder),
     session: AsyncSession = Depends(get_db),
 ):
-    use_case = InviteMember(workspace_repo, user_repo)
+    use_case = InviteMember(workspace_repo, user_repo, audit)
     try:
         member = await use_case.execute(id, current_user, data)
         await session.commit()
@@ -205,15 +245,54 @@ async def invite_member(
         )
 
 
-@router.get("/{id}/members", response_model=List[WorkspaceMemberResponseDto])
+@router.post("/{id}/members/bulk", response_model=BulkInviteMembersResponseDto)
+async def bulk_invite_members(
+    id: UUID,
+    data: BulkInviteMembersRequestDto,
+    current_user: User = Depends(get_current_user),
+    workspace_repo: SQLWorkspaceRepository = Depends(get_workspace_repository),
+    user_repo: SQLUserRepository = Depends(get_user_repository),
+    audit: AuditRecorder = Depends(get_audit_recorder),
+    session: AsyncSession = Depends(get_db),
+):
+    use_case = BulkInviteMembers(workspace_repo, user_repo, audit)
+    try:
+        result = await use_case.execute(id, current_user, data)
+        await session.commit()
+        return result
+    except WorkspaceNotFoundError as e:
+        await session.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except UnauthorizedError as e:
+        await session.rollback()
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except ValidationError as e:
+        await session.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
+
+
+@router.get(
+    "/{id}/members",
+    response_model=List[WorkspaceMemberResponseDto],
+    response_class=NegotiatedResponse,
+)
 async def list_members(
     id: UUID,
+    fields: Optional[Tuple[str, ...]] = Depends(sparse_fields(WorkspaceMemberResponseDto)),
     current_user: User = Depends(get_current_user),
     repo: SQLWorkspaceRepository = Depends(get_workspace_repository),
 ):
     use_case = ListMembers(repo)
     try:
-        return await use_case.execute(id, current_user)
+        members = await use_case.execute(id, current_user)
+        if fields:
+            return sparse_response(pick(WorkspaceMemberResponseDto, members, fields), {})
+        return members
     except WorkspaceNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except UnauthorizedError as e:
@@ -231,9 +310,10 @@ async def update_member_role(
     data: UpdateMemberRoleRequestDto,
     current_user: User = Depends(get_current_user),
     repo: SQLWorkspaceRepository = Depends(get_workspace_repository),
+    audit: AuditRecorder = Depends(get_audit_recorder),
     session: AsyncSession = Depends(get_db),
 ):
-    use_case = UpdateMemberRole(repo)
+    use_case = UpdateMemberRole(repo, audit)
     try:
         member = await use_case.execute(id, user_id, current_user, data)
         await session.commit()
@@ -280,3 +360,34 @@ async def remove_member(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
         )
+
+
+# Audit Log
+
+
+@router.get(
+    "/{id}/audit-events",
+    response_model=ListAuditEventsResponseDto,
+    response_class=NegotiatedResponse,
+)
+async def list_audit_events(
+    id: UUID,
+    limit: int = Query(AUDIT_PAGE_SIZE, ge=1, le=AUDIT_PAGE_MAX_SIZE),
+    before: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    current_user: User = Depends(get_current_user),
+    audit_repo: SQLAuditEventRepository = Depends(get_audit_repository),
+    workspace_repo: SQLWorkspaceRepository = Depends(get_workspace_repository),
+):
+    use_case = ListAuditEvents(audit_repo, workspace_repo)
+    try:
+        return await use_case.execute(id, current_user, limit, before)
+    except WorkspaceNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except UnauthorizedError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+        )
@@ -0,0 +1,11 @@
+from uvicorn.workers import UvicornWorker
+
+
+class ProductionWorker(UvicornWorker):
+    """Gunicorn worker running the app on uvloop with the httptools parser.
+
+    Both are required rather than picked automatically, and a failing
+    lifespan startup stops the worker instead of serving without a pool.
+    """
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on"}
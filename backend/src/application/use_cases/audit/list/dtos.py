@@ -0,0 +1,49 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+from src.domain.audit.repositories import AuditCursor
+from src.domain.audit.value_objects import AuditAction
+from src.domain.errors import ValidationError
+
+AUDIT_PAGE_SIZE = 50
+AUDIT_PAGE_MAX_SIZE = 200
+
+
+def encode_cursor(cursor: AuditCursor) -> str:
+    occurred_at, id = cursor
+    raw = f"{occurred_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(value: str) -> AuditCursor:
+    try:
+        raw = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+        occurred_at, id = raw.split("|")
+        parsed = datetime.fromisoformat(occurred_at)
+        if parsed.tzinfo is None:
+            raise ValueError("naive timestamp")
+        return parsed, UUID(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValidationError("Invalid cursor") from e
+
+
+class AuditEventResponseDto(BaseModel):
+    id: UUID
+    workspace_id: UUID
+    actor_id: Optional[UUID] = None
+    action: AuditAction
+    target_id: UUID
+    details: Dict[str, Any]
+    occurred_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ListAuditEventsResponseDto(BaseModel):
+    items: List[AuditEventResponseDto]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,66 @@
+from typing import Optional
+from uuid import UUID
+
+from src.application.use_cases.audit.list.dtos import (
+    AuditEventResponseDto,
+    ListAuditEventsResponseDto,
+    decode_cursor,
+    encode_cursor,
+)
+from src.domain.audit.repositories import AuditEventRepository
+from src.domain.auth.models import User
+from src.domain.errors import UnauthorizedError, WorkspaceNotFoundError
+from src.domain.workspace.repositories import WorkspaceRepository
+from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.observability import instrumented
+
+
+class ListAuditEvents:
+    """Pages through a workspace's audit trail, newest first.
+
+    Pages are keyset-based: ``before`` is the ``next_cursor`` of the previous
+    page, so every page is an index range scan however deep it is, and
+    events written meanwhile neither shift nor repeat entries. Only the owner
+    and admins may read the trail.
+    """
+
+    def __init__(
+        self, audit_repo: AuditEventRepository, workspace_repo: WorkspaceRepository
+    ):
+        self._audit_repo = audit_repo
+        self._workspace_repo = workspace_repo
+
+    @instrumented
+    async def execute(
+        self,
+        workspace_id: UUID,
+        user: User,
+        limit: int,
+        before: Optional[str] = None,
+    ) -> ListAuditEventsResponseDto:
+        cursor = decode_cursor(before) if before else None
+
+        workspace = await self._workspace_repo.get_by_id(workspace_id)
+        if not workspace:
+            raise WorkspaceNotFoundError("Workspace not found")
+
+        if workspace.owner_id != user.id:
+            member = await self._workspace_repo.get_member(workspace_id, user.id)
+            if not member or member.role != WorkspaceRole.ADMIN:
+                raise UnauthorizedError(
+                    "Insufficient permissions to read the audit log"
+                )
+
+        # One extra row tells whether another page follows
+        events = await self._audit_repo.list_by_workspace(
+            workspace_id, limit + 1, before=cursor
+        )
+        next_cursor = None
+        if len(events) > limit:
+            events = events[:limit]
+            next_cursor = encode_cursor((events[-1].occurred_at, events[-1].id))
+
+        return ListAuditEventsResponseDto(
+            items=[AuditEventResponseDto.model_validate(event) for event in events],
+            next_cursor=next_cursor,
+        )
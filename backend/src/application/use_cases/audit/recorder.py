@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+from src.domain.audit.models import AuditEvent
+
+
+class AuditRecorder(ABC):
+    @abstractmethod
+    def record(self, audit_event: AuditEvent) -> None:
+        """Queues an event to be persisted if the current transaction commits."""
+
+
+class NullAuditRecorder(AuditRecorder):
+    def record(self, audit_event: AuditEvent) -> None:
+        pass
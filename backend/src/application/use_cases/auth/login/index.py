@@ -3,6 +3,7 @@ from src.domain.auth.value_objects import Email
 from src.domain.errors import UnauthorizedError
 from src.infrastructure.auth.services.hasher import Hasher
 from src.infrastructure.auth.services.jwt import JWTService
+from src.infrastructure.observability import instrumented
 
 from .dtos import LoginUserRequestDto, LoginUserResponseDto, UserResponseDto
 
@@ -11,9 +12,12 @@ class LoginUser:
     def __init__(self, user_repo: UserRepository):
         self._user_repo = user_repo
 
+    @instrumented
     async def execute(self, data: LoginUserRequestDto) -> LoginUserResponseDto:
         user = await self._user_repo.get_by_email(Email(data.email))
-        if not user or not Hasher.verify_password(data.password, user.password_hash):
+        if not user or not await Hasher.verify_password(
+            data.password, user.password_hash
+        ):
             raise UnauthorizedError("Invalid credentials")
 
         if not user.is_active:
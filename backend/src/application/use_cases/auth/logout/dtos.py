@@ -0,0 +1,7 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class LogoutRequestDto(BaseModel):
+    refresh_token: Optional[str] = None
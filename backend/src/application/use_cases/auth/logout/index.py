@@ -0,0 +1,43 @@
+from typing import Any, Dict, List
+
+from jose import JWTError
+
+from src.application.use_cases.auth.tokens import revoked_token_from_claims
+from src.domain.auth.models import RevokedToken
+from src.domain.auth.repositories import RevokedTokenRepository
+from src.domain.errors import UnauthorizedError
+from src.infrastructure.auth.services.jwt import JWTService
+from src.infrastructure.observability import instrumented
+
+from .dtos import LogoutRequestDto
+
+
+class Logout:
+    def __init__(self, revoked_token_repo: RevokedTokenRepository):
+        self._revoked_token_repo = revoked_token_repo
+
+    @instrumented
+    async def execute(
+        self, access_claims: Dict[str, Any], data: LogoutRequestDto
+    ) -> List[RevokedToken]:
+        """Revokes the caller's access token and, if given, its refresh token."""
+        claims = [access_claims]
+        if data.refresh_token is not None:
+            try:
+                refresh_claims = JWTService.decode_token(data.refresh_token)
+            except JWTError:
+                raise UnauthorizedError("Invalid refresh token")
+            if (
+                refresh_claims.get("type") != "refresh"
+                or refresh_claims.get("sub") != access_claims.get("sub")
+            ):
+                raise UnauthorizedError("Invalid refresh token")
+            claims.append(refresh_claims)
+
+        revoked = []
+        for token_claims in claims:
+            token = revoked_token_from_claims(token_claims)
+            if token is not None:
+                await self._revoked_token_repo.revoke(token)
+                revoked.append(token)
+        return revoked
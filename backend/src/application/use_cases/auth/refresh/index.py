@@ -3,17 +3,23 @@ import uuid
 from jose import JWTError
 
 from src.application.use_cases.auth.login.dtos import LoginUserResponseDto, UserResponseDto
-from src.domain.auth.repositories import UserRepository
+from src.application.use_cases.auth.tokens import revoked_token_from_claims
+from src.domain.auth.repositories import RevokedTokenRepository, UserRepository
 from src.domain.errors import UnauthorizedError
 from src.infrastructure.auth.services.jwt import JWTService
+from src.infrastructure.observability import instrumented
 
 from .dtos import RefreshTokenRequestDto
 
 
 class RefreshToken:
-    def __init__(self, user_repo: UserRepository):
+    def __init__(
+        self, user_repo: UserRepository, revoked_token_repo: RevokedTokenRepository
+    ):
         self._user_repo = user_repo
+        self._revoked_token_repo = revoked_token_repo
 
+    @instrumented
     async def execute(self, data: RefreshTokenRequestDto) -> LoginUserResponseDto:
         try:
             payload = JWTService.decode_token(data.refresh_token)
@@ -27,6 +33,16 @@ class RefreshToken:
             if not user or not user.is_active:
                 raise UnauthorizedError("User not found or inactive")
 
+            # Checked against the table rather than the mirrored list, which
+            # may lag a logout on another worker; refreshes are rare enough.
+            # The token stays usable until it expires or is logged out, so
+            # refreshes from two tabs or a retried request both succeed.
+            presented = revoked_token_from_claims(payload)
+            if presented is not None and await self._revoked_token_repo.is_revoked(
+                presented.id
+            ):
+                raise UnauthorizedError("Refresh token has been revoked")
+
             new_payload = {"sub": str(user.id)}
             access_token = JWTService.create_token(
                 data=new_payload, token_type="access"
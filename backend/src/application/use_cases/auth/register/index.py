@@ -3,6 +3,7 @@ from src.domain.auth.repositories import UserRepository
 from src.domain.auth.value_objects import Email
 from src.domain.errors import ValidationError
 from src.infrastructure.auth.services.hasher import Hasher
+from src.infrastructure.observability import instrumented
 
 from .dtos import RegisterUserRequestDto, RegisterUserResponseDto
 
@@ -11,6 +12,7 @@ class RegisterUser:
     def __init__(self, user_repo: UserRepository):
         self._user_repo = user_repo
 
+    @instrumented
     async def execute(self, data: RegisterUserRequestDto) -> RegisterUserResponseDto:
         existing_user = await self._user_repo.get_by_email(Email(data.email))
         if existing_user:
@@ -18,7 +20,7 @@ class RegisterUser:
 
         user = User(
             email=Email(data.email),
-            password_hash=Hasher.get_password_hash(data.password),
+            password_hash=await Hasher.get_password_hash(data.password),
             full_name=data.full_name,
         )
         await self._user_repo.add(user)
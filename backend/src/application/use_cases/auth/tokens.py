@@ -0,0 +1,20 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from src.domain.auth.models import RevokedToken
+
+
+def revoked_token_from_claims(claims: Dict[str, Any]) -> Optional[RevokedToken]:
+    """Builds the revocation record for decoded token ``claims``.
+
+    Tokens issued before ``jti`` was added carry no identifier and cannot be
+    revoked; they simply run until they expire.
+    """
+    jti = claims.get("jti")
+    if jti is None:
+        return None
+    return RevokedToken(
+        id=UUID(jti),
+        expires_at=datetime.fromtimestamp(claims["exp"], tz=timezone.utc),
+    )
@@ -0,0 +1,30 @@
+from uuid import UUID
+
+from src.domain.auth.models import User
+from src.domain.errors import UnauthorizedError
+from src.domain.workspace.repositories import WorkspaceRepository
+
+
+class WorkspaceAccess:
+    """A user's checked access to a workspace's budgets.
+
+    Made by ``check_workspace_access``; use cases that take one instead of a
+    user and a workspace id run no access check of their own.
+    """
+
+    __slots__ = ("workspace_id", "user_id")
+
+    def __init__(self, workspace_id: UUID, user_id: UUID):
+        self.workspace_id = workspace_id
+        self.user_id = user_id
+
+
+async def check_workspace_access(
+    workspace_repo: WorkspaceRepository, user: User, workspace_id: UUID
+) -> WorkspaceAccess:
+    member = await workspace_repo.get_member(workspace_id, user.id)
+    if not member:
+        workspace = await workspace_repo.get_by_id(workspace_id)
+        if not workspace or workspace.owner_id != user.id:
+            raise UnauthorizedError("You do not have access to this workspace")
+    return WorkspaceAccess(workspace_id, user.id)
@@ -1,19 +1,31 @@
+from typing import Optional
+
+from src.application.use_cases.audit.recorder import AuditRecorder, NullAuditRecorder
 from src.application.use_cases.budget.create.dtos import CreateBudgetRequestDto
+from src.domain.audit.models import AuditEvent
+from src.domain.audit.value_objects import AuditAction
 from src.domain.auth.models import User
 from src.domain.budget.models import Budget
 from src.domain.budget.repositories import BudgetRepository, CategoryRepository
 from src.domain.errors import ConflictError, UnauthorizedError, NotFoundError
 from src.domain.workspace.repositories import WorkspaceRepository
+from src.infrastructure.observability import instrumented
 
 
 class CreateBudget:
     def __init__(
-        self, budget_repo: BudgetRepository, workspace_repo: WorkspaceRepository, category_repo: CategoryRepository
+        self,
+        budget_repo: BudgetRepository,
+        workspace_repo: WorkspaceRepository,
+        category_repo: CategoryRepository,
+        audit: Optional[AuditRecorder] = None,
     ):
         self._budget_repo = budget_repo
         self._workspace_repo = workspace_repo
         self._category_repo = category_repo
+        self._audit = audit or NullAuditRecorder()
 
+    @instrumented
     async def execute(self, user: User, data: CreateBudgetRequestDto) -> Budget:
         member = await self._workspace_repo.get_member(data.workspace_id, user.id)
         if not member:
@@ -46,4 +58,18 @@ class CreateBudget:
         )
 
         await self._budget_repo.add(budget)
+        self._audit.record(
+            AuditEvent(
+                workspace_id=budget.workspace_id,
+                actor_id=user.id,
+                action=AuditAction.BUDGET_CREATED,
+                target_id=budget.id,
+                details={
+                    "category_id": str(budget.category_id),
+                    "limit_amount": budget.limit_amount,
+                    "month": budget.month,
+                    "year": budget.year,
+                },
+            )
+        )
         return budget
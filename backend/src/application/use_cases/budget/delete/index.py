@@ -1,19 +1,29 @@
+from typing import Optional
 from uuid import UUID
 
+from src.application.use_cases.audit.recorder import AuditRecorder, NullAuditRecorder
+from src.domain.audit.models import AuditEvent
+from src.domain.audit.value_objects import AuditAction
 from src.domain.auth.models import User
 from src.domain.budget.repositories import BudgetRepository
 from src.domain.errors import NotFoundError, UnauthorizedError
 from src.domain.workspace.repositories import WorkspaceRepository
 from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.observability import instrumented
 
 
 class DeleteBudget:
     def __init__(
-        self, budget_repo: BudgetRepository, workspace_repo: WorkspaceRepository
+        self,
+        budget_repo: BudgetRepository,
+        workspace_repo: WorkspaceRepository,
+        audit: Optional[AuditRecorder] = None,
     ):
         self._budget_repo = budget_repo
         self._workspace_repo = workspace_repo
+        self._audit = audit or NullAuditRecorder()
 
+    @instrumented
     async def execute(self, budget_id: UUID, user: User) -> None:
         budget = await self._budget_repo.get_by_id(budget_id)
         if not budget:
@@ -35,3 +45,16 @@ class DeleteBudget:
 
         budget.delete()
         await self._budget_repo.remove(budget)
+        self._audit.record(
+            AuditEvent(
+                workspace_id=budget.workspace_id,
+                actor_id=user.id,
+                action=AuditAction.BUDGET_DELETED,
+                target_id=budget.id,
+                details={
+                    "category_id": str(budget.category_id),
+                    "month": budget.month,
+                    "year": budget.year,
+                },
+            )
+        )
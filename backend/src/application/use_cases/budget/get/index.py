@@ -6,6 +6,7 @@ from src.domain.budget.models import Budget
 from src.domain.budget.repositories import BudgetRepository
 from src.domain.errors import NotFoundError, UnauthorizedError
 from src.domain.workspace.repositories import WorkspaceRepository
+from src.infrastructure.observability import instrumented
 
 
 class GetBudget:
@@ -19,6 +20,7 @@ class GetBudget:
         self._workspace_repo = workspace_repo
         self._movement_service = movement_service
 
+    @instrumented
     async def execute(self, budget_id: UUID, user: User) -> tuple[Budget, float, float]:
         budget = await self._budget_repo.get_by_id(budget_id)
         if not budget:
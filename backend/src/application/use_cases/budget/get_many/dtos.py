@@ -0,0 +1,15 @@
+import os
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.application.use_cases.budget.create.dtos import BudgetResponseDto
+
+BUDGET_BATCH_MAX_IDS = int(os.getenv("BUDGET_BATCH_MAX_IDS", "100"))
+
+
+class GetBudgetsResponseDto(BaseModel):
+    items: List[BudgetResponseDto]
+    # Requested ids that do not exist or belong to a workspace the user cannot see
+    missing: List[UUID]
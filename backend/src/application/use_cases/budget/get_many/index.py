@@ -0,0 +1,64 @@
+from typing import Dict, List, Sequence, Tuple
+from uuid import UUID
+
+from src.application.use_cases.budget.movement_service import MovementService
+from src.domain.auth.models import User
+from src.domain.budget.models import Budget
+from src.domain.budget.repositories import BudgetRepository
+from src.domain.workspace.repositories import WorkspaceRepository
+from src.infrastructure.observability import instrumented
+
+
+class GetBudgets:
+    """Batch version of ``GetBudget``.
+
+    Loads every budget in one query, checks access to all their distinct
+    workspaces in another and asks the movement service for all spends in
+    one call.
+    Budgets the user cannot see are reported as missing rather than
+    forbidden, so the response does not reveal that they exist.
+    """
+
+    def __init__(
+        self,
+        budget_repo: BudgetRepository,
+        workspace_repo: WorkspaceRepository,
+        movement_service: MovementService,
+    ):
+        self._budget_repo = budget_repo
+        self._workspace_repo = workspace_repo
+        self._movement_service = movement_service
+
+    @instrumented
+    async def execute(
+        self, budget_ids: Sequence[UUID], user: User
+    ) -> Tuple[List[Tuple[Budget, float, float]], List[UUID]]:
+        ids = list(dict.fromkeys(budget_ids))
+        found: Dict[UUID, Budget] = {
+            budget.id: budget for budget in await self._budget_repo.get_by_ids(ids)
+        }
+
+        accessible = await self._workspace_repo.get_accessible_workspace_ids(
+            user.id, {budget.workspace_id for budget in found.values()}
+        )
+        budgets = [
+            found[id] for id in ids if id in found and found[id].workspace_id in accessible
+        ]
+
+        spent = await self._movement_service.get_spent_amounts(
+            {(b.workspace_id, b.category_id, b.month, b.year) for b in budgets}
+        )
+        results = []
+        for budget in budgets:
+            spent_amount = spent[
+                (budget.workspace_id, budget.category_id, budget.month, budget.year)
+            ]
+            progress = (
+                (spent_amount / budget.limit_amount) * 100
+                if budget.limit_amount > 0
+                else 0
+            )
+            results.append((budget, spent_amount, round(progress, 2)))
+
+        returned = {budget.id for budget in budgets}
+        return results, [id for id in ids if id not in returned]
@@ -1,44 +1,52 @@
 from typing import List, Optional, Tuple
 from uuid import UUID
 
+from src.application.use_cases.budget.access import WorkspaceAccess
 from src.application.use_cases.budget.movement_service import MovementService
-from src.domain.auth.models import User
 from src.domain.budget.models import Budget
 from src.domain.budget.repositories import BudgetRepository
-from src.domain.errors import UnauthorizedError
-from src.domain.workspace.repositories import WorkspaceRepository
+from src.domain.budget.value_objects import BudgetSort
+from src.infrastructure.observability import instrumented
 
 
 class ListBudgets:
     def __init__(
         self,
         budget_repo: BudgetRepository,
-        workspace_repo: WorkspaceRepository,
         movement_service: MovementService,
     ):
         self._budget_repo = budget_repo
-        self._workspace_repo = workspace_repo
         self._movement_service = movement_service
 
+    @instrumented
     async def execute(
         self,
-        user: User,
-        workspace_id: UUID,
+        access: WorkspaceAccess,
         category_id: Optional[UUID] = None,
         month: Optional[int] = None,
         year: Optional[int] = None,
         page: int = 1,
         size: int = 20,
+        *,
+        period_from: Optional[int] = None,
+        period_to: Optional[int] = None,
+        min_limit: Optional[float] = None,
+        max_limit: Optional[float] = None,
+        sort: Optional[BudgetSort] = None,
     ) -> Tuple[List[Tuple[Budget, float, float]], int]:
-        member = await self._workspace_repo.get_member(workspace_id, user.id)
-        if not member:
-            workspace = await self._workspace_repo.get_by_id(workspace_id)
-            if not workspace or workspace.owner_id != user.id:
-                raise UnauthorizedError("You do not have access to this workspace")
-
         offset = (page - 1) * size
         budgets, total = await self._budget_repo.list_by_workspace(
-            workspace_id, category_id, month, year, size, offset
+            access.workspace_id,
+            category_id,
+            month,
+            year,
+            size,
+            offset,
+            period_from=period_from,
+            period_to=period_to,
+            min_limit=min_limit,
+            max_limit=max_limit,
+            sort=sort,
         )
 
         results = []
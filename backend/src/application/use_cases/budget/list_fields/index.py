@@ -0,0 +1,87 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from src.application.use_cases.budget.access import WorkspaceAccess
+from src.application.use_cases.budget.movement_service import MovementService
+from src.domain.budget.repositories import BudgetRepository
+from src.domain.budget.value_objects import BudgetSort
+from src.infrastructure.observability import instrumented
+
+# Derived per row from the movements of the budget's category and period
+COMPUTED_FIELDS = ("spent_amount", "progress_percentage")
+COMPUTED_FIELD_INPUTS = ("workspace_id", "category_id", "limit_amount", "month", "year")
+
+
+class ListBudgetFields:
+    """Lists budgets reading only the requested fields.
+
+    Only the columns behind ``fields`` are selected, and the movements are
+    looked up, in one batch for the page, only when a computed field is
+    among them.
+    """
+
+    def __init__(
+        self,
+        budget_repo: BudgetRepository,
+        movement_service: MovementService,
+    ):
+        self._budget_repo = budget_repo
+        self._movement_service = movement_service
+
+    @instrumented
+    async def execute(
+        self,
+        access: WorkspaceAccess,
+        fields: Sequence[str],
+        category_id: Optional[UUID] = None,
+        month: Optional[int] = None,
+        year: Optional[int] = None,
+        page: int = 1,
+        size: int = 20,
+        *,
+        period_from: Optional[int] = None,
+        period_to: Optional[int] = None,
+        min_limit: Optional[float] = None,
+        max_limit: Optional[float] = None,
+        sort: Optional[BudgetSort] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        computed = any(field in COMPUTED_FIELDS for field in fields)
+        columns = [field for field in fields if field not in COMPUTED_FIELDS]
+        if computed:
+            columns += [c for c in COMPUTED_FIELD_INPUTS if c not in columns]
+
+        offset = (page - 1) * size
+        rows, total = await self._budget_repo.list_columns_by_workspace(
+            access.workspace_id,
+            columns,
+            category_id,
+            month,
+            year,
+            size,
+            offset,
+            period_from=period_from,
+            period_to=period_to,
+            min_limit=min_limit,
+            max_limit=max_limit,
+            sort=sort,
+        )
+        if not computed:
+            return rows, total
+
+        spent_amounts = await self._movement_service.get_spent_amounts(
+            {
+                (row["workspace_id"], row["category_id"], row["month"], row["year"])
+                for row in rows
+            }
+        )
+        results = []
+        for row in rows:
+            spent = spent_amounts[
+                (row["workspace_id"], row["category_id"], row["month"], row["year"])
+            ]
+            progress = (
+                (spent / row["limit_amount"]) * 100 if row["limit_amount"] > 0 else 0
+            )
+            row.update(spent_amount=spent, progress_percentage=round(progress, 2))
+            results.append({field: row[field] for field in fields})
+        return results, total
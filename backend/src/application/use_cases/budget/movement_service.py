@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Tuple
 from uuid import UUID
 
+# (workspace_id, category_id, month, year)
+SpendPeriod = Tuple[UUID, UUID, int, int]
+
 
 class MovementService(ABC):
     @abstractmethod
@@ -9,9 +13,20 @@ class MovementService(ABC):
     ) -> float:
         """Calculates the sum of all expense movements for a category in a period."""
 
+    @abstractmethod
+    async def get_spent_amounts(
+        self, periods: Iterable[SpendPeriod]
+    ) -> Dict[SpendPeriod, float]:
+        """Same as ``get_spent_amount`` for several periods in one call."""
+
 
 class MockMovementService(MovementService):
     async def get_spent_amount(
         self, workspace_id: UUID, category_id: UUID, month: int, year: int
     ) -> float:
         return 0.0
+
+    async def get_spent_amounts(
+        self, periods: Iterable[SpendPeriod]
+    ) -> Dict[SpendPeriod, float]:
+        return {period: 0.0 for period in periods}
@@ -1,12 +1,17 @@
+from typing import Optional
 from uuid import UUID
 
+from src.application.use_cases.audit.recorder import AuditRecorder, NullAuditRecorder
 from src.application.use_cases.budget.movement_service import MovementService
+from src.domain.audit.models import AuditEvent
+from src.domain.audit.value_objects import AuditAction
 from src.domain.auth.models import User
 from src.domain.budget.models import Budget
 from src.domain.budget.repositories import BudgetRepository
 from src.domain.errors import NotFoundError, UnauthorizedError
 from src.domain.workspace.repositories import WorkspaceRepository
 from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.observability import instrumented
 
 
 class UpdateBudget:
@@ -15,11 +20,14 @@ class UpdateBudget:
         budget_repo: BudgetRepository,
         workspace_repo: WorkspaceRepository,
         movement_service: MovementService,
+        audit: Optional[AuditRecorder] = None,
     ):
         self._budget_repo = budget_repo
         self._workspace_repo = workspace_repo
         self._movement_service = movement_service
+        self._audit = audit or NullAuditRecorder()
 
+    @instrumented
     async def execute(
         self, budget_id: UUID, user: User, limit_amount: float
     ) -> tuple[Budget, float, float]:
@@ -41,8 +49,21 @@ class UpdateBudget:
         ]:
             raise UnauthorizedError("Only editors or owners can update budgets")
 
+        previous_limit = budget.limit_amount
         budget.update_limit(limit_amount)
         await self._budget_repo.update(budget)
+        self._audit.record(
+            AuditEvent(
+                workspace_id=budget.workspace_id,
+                actor_id=user.id,
+                action=AuditAction.BUDGET_UPDATED,
+                target_id=budget.id,
+                details={
+                    "previous_limit_amount": previous_limit,
+                    "limit_amount": budget.limit_amount,
+                },
+            )
+        )
 
         spent = await self._movement_service.get_spent_amount(
             budget.workspace_id, budget.category_id, budget.month, budget.year
@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from src.application.use_cases.budget.access import (
+    WorkspaceAccess,
+    check_workspace_access,
+)
+from src.domain.auth.models import User
+from src.domain.budget.repositories import BudgetRepository
+from src.domain.workspace.repositories import WorkspaceRepository
+from src.infrastructure.observability import instrumented
+
+
+class GetBudgetListVersion:
+    """Returns the version of a budget list scope without loading any budget.
+
+    Spent amounts come from the movement service and are not part of the
+    version. The checked access is returned with it, for the list use cases
+    to read the page with.
+    """
+
+    def __init__(
+        self,
+        budget_repo: BudgetRepository,
+        workspace_repo: WorkspaceRepository,
+    ):
+        self._budget_repo = budget_repo
+        self._workspace_repo = workspace_repo
+
+    @instrumented
+    async def execute(
+        self,
+        user: User,
+        workspace_id: UUID,
+        category_id: Optional[UUID] = None,
+        month: Optional[int] = None,
+        year: Optional[int] = None,
+        *,
+        period_from: Optional[int] = None,
+        period_to: Optional[int] = None,
+    ) -> Tuple[Tuple[Optional[datetime], int], WorkspaceAccess]:
+        access = await check_workspace_access(self._workspace_repo, user, workspace_id)
+        version = await self._budget_repo.get_list_version(
+            workspace_id,
+            category_id,
+            month,
+            year,
+            period_from=period_from,
+            period_to=period_to,
+        )
+        return version, access
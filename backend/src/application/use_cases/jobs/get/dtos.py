@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+from src.domain.jobs.value_objects import JobKind, JobStatus
+
+
+class JobResponseDto(BaseModel):
+    id: UUID
+    kind: JobKind
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    last_error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,20 @@
+from uuid import UUID
+
+from src.domain.auth.models import User
+from src.domain.errors import NotFoundError
+from src.domain.jobs.models import Job
+from src.domain.jobs.repositories import JobRepository
+from src.infrastructure.observability import instrumented
+
+
+class GetJob:
+    def __init__(self, job_repo: JobRepository):
+        self._repo = job_repo
+
+    @instrumented
+    async def execute(self, job_id: UUID, user: User) -> Job:
+        job = await self._repo.get_by_id(job_id)
+        # Other users' jobs are reported as missing rather than forbidden
+        if not job or job.created_by != user.id:
+            raise NotFoundError("Job not found")
+        return job
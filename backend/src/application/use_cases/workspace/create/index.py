@@ -4,12 +4,14 @@ from src.domain.auth.models import User
 from src.domain.workspace.models import Workspace, WorkspaceMember
 from src.domain.workspace.repositories import WorkspaceRepository
 from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.observability import instrumented
 
 
 class CreateWorkspace:
     def __init__(self, workspace_repo: WorkspaceRepository):
         self._repo = workspace_repo
 
+    @instrumented
     async def execute(self, user: User, data: CreateWorkspaceRequestDto) -> Workspace:
         existing = await self._repo.get_by_name_and_owner(data.name, user.id)
         if existing:
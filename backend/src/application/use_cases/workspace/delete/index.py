@@ -1,15 +1,37 @@
+from typing import Optional
 from uuid import UUID
 
+from src.application.use_cases.audit.recorder import AuditRecorder, NullAuditRecorder
+from src.domain.audit.models import AuditEvent
+from src.domain.audit.value_objects import AuditAction
 from src.domain.auth.models import User
 from src.domain.errors import UnauthorizedError, WorkspaceNotFoundError
+from src.domain.jobs.models import Job
+from src.domain.jobs.repositories import JobRepository
+from src.domain.jobs.value_objects import JobKind
 from src.domain.workspace.repositories import WorkspaceRepository
+from src.infrastructure.observability import instrumented
 
 
 class DeleteWorkspace:
-    def __init__(self, workspace_repo: WorkspaceRepository):
+    """Soft-deletes the workspace and queues the purge of its data.
+
+    The workspace disappears from reads at once; PurgeWorkspace removes the
+    rows later from the job queue.
+    """
+
+    def __init__(
+        self,
+        workspace_repo: WorkspaceRepository,
+        job_repo: JobRepository,
+        audit: Optional[AuditRecorder] = None,
+    ):
         self._repo = workspace_repo
+        self._job_repo = job_repo
+        self._audit = audit or NullAuditRecorder()
 
-    async def execute(self, workspace_id: UUID, user: User) -> None:
+    @instrumented
+    async def execute(self, workspace_id: UUID, user: User) -> Job:
         workspace = await self._repo.get_by_id(workspace_id)
         if not workspace:
             raise WorkspaceNotFoundError("Workspace not found")
@@ -17,4 +39,22 @@ class DeleteWorkspace:
         if workspace.owner_id != user.id:
             raise UnauthorizedError("Only the workspace owner can delete the workspace")
 
-        await self._repo.remove(workspace)
+        workspace.delete()
+        await self._repo.update(workspace)
+
+        job = Job(
+            kind=JobKind.DELETE_WORKSPACE,
+            payload={"workspace_id": str(workspace_id)},
+            created_by=user.id,
+        )
+        await self._job_repo.add(job)
+        self._audit.record(
+            AuditEvent(
+                workspace_id=workspace_id,
+                actor_id=user.id,
+                action=AuditAction.WORKSPACE_DELETED,
+                target_id=workspace_id,
+                details={"job_id": str(job.id)},
+            )
+        )
+        return job
@@ -4,12 +4,14 @@ from src.domain.auth.models import User
 from src.domain.errors import UnauthorizedError, WorkspaceNotFoundError
 from src.domain.workspace.models import Workspace
 from src.domain.workspace.repositories import WorkspaceRepository
+from src.infrastructure.observability import instrumented
 
 
 class GetWorkspace:
     def __init__(self, workspace_repo: WorkspaceRepository):
         self._repo = workspace_repo
 
+    @instrumented
     async def execute(self, workspace_id: UUID, user: User) -> Workspace:
         workspace = await self._repo.get_by_id(workspace_id)
         if not workspace:
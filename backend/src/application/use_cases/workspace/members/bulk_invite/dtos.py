@@ -0,0 +1,33 @@
+import os
+from enum import Enum
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.domain.workspace.value_objects import WorkspaceRole
+
+BULK_INVITE_MAX_EMAILS = int(os.getenv("BULK_INVITE_MAX_EMAILS", "100"))
+
+
+class BulkInviteStatus(str, Enum):
+    INVITED = "invited"
+    ALREADY_MEMBER = "already_member"
+    OWNER = "owner"
+    NOT_FOUND = "not_found"
+    INVALID_EMAIL = "invalid_email"
+
+
+class BulkInviteMembersRequestDto(BaseModel):
+    emails: List[str] = Field(..., min_length=1, max_length=BULK_INVITE_MAX_EMAILS)
+    role: WorkspaceRole = WorkspaceRole.VIEWER
+
+
+class BulkInviteResultDto(BaseModel):
+    email: str
+    status: BulkInviteStatus
+    user_id: Optional[UUID] = None
+
+
+class BulkInviteMembersResponseDto(BaseModel):
+    results: List[BulkInviteResultDto]
@@ -0,0 +1,128 @@
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from src.application.use_cases.audit.recorder import AuditRecorder, NullAuditRecorder
+from src.application.use_cases.workspace.members.bulk_invite.dtos import (
+    BulkInviteMembersRequestDto,
+    BulkInviteMembersResponseDto,
+    BulkInviteResultDto,
+    BulkInviteStatus,
+)
+from src.domain.audit.models import AuditEvent
+from src.domain.audit.value_objects import AuditAction
+from src.domain.auth.models import User
+from src.domain.auth.repositories import UserRepository
+from src.domain.auth.value_objects import Email
+from src.domain.errors import (
+    UnauthorizedError,
+    ValidationError,
+    WorkspaceNotFoundError,
+)
+from src.domain.workspace.models import Workspace, WorkspaceMember
+from src.domain.workspace.repositories import WorkspaceRepository
+from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.observability import instrumented
+
+
+class BulkInviteMembers:
+    """Invites many users at once with a fixed number of queries.
+
+    Emails are resolved with one ``IN`` query, existing memberships with
+    another, and the new members are written in a single insert that skips
+    conflicts, so a concurrent invite of the same user is reported as
+    ``already_member`` instead of failing the batch.
+    """
+
+    def __init__(
+        self,
+        workspace_repo: WorkspaceRepository,
+        user_repo: UserRepository,
+        audit: Optional[AuditRecorder] = None,
+    ):
+        self._workspace_repo = workspace_repo
+        self._user_repo = user_repo
+        self._audit = audit or NullAuditRecorder()
+
+    @instrumented
+    async def execute(
+        self,
+        workspace_id: UUID,
+        current_user: User,
+        data: BulkInviteMembersRequestDto,
+    ) -> BulkInviteMembersResponseDto:
+        if data.role == WorkspaceRole.OWNER:
+            raise ValidationError("Cannot assign OWNER role via invitation")
+
+        workspace = await self._workspace_repo.get_by_id(workspace_id)
+        if not workspace:
+            raise WorkspaceNotFoundError("Workspace not found")
+
+        if workspace.owner_id != current_user.id:
+            inviter = await self._workspace_repo.get_member(
+                workspace_id, current_user.id
+            )
+            if not inviter or inviter.role != WorkspaceRole.ADMIN:
+                raise UnauthorizedError("Insufficient permissions to invite members")
+
+        emails = list(dict.fromkeys(data.emails))
+        invalid, users = await self._resolve(emails)
+        existing = await self._workspace_repo.get_member_user_ids(
+            workspace_id, [user.id for user in users.values()]
+        )
+
+        candidates = [
+            WorkspaceMember(workspace_id=workspace.id, user_id=user.id, role=data.role)
+            for user in users.values()
+            if user.id != workspace.owner_id and user.id not in existing
+        ]
+        added = await self._workspace_repo.add_members(candidates)
+        for member in candidates:
+            if member.user_id in added:
+                self._audit.record(
+                    AuditEvent(
+                        workspace_id=workspace.id,
+                        actor_id=current_user.id,
+                        action=AuditAction.MEMBER_INVITED,
+                        target_id=member.user_id,
+                        details={"role": member.role.value},
+                    )
+                )
+
+        results = []
+        for email in emails:
+            user = users.get(email)
+            results.append(
+                BulkInviteResultDto(
+                    email=email,
+                    status=self._status(email in invalid, user, workspace, added),
+                    user_id=user.id if user else None,
+                )
+            )
+        return BulkInviteMembersResponseDto(results=results)
+
+    async def _resolve(self, emails: List[str]) -> Tuple[Set[str], Dict[str, User]]:
+        """Returns the invalid emails and the users of the valid ones by email."""
+        invalid: Set[str] = set()
+        valid: List[Email] = []
+        for email in emails:
+            try:
+                valid.append(Email(email))
+            except ValidationError:
+                invalid.add(email)
+
+        users = await self._user_repo.list_by_emails(valid)
+        return invalid, {user.email.value: user for user in users}
+
+    @staticmethod
+    def _status(
+        invalid: bool, user: Optional[User], workspace: Workspace, added: Set[UUID]
+    ) -> BulkInviteStatus:
+        if invalid:
+            return BulkInviteStatus.INVALID_EMAIL
+        if user is None:
+            return BulkInviteStatus.NOT_FOUND
+        if user.id == workspace.owner_id:
+            return BulkInviteStatus.OWNER
+        if user.id in added:
+            return BulkInviteStatus.INVITED
+        return BulkInviteStatus.ALREADY_MEMBER
@@ -1,8 +1,12 @@
+from typing import Optional
 from uuid import UUID
 
+from src.application.use_cases.audit.recorder import AuditRecorder, NullAuditRecorder
 from src.application.use_cases.workspace.members.invite.dtos import (
     InviteMemberRequestDto,
 )
+from src.domain.audit.models import AuditEvent
+from src.domain.audit.value_objects import AuditAction
 from src.domain.auth.models import User
 from src.domain.auth.repositories import UserRepository
 from src.domain.auth.value_objects import Email
@@ -15,13 +19,21 @@ from src.domain.errors import (
 from src.domain.workspace.models import WorkspaceMember
 from src.domain.workspace.repositories import WorkspaceRepository
 from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.observability import instrumented
 
 
 class InviteMember:
-    def __init__(self, workspace_repo: WorkspaceRepository, user_repo: UserRepository):
+    def __init__(
+        self,
+        workspace_repo: WorkspaceRepository,
+        user_repo: UserRepository,
+        audit: Optional[AuditRecorder] = None,
+    ):
         self._workspace_repo = workspace_repo
         self._user_repo = user_repo
+        self._audit = audit or NullAuditRecorder()
 
+    @instrumented
     async def execute(
         self, workspace_id: UUID, current_user: User, data: InviteMemberRequestDto
     ) -> WorkspaceMember:
@@ -68,4 +80,13 @@ class InviteMember:
         )
 
         await self._workspace_repo.add_member(new_member)
+        self._audit.record(
+            AuditEvent(
+                workspace_id=workspace.id,
+                actor_id=current_user.id,
+                action=AuditAction.MEMBER_INVITED,
+                target_id=new_member.user_id,
+                details={"role": new_member.role.value},
+            )
+        )
         return new_member
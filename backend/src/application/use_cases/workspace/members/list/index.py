@@ -5,12 +5,14 @@ from src.domain.auth.models import User
 from src.domain.errors import UnauthorizedError, WorkspaceNotFoundError
 from src.domain.workspace.models import WorkspaceMember
 from src.domain.workspace.repositories import WorkspaceRepository
+from src.infrastructure.observability import instrumented
 
 
 class ListMembers:
     def __init__(self, workspace_repo: WorkspaceRepository):
         self._repo = workspace_repo
 
+    @instrumented
     async def execute(
         self, workspace_id: UUID, current_user: User
     ) -> List[WorkspaceMember]:
@@ -9,12 +9,14 @@ from src.domain.errors import (
 )
 from src.domain.workspace.repositories import WorkspaceRepository
 from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.observability import instrumented
 
 
 class RemoveMember:
     def __init__(self, workspace_repo: WorkspaceRepository):
         self._repo = workspace_repo
 
+    @instrumented
     async def execute(
         self, workspace_id: UUID, member_user_id: UUID, current_user: User
     ) -> None:
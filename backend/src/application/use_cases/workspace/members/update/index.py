@@ -1,8 +1,12 @@
+from typing import Optional
 from uuid import UUID
 
+from src.application.use_cases.audit.recorder import AuditRecorder, NullAuditRecorder
 from src.application.use_cases.workspace.members.update.dtos import (
     UpdateMemberRoleRequestDto,
 )
+from src.domain.audit.models import AuditEvent
+from src.domain.audit.value_objects import AuditAction
 from src.domain.auth.models import User
 from src.domain.errors import (
     MemberNotFoundError,
@@ -13,12 +17,17 @@ from src.domain.errors import (
 from src.domain.workspace.models import WorkspaceMember
 from src.domain.workspace.repositories import WorkspaceRepository
 from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.observability import instrumented
 
 
 class UpdateMemberRole:
-    def __init__(self, workspace_repo: WorkspaceRepository):
+    def __init__(
+        self, workspace_repo: WorkspaceRepository, audit: Optional[AuditRecorder] = None
+    ):
         self._repo = workspace_repo
+        self._audit = audit or NullAuditRecorder()
 
+    @instrumented
     async def execute(
         self,
         workspace_id: UUID,
@@ -54,6 +63,19 @@ class UpdateMemberRole:
                 "Cannot assign OWNER role via update. Transfer ownership instead."
             )
 
+        previous_role = member.role
         member.change_role(data.role)
         await self._repo.update_member(member)
+        self._audit.record(
+            AuditEvent(
+                workspace_id=workspace_id,
+                actor_id=current_user.id,
+                action=AuditAction.MEMBER_ROLE_UPDATED,
+                target_id=member_user_id,
+                details={
+                    "previous_role": previous_role.value,
+                    "role": member.role.value,
+                },
+            )
+        )
         return member
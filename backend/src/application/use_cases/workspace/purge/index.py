@@ -0,0 +1,49 @@
+from uuid import UUID
+
+from src.domain.budget.repositories import BudgetRepository, CategoryRepository
+from src.domain.errors import ValidationError
+from src.domain.workspace.repositories import WorkspaceRepository
+from src.infrastructure.observability import instrumented
+
+
+class PurgeWorkspace:
+    """Removes a soft-deleted workspace one bounded batch at a time.
+
+    Each call deletes at most ``batch_size`` budgets, custom categories or
+    members, in that order, and returns False while rows remain. The call
+    that finds nothing left deletes the workspace row and returns True.
+    Runs from the job queue, so a workspace that is already gone counts as
+    purged and a retried job can still finish.
+    """
+
+    def __init__(
+        self,
+        workspace_repo: WorkspaceRepository,
+        budget_repo: BudgetRepository,
+        category_repo: CategoryRepository,
+    ):
+        self._workspace_repo = workspace_repo
+        self._budget_repo = budget_repo
+        self._category_repo = category_repo
+
+    @instrumented
+    async def execute(self, workspace_id: UUID, batch_size: int) -> bool:
+        workspace = await self._workspace_repo.get_by_id(
+            workspace_id, include_deleted=True
+        )
+        if not workspace:
+            return True
+        if workspace.deleted_at is None:
+            raise ValidationError("Only deleted workspaces can be purged")
+
+        # Budgets reference categories, so they have to go first
+        for remove_batch in (
+            self._budget_repo.remove_by_workspace_batch,
+            self._category_repo.remove_by_workspace_batch,
+            self._workspace_repo.remove_members_batch,
+        ):
+            if await remove_batch(workspace_id, batch_size):
+                return False
+
+        await self._workspace_repo.remove(workspace)
+        return True
@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import List
+
+from src.domain.jobs.models import Job
+from src.domain.jobs.repositories import JobRepository
+from src.domain.jobs.value_objects import JobKind, JobStatus
+from src.domain.workspace.repositories import WorkspaceRepository
+from src.infrastructure.observability import instrumented
+
+# Statuses of a purge job that make queueing another one pointless
+_HANDLED = (JobStatus.QUEUED, JobStatus.RUNNING, JobStatus.FAILED)
+
+
+class ReconcileWorkspacePurges:
+    """Queues the purge of deleted workspaces that have no purge job pending.
+
+    With sharding, DeleteWorkspace writes the soft-delete to the workspace's
+    shard and the job to the primary, and the two commit independently; if
+    the job is lost the workspace stays hidden and is never purged. Only
+    workspaces deleted before ``deleted_before`` are considered, so a
+    deletion still in flight is left alone. Purging is idempotent, so a
+    duplicate job is harmless. A purge that failed has run out of attempts
+    and would fail again, so it is left for an operator to look at.
+    """
+
+    def __init__(self, workspace_repo: WorkspaceRepository, job_repo: JobRepository):
+        self._workspace_repo = workspace_repo
+        self._job_repo = job_repo
+
+    @instrumented
+    async def execute(self, deleted_before: datetime) -> List[Job]:
+        deleted = await self._workspace_repo.list_deleted_ids(deleted_before)
+        if not deleted:
+            return []
+        pending = {
+            payload.get("workspace_id")
+            for payload in await self._job_repo.list_payloads(
+                JobKind.DELETE_WORKSPACE, _HANDLED
+            )
+        }
+        jobs = [
+            Job(
+                kind=JobKind.DELETE_WORKSPACE,
+                payload={"workspace_id": str(workspace_id)},
+            )
+            for workspace_id in deleted
+            if str(workspace_id) not in pending
+        ]
+        for job in jobs:
+            await self._job_repo.add(job)
+        return jobs
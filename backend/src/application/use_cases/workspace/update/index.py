@@ -6,12 +6,14 @@ from src.domain.errors import ConflictError, UnauthorizedError, WorkspaceNotFoun
 from src.domain.workspace.models import Workspace
 from src.domain.workspace.repositories import WorkspaceRepository
 from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.observability import instrumented
 
 
 class UpdateWorkspace:
     def __init__(self, workspace_repo: WorkspaceRepository):
         self._repo = workspace_repo
 
+    @instrumented
     async def execute(
         self, workspace_id: UUID, user: User, data: UpdateWorkspaceRequestDto
     ) -> Workspace:
@@ -0,0 +1,15 @@
+from datetime import datetime
+from typing import Optional, Tuple
+
+from src.domain.auth.models import User
+from src.domain.workspace.repositories import WorkspaceRepository
+from src.infrastructure.observability import instrumented
+
+
+class GetWorkspaceListVersion:
+    def __init__(self, workspace_repo: WorkspaceRepository):
+        self._repo = workspace_repo
+
+    @instrumented
+    async def execute(self, user: User) -> Tuple[Optional[datetime], int]:
+        return await self._repo.get_list_version(user.id)
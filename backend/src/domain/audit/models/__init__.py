@@ -0,0 +1,3 @@
+from .audit_event import AuditEvent
+
+__all__ = ["AuditEvent"]
@@ -0,0 +1,57 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from src.domain.audit.value_objects import AuditAction
+from src.domain.base import Entity
+
+
+class AuditEvent(Entity):
+    """A record of a change made to a workspace.
+
+    Events are immutable once recorded. ``target_id`` is the budget, member
+    or workspace the action applied to and ``details`` holds whatever the
+    action needs to be read back later, such as the old and new values.
+    """
+
+    def __init__(
+        self,
+        workspace_id: UUID,
+        action: AuditAction,
+        target_id: UUID,
+        actor_id: Optional[UUID] = None,
+        details: Optional[Dict[str, Any]] = None,
+        occurred_at: Optional[datetime] = None,
+        id: Optional[UUID] = None,
+    ):
+        super().__init__(id)
+        self._workspace_id = workspace_id
+        self._action = AuditAction(action)
+        self._target_id = target_id
+        self._actor_id = actor_id
+        self._details = details or {}
+        self._occurred_at = occurred_at or datetime.now(timezone.utc)
+
+    @property
+    def workspace_id(self) -> UUID:
+        return self._workspace_id
+
+    @property
+    def action(self) -> AuditAction:
+        return self._action
+
+    @property
+    def target_id(self) -> UUID:
+        return self._target_id
+
+    @property
+    def actor_id(self) -> Optional[UUID]:
+        return self._actor_id
+
+    @property
+    def details(self) -> Dict[str, Any]:
+        return self._details
+
+    @property
+    def occurred_at(self) -> datetime:
+        return self._occurred_at
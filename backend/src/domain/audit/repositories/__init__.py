@@ -0,0 +1,3 @@
+from .audit_event import AuditCursor, AuditEventRepository
+
+__all__ = ["AuditCursor", "AuditEventRepository"]
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from src.domain.audit.models import AuditEvent
+
+# (occurred_at, id) of the last event of the previous page
+AuditCursor = Tuple[datetime, UUID]
+
+
+class AuditEventRepository(ABC):
+    @abstractmethod
+    async def add_many(self, events: Sequence[AuditEvent]) -> None:
+        """Writes all the events in a single statement."""
+        pass
+
+    @abstractmethod
+    async def list_by_workspace(
+        self, workspace_id: UUID, limit: int, before: Optional[AuditCursor] = None
+    ) -> List[AuditEvent]:
+        """Newest first, starting after ``before`` when given."""
+        pass
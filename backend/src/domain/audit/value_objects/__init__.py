@@ -0,0 +1,3 @@
+from .action import AuditAction
+
+__all__ = ["AuditAction"]
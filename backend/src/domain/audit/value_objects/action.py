@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class AuditAction(str, Enum):
+    BUDGET_CREATED = "budget.created"
+    BUDGET_UPDATED = "budget.updated"
+    BUDGET_DELETED = "budget.deleted"
+    MEMBER_INVITED = "member.invited"
+    MEMBER_ROLE_UPDATED = "member.role_updated"
+    WORKSPACE_DELETED = "workspace.deleted"
@@ -1,3 +1,4 @@
+from .revoked_token import RevokedToken
 from .user import User
 
-__all__ = ["User"]
+__all__ = ["RevokedToken", "User"]
@@ -0,0 +1,31 @@
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from src.domain.base import Entity
+
+
+class RevokedToken(Entity):
+    """A token that must no longer be accepted, identified by its ``jti``.
+
+    The record is only needed until ``expires_at``; after that the token is
+    rejected on its expiry alone.
+    """
+
+    def __init__(
+        self,
+        id: UUID,
+        expires_at: datetime,
+        revoked_at: Optional[datetime] = None,
+    ):
+        super().__init__(id)
+        self._expires_at = expires_at
+        self._revoked_at = revoked_at or datetime.now(timezone.utc)
+
+    @property
+    def expires_at(self) -> datetime:
+        return self._expires_at
+
+    @property
+    def revoked_at(self) -> datetime:
+        return self._revoked_at
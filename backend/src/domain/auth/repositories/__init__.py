@@ -1,3 +1,4 @@
+from .revoked_token import RevokedTokenRepository
 from .user import UserRepository
 
-__all__ = ["UserRepository"]
+__all__ = ["RevokedTokenRepository", "UserRepository"]
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from src.domain.auth.models import RevokedToken
+
+
+class RevokedTokenRepository(ABC):
+    @abstractmethod
+    async def revoke(self, token: RevokedToken) -> bool:
+        """Records a revocation; False if the token was already revoked."""
+        pass
+
+    @abstractmethod
+    async def is_revoked(self, id: UUID) -> bool:
+        pass
+
+    @abstractmethod
+    async def list_revoked(self, since: Optional[datetime] = None) -> List[RevokedToken]:
+        """Returns unexpired revocations recorded at or after ``since``."""
+        pass
+
+    @abstractmethod
+    async def remove_expired(self) -> int:
+        """Deletes revocations of tokens that have expired; returns how many."""
+        pass
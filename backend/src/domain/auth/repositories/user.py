@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from src.domain.auth.models import User
 from src.domain.auth.value_objects import Email
@@ -10,3 +10,8 @@ class UserRepository(Repository[User]):
     @abstractmethod
     async def get_by_email(self, email: Email) -> Optional[User]:
         pass
+
+    @abstractmethod
+    async def list_by_emails(self, emails: List[Email]) -> List[User]:
+        """Returns the users registered with any of ``emails``, in one query."""
+        pass
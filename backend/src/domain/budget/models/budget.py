@@ -3,6 +3,7 @@ from typing import Optional
 from uuid import UUID
 
 from src.domain.base import Entity
+from src.domain.budget.value_objects import period_key
 from src.domain.errors import ValidationError
 
 
@@ -57,6 +58,10 @@ class Budget(Entity):
     def year(self) -> int:
         return self._year
 
+    @property
+    def period(self) -> int:
+        return period_key(self._year, self._month)
+
     @property
     def deleted_at(self) -> Optional[datetime]:
         return self._deleted_at
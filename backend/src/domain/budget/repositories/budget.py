@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from datetime import datetime
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from src.domain.budget.models import Budget
+from src.domain.budget.value_objects import BudgetSort
 
 
 class BudgetRepository(ABC):
@@ -14,6 +16,11 @@ class BudgetRepository(ABC):
     async def get_by_id(self, id: UUID) -> Optional[Budget]:
         pass
 
+    @abstractmethod
+    async def get_by_ids(self, ids: Collection[UUID]) -> List[Budget]:
+        """Returns the live budgets among ``ids``, in no particular order."""
+        pass
+
     @abstractmethod
     async def get_by_category_period(
         self, workspace_id: UUID, category_id: UUID, month: int, year: int
@@ -29,13 +36,65 @@ class BudgetRepository(ABC):
         year: Optional[int] = None,
         limit: int = 20,
         offset: int = 0,
+        *,
+        period_from: Optional[int] = None,
+        period_to: Optional[int] = None,
+        min_limit: Optional[float] = None,
+        max_limit: Optional[float] = None,
+        sort: Optional[BudgetSort] = None,
     ) -> Tuple[List[Budget], int]:
+        """Pages live budgets; ``period_from``/``period_to`` are inclusive ``period_key`` values."""
+        pass
+
+    @abstractmethod
+    async def list_columns_by_workspace(
+        self,
+        workspace_id: UUID,
+        columns: Sequence[str],
+        category_id: Optional[UUID] = None,
+        month: Optional[int] = None,
+        year: Optional[int] = None,
+        limit: int = 20,
+        offset: int = 0,
+        *,
+        period_from: Optional[int] = None,
+        period_to: Optional[int] = None,
+        min_limit: Optional[float] = None,
+        max_limit: Optional[float] = None,
+        sort: Optional[BudgetSort] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Same page as ``list_by_workspace``, reading only ``columns`` as plain rows."""
+        pass
+
+    @abstractmethod
+    async def get_list_version(
+        self,
+        workspace_id: UUID,
+        category_id: Optional[UUID] = None,
+        month: Optional[int] = None,
+        year: Optional[int] = None,
+        *,
+        period_from: Optional[int] = None,
+        period_to: Optional[int] = None,
+    ) -> Tuple[Optional[datetime], int]:
+        """Returns the latest ``updated_at`` and the row count for a list scope.
+
+        The limit-amount range is not part of the scope: changing a limit
+        bumps ``updated_at`` within the wider scope anyway.
+        """
         pass
 
     @abstractmethod
     async def update(self, budget: Budget) -> None:
+        """Raises ``ArchivedError`` if the budget is only in the archive."""
         pass
 
     @abstractmethod
     async def remove(self, budget: Budget) -> None:
+        """Raises ``ArchivedError`` if the budget is only in the archive."""
+        pass
+
+    @abstractmethod
+    async def remove_by_workspace_batch(self, workspace_id: UUID, limit: int) -> int:
+        """Hard-deletes up to ``limit`` budgets of a workspace; returns how many."""
         pass
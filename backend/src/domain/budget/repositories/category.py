@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from src.domain.budget.models import Category
@@ -25,3 +26,15 @@ class CategoryRepository(ABC):
     @abstractmethod
     async def list_by_workspace(self, workspace_id: UUID) -> List[Category]:
         pass
+
+    @abstractmethod
+    async def get_list_version(
+        self, workspace_id: Optional[UUID] = None
+    ) -> Tuple[Optional[datetime], int]:
+        """Returns the latest ``updated_at`` and the row count of a catalog."""
+        pass
+
+    @abstractmethod
+    async def remove_by_workspace_batch(self, workspace_id: UUID, limit: int) -> int:
+        """Deletes up to ``limit`` custom categories of a workspace; returns how many."""
+        pass
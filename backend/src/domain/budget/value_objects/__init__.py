@@ -0,0 +1,4 @@
+from .period import period_key, period_year
+from .sort import BudgetSort
+
+__all__ = ["BudgetSort", "period_key", "period_year"]
@@ -0,0 +1,8 @@
+def period_key(year: int, month: int) -> int:
+    """Single integer for a budget period; consecutive months get consecutive keys."""
+    return year * 12 + month
+
+
+def period_year(key: int) -> int:
+    """Year of the period ``key``; the inverse of ``period_key`` for the year."""
+    return (key - 1) // 12
@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class BudgetSort(str, Enum):
+    PERIOD = "period"
+    PERIOD_DESC = "-period"
+    LIMIT_AMOUNT = "limit_amount"
+    LIMIT_AMOUNT_DESC = "-limit_amount"
+    CREATED_AT = "created_at"
+    CREATED_AT_DESC = "-created_at"
+
+    @property
+    def field(self) -> str:
+        return self.value.lstrip("-")
+
+    @property
+    def descending(self) -> bool:
+        return self.value.startswith("-")
@@ -24,3 +24,7 @@ class NotFoundError(DomainError):
 
 class ConflictError(DomainError):
     """Raised when a resource already exists"""
+
+
+class ArchivedError(DomainError):
+    """Raised when changing a resource that was archived and is read-only"""
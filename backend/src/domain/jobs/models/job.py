@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from src.domain.base import Entity
+from src.domain.jobs.value_objects import JobKind, JobStatus
+
+
+class Job(Entity):
+    """A unit of background work.
+
+    ``available_at`` is when a queued job may be picked up; while the job is
+    running it is the end of the worker's lease, after which another worker
+    may claim it again.
+    """
+
+    def __init__(
+        self,
+        kind: JobKind,
+        payload: Dict[str, Any],
+        created_by: Optional[UUID] = None,
+        status: JobStatus = JobStatus.QUEUED,
+        attempts: int = 0,
+        max_attempts: int = 5,
+        last_error: Optional[str] = None,
+        available_at: Optional[datetime] = None,
+        finished_at: Optional[datetime] = None,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+        id: Optional[UUID] = None,
+    ):
+        super().__init__(id)
+        self._kind = JobKind(kind)
+        self._payload = payload
+        self._created_by = created_by
+        self._status = JobStatus(status)
+        self._attempts = attempts
+        self._max_attempts = max_attempts
+        self._last_error = last_error
+        self._created_at = created_at or datetime.now(timezone.utc)
+        self._updated_at = updated_at or self._created_at
+        self._available_at = available_at or self._created_at
+        self._finished_at = finished_at
+
+    @property
+    def kind(self) -> JobKind:
+        return self._kind
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return self._payload
+
+    @property
+    def created_by(self) -> Optional[UUID]:
+        return self._created_by
+
+    @property
+    def status(self) -> JobStatus:
+        return self._status
+
+    @property
+    def attempts(self) -> int:
+        return self._attempts
+
+    @property
+    def max_attempts(self) -> int:
+        return self._max_attempts
+
+    @property
+    def last_error(self) -> Optional[str]:
+        return self._last_error
+
+    @property
+    def available_at(self) -> datetime:
+        return self._available_at
+
+    @property
+    def finished_at(self) -> Optional[datetime]:
+        return self._finished_at
+
+    @property
+    def attempts_exhausted(self) -> bool:
+        """True once a claim went over ``max_attempts``: the last try never finished."""
+        return self._attempts > self._max_attempts
@@ -0,0 +1,3 @@
+from .job import JobRepository
+
+__all__ = ["JobRepository"]
@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from typing import Any, Collection, Dict, List, Optional
+from uuid import UUID
+
+from src.domain.jobs.models import Job
+from src.domain.jobs.value_objects import JobKind, JobStatus
+
+
+class JobRepository(ABC):
+    @abstractmethod
+    async def add(self, job: Job) -> None:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, id: UUID) -> Optional[Job]:
+        pass
+
+    @abstractmethod
+    async def claim(self, visibility_timeout: float) -> Optional[Job]:
+        """Leases the next available job for ``visibility_timeout`` seconds."""
+        pass
+
+    @abstractmethod
+    async def extend_lease(self, job: Job, visibility_timeout: float) -> bool:
+        """Pushes a claimed job's lease ``visibility_timeout`` seconds out; False if lost."""
+        pass
+
+    @abstractmethod
+    async def complete(self, job: Job) -> bool:
+        """Marks a claimed job as succeeded; False if its lease was lost."""
+        pass
+
+    @abstractmethod
+    async def fail(self, job: Job, error: str, retry_in: Optional[float]) -> bool:
+        """Requeues a claimed job after ``retry_in`` seconds, or fails it for good."""
+        pass
+
+    @abstractmethod
+    async def list_payloads(
+        self, kind: JobKind, statuses: Collection[JobStatus]
+    ) -> List[Dict[str, Any]]:
+        """Payloads of the jobs of ``kind`` in one of ``statuses``."""
+        pass
+
+    @abstractmethod
+    async def get_queue_lag(self) -> float:
+        """Seconds the oldest due queued job has waited; 0 when none is due."""
+        pass
@@ -0,0 +1,3 @@
+from .status import JobKind, JobStatus
+
+__all__ = ["JobKind", "JobStatus"]
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobKind(str, Enum):
+    DELETE_WORKSPACE = "workspace.delete"
+    ARCHIVE_BUDGETS = "budgets.archive"
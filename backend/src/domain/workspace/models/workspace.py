@@ -15,6 +15,7 @@ class Workspace(Entity):
         is_active: bool = True,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
+        deleted_at: Optional[datetime] = None,
         id: Optional[UUID] = None,
     ):
         super().__init__(id)
@@ -25,6 +26,7 @@ class Workspace(Entity):
         self._is_active = is_active
         self._created_at = created_at or datetime.now(timezone.utc)
         self._updated_at = updated_at or datetime.now(timezone.utc)
+        self._deleted_at = deleted_at
 
     @property
     def name(self) -> str:
@@ -54,6 +56,10 @@ class Workspace(Entity):
     def updated_at(self) -> datetime:
         return self._updated_at
 
+    @property
+    def deleted_at(self) -> Optional[datetime]:
+        return self._deleted_at
+
     def update_details(
         self,
         name: Optional[str] = None,
@@ -67,3 +73,7 @@ class Workspace(Entity):
         if category is not None:
             self._category = category
         self._updated_at = datetime.now(timezone.utc)
+
+    def delete(self):
+        self._deleted_at = datetime.now(timezone.utc)
+        self._updated_at = self._deleted_at
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
 from src.domain.repository import Repository
@@ -12,13 +13,20 @@ class WorkspaceRepository(Repository, ABC):
         pass
 
     @abstractmethod
-    async def get_by_id(self, id: UUID) -> Optional[Workspace]:
+    async def get_by_id(
+        self, id: UUID, include_deleted: bool = False
+    ) -> Optional[Workspace]:
         pass
 
     @abstractmethod
     async def list_by_user(self, user_id: UUID) -> List[Workspace]:
         pass
 
+    @abstractmethod
+    async def get_list_version(self, user_id: UUID) -> Tuple[Optional[datetime], int]:
+        """Returns the latest ``updated_at`` and the count of a user's workspaces."""
+        pass
+
     @abstractmethod
     async def get_by_name_and_owner(self, name: str, owner_id: UUID) -> Optional[Workspace]:
         pass
@@ -31,10 +39,40 @@ class WorkspaceRepository(Repository, ABC):
     async def remove(self, workspace: Workspace) -> None:
         pass
 
+    @abstractmethod
+    async def list_deleted_ids(self, deleted_before: datetime) -> List[UUID]:
+        """Ids of workspaces soft-deleted before ``deleted_before`` and not yet purged."""
+        pass
+
+    @abstractmethod
+    async def remove_members_batch(self, workspace_id: UUID, limit: int) -> int:
+        """Deletes up to ``limit`` members of a workspace; returns how many."""
+        pass
+
     @abstractmethod
     async def add_member(self, member: WorkspaceMember) -> None:
         pass
 
+    @abstractmethod
+    async def add_members(self, members: List[WorkspaceMember]) -> Set[UUID]:
+        """Inserts ``members`` in one statement, skipping users that are
+        already members; returns the user ids actually added."""
+        pass
+
+    @abstractmethod
+    async def get_member_user_ids(
+        self, workspace_id: UUID, user_ids: Iterable[UUID]
+    ) -> Set[UUID]:
+        """Returns which of ``user_ids`` are already members of a workspace."""
+        pass
+
+    @abstractmethod
+    async def get_accessible_workspace_ids(
+        self, user_id: UUID, workspace_ids: Iterable[UUID]
+    ) -> Set[UUID]:
+        """Returns which of ``workspace_ids`` the user owns or is a member of."""
+        pass
+
     @abstractmethod
     async def get_member(
         self, workspace_id: UUID, user_id: UUID
@@ -0,0 +1,3 @@
+from .audit_event import AuditEventMapper
+
+__all__ = ["AuditEventMapper"]
@@ -0,0 +1,30 @@
+from typing import Any, Dict
+
+from src.domain.audit.models import AuditEvent
+from src.infrastructure.audit.models import AuditEventORM
+
+
+class AuditEventMapper:
+    @staticmethod
+    def to_domain(orm: AuditEventORM) -> AuditEvent:
+        return AuditEvent(
+            id=orm.id,
+            workspace_id=orm.workspace_id,
+            actor_id=orm.actor_id,
+            action=orm.action,
+            target_id=orm.target_id,
+            details=orm.details,
+            occurred_at=orm.occurred_at,
+        )
+
+    @staticmethod
+    def to_row(domain: AuditEvent) -> Dict[str, Any]:
+        return {
+            "id": domain.id,
+            "workspace_id": domain.workspace_id,
+            "actor_id": domain.actor_id,
+            "action": domain.action.value,
+            "target_id": domain.target_id,
+            "details": domain.details,
+            "occurred_at": domain.occurred_at,
+        }
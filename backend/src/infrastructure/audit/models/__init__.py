@@ -0,0 +1,3 @@
+from .audit_event import AuditEventORM
+
+__all__ = ["AuditEventORM"]
@@ -0,0 +1,35 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, Index, String, Uuid
+
+from src.infrastructure.database import Base
+from src.infrastructure.types import JSONDocument, UTCDateTime
+
+
+class AuditEventORM(Base):
+    """Append-only; no foreign keys, so the trail outlives purged workspaces."""
+
+    __tablename__ = "audit_events"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    workspace_id = Column(Uuid, nullable=False)
+    actor_id = Column(Uuid, nullable=True)
+    action = Column(String(64), nullable=False)
+    target_id = Column(Uuid, nullable=False)
+    details = Column(JSONDocument, nullable=False, default=dict)
+    occurred_at = Column(
+        UTCDateTime,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    __table_args__ = (
+        # Serves the newest-first keyset pages of one workspace
+        Index(
+            "ix_audit_events_workspace_occurred_at",
+            "workspace_id",
+            "occurred_at",
+            "id",
+        ),
+    )
@@ -0,0 +1,3 @@
+from .audit_event import SQLAuditEventRepository
+
+__all__ = ["SQLAuditEventRepository"]
@@ -0,0 +1,46 @@
+from typing import List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import Select, insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.audit.models import AuditEvent
+from src.domain.audit.repositories import AuditCursor, AuditEventRepository
+from src.infrastructure.audit.mappers import AuditEventMapper
+from src.infrastructure.audit.models import AuditEventORM
+
+
+class SQLAuditEventRepository(AuditEventRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def add_many(self, events: Sequence[AuditEvent]) -> None:
+        if not events:
+            return
+        # One multi-row INSERT ... VALUES instead of a statement per event
+        stmt = insert(AuditEventORM).values(
+            [AuditEventMapper.to_row(event) for event in events]
+        )
+        await self._session.execute(stmt)
+
+    @staticmethod
+    def _page_query(
+        workspace_id: UUID, limit: int, before: Optional[AuditCursor] = None
+    ) -> Select:
+        stmt = select(AuditEventORM).where(AuditEventORM.workspace_id == workspace_id)
+        if before is not None:
+            # Row comparison, so the index range scan starts at the cursor
+            stmt = stmt.where(
+                tuple_(AuditEventORM.occurred_at, AuditEventORM.id) < tuple_(*before)
+            )
+        return stmt.order_by(
+            AuditEventORM.occurred_at.desc(), AuditEventORM.id.desc()
+        ).limit(limit)
+
+    async def list_by_workspace(
+        self, workspace_id: UUID, limit: int, before: Optional[AuditCursor] = None
+    ) -> List[AuditEvent]:
+        result = await self._session.execute(
+            self._page_query(workspace_id, limit, before)
+        )
+        return [AuditEventMapper.to_domain(orm) for orm in result.scalars()]
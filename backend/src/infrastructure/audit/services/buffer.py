@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import os
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Iterable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.audit.models import AuditEvent
+from src.infrastructure.audit.repositories import SQLAuditEventRepository
+from src.infrastructure.database import async_session
+from src.infrastructure.observability.metrics import AUDIT_EVENTS
+
+AUDIT_BATCH_SIZE = int(os.getenv("AUDIT_BATCH_SIZE", "500"))
+AUDIT_FLUSH_INTERVAL = float(os.getenv("AUDIT_FLUSH_INTERVAL", "1"))
+AUDIT_MAX_PENDING = int(os.getenv("AUDIT_MAX_PENDING", "10000"))
+
+logger = logging.getLogger(__name__)
+
+
+class AuditBuffer:
+    """Per-process queue of committed audit events awaiting their write.
+
+    Requests only append to memory; ``run`` writes the queue every
+    ``flush_interval`` seconds, or as soon as ``batch_size`` events are
+    waiting, with one multi-row insert per batch. A failed batch goes back
+    to the front of the queue and is retried on the next tick. At most
+    ``max_pending`` events are held; past that the oldest are dropped and
+    counted, so a database outage cannot exhaust the worker's memory.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL,
+        max_pending: int = AUDIT_MAX_PENDING,
+    ):
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._pending: Deque[AuditEvent] = deque()
+        self._full = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _trim(self) -> None:
+        dropped = 0
+        while len(self._pending) > self._max_pending:
+            self._pending.popleft()
+            dropped += 1
+        if dropped:
+            AUDIT_EVENTS.labels("dropped").inc(dropped)
+            logger.warning("Audit buffer full, dropped %d oldest events", dropped)
+
+    def extend(self, events: Iterable[AuditEvent]) -> None:
+        self._pending.extend(events)
+        self._trim()
+        if len(self._pending) >= self._batch_size:
+            self._full.set()
+
+    async def flush(self) -> int:
+        """Writes every pending event; returns how many were written."""
+        written = 0
+        while self._pending:
+            count = min(self._batch_size, len(self._pending))
+            batch = [self._pending.popleft() for _ in range(count)]
+            try:
+                async with self._session_factory() as session:
+                    await SQLAuditEventRepository(session).add_many(batch)
+                    await session.commit()
+            except Exception:
+                # Keep the original order for the retry
+                self._pending.extendleft(reversed(batch))
+                self._trim()
+                raise
+            written += count
+            AUDIT_EVENTS.labels("written").inc(count)
+        return written
+
+    async def _wait(self, stop: asyncio.Event, wake_when_full: bool) -> None:
+        waiters = [asyncio.ensure_future(stop.wait())]
+        if wake_when_full:
+            waiters.append(asyncio.ensure_future(self._full.wait()))
+        try:
+            await asyncio.wait(
+                waiters,
+                timeout=self._flush_interval,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def run(self, stop: asyncio.Event) -> None:
+        healthy = True
+        while not stop.is_set():
+            # After a failure wait out the interval even if the queue is full,
+            # instead of retrying a down database in a tight loop
+            await self._wait(stop, wake_when_full=healthy)
+            self._full.clear()
+            try:
+                await self.flush()
+                healthy = True
+            except Exception:
+                healthy = False
+                logger.exception("Audit flush failed, %d events pending", len(self))
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Final audit flush failed, %d events lost", len(self))
+            AUDIT_EVENTS.labels("dropped").inc(len(self))
+
+
+audit_buffer = AuditBuffer()
+
+
+@asynccontextmanager
+async def running_audit_flush(
+    buffer: Optional[AuditBuffer] = None,
+) -> AsyncIterator[None]:
+    """Flushes the audit buffer in the background and once more on exit."""
+    # Not `buffer or ...`: an empty buffer is falsy
+    buffer = audit_buffer if buffer is None else buffer
+    stop = asyncio.Event()
+    task = asyncio.create_task(buffer.run(stop), name="audit-flush")
+    try:
+        yield
+    finally:
+        stop.set()
+        await asyncio.gather(task, return_exceptions=True)
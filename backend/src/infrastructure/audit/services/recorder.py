@@ -0,0 +1,33 @@
+from typing import List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases.audit.recorder import AuditRecorder
+from src.domain.audit.models import AuditEvent
+from src.infrastructure.audit.services.buffer import AuditBuffer
+
+
+class SessionAuditRecorder(AuditRecorder):
+    """Hands a request's events to the buffer when its transaction commits.
+
+    Events recorded before a rollback are discarded, so the trail only holds
+    changes that actually happened.
+    """
+
+    def __init__(self, session: AsyncSession, buffer: AuditBuffer):
+        self._buffer = buffer
+        self._pending: List[AuditEvent] = []
+        event.listen(session.sync_session, "after_commit", self._on_commit)
+        event.listen(session.sync_session, "after_rollback", self._on_rollback)
+
+    def record(self, audit_event: AuditEvent) -> None:
+        self._pending.append(audit_event)
+
+    def _on_commit(self, session) -> None:
+        events, self._pending = self._pending, []
+        if events:
+            self._buffer.extend(events)
+
+    def _on_rollback(self, session) -> None:
+        self._pending.clear()
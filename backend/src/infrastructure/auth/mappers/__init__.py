@@ -1,3 +1,4 @@
+from .revoked_token import RevokedTokenMapper
 from .user import UserMapper
 
-__all__ = ["UserMapper"]
+__all__ = ["RevokedTokenMapper", "UserMapper"]
@@ -0,0 +1,12 @@
+from src.domain.auth.models import RevokedToken
+from src.infrastructure.auth.models import RevokedTokenORM
+
+
+class RevokedTokenMapper:
+    @staticmethod
+    def to_domain(orm_token: RevokedTokenORM) -> RevokedToken:
+        return RevokedToken(
+            id=orm_token.jti,
+            expires_at=orm_token.expires_at,
+            revoked_at=orm_token.revoked_at,
+        )
@@ -1,3 +1,4 @@
+from .revoked_token import RevokedTokenORM
 from .user import UserORM
 
-__all__ = ["UserORM"]
+__all__ = ["RevokedTokenORM", "UserORM"]
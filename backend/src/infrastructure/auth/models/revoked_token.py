@@ -0,0 +1,22 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.database import Base
+from src.infrastructure.types import UTCDateTime
+
+
+class RevokedTokenORM(Base):
+    __tablename__ = "revoked_tokens"
+
+    jti: Mapped[UUID] = mapped_column(primary_key=True)
+    expires_at: Mapped[datetime] = mapped_column(
+        UTCDateTime, index=True, nullable=False
+    )
+    revoked_at: Mapped[datetime] = mapped_column(
+        UTCDateTime,
+        index=True,
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
@@ -1,3 +1,4 @@
+from .revoked_token import SQLRevokedTokenRepository
 from .user import SQLUserRepository
 
-__all__ = ["SQLUserRepository"]
+__all__ = ["SQLRevokedTokenRepository", "SQLUserRepository"]
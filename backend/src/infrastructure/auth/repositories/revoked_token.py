@@ -0,0 +1,55 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.auth.models import RevokedToken
+from src.domain.auth.repositories import RevokedTokenRepository
+from src.infrastructure.auth.mappers import RevokedTokenMapper
+from src.infrastructure.auth.models import RevokedTokenORM
+from src.infrastructure.database import insert_for
+
+
+class SQLRevokedTokenRepository(RevokedTokenRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def revoke(self, token: RevokedToken) -> bool:
+        # The primary key makes concurrent revocations of the same token race
+        # safely: exactly one of them inserts the row.
+        stmt = (
+            insert_for(self._session, RevokedTokenORM)
+            .values(
+                jti=token.id,
+                expires_at=token.expires_at,
+                revoked_at=token.revoked_at,
+            )
+            .on_conflict_do_nothing(index_elements=[RevokedTokenORM.jti])
+            .returning(RevokedTokenORM.jti)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def is_revoked(self, id: UUID) -> bool:
+        result = await self._session.execute(
+            select(RevokedTokenORM.jti).where(RevokedTokenORM.jti == id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def list_revoked(self, since: Optional[datetime] = None) -> List[RevokedToken]:
+        now = datetime.now(timezone.utc)
+        stmt = select(RevokedTokenORM).where(RevokedTokenORM.expires_at > now)
+        if since is not None:
+            stmt = stmt.where(RevokedTokenORM.revoked_at >= since)
+        result = await self._session.execute(stmt)
+        return [RevokedTokenMapper.to_domain(orm) for orm in result.scalars()]
+
+    async def remove_expired(self) -> int:
+        result = await self._session.execute(
+            delete(RevokedTokenORM).where(
+                RevokedTokenORM.expires_at <= datetime.now(timezone.utc)
+            )
+        )
+        return result.rowcount
@@ -9,6 +9,7 @@ from src.domain.auth.repositories import UserRepository
 from src.domain.auth.value_objects import Email
 from src.infrastructure.auth.mappers import UserMapper
 from src.infrastructure.auth.models import UserORM
+from src.infrastructure.sharding import replicated_users
 
 
 class SQLUserRepository(UserRepository):
@@ -31,6 +32,14 @@ class SQLUserRepository(UserRepository):
         orm_user = result.scalar_one_or_none()
         return UserMapper.to_domain(orm_user) if orm_user else None
 
+    async def list_by_emails(self, emails: List[Email]) -> List[User]:
+        if not emails:
+            return []
+        result = await self._session.execute(
+            select(UserORM).where(UserORM.email.in_({e.value for e in emails}))
+        )
+        return [UserMapper.to_domain(orm_user) for orm_user in result.scalars()]
+
     async def list(self) -> List[User]:
         result = await self._session.execute(select(UserORM))
         return [UserMapper.to_domain(orm_user) for orm_user in result.scalars()]
@@ -39,3 +48,5 @@ class SQLUserRepository(UserRepository):
         orm_user = await self._session.get(UserORM, user.id)
         if orm_user:
             await self._session.delete(orm_user)
+        # Its shard copies are never needed again
+        replicated_users.forget([user.id])
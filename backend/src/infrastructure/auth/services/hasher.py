@@ -1,16 +1,47 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
 from passlib.context import CryptContext
 
+from src.infrastructure.observability import track
+from src.infrastructure.observability.metrics import ARGON2_IN_PROGRESS
+
+# Each hash holds its memory cost (64 MiB by default) while it runs
+ARGON2_WORKERS = int(os.getenv("ARGON2_WORKERS", "2"))
+
 pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+_executor = ThreadPoolExecutor(max_workers=ARGON2_WORKERS, thread_name_prefix="argon2")
+
+T = TypeVar("T")
+
+
+async def _run(function: Callable[..., T], *args: str) -> T:
+    with ARGON2_IN_PROGRESS.track_inprogress(), track("hash"):
+        return await asyncio.get_running_loop().run_in_executor(
+            _executor, function, *args
+        )
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return pwd_context.verify(plain_password, hashed_password)
+    except Exception:
+        return False
 
 
 class Hasher:
+    """Argon2 hashing off the event loop.
+
+    At most ``ARGON2_WORKERS`` calls run at once, the rest wait for a
+    thread; ``ARGON2_IN_PROGRESS`` counts both.
+    """
+
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        try:
-            return pwd_context.verify(plain_password, hashed_password)
-        except Exception:
-            return False
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
+        return await _run(_verify, plain_password, hashed_password)
 
     @staticmethod
-    def get_password_hash(password: str) -> str:
-        return pwd_context.hash(password)
+    async def get_password_hash(password: str) -> str:
+        return await _run(pwd_context.hash, password)
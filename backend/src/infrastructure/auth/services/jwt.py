@@ -1,9 +1,12 @@
 import os
+import uuid
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
 from jose import jwt
 
+from src.infrastructure.observability import track
+
 SECRET_KEY = os.getenv("SECRET_KEY", "5SJ3@Nv715c6")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
@@ -27,10 +30,12 @@ class JWTService:
             else:
                 expire = datetime.utcnow() + timedelta(days=7)
 
-        to_encode.update({"exp": expire, "type": token_type})
+        # jti identifies the token so it can be revoked before it expires
+        to_encode.update({"exp": expire, "type": token_type, "jti": str(uuid.uuid4())})
         encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
         return encoded_jwt
 
     @staticmethod
     def decode_token(token: str) -> Dict[str, Any]:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        with track("jwt"):
+            return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
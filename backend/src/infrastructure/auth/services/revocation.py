@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, Iterable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.auth.models import RevokedToken
+from src.infrastructure.auth.repositories import SQLRevokedTokenRepository
+from src.infrastructure.database import async_session
+
+TOKEN_REVOCATION_POLL_INTERVAL = float(os.getenv("TOKEN_REVOCATION_POLL_INTERVAL", "2"))
+TOKEN_REVOCATION_LOOKBACK = float(os.getenv("TOKEN_REVOCATION_LOOKBACK", "30"))
+TOKEN_REVOCATION_PURGE_INTERVAL = 3600.0
+
+logger = logging.getLogger(__name__)
+
+
+class RevocationList:
+    """Per-process mirror of the ``revoked_tokens`` table.
+
+    ``is_revoked`` is a dictionary lookup, so authenticating a request costs
+    no query. The mirror is refreshed incrementally every ``poll_interval``
+    seconds by reading the revocations recorded since the newest one already
+    seen; re-reading the last ``lookback`` seconds catches rows whose
+    transaction committed after a later one. Revocations made by this process
+    are added directly and take effect immediately.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+        poll_interval: float = TOKEN_REVOCATION_POLL_INTERVAL,
+        lookback: float = TOKEN_REVOCATION_LOOKBACK,
+        clock=time.time,
+    ):
+        self._session_factory = session_factory
+        self._poll_interval = poll_interval
+        self._lookback = timedelta(seconds=lookback)
+        self._clock = clock
+        # jti -> expiry as a POSIX timestamp
+        self._revoked: Dict[str, float] = {}
+        self._newest: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+    def is_revoked(self, jti: Optional[str]) -> bool:
+        return jti is not None and jti in self._revoked
+
+    def add(self, tokens: Iterable[RevokedToken]) -> None:
+        for token in tokens:
+            self._revoked[str(token.id)] = token.expires_at.timestamp()
+            if self._newest is None or token.revoked_at > self._newest:
+                self._newest = token.revoked_at
+
+    def prune(self) -> None:
+        now = self._clock()
+        for jti in [jti for jti, expiry in self._revoked.items() if expiry <= now]:
+            del self._revoked[jti]
+
+    async def sync(self) -> None:
+        since = None if self._newest is None else self._newest - self._lookback
+        async with self._session_factory() as session:
+            tokens = await SQLRevokedTokenRepository(session).list_revoked(since)
+        self.add(tokens)
+        self.prune()
+
+    async def _purge_expired(self) -> None:
+        async with self._session_factory() as session:
+            removed = await SQLRevokedTokenRepository(session).remove_expired()
+            await session.commit()
+        if removed:
+            logger.info("Removed %d expired token revocations", removed)
+
+    async def run(self, stop: asyncio.Event) -> None:
+        last_purge = self._clock()
+        while not stop.is_set():
+            try:
+                await self.sync()
+                if self._clock() - last_purge >= TOKEN_REVOCATION_PURGE_INTERVAL:
+                    await self._purge_expired()
+                    last_purge = self._clock()
+            except Exception:
+                logger.exception("Token revocation sync failed")
+            try:
+                await asyncio.wait_for(stop.wait(), self._poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+revocation_list = RevocationList()
+
+
+@asynccontextmanager
+async def running_revocation_sync(
+    revocations: Optional[RevocationList] = None,
+) -> AsyncIterator[None]:
+    """Keeps the revocation mirror in sync for the block's duration."""
+    revocations = revocations or revocation_list
+    # Load the current list before serving so no revoked token slips through
+    # while the first poll is pending.
+    try:
+        await revocations.sync()
+    except Exception:
+        logger.exception("Initial token revocation sync failed")
+    stop = asyncio.Event()
+    task = asyncio.create_task(revocations.run(stop), name="token-revocation-sync")
+    try:
+        yield
+    finally:
+        stop.set()
+        await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,424 @@
+import argparse
+import asyncio
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from uuid import UUID
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from sqlalchemy import select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.domain.budget.value_objects import period_key
+from src.infrastructure.budget.models import BudgetORM
+from src.infrastructure.budget.partitions import partition_name, partition_years
+from src.domain.jobs.models import Job
+from src.domain.jobs.value_objects import JobKind
+from src.infrastructure.cache import invalidate_cached
+from src.infrastructure.database import async_session, close_pool, shard_engines
+from src.infrastructure.jobs.repositories import SQLJobRepository
+from src.infrastructure.workspace.models import WorkspaceORM
+
+BUDGET_ARCHIVE_DIR = os.getenv("BUDGET_ARCHIVE_DIR", "data/budget_archive")
+BUDGET_ARCHIVE_AFTER_YEARS = int(os.getenv("BUDGET_ARCHIVE_AFTER_YEARS", "3"))
+# Rows are sorted by workspace, so a workspace's rows span few row groups and
+# the min/max statistics let a read skip the others
+ARCHIVE_ROW_GROUP_SIZE = 10_000
+ARCHIVE_LOCK_TIMEOUT = "5s"
+BUDGET_ARCHIVE_CACHE_ENTRIES = int(os.getenv("BUDGET_ARCHIVE_CACHE_ENTRIES", "256"))
+
+logger = logging.getLogger(__name__)
+
+_FILE = re.compile(r"^budgets_y(\d+)\.parquet$")
+_UUIDS = ("id", "workspace_id", "owner_id", "category_id")
+
+SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("workspace_id", pa.string()),
+        ("owner_id", pa.string()),
+        ("category_id", pa.string()),
+        ("limit_amount", pa.float64()),
+        ("month", pa.int16()),
+        ("year", pa.int16()),
+        ("created_at", pa.timestamp("us", tz="UTC")),
+        ("updated_at", pa.timestamp("us", tz="UTC")),
+        ("deleted_at", pa.timestamp("us", tz="UTC")),
+    ]
+)
+
+
+def archive_cutoff_year(now: Optional[datetime] = None) -> int:
+    """First year kept in the database; earlier years are archived."""
+    now = now or datetime.now(timezone.utc)
+    return now.year - BUDGET_ARCHIVE_AFTER_YEARS
+
+
+class BudgetArchive:
+    """Budgets of archived years, one zstd-compressed Parquet file per year.
+
+    Files are replaced whole and atomically, so readers see either the old
+    or the new version of a year. Rows come back as dicts keyed like the
+    ``budgets`` columns, ``period`` included. Reads and writes block and
+    are meant to run in a thread.
+
+    Files only change when the archival job runs, so the workspaces each
+    year holds are indexed and the rows read for a workspace are kept, up
+    to ``max_cached`` of them, until their file changes. Lookups of a
+    workspace without archived rows never open a file.
+    """
+
+    def __init__(
+        self,
+        directory: str = BUDGET_ARCHIVE_DIR,
+        max_cached: int = BUDGET_ARCHIVE_CACHE_ENTRIES,
+    ):
+        self._directory = Path(directory)
+        self._max_cached = max_cached
+        self._lock = threading.Lock()
+        self._listed_at: Optional[int] = None
+        # Year -> (file mtime, workspaces with rows in it)
+        self._files: Dict[int, Tuple[int, FrozenSet[str]]] = {}
+        self._workspaces: Dict[int, FrozenSet[str]] = {}
+        self._cached: "OrderedDict[Tuple[int, str], List[Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+
+    def path(self, year: int) -> Path:
+        return self._directory / f"budgets_y{int(year)}.parquet"
+
+    def _set_files(self, files: Dict[int, Tuple[int, FrozenSet[str]]]) -> None:
+        """Replaces the index, dropping the cached rows of changed files.
+
+        Called with the lock held.
+        """
+        # Unchanged files keep their entry, the very same object
+        stale = [
+            key
+            for key in self._cached
+            if files.get(key[0]) is not self._files.get(key[0])
+        ]
+        for key in stale:
+            del self._cached[key]
+        self._files = files
+        self._workspaces = {year: ids for year, (_, ids) in files.items()}
+
+    def _index(self) -> Dict[int, FrozenSet[str]]:
+        """Workspaces with rows in each archived year.
+
+        The directory is listed again when its mtime changes, and only the
+        files whose own mtime changed are read.
+        """
+        try:
+            mtime = self._directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        with self._lock:
+            if mtime == self._listed_at:
+                return self._workspaces
+            known = self._files
+        files = {}
+        if mtime is not None:
+            for match in map(_FILE.match, os.listdir(self._directory)):
+                if not match:
+                    continue
+                year = int(match.group(1))
+                try:
+                    stamp = self.path(year).stat().st_mtime_ns
+                    if year in known and known[year][0] == stamp:
+                        files[year] = known[year]
+                        continue
+                    column = pq.read_table(self.path(year), columns=["workspace_id"])
+                except FileNotFoundError:
+                    continue
+                ids = frozenset(pc.unique(column["workspace_id"]).to_pylist())
+                files[year] = (stamp, ids)
+        with self._lock:
+            # The mtime was taken first, so a change made meanwhile is
+            # picked up by the next call
+            self._set_files(files)
+            self._listed_at = mtime
+            return self._workspaces
+
+    def years(self, workspace_id: Optional[UUID] = None) -> FrozenSet[int]:
+        """Archived years; with ``workspace_id``, those holding its rows."""
+        index = self._index()
+        if workspace_id is None:
+            return frozenset(index)
+        key = str(workspace_id)
+        return frozenset(year for year, ids in index.items() if key in ids)
+
+    @staticmethod
+    def _to_rows(table: pa.Table) -> List[Dict[str, Any]]:
+        rows = table.to_pylist()
+        for row in rows:
+            for name in _UUIDS:
+                row[name] = UUID(row[name])
+            row["period"] = period_key(row["year"], row["month"])
+        return rows
+
+    def _read_year(self, workspace_id: UUID, year: int) -> List[Dict[str, Any]]:
+        key = (year, str(workspace_id))
+        with self._lock:
+            rows = self._cached.get(key)
+            if rows is not None:
+                self._cached.move_to_end(key)
+                return rows
+            indexed = self._files.get(year)
+        try:
+            table = pq.read_table(
+                self.path(year),
+                schema=SCHEMA,
+                filters=pc.field("workspace_id") == key[1],
+            )
+        except FileNotFoundError:
+            return []
+        rows = self._to_rows(table)
+        with self._lock:
+            # Not kept if the file changed while it was read
+            if indexed is not None and self._files.get(year) is indexed:
+                self._cached[key] = rows
+                while len(self._cached) > self._max_cached:
+                    self._cached.popitem(last=False)
+        return rows
+
+    def read(self, workspace_id: UUID, years: Iterable[int]) -> List[Dict[str, Any]]:
+        """Rows of ``workspace_id`` in the archived ``years``.
+
+        The rows may be shared with other callers and must not be modified.
+        """
+        holding = self.years(workspace_id)
+        rows: List[Dict[str, Any]] = []
+        for year in sorted(years):
+            if year in holding:
+                rows.extend(self._read_year(workspace_id, year))
+        return rows
+
+    def find(self, ids: Collection[UUID]) -> List[Dict[str, Any]]:
+        """Rows with one of ``ids`` in any archived year, deleted ones included.
+
+        Ids do not say the year, so every file's ``id`` column is scanned.
+        """
+        keys = [str(id) for id in ids]
+        rows: List[Dict[str, Any]] = []
+        for year in sorted(self._index()):
+            try:
+                table = pq.read_table(
+                    self.path(year), schema=SCHEMA, filters=pc.field("id").isin(keys)
+                )
+            except FileNotFoundError:
+                continue
+            rows.extend(self._to_rows(table))
+        return rows
+
+    def load(self, year: int) -> List[Dict[str, Any]]:
+        """Every archived row of ``year``."""
+        try:
+            return self._to_rows(pq.read_table(self.path(year), schema=SCHEMA))
+        except FileNotFoundError:
+            return []
+
+    def write(self, year: int, rows: Sequence[Dict[str, Any]]) -> None:
+        """Replaces the file of ``year`` with ``rows``; removes it when empty."""
+        path = self.path(year)
+        if not rows:
+            path.unlink(missing_ok=True)
+            self._remember(year, None)
+            return
+        ordered = sorted(
+            rows, key=lambda r: (str(r["workspace_id"]), r["month"], str(r["id"]))
+        )
+        table = pa.Table.from_pylist(
+            [
+                {
+                    name: str(row[name]) if name in _UUIDS else row[name]
+                    for name in SCHEMA.names
+                }
+                for row in ordered
+            ],
+            schema=SCHEMA,
+        )
+        self._directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".parquet.tmp")
+        pq.write_table(
+            table,
+            tmp,
+            compression="zstd",
+            row_group_size=ARCHIVE_ROW_GROUP_SIZE,
+        )
+        with open(tmp, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        self._remember(
+            year,
+            (path.stat().st_mtime_ns, frozenset(str(r["workspace_id"]) for r in rows)),
+        )
+
+    def _remember(self, year: int, entry: Optional[Tuple[int, FrozenSet[str]]]) -> None:
+        """Indexes a file this process wrote, so it is not read back."""
+        with self._lock:
+            files = {y: e for y, e in self._files.items() if y != year}
+            if entry is not None:
+                files[year] = entry
+            self._set_files(files)
+
+
+budget_archive = BudgetArchive()
+
+
+async def _live_workspaces(
+    engines: Sequence[AsyncEngine], workspace_ids: Iterable[UUID]
+) -> set:
+    workspace_ids = list(set(workspace_ids))
+    live = set()
+    for engine in engines:
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                select(WorkspaceORM.id).where(WorkspaceORM.id.in_(workspace_ids))
+            )
+            live.update(result.scalars())
+    return live
+
+
+async def _take_year(conn: AsyncConnection, year: int) -> List[Dict[str, Any]]:
+    table = BudgetORM.__table__
+    result = await conn.execute(
+        table.delete()
+        .where(table.c.year == year)
+        .returning(*(table.c[name] for name in SCHEMA.names))
+    )
+    return [dict(row) for row in result.mappings()]
+
+
+async def _drop_partition(engine: AsyncEngine, year: int) -> None:
+    """Drops the partition of an archived year if it is empty.
+
+    Dropping takes an exclusive lock on ``budgets``, and waiting for it
+    would queue every budget query behind the archival, so the attempt
+    gives up after ``ARCHIVE_LOCK_TIMEOUT`` and the next run tries again.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+    name = partition_name(year)
+    try:
+        async with engine.begin() as conn:
+            if year not in await partition_years(conn):
+                return
+            await conn.execute(
+                text(f"SET LOCAL lock_timeout = '{ARCHIVE_LOCK_TIMEOUT}'")
+            )
+            await conn.execute(text("LOCK TABLE budgets IN ACCESS EXCLUSIVE MODE"))
+            if await conn.scalar(text(f"SELECT EXISTS (SELECT 1 FROM {name})")):
+                return
+            await conn.execute(text(f"DROP TABLE {name}"))
+    except DBAPIError:
+        logger.warning("Could not drop %s, next run will retry", name, exc_info=True)
+
+
+async def archive_budgets(
+    before_year: Optional[int] = None,
+    archive: Optional[BudgetArchive] = None,
+    engines: Optional[Sequence[AsyncEngine]] = None,
+) -> Dict[int, int]:
+    """Moves the budgets of every year before ``before_year`` to the archive.
+
+    For each year the rows are deleted on every shard, merged into that
+    year's file and the transactions are committed once the file is in
+    place; the year's partition is dropped afterwards. Rows written to an
+    archived year later are merged in the next run. If the process dies
+    between the file and the commits, the rows are read twice until that
+    next run, which merges them by id. Rows of workspaces that no longer
+    exist are left out. The moved workspaces' budgets are then invalidated
+    in the repository cache. Returns the rows in each rewritten file.
+    """
+    before_year = archive_cutoff_year() if before_year is None else before_year
+    archive = budget_archive if archive is None else archive
+    engines = list(shard_engines if engines is None else engines)
+
+    years = set()
+    for engine in engines:
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text("SELECT DISTINCT year FROM budgets WHERE year < :year"),
+                {"year": before_year},
+            )
+            years.update(result.scalars())
+            # Partitions left behind by a run that could not drop them
+            if engine.dialect.name == "postgresql":
+                partitions = await partition_years(conn)
+                years.update(y for y in partitions if y < before_year)
+
+    archived: Dict[int, int] = {}
+    for year in sorted(years):
+        connections = [await engine.connect() for engine in engines]
+        try:
+            taken = []
+            for conn in connections:
+                await conn.begin()
+                taken += await _take_year(conn, year)
+            # Read after the rows are locked: a concurrent run waits on them
+            # until this one commits, and then reads the file written here
+            merged = {
+                row["id"]: row for row in await asyncio.to_thread(archive.load, year)
+            }
+            merged.update((row["id"], row) for row in taken)
+            live = await _live_workspaces(
+                engines, (r["workspace_id"] for r in merged.values())
+            )
+            rows = [row for row in merged.values() if row["workspace_id"] in live]
+            await asyncio.to_thread(archive.write, year, rows)
+            for conn in connections:
+                await conn.commit()
+        finally:
+            for conn in connections:
+                await conn.close()
+        # Cached lists and versions were built from the rows just moved
+        await invalidate_cached({f"budgets:{row['workspace_id']}" for row in taken})
+        for engine in engines:
+            await _drop_partition(engine, year)
+        archived[year] = len(rows)
+        logger.info("Archived %d budgets of %d", len(rows), year)
+    return archived
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Queue a budget archival job")
+    parser.add_argument(
+        "--before-year",
+        type=int,
+        help="archive the years before this one "
+        f"(default: {BUDGET_ARCHIVE_AFTER_YEARS} years ago)",
+    )
+    args = parser.parse_args()
+
+    payload = {} if args.before_year is None else {"before_year": args.before_year}
+    job = Job(kind=JobKind.ARCHIVE_BUDGETS, payload=payload)
+    try:
+        async with async_session() as session:
+            await SQLJobRepository(session).add(job)
+            await session.commit()
+    finally:
+        await close_pool()
+    print(f"Queued job {job.id}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
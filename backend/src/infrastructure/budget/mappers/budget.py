@@ -1,3 +1,5 @@
+from typing import Any, Mapping
+
 from src.domain.budget.models import Budget
 from src.infrastructure.budget.models import BudgetORM
 
@@ -18,6 +20,21 @@ class BudgetMapper:
             deleted_at=orm.deleted_at,
         )
 
+    @staticmethod
+    def from_row(row: Mapping[str, Any]) -> Budget:
+        return Budget(
+            id=row["id"],
+            workspace_id=row["workspace_id"],
+            owner_id=row["owner_id"],
+            category_id=row["category_id"],
+            limit_amount=row["limit_amount"],
+            month=row["month"],
+            year=row["year"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            deleted_at=row["deleted_at"],
+        )
+
     @staticmethod
     def to_orm(domain: Budget) -> BudgetORM:
         return BudgetORM(
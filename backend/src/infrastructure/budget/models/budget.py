@@ -2,38 +2,46 @@ import uuid
 from datetime import datetime, timezone
 
 from sqlalchemy import (
+    DDL,
     Column,
-    DateTime,
+    Computed,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    PrimaryKeyConstraint,
     String,
     UniqueConstraint,
+    Uuid,
+    event,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from src.infrastructure.database import Base
+from src.infrastructure.types import UTCDateTime
 
 
 class BudgetORM(Base):
     __tablename__ = "budgets"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # The key is (id, year) because a partitioned table's unique constraints
+    # must include the partition key; ids alone still identify a budget
+    id = Column(Uuid, nullable=False, default=uuid.uuid4)
     workspace_id = Column(
-        UUID(as_uuid=True),
+        Uuid,
         ForeignKey("workspaces.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     owner_id = Column(
-        UUID(as_uuid=True),
+        Uuid,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     category_id = Column(
-        UUID(as_uuid=True),
+        Uuid,
         ForeignKey("categories.id", ondelete="RESTRICT"),
         nullable=False,
         index=True,
@@ -41,22 +49,25 @@ class BudgetORM(Base):
     limit_amount = Column(Float, nullable=False)
     month = Column(Integer, nullable=False)
     year = Column(Integer, nullable=False)
+    # Same as period_key(year, month); lets a period range be one index scan
+    period = Column(Integer, Computed("year * 12 + month", persisted=True), nullable=False)
 
     created_at = Column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        UTCDateTime, default=lambda: datetime.now(timezone.utc)
     )
     updated_at = Column(
-        DateTime(timezone=True),
+        UTCDateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
-    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    deleted_at = Column(UTCDateTime, nullable=True)
 
     workspace = relationship("WorkspaceORM", backref="budgets")
     owner = relationship("UserORM", backref="created_budgets")
     category = relationship("CategoryORM", backref="budgets")
 
     __table_args__ = (
+        PrimaryKeyConstraint("id", "year"),
         UniqueConstraint(
             "workspace_id",
             "category_id",
@@ -64,4 +75,24 @@ class BudgetORM(Base):
             "year",
             name="uq_budget_workspace_category_period",
         ),
+        Index(
+            "ix_budgets_workspace_period",
+            "workspace_id",
+            "period",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+        # One partition per year on PostgreSQL, see src.infrastructure.budget.partitions
+        {"postgresql_partition_by": "RANGE (year)"},
     )
+    __mapper_args__ = {"primary_key": [id]}
+
+
+# Catches the years that have no partition yet, so inserts never fail
+event.listen(
+    BudgetORM.__table__,
+    "after_create",
+    DDL("CREATE TABLE budgets_default PARTITION OF budgets DEFAULT").execute_if(
+        dialect="postgresql"
+    ),
+)
@@ -4,36 +4,34 @@ from datetime import datetime, timezone
 from sqlalchemy import (
     Boolean,
     Column,
-    DateTime,
     ForeignKey,
     String,
     UniqueConstraint,
+    Uuid,
 )
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from src.infrastructure.database import Base
+from src.infrastructure.types import UTCDateTime
 
 
 class CategoryORM(Base):
     __tablename__ = "categories"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     name = Column(String(50), nullable=False)
     description = Column(String(255), nullable=True)
     is_default = Column(Boolean, default=False, nullable=False)
     workspace_id = Column(
-        UUID(as_uuid=True),
+        Uuid,
         ForeignKey("workspaces.id", ondelete="CASCADE"),
         nullable=True,
         index=True,
     )
 
-    created_at = Column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
-    )
+    created_at = Column(UTCDateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(
-        DateTime(timezone=True),
+        UTCDateTime,
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
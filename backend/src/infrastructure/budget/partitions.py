@@ -0,0 +1,128 @@
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.infrastructure.budget.models import BudgetORM
+from src.infrastructure.database import shard_engines
+
+BUDGET_PARTITIONS_AHEAD = int(os.getenv("BUDGET_PARTITIONS_AHEAD", "2"))
+DEFAULT_PARTITION = "budgets_default"
+
+logger = logging.getLogger(__name__)
+
+# Serializes partition maintenance between workers starting at the same time
+_LOCK_KEY = 4_206_513_717
+
+# Generated columns (period) are computed again when rows are moved
+_COLUMNS = ", ".join(
+    column.name for column in BudgetORM.__table__.columns if column.computed is None
+)
+
+
+def partition_name(year: int) -> str:
+    return f"budgets_y{int(year)}"
+
+
+async def partition_years(conn: AsyncConnection) -> Set[int]:
+    """Years that have their own partition."""
+    result = await conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = 'budgets'::regclass"
+        )
+    )
+    prefix = partition_name(0)[:-1]
+    return {
+        int(name[len(prefix) :]) for name in result.scalars() if name.startswith(prefix)
+    }
+
+
+async def create_partition(conn: AsyncConnection, year: int) -> None:
+    """Creates the partition for ``year``, moving its rows out of the default one.
+
+    Postgres refuses a new partition while the default partition holds rows
+    that belong in it, so in that case the default partition is detached,
+    its rows for the year are moved and it is attached again, all in the
+    caller's transaction.
+    """
+    year = int(year)
+    bounds = f"FOR VALUES FROM ({year}) TO ({year + 1})"
+    stranded = await conn.scalar(
+        text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE year = :year)"),
+        {"year": year},
+    )
+    if not stranded:
+        await conn.execute(
+            text(f"CREATE TABLE {partition_name(year)} PARTITION OF budgets {bounds}")
+        )
+        return
+    await conn.execute(
+        text(f"ALTER TABLE budgets DETACH PARTITION {DEFAULT_PARTITION}")
+    )
+    await conn.execute(
+        text(f"CREATE TABLE {partition_name(year)} PARTITION OF budgets {bounds}")
+    )
+    await conn.execute(
+        text(
+            f"INSERT INTO budgets ({_COLUMNS}) "
+            f"SELECT {_COLUMNS} FROM {DEFAULT_PARTITION} WHERE year = :year"
+        ),
+        {"year": year},
+    )
+    await conn.execute(
+        text(f"DELETE FROM {DEFAULT_PARTITION} WHERE year = :year"), {"year": year}
+    )
+    await conn.execute(
+        text(f"ALTER TABLE budgets ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT")
+    )
+
+
+async def ensure_partitions(
+    conn: AsyncConnection, years: Optional[Iterable[int]] = None
+) -> List[int]:
+    """Creates the missing partitions and returns their years.
+
+    By default these are this year and the next ``BUDGET_PARTITIONS_AHEAD``,
+    plus every year that has rows waiting in the default partition.
+    """
+    await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _LOCK_KEY})
+    if years is None:
+        current = datetime.now(timezone.utc).year
+        wanted = set(range(current, current + BUDGET_PARTITIONS_AHEAD + 1))
+        result = await conn.execute(
+            text(f"SELECT DISTINCT year FROM {DEFAULT_PARTITION}")
+        )
+        wanted.update(result.scalars())
+    else:
+        wanted = set(years)
+    missing = sorted(wanted - await partition_years(conn))
+    for year in missing:
+        await create_partition(conn, year)
+    return missing
+
+
+async def ensure_budget_partitions(
+    engines: Optional[Iterable[AsyncEngine]] = None,
+) -> None:
+    """Runs ``ensure_partitions`` on every shard at startup.
+
+    Failures are logged, never raised: until its partition exists a year's
+    budgets are stored in the default partition, which only costs pruning.
+    The embedded SQLite database has no partitions.
+    """
+    for engine in shard_engines if engines is None else engines:
+        if engine.dialect.name != "postgresql":
+            continue
+        try:
+            async with engine.begin() as conn:
+                created = await ensure_partitions(conn)
+        except Exception:
+            logger.warning("Budget partition maintenance failed", exc_info=True)
+            continue
+        if created:
+            logger.info("Created budget partitions for %s", created)
@@ -1,36 +1,70 @@
-from typing import List, Optional, Tuple
+import asyncio
+from datetime import datetime
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import and_, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.budget.models import Budget
 from src.domain.budget.repositories import BudgetRepository
+from src.domain.budget.value_objects import BudgetSort, period_key, period_year
+from src.domain.errors import ArchivedError
+from src.infrastructure.budget.archive import BudgetArchive, budget_archive
 from src.infrastructure.budget.mappers import BudgetMapper
 from src.infrastructure.budget.models import BudgetORM
+from src.infrastructure.sharding import gather_shards, replicate_users, route
 
 
 class SQLBudgetRepository(BudgetRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, archive: Optional[BudgetArchive] = None):
         self._session = session
+        # Archived years are read-only: reads fall back to the archive and
+        # writes to an archived budget raise ``ArchivedError``
+        self._archive = budget_archive if archive is None else archive
 
     async def add(self, budget: Budget) -> None:
+        await route(self._session, budget.workspace_id)
+        await replicate_users(self._session, [budget.owner_id])
         orm_budget = BudgetMapper.to_orm(budget)
         self._session.add(orm_budget)
 
     async def get_by_id(self, id: UUID) -> Optional[Budget]:
+        budgets = await self.get_by_ids([id])
+        return budgets[0] if budgets else None
+
+    async def get_by_ids(self, ids: Collection[UUID]) -> List[Budget]:
+        if not ids:
+            return []
         stmt = select(BudgetORM).where(
-            and_(BudgetORM.id == id, BudgetORM.deleted_at.is_(None))
+            and_(BudgetORM.id.in_(ids), BudgetORM.deleted_at.is_(None))
         )
-        result = await self._session.execute(stmt)
-        orm_budget = result.scalar_one_or_none()
-        if not orm_budget:
-            return None
-        return BudgetMapper.to_domain(orm_budget)
+
+        async def query(session: AsyncSession) -> List[Budget]:
+            result = await session.execute(stmt)
+            return [BudgetMapper.to_domain(orm) for orm in result.scalars()]
+
+        # Ids do not say which workspace, hence which shard, a budget is in
+        budgets = [
+            budget
+            for shard in await gather_shards(self._session, query)
+            for budget in shard
+        ]
+        found = {budget.id for budget in budgets}
+        missing = [id for id in ids if id not in found]
+        if missing:
+            rows = await asyncio.to_thread(self._archive.find, missing)
+            budgets += [
+                BudgetMapper.from_row(row)
+                for row in rows
+                if row["deleted_at"] is None and row["id"] not in found
+            ]
+        return budgets
 
     async def get_by_category_period(
         self, workspace_id: UUID, category_id: UUID, month: int, year: int
     ) -> Optional[Budget]:
+        await route(self._session, workspace_id)
         stmt = select(BudgetORM).where(
             and_(
                 BudgetORM.workspace_id == workspace_id,
@@ -42,57 +76,358 @@ class SQLBudgetRepository(BudgetRepository):
         )
         result = await self._session.execute(stmt)
         orm_budget = result.scalar_one_or_none()
-        if not orm_budget:
+        if orm_budget:
+            return BudgetMapper.to_domain(orm_budget)
+        if year not in await asyncio.to_thread(self._archive.years, workspace_id):
             return None
-        return BudgetMapper.to_domain(orm_budget)
+        rows = await self._archived_rows(
+            workspace_id, [year], category_id, month, year, None, None
+        )
+        for row in rows:
+            if row["deleted_at"] is None:
+                return BudgetMapper.from_row(row)
+        return None
 
-    async def list_by_workspace(
+    @staticmethod
+    def _scope_filters(
+        workspace_id: UUID,
+        category_id: Optional[UUID],
+        month: Optional[int],
+        year: Optional[int],
+        period_from: Optional[int],
+        period_to: Optional[int],
+    ) -> list:
+        filters = [BudgetORM.workspace_id == workspace_id]
+        if category_id:
+            filters.append(BudgetORM.category_id == category_id)
+        # A year, with or without its month, is also a period range, which
+        # the (workspace_id, period) index can serve. The matching conditions
+        # on year, the partition key, let Postgres skip the other partitions.
+        if year and month:
+            filters.append(BudgetORM.period == period_key(year, month))
+            filters.append(BudgetORM.year == year)
+        elif year:
+            filters.append(
+                BudgetORM.period.between(period_key(year, 1), period_key(year, 12))
+            )
+            filters.append(BudgetORM.year == year)
+        elif month:
+            filters.append(BudgetORM.month == month)
+        if period_from is not None:
+            filters.append(BudgetORM.period >= period_from)
+            filters.append(BudgetORM.year >= period_year(period_from))
+        if period_to is not None:
+            filters.append(BudgetORM.period <= period_to)
+            filters.append(BudgetORM.year <= period_year(period_to))
+        return filters
+
+    @classmethod
+    def _list_filters(
+        cls,
+        workspace_id: UUID,
+        category_id: Optional[UUID],
+        month: Optional[int],
+        year: Optional[int],
+        period_from: Optional[int],
+        period_to: Optional[int],
+        min_limit: Optional[float],
+        max_limit: Optional[float],
+    ) -> list:
+        filters = cls._scope_filters(
+            workspace_id, category_id, month, year, period_from, period_to
+        )
+        filters.append(BudgetORM.deleted_at.is_(None))
+        if min_limit is not None:
+            filters.append(BudgetORM.limit_amount >= min_limit)
+        if max_limit is not None:
+            filters.append(BudgetORM.limit_amount <= max_limit)
+        return filters
+
+    async def _archived_years(
+        self,
+        workspace_id: UUID,
+        year: Optional[int],
+        period_from: Optional[int],
+        period_to: Optional[int],
+    ) -> List[int]:
+        """Archived years a scope reaches into that hold rows of the workspace."""
+        # Refreshing the index stats the directory and may read files
+        archived_years = await asyncio.to_thread(self._archive.years, workspace_id)
+        return sorted(
+            archived
+            for archived in archived_years
+            if (not year or archived == year)
+            and (period_from is None or archived >= period_year(period_from))
+            and (period_to is None or archived <= period_year(period_to))
+        )
+
+    async def _archived_rows(
+        self,
+        workspace_id: UUID,
+        years: Collection[int],
+        category_id: Optional[UUID],
+        month: Optional[int],
+        year: Optional[int],
+        period_from: Optional[int],
+        period_to: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        """Archive rows in the scope of ``_scope_filters``, deleted ones included."""
+        rows = await asyncio.to_thread(self._archive.read, workspace_id, years)
+        return [
+            row
+            for row in rows
+            if (not category_id or row["category_id"] == category_id)
+            and (not year or row["year"] == year)
+            and (not month or row["month"] == month)
+            and (period_from is None or row["period"] >= period_from)
+            and (period_to is None or row["period"] <= period_to)
+        ]
+
+    @staticmethod
+    def _order_by(sort: Optional[BudgetSort]) -> list:
+        if sort is None:
+            return []
+        column = getattr(BudgetORM, sort.field)
+        # The id breaks ties so pages do not overlap
+        if sort.descending:
+            return [column.desc(), BudgetORM.id.desc()]
+        return [column.asc(), BudgetORM.id.asc()]
+
+    async def get_list_version(
         self,
         workspace_id: UUID,
         category_id: Optional[UUID] = None,
         month: Optional[int] = None,
         year: Optional[int] = None,
-        limit: int = 20,
-        offset: int = 0,
-    ) -> Tuple[List[Budget], int]:
-        filters = [
-            BudgetORM.workspace_id == workspace_id,
-            BudgetORM.deleted_at.is_(None),
+        *,
+        period_from: Optional[int] = None,
+        period_to: Optional[int] = None,
+    ) -> Tuple[Optional[datetime], int]:
+        await route(self._session, workspace_id)
+        # Soft-deleted rows keep bumping max(updated_at) so a removal changes
+        # the version even when another budget is created in the same scope.
+        filters = self._scope_filters(
+            workspace_id, category_id, month, year, period_from, period_to
+        )
+
+        stmt = select(
+            func.max(BudgetORM.updated_at),
+            func.count().filter(BudgetORM.deleted_at.is_(None)),
+        ).where(and_(*filters))
+        result = await self._session.execute(stmt)
+        last_updated, total = result.one()
+        total = total or 0
+        years = await self._archived_years(workspace_id, year, period_from, period_to)
+        if years:
+            rows = await self._archived_rows(
+                workspace_id, years, category_id, month, year, period_from, period_to
+            )
+            stamps = [row["updated_at"] for row in rows if row["updated_at"]]
+            if last_updated:
+                stamps.append(last_updated)
+            last_updated = max(stamps, default=None)
+            total += sum(row["deleted_at"] is None for row in rows)
+        return last_updated, total
+
+    async def _list_with_archive(
+        self,
+        workspace_id: UUID,
+        years: List[int],
+        filters: list,
+        scope: Tuple,
+        min_limit: Optional[float],
+        max_limit: Optional[float],
+        limit: int,
+        offset: int,
+        sort: Optional[BudgetSort],
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """A page of rows from both the database and the archived ``years``.
+
+        Without a sort the database rows come first and the archive rows
+        after them. With one, each side contributes its first
+        ``offset + limit`` rows and the page is cut from their merge.
+        """
+        archived = [
+            row
+            for row in await self._archived_rows(workspace_id, years, *scope)
+            if row["deleted_at"] is None
+            and (min_limit is None or row["limit_amount"] >= min_limit)
+            and (max_limit is None or row["limit_amount"] <= max_limit)
         ]
-        if category_id:
-            filters.append(BudgetORM.category_id == category_id)
-        if month:
-            filters.append(BudgetORM.month == month)
-        if year:
-            filters.append(BudgetORM.year == year)
+        total = await self._count(filters)
+        stmt = (
+            select(*BudgetORM.__table__.c)
+            .where(and_(*filters))
+            .order_by(*self._order_by(sort))
+        )
+        if sort is None:
+            rows = []
+            if offset < total:
+                result = await self._session.execute(stmt.limit(limit).offset(offset))
+                rows = [dict(row) for row in result.mappings()]
+            start = max(offset - total, 0)
+            rows += archived[start : start + limit - len(rows)]
+        else:
+            result = await self._session.execute(stmt.limit(offset + limit))
+            rows = [dict(row) for row in result.mappings()] + archived
+            rows.sort(
+                key=lambda row: (row[sort.field], row["id"]), reverse=sort.descending
+            )
+            rows = rows[offset : offset + limit]
+        return rows, total + len(archived)
 
-        # Count total
+    async def _count(self, filters: list) -> int:
         count_stmt = select(func.count()).select_from(BudgetORM).where(and_(*filters))
         total_result = await self._session.execute(count_stmt)
-        total = total_result.scalar() or 0
+        return total_result.scalar() or 0
+
+    async def list_by_workspace(
+        self,
+        workspace_id: UUID,
+        category_id: Optional[UUID] = None,
+        month: Optional[int] = None,
+        year: Optional[int] = None,
+        limit: int = 20,
+        offset: int = 0,
+        *,
+        period_from: Optional[int] = None,
+        period_to: Optional[int] = None,
+        min_limit: Optional[float] = None,
+        max_limit: Optional[float] = None,
+        sort: Optional[BudgetSort] = None,
+    ) -> Tuple[List[Budget], int]:
+        await route(self._session, workspace_id)
+        filters = self._list_filters(
+            workspace_id,
+            category_id,
+            month,
+            year,
+            period_from,
+            period_to,
+            min_limit,
+            max_limit,
+        )
+        years = await self._archived_years(workspace_id, year, period_from, period_to)
+        if years:
+            rows, total = await self._list_with_archive(
+                workspace_id,
+                years,
+                filters,
+                (category_id, month, year, period_from, period_to),
+                min_limit,
+                max_limit,
+                limit,
+                offset,
+                sort,
+            )
+            return [BudgetMapper.from_row(row) for row in rows], total
+        total = await self._count(filters)
 
         # Get page
-        stmt = select(BudgetORM).where(and_(*filters)).limit(limit).offset(offset)
+        stmt = (
+            select(BudgetORM)
+            .where(and_(*filters))
+            .order_by(*self._order_by(sort))
+            .limit(limit)
+            .offset(offset)
+        )
         result = await self._session.execute(stmt)
         return [BudgetMapper.to_domain(orm) for orm in result.scalars()], total
 
+    async def list_columns_by_workspace(
+        self,
+        workspace_id: UUID,
+        columns: Sequence[str],
+        category_id: Optional[UUID] = None,
+        month: Optional[int] = None,
+        year: Optional[int] = None,
+        limit: int = 20,
+        offset: int = 0,
+        *,
+        period_from: Optional[int] = None,
+        period_to: Optional[int] = None,
+        min_limit: Optional[float] = None,
+        max_limit: Optional[float] = None,
+        sort: Optional[BudgetSort] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        await route(self._session, workspace_id)
+        filters = self._list_filters(
+            workspace_id,
+            category_id,
+            month,
+            year,
+            period_from,
+            period_to,
+            min_limit,
+            max_limit,
+        )
+        years = await self._archived_years(workspace_id, year, period_from, period_to)
+        if years:
+            rows, total = await self._list_with_archive(
+                workspace_id,
+                years,
+                filters,
+                (category_id, month, year, period_from, period_to),
+                min_limit,
+                max_limit,
+                limit,
+                offset,
+                sort,
+            )
+            return [{name: row[name] for name in columns} for row in rows], total
+        total = await self._count(filters)
+
+        table_columns = BudgetORM.__table__.c
+        stmt = (
+            select(*(table_columns[name] for name in columns))
+            .where(and_(*filters))
+            .order_by(*self._order_by(sort))
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self._session.execute(stmt)
+        return [dict(row) for row in result.mappings()], total
+
     async def update(self, budget: Budget) -> None:
+        await route(self._session, budget.workspace_id)
         stmt = (
             update(BudgetORM)
-            .where(BudgetORM.id == budget.id)
+            .where(BudgetORM.id == budget.id, BudgetORM.year == budget.year)
             .values(
                 limit_amount=budget.limit_amount,
                 updated_at=budget.updated_at,
                 deleted_at=budget.deleted_at,
             )
         )
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
+        self._check_written(result.rowcount)
 
     async def remove(self, budget: Budget) -> None:
+        await route(self._session, budget.workspace_id)
         # Soft delete
         stmt = (
             update(BudgetORM)
-            .where(BudgetORM.id == budget.id)
+            .where(BudgetORM.id == budget.id, BudgetORM.year == budget.year)
             .values(deleted_at=budget.deleted_at, updated_at=budget.updated_at)
         )
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
+        self._check_written(result.rowcount)
+
+    @staticmethod
+    def _check_written(rowcount: int) -> None:
+        # A budget that was read but has no row left came from the archive
+        if rowcount == 0:
+            raise ArchivedError("Budget is archived and can no longer be changed")
+
+    async def remove_by_workspace_batch(self, workspace_id: UUID, limit: int) -> int:
+        await route(self._session, workspace_id)
+        batch = (
+            select(BudgetORM.id)
+            .where(BudgetORM.workspace_id == workspace_id)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = await self._session.execute(
+            delete(BudgetORM).where(BudgetORM.id.in_(batch))
+        )
+        return result.rowcount
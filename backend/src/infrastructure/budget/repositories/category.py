@@ -1,13 +1,15 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, delete, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.budget.models import Category
 from src.domain.budget.repositories import CategoryRepository
 from src.infrastructure.budget.mappers.category import CategoryMapper
 from src.infrastructure.budget.models.category import CategoryORM
+from src.infrastructure.sharding import route
 
 
 class SQLCategoryRepository(CategoryRepository):
@@ -15,10 +17,14 @@ class SQLCategoryRepository(CategoryRepository):
         self._session = session
 
     async def add(self, category: Category) -> None:
+        if category.workspace_id:
+            await route(self._session, category.workspace_id)
         orm_category = CategoryMapper.to_orm(category)
         self._session.add(orm_category)
 
     async def get_by_id(self, id: UUID) -> Optional[Category]:
+        # Every shard holds the default categories; a workspace category is
+        # read from the shard the session was routed to
         stmt = select(CategoryORM).where(CategoryORM.id == id)
         result = await self._session.execute(stmt)
         orm_category = result.scalar_one_or_none()
@@ -29,6 +35,7 @@ class SQLCategoryRepository(CategoryRepository):
     async def get_by_name(self, name: str, workspace_id: Optional[UUID] = None) -> Optional[Category]:
         filters = [CategoryORM.name == name]
         if workspace_id:
+            await route(self._session, workspace_id)
             filters.append(or_(CategoryORM.workspace_id == workspace_id, CategoryORM.is_default == True))
         else:
             filters.append(CategoryORM.is_default == True)
@@ -46,8 +53,34 @@ class SQLCategoryRepository(CategoryRepository):
         return [CategoryMapper.to_domain(orm) for orm in result.scalars()]
 
     async def list_by_workspace(self, workspace_id: UUID) -> List[Category]:
+        await route(self._session, workspace_id)
         stmt = select(CategoryORM).where(
             or_(CategoryORM.workspace_id == workspace_id, CategoryORM.is_default == True)
         )
         result = await self._session.execute(stmt)
         return [CategoryMapper.to_domain(orm) for orm in result.scalars()]
+
+    async def get_list_version(
+        self, workspace_id: Optional[UUID] = None
+    ) -> Tuple[Optional[datetime], int]:
+        scope = CategoryORM.is_default.is_(True)
+        if workspace_id:
+            await route(self._session, workspace_id)
+            scope = or_(CategoryORM.workspace_id == workspace_id, scope)
+        stmt = select(func.max(CategoryORM.updated_at), func.count()).where(scope)
+        result = await self._session.execute(stmt)
+        last_updated, total = result.one()
+        return last_updated, total or 0
+
+    async def remove_by_workspace_batch(self, workspace_id: UUID, limit: int) -> int:
+        await route(self._session, workspace_id)
+        batch = (
+            select(CategoryORM.id)
+            .where(CategoryORM.workspace_id == workspace_id)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = await self._session.execute(
+            delete(CategoryORM).where(CategoryORM.id.in_(batch))
+        )
+        return result.rowcount
@@ -0,0 +1,42 @@
+from .backends import CacheBackend, InMemoryCacheBackend, RedisCacheBackend
+from .codec import Codec
+from .invalidation import InvalidationBus, create_invalidation_bus
+from .policies import (
+    BUDGET_POLICY,
+    CATEGORY_POLICY,
+    DOMAIN_CODEC,
+    USER_POLICY,
+    WORKSPACE_POLICY,
+)
+from .repository import (
+    CachedRead,
+    CachedRepository,
+    CachePolicy,
+    Invalidation,
+    cached,
+    create_cache_backend,
+    invalidate_cached,
+    running_cache_invalidation,
+)
+
+__all__ = [
+    "BUDGET_POLICY",
+    "CATEGORY_POLICY",
+    "CacheBackend",
+    "CachePolicy",
+    "CachedRead",
+    "CachedRepository",
+    "Codec",
+    "DOMAIN_CODEC",
+    "InMemoryCacheBackend",
+    "Invalidation",
+    "InvalidationBus",
+    "RedisCacheBackend",
+    "USER_POLICY",
+    "WORKSPACE_POLICY",
+    "cached",
+    "create_cache_backend",
+    "create_invalidation_bus",
+    "invalidate_cached",
+    "running_cache_invalidation",
+]
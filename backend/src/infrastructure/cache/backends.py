@@ -0,0 +1,169 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+
+class CacheBackend(ABC):
+    """Values with a time to live, grouped under tags for invalidation.
+
+    ``shared`` backends are seen by every worker, so an invalidation reaches
+    them all, and store bytes; the others live in one process and keep the
+    objects they are given.
+    """
+
+    shared = False
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    async def set(
+        self, key: str, value: Any, ttl: float, tags: Iterable[str] = ()
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, keys: Iterable[str]) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Deletes every key stored under any of ``tags``."""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Per-process entries, least recently used evicted past ``max_entries``."""
+
+    def __init__(
+        self, max_entries: int = 10_000, clock: Callable[[], float] = time.monotonic
+    ):
+        self._entries: "OrderedDict[str, Tuple[float, Any, Tuple[str, ...]]]" = (
+            OrderedDict()
+        )
+        self._tags: Dict[str, Set[str]] = {}
+        self._max_entries = max_entries
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def set(
+        self, key: str, value: Any, ttl: float, tags: Iterable[str] = ()
+    ) -> None:
+        self._drop(key)
+        tags = tuple(set(tags))
+        self._entries[key] = (self._clock() + ttl, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self._max_entries:
+            self._drop(next(iter(self._entries)))
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self._drop(key)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            for key in list(self._tags.get(tag, ())):
+                self._drop(key)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+
+
+# The value and its tag sets are written together; a tag set lives as long
+# as its longest-lived key so an invalidation never misses one.
+_SET_SCRIPT = """
+local ttl = tonumber(ARGV[2])
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ttl)
+for i = 2, #KEYS do
+    redis.call('SADD', KEYS[i], KEYS[1])
+    if redis.call('PTTL', KEYS[i]) < ttl then
+        redis.call('PEXPIRE', KEYS[i], ttl)
+    end
+end
+"""
+
+_INVALIDATE_SCRIPT = """
+for i = 1, #KEYS do
+    local keys = redis.call('SMEMBERS', KEYS[i])
+    for j = 1, #keys do
+        redis.call('DEL', keys[j])
+    end
+    redis.call('DEL', KEYS[i])
+end
+"""
+
+
+class RedisCacheBackend(CacheBackend):
+    """Entries shared by every worker through a Redis server.
+
+    ``client`` is a ``redis.asyncio.Redis``. Each tag is a set of the keys
+    stored under it, so invalidating a tag deletes them in one round trip.
+    """
+
+    shared = True
+
+    def __init__(self, client, prefix: str = "wiselab:cache:"):
+        self._client = client
+        self._set = client.register_script(_SET_SCRIPT)
+        self._invalidate = client.register_script(_INVALIDATE_SCRIPT)
+        self._prefix = prefix
+
+    def _tag(self, tag: str) -> str:
+        return f"{self._prefix}tag:{tag}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(self._prefix + key)
+
+    async def set(
+        self, key: str, value: bytes, ttl: float, tags: Iterable[str] = ()
+    ) -> None:
+        await self._set(
+            keys=[self._prefix + key, *map(self._tag, set(tags))],
+            args=[value, max(int(ttl * 1000), 1)],
+        )
+
+    async def delete(self, keys: Iterable[str]) -> None:
+        keys = [self._prefix + key for key in keys]
+        if keys:
+            await self._client.delete(*keys)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        keys = [self._tag(tag) for tag in set(tags)]
+        if keys:
+            await self._invalidate(keys=keys)
+
+    async def clear(self) -> None:
+        keys = [key async for key in self._client.scan_iter(f"{self._prefix}*")]
+        for i in range(0, len(keys), 1000):
+            await self._client.delete(*keys[i : i + 1000])
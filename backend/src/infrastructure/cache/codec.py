@@ -0,0 +1,66 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+from uuid import UUID
+
+import msgpack
+
+_UUID = 1
+_DATETIME = 2
+_TUPLE = 3
+_SET = 4
+_OBJECT = 5
+
+# name -> (class, to fields, from fields)
+CodecTypes = Mapping[
+    str, Tuple[type, Callable[[Any], Dict[str, Any]], Callable[[Dict[str, Any]], Any]]
+]
+
+
+class Codec:
+    """Encodes cached values as msgpack for a shared backend.
+
+    Besides msgpack's own types it handles UUIDs, datetimes, tuples and
+    sets, and the classes in ``types``, which are stored as their fields.
+    Anything else raises ``TypeError``: unlike pickle, reading a value back
+    never runs code named by whoever wrote it.
+    """
+
+    def __init__(self, types: Optional[CodecTypes] = None):
+        self._types = dict(types or {})
+        self._names = {cls: name for name, (cls, _, _) in self._types.items()}
+
+    def _default(self, value: Any) -> msgpack.ExtType:
+        if isinstance(value, UUID):
+            return msgpack.ExtType(_UUID, value.bytes)
+        if isinstance(value, datetime):
+            return msgpack.ExtType(_DATETIME, value.isoformat().encode())
+        if isinstance(value, tuple):
+            return msgpack.ExtType(_TUPLE, self.dumps(list(value)))
+        if isinstance(value, (set, frozenset)):
+            return msgpack.ExtType(_SET, self.dumps(list(value)))
+        name = self._names.get(type(value))
+        if name is not None:
+            fields = self._types[name][1](value)
+            return msgpack.ExtType(_OBJECT, self.dumps([name, fields]))
+        raise TypeError(f"Cannot cache a {type(value).__name__}")
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        if code == _UUID:
+            return UUID(bytes=data)
+        if code == _DATETIME:
+            return datetime.fromisoformat(data.decode())
+        if code == _TUPLE:
+            return tuple(self.loads(data))
+        if code == _SET:
+            return set(self.loads(data))
+        if code == _OBJECT:
+            name, fields = self.loads(data)
+            return self._types[name][2](fields)
+        raise ValueError(f"Unknown cached type {code}")
+
+    def dumps(self, value: Any) -> bytes:
+        # Strict, so tuples reach ``_default`` instead of becoming lists
+        return msgpack.packb(value, default=self._default, strict_types=True)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, ext_hook=self._ext_hook, strict_map_key=False)
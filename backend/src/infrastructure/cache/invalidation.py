@@ -0,0 +1,133 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Iterable, Optional, Set, Union
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.infrastructure.cache.backends import CacheBackend
+
+CACHE_INVALIDATION_CHANNEL = "wiselab_cache"
+CACHE_LISTENER_PING_INTERVAL = float(os.getenv("CACHE_LISTENER_PING_INTERVAL", "10"))
+CACHE_LISTENER_RETRY_DELAY = float(os.getenv("CACHE_LISTENER_RETRY_DELAY", "2"))
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+MAX_PAYLOAD = 7900
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidationBus:
+    """Carries cache invalidations between workers over LISTEN/NOTIFY.
+
+    ``publish`` queues a ``pg_notify`` in the writer's transaction, so the
+    message goes out when it commits and never if it rolls back. Each
+    worker keeps one connection, outside the pool, listening on the channel
+    and evicting the keys and tags it hears about from its own ``backend``;
+    a worker hears its own messages too, which drops whatever another
+    request cached between the write and the commit. Messages sent while
+    the connection is down are lost, so the backend is cleared every time
+    the listener (re)connects.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        url: str,
+        channel: str = CACHE_INVALIDATION_CHANNEL,
+        ping_interval: float = CACHE_LISTENER_PING_INTERVAL,
+        retry_delay: float = CACHE_LISTENER_RETRY_DELAY,
+    ):
+        self._backend = backend
+        self._dsn = (
+            make_url(url)
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+        )
+        self._channel = channel
+        self._ping_interval = ping_interval
+        self._retry_delay = retry_delay
+        self._pending: Set[asyncio.Task] = set()
+        self.listening = asyncio.Event()
+
+    async def publish(
+        self,
+        session: Union[AsyncSession, AsyncConnection],
+        keys: Iterable[str],
+        tags: Iterable[str],
+    ) -> None:
+        message = {"keys": list(keys), "tags": list(tags)}
+        if not message["keys"] and not message["tags"]:
+            return
+        payload = json.dumps(message, separators=(",", ":"))
+        if len(payload.encode()) >= MAX_PAYLOAD:
+            payload = json.dumps({"clear": True})
+        await session.execute(select(func.pg_notify(self._channel, payload)))
+
+    async def apply(self, payload: str) -> None:
+        """Evicts what a published message names from the local backend."""
+        message = json.loads(payload)
+        if message.get("clear"):
+            await self._backend.clear()
+            return
+        if message.get("keys"):
+            await self._backend.delete(message["keys"])
+        if message.get("tags"):
+            await self._backend.invalidate_tags(message["tags"])
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        task = asyncio.create_task(self.apply(payload))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _listen(self, stop: asyncio.Event) -> None:
+        connection = await asyncpg.connect(
+            self._dsn, server_settings={"application_name": "wiselab-cache-listener"}
+        )
+        try:
+            await connection.add_listener(self._channel, self._on_notify)
+            # Anything cached while nobody was listening may be stale
+            await self._backend.clear()
+            self.listening.set()
+            logger.info("Listening for cache invalidations on %s", self._channel)
+            while not stop.is_set():
+                try:
+                    await asyncio.wait_for(stop.wait(), self._ping_interval)
+                except asyncio.TimeoutError:
+                    # A dropped connection shows up here, not in the listener
+                    await asyncio.wait_for(
+                        connection.fetchval("SELECT 1"), self._ping_interval
+                    )
+        finally:
+            self.listening.clear()
+            connection.terminate()
+
+    async def run(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                await self._listen(stop)
+            except Exception as e:
+                logger.warning("Cache invalidation listener lost, reconnecting: %s", e)
+            try:
+                await asyncio.wait_for(stop.wait(), self._retry_delay)
+            except asyncio.TimeoutError:
+                pass
+        await asyncio.gather(*self._pending, return_exceptions=True)
+
+
+def create_invalidation_bus(
+    backend: Optional[CacheBackend], url: str
+) -> Optional[InvalidationBus]:
+    """A bus for a per-process cache on PostgreSQL, None otherwise.
+
+    A shared backend is invalidated directly by the writer and SQLite has
+    no NOTIFY.
+    """
+    if backend is None or backend.shared:
+        return None
+    if make_url(url).get_backend_name() != "postgresql":
+        return None
+    return InvalidationBus(backend, url)
@@ -0,0 +1,199 @@
+"""What the repositories cache and what their writes invalidate.
+
+Tags shared across repositories:
+
+- ``user:<id>``: a user row.
+- ``workspace:<id>``: a workspace row and its memberships.
+- ``member:<user id>``: lists of the workspaces a user belongs to.
+- ``categories:<workspace id>``: a workspace's catalog; ``categories:default``
+  for the default categories.
+- ``budgets:<workspace id>``: a workspace's budgets; ``budget:<id>`` for a
+  lookup by id that found nothing.
+"""
+
+from sqlalchemy import inspect
+
+from src.domain.auth.models import User
+from src.domain.budget.models import Budget, Category
+from src.domain.workspace.models import Workspace, WorkspaceMember
+from src.infrastructure.auth.mappers import UserMapper
+from src.infrastructure.auth.models import UserORM
+from src.infrastructure.budget.mappers import BudgetMapper
+from src.infrastructure.budget.mappers.category import CategoryMapper
+from src.infrastructure.budget.models import BudgetORM, CategoryORM
+from src.infrastructure.cache.codec import Codec
+from src.infrastructure.cache.repository import CachedRead, CachePolicy, Invalidation
+from src.infrastructure.workspace.mappers import WorkspaceMapper, WorkspaceMemberMapper
+from src.infrastructure.workspace.models import WorkspaceMemberORM, WorkspaceORM
+
+
+def _mapped(domain, mapper, orm):
+    """Codec entry storing ``domain`` objects as their rows' columns."""
+    columns = [attr.key for attr in inspect(orm).column_attrs]
+
+    def fields(value):
+        row = mapper.to_orm(value)
+        return {column: getattr(row, column) for column in columns}
+
+    return domain, fields, lambda fields: mapper.to_domain(orm(**fields))
+
+
+DOMAIN_CODEC = Codec(
+    {
+        "user": _mapped(User, UserMapper, UserORM),
+        "workspace": _mapped(Workspace, WorkspaceMapper, WorkspaceORM),
+        "member": _mapped(WorkspaceMember, WorkspaceMemberMapper, WorkspaceMemberORM),
+        "category": _mapped(Category, CategoryMapper, CategoryORM),
+        "budget": _mapped(Budget, BudgetMapper, BudgetORM),
+    }
+)
+
+
+def _user_keys(a):
+    user = a["user"]
+    return [("get_by_id", str(user.id)), ("get_by_email", user.email.value)]
+
+
+USER_POLICY = CachePolicy(
+    "user_repository",
+    reads={
+        "get_by_id": CachedRead(
+            tags=lambda a, user: [f"user:{a['id']}"],
+            key=lambda a: str(a["id"]),
+        ),
+        "get_by_email": CachedRead(
+            tags=lambda a, user: [f"user:{user.id}"] if user else [],
+            key=lambda a: a["email"].value,
+        ),
+    },
+    writes={
+        "add": Invalidation(keys=_user_keys),
+        "remove": Invalidation(
+            tags=lambda a: [f"user:{a['user'].id}"], keys=_user_keys
+        ),
+    },
+    codec=DOMAIN_CODEC,
+)
+
+
+def _workspace_tags(a):
+    workspace_id = a["workspace"].id
+    return [
+        f"workspace:{workspace_id}",
+        f"categories:{workspace_id}",
+        f"budgets:{workspace_id}",
+    ]
+
+
+def _member_tags(a):
+    members = a["members"] if "members" in a else [a["member"]]
+    return {f"workspace:{m.workspace_id}" for m in members} | {
+        f"member:{m.user_id}" for m in members
+    }
+
+
+WORKSPACE_POLICY = CachePolicy(
+    "workspace_repository",
+    reads={
+        "get_by_id": CachedRead(tags=lambda a, _: [f"workspace:{a['id']}"]),
+        "list_by_user": CachedRead(
+            tags=lambda a, workspaces: [f"member:{a['user_id']}"]
+            + [f"workspace:{w.id}" for w in workspaces]
+        ),
+        "get_accessible_workspace_ids": CachedRead(
+            tags=lambda a, _: [f"member:{a['user_id']}"]
+            + [f"workspace:{id}" for id in a["workspace_ids"]]
+        ),
+        "get_member": CachedRead(tags=lambda a, _: [f"workspace:{a['workspace_id']}"]),
+        "list_members": CachedRead(
+            tags=lambda a, _: [f"workspace:{a['workspace_id']}"]
+        ),
+    },
+    writes={
+        "add": Invalidation(
+            tags=lambda a: _workspace_tags(a) + [f"member:{a['workspace'].owner_id}"]
+        ),
+        "update": Invalidation(tags=_workspace_tags),
+        "remove": Invalidation(tags=_workspace_tags),
+        "remove_members_batch": Invalidation(
+            tags=lambda a: [f"workspace:{a['workspace_id']}"]
+        ),
+        "add_member": Invalidation(tags=_member_tags),
+        "add_members": Invalidation(tags=_member_tags),
+        "update_member": Invalidation(tags=_member_tags),
+        "remove_member": Invalidation(
+            tags=lambda a: [f"workspace:{a['workspace_id']}", f"member:{a['user_id']}"]
+        ),
+    },
+    codec=DOMAIN_CODEC,
+)
+
+
+def _catalog_tag(workspace_id):
+    return f"categories:{workspace_id}" if workspace_id else "categories:default"
+
+
+CATEGORY_POLICY = CachePolicy(
+    "category_repository",
+    reads={
+        "get_by_id": CachedRead(
+            tags=lambda a, category: (
+                [_catalog_tag(category.workspace_id)] if category else []
+            )
+        ),
+        "list_defaults": CachedRead(tags=lambda a, _: ["categories:default"]),
+        "list_by_workspace": CachedRead(
+            tags=lambda a, _: [_catalog_tag(a["workspace_id"]), "categories:default"]
+        ),
+        "get_list_version": CachedRead(
+            tags=lambda a, _: [_catalog_tag(a["workspace_id"]), "categories:default"]
+        ),
+    },
+    writes={
+        "add": Invalidation(
+            tags=lambda a: [_catalog_tag(a["category"].workspace_id)],
+            keys=lambda a: [("get_by_id", f"id={a['category'].id}")],
+        ),
+        "remove_by_workspace_batch": Invalidation(
+            tags=lambda a: [_catalog_tag(a["workspace_id"])]
+        ),
+    },
+    codec=DOMAIN_CODEC,
+)
+
+
+def _budget_tags(a):
+    budget = a["budget"]
+    return [f"budgets:{budget.workspace_id}", f"budget:{budget.id}"]
+
+
+BUDGET_POLICY = CachePolicy(
+    "budget_repository",
+    reads={
+        "get_by_id": CachedRead(
+            tags=lambda a, budget: [f"budget:{a['id']}"]
+            + ([f"budgets:{budget.workspace_id}"] if budget else [])
+        ),
+        "get_by_category_period": CachedRead(
+            tags=lambda a, _: [f"budgets:{a['workspace_id']}"]
+        ),
+        "list_by_workspace": CachedRead(
+            tags=lambda a, _: [f"budgets:{a['workspace_id']}"]
+        ),
+        "list_columns_by_workspace": CachedRead(
+            tags=lambda a, _: [f"budgets:{a['workspace_id']}"]
+        ),
+        "get_list_version": CachedRead(
+            tags=lambda a, _: [f"budgets:{a['workspace_id']}"]
+        ),
+    },
+    writes={
+        "add": Invalidation(tags=_budget_tags),
+        "update": Invalidation(tags=_budget_tags),
+        "remove": Invalidation(tags=_budget_tags),
+        "remove_by_workspace_batch": Invalidation(
+            tags=lambda a: [f"budgets:{a['workspace_id']}"]
+        ),
+    },
+    codec=DOMAIN_CODEC,
+)
@@ -0,0 +1,329 @@
+import asyncio
+import copy
+import inspect
+import logging
+import os
+from collections.abc import Iterator
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.cache.backends import (
+    CacheBackend,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+)
+from src.infrastructure.cache.codec import Codec
+from src.infrastructure.cache.invalidation import (
+    InvalidationBus,
+    create_invalidation_bus,
+)
+from src.infrastructure.database import DATABASE_URL, engine
+from src.infrastructure.observability import record_cache_lookup
+
+REPOSITORY_CACHE = os.getenv("REPOSITORY_CACHE", "false").lower() == "true"
+REPOSITORY_CACHE_TTL = float(os.getenv("REPOSITORY_CACHE_TTL", "60"))
+REPOSITORY_CACHE_MAX_ENTRIES = int(os.getenv("REPOSITORY_CACHE_MAX_ENTRIES", "10000"))
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL")
+
+# Set in ``session.info`` once a cached repository writes through the session
+WRITTEN = "cache_written"
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+Arguments = Dict[str, Any]
+
+
+def _nothing(*_: Any) -> Tuple[str, ...]:
+    return ()
+
+
+class CachedRead:
+    """A read served from the cache.
+
+    ``tags`` gets the call's arguments and result and names the tags the
+    entry is stored under. ``key`` names the entry from the arguments, so
+    writes can drop it by key; it defaults to the method and every argument.
+    """
+
+    def __init__(
+        self,
+        tags: Callable[[Arguments, Any], Iterable[str]] = _nothing,
+        key: Optional[Callable[[Arguments], str]] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.tags = tags
+        self.key = key
+        self.ttl = ttl
+
+
+class Invalidation:
+    """Keys and tags a write makes stale, named from its arguments.
+
+    ``keys`` yields ``(method, key)`` pairs, ``key`` as the read's ``key``
+    would name it.
+    """
+
+    def __init__(
+        self,
+        tags: Callable[[Arguments], Iterable[str]] = _nothing,
+        keys: Callable[[Arguments], Iterable[Tuple[str, str]]] = _nothing,
+    ):
+        self.tags = tags
+        self.keys = keys
+
+
+class CachePolicy:
+    """Which methods of a repository are cached reads and which are writes.
+
+    ``name`` prefixes the keys and labels the hit/miss metric. Tags are not
+    prefixed: they are shared by every repository on the backend, so a write
+    through one can invalidate what another cached. ``codec`` encodes the
+    reads' results for a shared backend.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        reads: Dict[str, CachedRead],
+        writes: Dict[str, Invalidation],
+        ttl: float = REPOSITORY_CACHE_TTL,
+        codec: Optional[Codec] = None,
+    ):
+        self.name = name
+        self.reads = reads
+        self.writes = writes
+        self.ttl = ttl
+        self.codec = codec or Codec()
+
+    def key(self, method: str, key: str) -> str:
+        return f"{self.name}:{method}:{key}"
+
+
+def _key_part(value: Any) -> str:
+    if value is None:
+        return "~"
+    if isinstance(value, Enum):
+        return str(value.value)
+    if isinstance(value, str):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(map(_key_part, value)) + "]"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(map(_key_part, value))) + "}"
+    return str(value)
+
+
+def _bind(method: Callable, args: tuple, kwargs: dict) -> inspect.BoundArguments:
+    bound = inspect.signature(method).bind(*args, **kwargs)
+    bound.apply_defaults()
+    # A one-shot iterator would be spent on the key before the query
+    for name, value in bound.arguments.items():
+        if isinstance(value, Iterator):
+            bound.arguments[name] = list(value)
+    return bound
+
+
+class CachedRepository:
+    """Read-through cache in front of any repository.
+
+    Methods named in the policy's ``reads`` are served from ``backend``;
+    those in ``writes`` run against the repository and then drop the keys
+    and tags they make stale. Everything else passes through. A shared
+    backend stores values encoded with the policy's codec, a local one deep
+    copies of them, so either way callers get their own copies to change.
+
+    A session that has written through a cached repository reads straight
+    from the database from then on: its uncommitted rows must not reach
+    the cache, where a rollback would leave them behind. A read racing a
+    commit elsewhere can still cache the old row until the TTL runs out.
+    If the backend fails, reads fall back to the repository.
+
+    With a ``bus``, writes also publish their invalidations in the session's
+    transaction for the other workers (see ``InvalidationBus``).
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        policy: CachePolicy,
+        backend: CacheBackend,
+        session: Optional[AsyncSession] = None,
+        bus: Optional[InvalidationBus] = None,
+    ):
+        self._repository = repository
+        self._policy = policy
+        self._backend = backend
+        self._session = session
+        self._bus = bus if session is not None else None
+        self._info: Dict[str, Any] = session.info if session is not None else {}
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._repository, name)
+        if name in self._policy.reads:
+
+            async def read(*args: Any, **kwargs: Any) -> Any:
+                return await self._read(name, attr, args, kwargs)
+
+            return read
+        if name in self._policy.writes:
+
+            async def write(*args: Any, **kwargs: Any) -> Any:
+                return await self._write(name, attr, args, kwargs)
+
+            return write
+        return attr
+
+    def _encode(self, value: Any) -> Any:
+        if self._backend.shared:
+            return self._policy.codec.dumps(value)
+        # Boxed, so a cached None is not taken for a miss
+        return (copy.deepcopy(value),)
+
+    def _decode(self, cached: Any) -> Any:
+        if self._backend.shared:
+            return self._policy.codec.loads(cached)
+        return copy.deepcopy(cached[0])
+
+    async def _read(self, name: str, method: Callable, args: tuple, kwargs: dict):
+        bound = _bind(method, args, kwargs)
+        if self._info.get(WRITTEN):
+            return await method(*bound.args, **bound.kwargs)
+
+        rule = self._policy.reads[name]
+        arguments = bound.arguments
+        if rule.key is not None:
+            key = self._policy.key(name, rule.key(arguments))
+        else:
+            key = self._policy.key(
+                name,
+                ",".join(f"{k}={_key_part(v)}" for k, v in arguments.items()),
+            )
+        try:
+            cached = await self._backend.get(key)
+        except Exception as e:
+            logger.warning("Repository cache unavailable, reading through: %s", e)
+            return await method(*bound.args, **bound.kwargs)
+        record_cache_lookup(self._policy.name, cached is not None)
+        if cached is not None:
+            try:
+                return self._decode(cached)
+            except Exception as e:
+                logger.warning("Could not read cached %s, reading through: %s", key, e)
+                return await method(*bound.args, **bound.kwargs)
+
+        result = await method(*bound.args, **bound.kwargs)
+        try:
+            await self._backend.set(
+                key,
+                self._encode(result),
+                rule.ttl or self._policy.ttl,
+                rule.tags(arguments, result),
+            )
+        except Exception as e:
+            logger.warning("Could not cache %s: %s", key, e)
+        return result
+
+    async def _write(self, name: str, method: Callable, args: tuple, kwargs: dict):
+        bound = _bind(method, args, kwargs)
+        self._info[WRITTEN] = True
+        result = await method(*bound.args, **bound.kwargs)
+
+        rule = self._policy.writes[name]
+        arguments = bound.arguments
+        keys = [self._policy.key(*key) for key in rule.keys(arguments)]
+        tags = list(rule.tags(arguments))
+        if self._bus is not None:
+            await self._bus.publish(self._session, keys, tags)
+        try:
+            if keys:
+                await self._backend.delete(keys)
+            if tags:
+                await self._backend.invalidate_tags(tags)
+        except Exception as e:
+            logger.warning("Could not invalidate %s %s: %s", keys, tags, e)
+        return result
+
+
+def create_cache_backend(
+    redis_url: Optional[str] = CACHE_REDIS_URL,
+    max_entries: int = REPOSITORY_CACHE_MAX_ENTRIES,
+) -> CacheBackend:
+    """Shared Redis cache when ``redis_url`` is set, per-process otherwise."""
+    if not redis_url:
+        return InMemoryCacheBackend(max_entries)
+    from redis.asyncio import Redis
+
+    return RedisCacheBackend(Redis.from_url(redis_url))
+
+
+repository_cache: Optional[CacheBackend] = (
+    create_cache_backend() if REPOSITORY_CACHE else None
+)
+invalidation_bus = create_invalidation_bus(repository_cache, DATABASE_URL)
+
+
+def cached(repository: T, policy: CachePolicy, session: AsyncSession) -> T:
+    """Wraps ``repository`` in the process cache, or returns it when disabled."""
+    if repository_cache is None:
+        return repository
+    return CachedRepository(
+        repository, policy, repository_cache, session, invalidation_bus
+    )
+
+
+async def invalidate_cached(
+    tags: Iterable[str],
+    backend: Optional[CacheBackend] = None,
+    bus: Optional[InvalidationBus] = None,
+) -> None:
+    """Drops ``tags`` after a write made outside the cached repositories.
+
+    The invalidation is published in a transaction of its own, as the write
+    is already committed.
+    """
+    backend = backend or repository_cache
+    bus = bus or invalidation_bus
+    tags = list(tags)
+    if backend is None or not tags:
+        return
+    if bus is not None:
+        async with engine.begin() as conn:
+            await bus.publish(conn, (), tags)
+    try:
+        await backend.invalidate_tags(tags)
+    except Exception as e:
+        logger.warning("Could not invalidate %s: %s", tags, e)
+
+
+@asynccontextmanager
+async def running_cache_invalidation(
+    bus: Optional[InvalidationBus] = None,
+) -> AsyncIterator[None]:
+    """Listens for other workers' invalidations for the block's duration.
+
+    Does nothing without a bus, i.e. when the cache is off or shared.
+    """
+    bus = bus or invalidation_bus
+    if bus is None:
+        yield
+        return
+    stop = asyncio.Event()
+    task = asyncio.create_task(bus.run(stop), name="cache-invalidation")
+    try:
+        yield
+    finally:
+        stop.set()
+        await asyncio.gather(task, return_exceptions=True)
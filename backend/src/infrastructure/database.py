@@ -1,12 +1,51 @@
 import os
+from typing import Any, Optional, Sequence, Union
 
-from sqlalchemy import MetaData
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import MetaData, event, inspect, make_url
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.sql.util import find_tables
+
+from src.infrastructure.observability import instrument_engine
 
 DATABASE_URL = os.getenv(
     "DATABASE_URL", "postgresql+asyncpg://postgres:postgres@db/wiselab"
 )
+DB_ECHO = os.getenv("DB_ECHO", "true").lower() == "true"
+# Embedded mode: DATABASE_URL=sqlite+aiosqlite:///path/to/wiselab.db
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+# WAL lets readers run alongside the single writer, and with it
+# synchronous=NORMAL only syncs at checkpoints. Foreign keys, and so the
+# ON DELETE cascades, are off unless enabled on every connection.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+    "busy_timeout": SQLITE_BUSY_TIMEOUT_MS,
+    "cache_size": -SQLITE_CACHE_SIZE_KB,
+    "mmap_size": SQLITE_MMAP_SIZE,
+    "temp_store": "MEMORY",
+}
+# Comma-separated; shard 0 may be DATABASE_URL itself. Empty: a single database
+DATABASE_SHARD_URLS = [
+    url.strip()
+    for url in os.getenv("DATABASE_SHARD_URLS", "").split(",")
+    if url.strip()
+]
+
+# Workspace-scoped tables; everything else (users, tokens, jobs, audit and the
+# shard directory) stays in the primary database at DATABASE_URL
+SHARDED_TABLES = frozenset({"workspaces", "workspace_members", "categories", "budgets"})
 
 naming_convention = {
     "ix": "ix_%(column_0_label)s",
@@ -23,15 +62,113 @@ class Base(DeclarativeBase):
     metadata = metadata
 
 
-engine = create_async_engine(DATABASE_URL, echo=True)
+_IN_MEMORY = (None, "", ":memory:")
+
+
+def create_engine(url: str, **kwargs: Any) -> AsyncEngine:
+    """An async engine for ``url``, PostgreSQL (asyncpg) or SQLite (aiosqlite).
+
+    SQLite connections get ``SQLITE_PRAGMAS`` when opened. They are pooled
+    like PostgreSQL's rather than opened per session, SQLAlchemy's default
+    for aiosqlite files, which keeps each connection's page cache warm.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database not in _IN_MEMORY:
+        kwargs.setdefault("poolclass", AsyncAdaptedQueuePool)
+    db_engine = create_async_engine(url, **kwargs)
+    if db_engine.dialect.name == "sqlite":
+
+        @event.listens_for(db_engine.sync_engine, "connect")
+        def set_pragmas(dbapi_connection, connection_record) -> None:
+            cursor = dbapi_connection.cursor()
+            for name, value in SQLITE_PRAGMAS.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+    return db_engine
+
+
+def insert_for(bind: Union[AsyncSession, AsyncConnection, AsyncEngine], table: Any):
+    """``INSERT`` with the ``ON CONFLICT`` clauses of ``bind``'s database."""
+    if isinstance(bind, AsyncSession):
+        bind = bind.get_bind()
+    return (sqlite if bind.dialect.name == "sqlite" else postgresql).insert(table)
+
+
+engine = create_engine(DATABASE_URL, echo=DB_ECHO)
+instrument_engine(engine)
+
+
+def _shard_engine(url: str) -> AsyncEngine:
+    if url == DATABASE_URL:
+        return engine
+    shard = create_engine(url, echo=DB_ECHO)
+    instrument_engine(shard)
+    return shard
+
+
+shard_engines = [_shard_engine(url) for url in DATABASE_SHARD_URLS] or [engine]
+
+
+class RoutingSession(Session):
+    """Sends workspace-scoped tables to one shard and the rest to the primary.
+
+    The shard is ``info["shard"]`` (0 until a repository routes the session
+    to a workspace, see ``src.infrastructure.sharding``). With a single shard
+    this is a plain session. Otherwise a commit that wrote to both databases
+    commits two independent transactions, in no set order, and one can
+    succeed while the other fails.
+    """
+
+    def __init__(self, *args, shards: Sequence[AsyncEngine] = (), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.shards = list(shards)
+
+    @property
+    def sharded(self) -> bool:
+        return len(self.shards) > 1
+
+    def shard_engine(self, shard: Optional[int] = None) -> AsyncEngine:
+        return self.shards[self.info.get("shard", 0) if shard is None else shard]
+
+    def get_bind(self, mapper=None, *, clause=None, bind=None, **kwargs):
+        if bind is None and self.sharded:
+            if mapper is not None:
+                target = inspect(mapper)
+                tables = [getattr(target, "local_table", target)]
+            elif clause is not None:
+                tables = find_tables(clause, include_crud=True)
+            else:
+                tables = []
+            if any(table.name in SHARDED_TABLES for table in tables):
+                return self.shard_engine().sync_engine
+        return super().get_bind(mapper, clause=clause, bind=bind, **kwargs)
+
 
 async_session = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
+    sync_session_class=RoutingSession,
+    shards=shard_engines,
 )
 
 
 async def get_db():
     async with async_session() as session:
         yield session
+
+
+async def open_pool() -> None:
+    """Drops connections inherited from a parent process (``gunicorn --preload``).
+
+    They are discarded without being closed, since the parent still owns
+    the sockets; this worker then opens its own.
+    """
+    for pool in {engine, *shard_engines}:
+        await pool.dispose(close=False)
+
+
+async def close_pool() -> None:
+    for pool in {engine, *shard_engines}:
+        await pool.dispose()
@@ -0,0 +1,158 @@
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import List
+
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import Column, MetaData, String, Table, inspect, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.audit.models import AuditEventORM  # noqa: F401
+from src.infrastructure.auth.models import RevokedTokenORM, UserORM  # noqa: F401
+from src.infrastructure.budget.models import BudgetORM, CategoryORM  # noqa: F401
+from src.infrastructure.database import Base
+from src.infrastructure.database import engine as default_engine
+from src.infrastructure.jobs.models import JobORM  # noqa: F401
+from src.infrastructure.readiness import migration_heads
+from src.infrastructure.sharding import WorkspaceShardORM  # noqa: F401
+from src.infrastructure.workspace.models import (  # noqa: F401
+    WorkspaceMemberORM,
+    WorkspaceORM,
+)
+
+logger = logging.getLogger(__name__)
+
+# The ones the categories migration seeds on PostgreSQL
+DEFAULT_CATEGORIES = [
+    ("Vivienda", "Alquiler, hipoteca, servicios del hogar"),
+    ("Transporte", "Combustible, transporte público, mantenimiento de vehículos"),
+    ("Alimentación", "Supermercado, restaurantes, snacks"),
+    ("Servicios", "Electricidad, agua, internet, telefonía"),
+    ("Salud y Bienestar", "Gimnasio, seguros, gastos médicos"),
+    ("Compras", "Ropa, electrónica, artículos para el hogar"),
+    ("Entretenimiento", "Cine, juegos, eventos sociales"),
+    ("Educación", "Cursos, libros, colegiaturas"),
+    ("Viajes", "Vuelos, hoteles, vacaciones"),
+    ("Inversiones", "Acciones, criptomonedas, ahorros"),
+]
+
+_alembic_version = Table(
+    "alembic_version",
+    MetaData(),
+    Column("version_num", String(32), primary_key=True),
+)
+
+
+# Differences SQLite can apply in place, in the order they are applied
+_ADDITIVE = ("add_table", "add_column", "add_index")
+
+
+class EmbeddedSchemaError(RuntimeError):
+    """Raised when an embedded database cannot be brought to the current models."""
+
+
+def _describe(diff: tuple) -> str:
+    kind, *args = diff
+    if kind in ("add_table", "remove_table", "add_index", "remove_index"):
+        return f"{kind} {args[0].name}"
+    if kind in ("add_column", "remove_column"):
+        return f"{kind} {args[1]}.{args[2].name}"
+    if kind.startswith("modify_"):
+        return f"{kind} {args[1]}.{args[2]}"
+    return f"{kind} {getattr(args[0], 'name', args[0])}"
+
+
+def _can_apply(diff: tuple) -> bool:
+    if diff[0] == "add_column":
+        # SQLite only adds a NOT NULL column that has a default
+        column = diff[3]
+        return column.nullable or column.server_default is not None
+    return diff[0] in _ADDITIVE
+
+
+def _upgrade(conn: Connection) -> List[str]:
+    """Adds the tables, columns and indexes the models have and the database lacks."""
+    context = MigrationContext.configure(conn, opts={"compare_type": False})
+    diffs = []
+    for entry in compare_metadata(context, Base.metadata):
+        # Changes to one column come grouped in a list
+        diffs.extend(entry if isinstance(entry, list) else [entry])
+    unsupported = [_describe(diff) for diff in diffs if not _can_apply(diff)]
+    if unsupported:
+        raise EmbeddedSchemaError(
+            "The embedded database needs changes it cannot apply in place: "
+            + ", ".join(unsupported)
+            + ". Export the data and start from a new database file."
+        )
+    operations = Operations(context)
+    diffs.sort(key=lambda diff: _ADDITIVE.index(diff[0]))
+    for diff in diffs:
+        if diff[0] == "add_column":
+            operations.add_column(diff[2], diff[3]._copy())
+        else:
+            # A new table's indexes are reported too and may already exist
+            diff[1].create(conn, checkfirst=True)
+    return [_describe(diff) for diff in diffs]
+
+
+async def create_embedded_schema(db_engine: AsyncEngine = default_engine) -> bool:
+    """Creates or upgrades the schema of an embedded SQLite database.
+
+    The migrations are written for PostgreSQL, so a new SQLite database
+    gets the tables of the current models, the default categories and an
+    ``alembic_version`` stamped with the migration head, which keeps the
+    readiness check meaningful. A database stamped with an older revision
+    gets the tables, columns and indexes it is missing and is stamped
+    again; the stamp is written last, so an interrupted upgrade resumes on
+    the next start. Anything else, such as a dropped or retyped column,
+    raises ``EmbeddedSchemaError`` rather than starting on a schema the
+    code does not match. Does nothing on PostgreSQL or when the stamp is
+    current, and returns whether the schema changed.
+    """
+    if db_engine.dialect.name != "sqlite":
+        return False
+    heads = migration_heads()
+    async with db_engine.begin() as conn:
+        if await conn.run_sync(lambda c: inspect(c).has_table("alembic_version")):
+            result = await conn.execute(select(_alembic_version.c.version_num))
+            current = set(result.scalars())
+            if not heads or current == set(heads):
+                return False
+            changes = await conn.run_sync(_upgrade)
+            await conn.execute(_alembic_version.delete())
+            await conn.execute(
+                _alembic_version.insert(), [{"version_num": head} for head in heads]
+            )
+            logger.info(
+                "Upgraded the embedded database from %s to %s: %s",
+                ", ".join(sorted(current)) or "no revision",
+                ", ".join(sorted(heads)),
+                ", ".join(changes) or "no schema changes",
+            )
+            return True
+        await conn.run_sync(Base.metadata.create_all)
+        now = datetime.now(timezone.utc)
+        await conn.execute(
+            CategoryORM.__table__.insert(),
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "name": name,
+                    "description": description,
+                    "is_default": True,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for name, description in DEFAULT_CATEGORIES
+            ],
+        )
+        await conn.run_sync(_alembic_version.create)
+        if heads:
+            await conn.execute(
+                _alembic_version.insert(), [{"version_num": head} for head in heads]
+            )
+    logger.info("Created the embedded database schema")
+    return True
@@ -0,0 +1,47 @@
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases.workspace.purge.index import PurgeWorkspace
+from src.domain.jobs.value_objects import JobKind
+from src.infrastructure.budget.archive import archive_budgets
+from src.infrastructure.budget.repositories import (
+    SQLBudgetRepository,
+    SQLCategoryRepository,
+)
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository
+
+PURGE_BATCH_SIZE = int(os.getenv("PURGE_BATCH_SIZE", "500"))
+PURGE_BATCH_PAUSE = float(os.getenv("PURGE_BATCH_PAUSE", "0.1"))
+
+JobHandler = Callable[[AsyncSession, Dict[str, Any]], Awaitable[None]]
+
+
+async def delete_workspace(session: AsyncSession, payload: Dict[str, Any]) -> None:
+    use_case = PurgeWorkspace(
+        SQLWorkspaceRepository(session),
+        SQLBudgetRepository(session),
+        SQLCategoryRepository(session),
+    )
+    workspace_id = UUID(payload["workspace_id"])
+    # Every batch commits on its own so row locks are short-lived, and the
+    # pause gives replicas and concurrent writers room to catch up. The last
+    # batch is committed by the worker together with the job completion.
+    while not await use_case.execute(workspace_id, PURGE_BATCH_SIZE):
+        await session.commit()
+        await asyncio.sleep(PURGE_BATCH_PAUSE)
+
+
+async def archive_old_budgets(session: AsyncSession, payload: Dict[str, Any]) -> None:
+    # Works on every shard through its own connections; the job's session
+    # only records the completion
+    await archive_budgets(payload.get("before_year"))
+
+
+HANDLERS: Dict[JobKind, JobHandler] = {
+    JobKind.DELETE_WORKSPACE: delete_workspace,
+    JobKind.ARCHIVE_BUDGETS: archive_old_budgets,
+}
@@ -0,0 +1,3 @@
+from .job import JobMapper
+
+__all__ = ["JobMapper"]
@@ -0,0 +1,38 @@
+from src.domain.jobs.models import Job
+from src.infrastructure.jobs.models import JobORM
+
+
+class JobMapper:
+    @staticmethod
+    def to_domain(orm: JobORM) -> Job:
+        return Job(
+            id=orm.id,
+            kind=orm.kind,
+            payload=orm.payload,
+            created_by=orm.created_by,
+            status=orm.status,
+            attempts=orm.attempts,
+            max_attempts=orm.max_attempts,
+            last_error=orm.last_error,
+            available_at=orm.available_at,
+            finished_at=orm.finished_at,
+            created_at=orm.created_at,
+            updated_at=orm.updated_at,
+        )
+
+    @staticmethod
+    def to_orm(domain: Job) -> JobORM:
+        return JobORM(
+            id=domain.id,
+            kind=domain.kind.value,
+            payload=domain.payload,
+            created_by=domain.created_by,
+            status=domain.status.value,
+            attempts=domain.attempts,
+            max_attempts=domain.max_attempts,
+            last_error=domain.last_error,
+            available_at=domain.available_at,
+            finished_at=domain.finished_at,
+            created_at=domain.created_at,
+            updated_at=domain.updated_at,
+        )
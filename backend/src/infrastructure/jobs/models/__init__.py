@@ -0,0 +1,3 @@
+from .job import JobORM
+
+__all__ = ["JobORM"]
@@ -0,0 +1,3 @@
+from .job import SQLJobRepository
+
+__all__ = ["SQLJobRepository"]
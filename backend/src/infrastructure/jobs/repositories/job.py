@@ -0,0 +1,143 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Collection, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.jobs.models import Job
+from src.domain.jobs.repositories import JobRepository
+from src.domain.jobs.value_objects import JobKind, JobStatus
+from src.infrastructure.jobs.mappers import JobMapper
+from src.infrastructure.jobs.models import JobORM
+
+
+def _now() -> datetime:
+    # The application's clock rather than now(): SQLite has no time zone
+    # aware timestamps to add intervals to
+    return datetime.now(timezone.utc)
+
+
+class SQLJobRepository(JobRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def add(self, job: Job) -> None:
+        self._session.add(JobMapper.to_orm(job))
+
+    async def get_by_id(self, id: UUID) -> Optional[Job]:
+        result = await self._session.execute(select(JobORM).filter_by(id=id))
+        orm_job = result.scalar_one_or_none()
+        if not orm_job:
+            return None
+        return JobMapper.to_domain(orm_job)
+
+    async def claim(self, visibility_timeout: float) -> Optional[Job]:
+        # Queued jobs that are due and running jobs whose lease ran out are
+        # both claimable. SKIP LOCKED lets concurrent workers take different
+        # rows instead of queueing up behind the same one.
+        now = _now()
+        next_job = (
+            select(JobORM.id)
+            .where(
+                JobORM.status.in_([JobStatus.QUEUED.value, JobStatus.RUNNING.value]),
+                JobORM.available_at <= now,
+            )
+            .order_by(JobORM.available_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(JobORM)
+            .where(JobORM.id == next_job)
+            .values(
+                status=JobStatus.RUNNING.value,
+                attempts=JobORM.attempts + 1,
+                available_at=now + timedelta(seconds=visibility_timeout),
+                updated_at=now,
+            )
+            .returning(JobORM)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        orm_job = result.scalar_one_or_none()
+        if not orm_job:
+            return None
+        return JobMapper.to_domain(orm_job)
+
+    def _owned(self, job: Job):
+        # A worker only owns the attempt it claimed; once the lease expired
+        # and someone else claimed the job, attempts no longer matches.
+        return and_(
+            JobORM.id == job.id,
+            JobORM.status == JobStatus.RUNNING.value,
+            JobORM.attempts == job.attempts,
+        )
+
+    async def extend_lease(self, job: Job, visibility_timeout: float) -> bool:
+        now = _now()
+        stmt = (
+            update(JobORM)
+            .where(self._owned(job))
+            .values(
+                available_at=now + timedelta(seconds=visibility_timeout), updated_at=now
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount == 1
+
+    async def complete(self, job: Job) -> bool:
+        now = _now()
+        stmt = (
+            update(JobORM)
+            .where(self._owned(job))
+            .values(
+                status=JobStatus.SUCCEEDED.value,
+                last_error=None,
+                finished_at=now,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount == 1
+
+    async def fail(self, job: Job, error: str, retry_in: Optional[float]) -> bool:
+        now = _now()
+        if retry_in is None:
+            values = {"status": JobStatus.FAILED.value, "finished_at": now}
+        else:
+            values = {
+                "status": JobStatus.QUEUED.value,
+                "available_at": now + timedelta(seconds=retry_in),
+            }
+        stmt = (
+            update(JobORM)
+            .where(self._owned(job))
+            .values(last_error=error, updated_at=now, **values)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount == 1
+
+    async def list_payloads(
+        self, kind: JobKind, statuses: Collection[JobStatus]
+    ) -> List[Dict[str, Any]]:
+        result = await self._session.execute(
+            select(JobORM.payload).where(
+                JobORM.kind == kind.value,
+                JobORM.status.in_([status.value for status in statuses]),
+            )
+        )
+        return list(result.scalars())
+
+    async def get_queue_lag(self) -> float:
+        now = _now()
+        stmt = select(func.min(JobORM.available_at)).where(
+            JobORM.status == JobStatus.QUEUED.value,
+            JobORM.available_at <= now,
+        )
+        oldest = await self._session.scalar(stmt)
+        return (now - oldest).total_seconds() if oldest else 0.0
@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import os
+import signal
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.use_cases.workspace.reconcile.index import (
+    ReconcileWorkspacePurges,
+)
+from src.domain.jobs.models import Job
+from src.domain.jobs.value_objects import JobKind
+from src.infrastructure.database import async_session
+from src.infrastructure.jobs.handlers import HANDLERS, JobHandler
+from src.infrastructure.jobs.repositories import SQLJobRepository
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))
+JOB_VISIBILITY_TIMEOUT = float(os.getenv("JOB_VISIBILITY_TIMEOUT", "300"))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+JOB_RETRY_BACKOFF = float(os.getenv("JOB_RETRY_BACKOFF", "5"))
+JOB_MAX_RETRY_DELAY = 3600.0
+WORKSPACE_SWEEP_INTERVAL = float(os.getenv("WORKSPACE_SWEEP_INTERVAL", "600"))
+# Far longer than a request takes to commit both halves of a deletion
+WORKSPACE_SWEEP_GRACE = 300.0
+_SWEEP_LOCK_KEY = 4_206_513_718
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """Claims jobs from the ``jobs`` table and runs their handlers.
+
+    A claimed job is leased for ``visibility_timeout`` seconds and the lease
+    is renewed every ``heartbeat_interval`` while the handler runs, so only
+    a worker that died lets the job be claimed again, once its lease runs
+    out. The handler and the completion are committed together, so a job
+    whose work was committed is never run again. Failures are retried with
+    exponential backoff until ``max_attempts`` is reached.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session,
+        handlers: Optional[Dict[JobKind, JobHandler]] = None,
+        visibility_timeout: float = JOB_VISIBILITY_TIMEOUT,
+        poll_interval: float = JOB_POLL_INTERVAL,
+        retry_backoff: float = JOB_RETRY_BACKOFF,
+        heartbeat_interval: Optional[float] = None,
+    ):
+        self._session_factory = session_factory
+        self._handlers = HANDLERS if handlers is None else handlers
+        self._visibility_timeout = visibility_timeout
+        self._poll_interval = poll_interval
+        self._retry_backoff = retry_backoff
+        self._heartbeat_interval = heartbeat_interval or visibility_timeout / 3
+
+    def _retry_delay(self, job: Job) -> Optional[float]:
+        if job.attempts >= job.max_attempts:
+            return None
+        return min(self._retry_backoff * 2 ** (job.attempts - 1), JOB_MAX_RETRY_DELAY)
+
+    async def _fail(self, job: Job, error: str, retry_in: Optional[float]) -> None:
+        async with self._session_factory() as session:
+            await SQLJobRepository(session).fail(job, error, retry_in)
+            await session.commit()
+        if retry_in is None:
+            logger.error("Job %s (%s) failed: %s", job.id, job.kind.value, error)
+        else:
+            logger.warning(
+                "Job %s (%s) attempt %d failed, retrying in %.0fs: %s",
+                job.id,
+                job.kind.value,
+                job.attempts,
+                retry_in,
+                error,
+            )
+
+    async def _heartbeat(self, job: Job) -> None:
+        # Its own session: the handler's transaction only commits at the end
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            try:
+                async with self._session_factory() as session:
+                    renewed = await SQLJobRepository(session).extend_lease(
+                        job, self._visibility_timeout
+                    )
+                    await session.commit()
+            except Exception as e:
+                logger.warning("Job %s lease renewal failed: %s", job.id, e)
+                continue
+            if not renewed:
+                logger.warning("Job %s lost its lease while running", job.id)
+                return
+
+    async def run_once(self) -> bool:
+        """Runs at most one job; returns False when nothing was available."""
+        async with self._session_factory() as session:
+            job = await SQLJobRepository(session).claim(self._visibility_timeout)
+            await session.commit()
+        if job is None:
+            return False
+
+        if job.attempts_exhausted:
+            await self._fail(job, "Lease expired on the last attempt", None)
+            return True
+
+        handler = self._handlers.get(job.kind)
+        if handler is None:
+            await self._fail(job, f"No handler for job kind {job.kind.value}", None)
+            return True
+
+        try:
+            async with self._session_factory() as session:
+                heartbeat = asyncio.create_task(self._heartbeat(job))
+                try:
+                    await handler(session, job.payload)
+                finally:
+                    # Stopped before the job row is touched, so a renewal
+                    # never races the completion or the failure
+                    heartbeat.cancel()
+                    await asyncio.gather(heartbeat, return_exceptions=True)
+                if await SQLJobRepository(session).complete(job):
+                    await session.commit()
+                else:
+                    await session.rollback()
+                    logger.warning("Job %s lost its lease, result discarded", job.id)
+        except Exception as e:
+            await self._fail(
+                job, f"{type(e).__name__}: {e}"[:1000], self._retry_delay(job)
+            )
+        return True
+
+    async def run(self, stop: asyncio.Event) -> None:
+        while not stop.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception:
+                logger.exception("Job worker iteration failed")
+                processed = False
+            if not processed:
+                try:
+                    await asyncio.wait_for(stop.wait(), self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+
+async def sweep_once(
+    session_factory: async_sessionmaker[AsyncSession] = async_session,
+) -> Optional[List[Job]]:
+    """Queues the purges a deletion failed to queue; returns them.
+
+    Every process with job workers sweeps, so on PostgreSQL the sweep runs
+    under a transaction-level advisory lock and returns None, doing nothing,
+    while another holds it. SQLite databases have a single process.
+    """
+    deleted_before = datetime.now(timezone.utc) - timedelta(
+        seconds=WORKSPACE_SWEEP_GRACE
+    )
+    async with session_factory() as session:
+        conn = await session.connection()
+        if conn.dialect.name == "postgresql":
+            locked = await conn.scalar(
+                text("SELECT pg_try_advisory_xact_lock(:key)"),
+                {"key": _SWEEP_LOCK_KEY},
+            )
+            if not locked:
+                return None
+        jobs = await ReconcileWorkspacePurges(
+            SQLWorkspaceRepository(session), SQLJobRepository(session)
+        ).execute(deleted_before)
+        await session.commit()
+    return jobs
+
+
+async def sweep_deleted_workspaces(
+    stop: asyncio.Event,
+    session_factory: async_sessionmaker[AsyncSession] = async_session,
+    interval: float = WORKSPACE_SWEEP_INTERVAL,
+) -> None:
+    """Runs ``sweep_once`` every ``interval`` seconds."""
+    while not stop.is_set():
+        try:
+            jobs = await sweep_once(session_factory)
+            if jobs:
+                logger.warning("Queued %d missing workspace purges", len(jobs))
+        except Exception:
+            logger.exception("Deleted workspace sweep failed")
+        try:
+            await asyncio.wait_for(stop.wait(), interval)
+        except asyncio.TimeoutError:
+            pass
+
+
+@asynccontextmanager
+async def running_workers(count: int = JOB_WORKERS) -> AsyncIterator[None]:
+    """Runs ``count`` workers, and the deleted workspace sweep if any, in the
+    current event loop for the block's duration."""
+    stop = asyncio.Event()
+    tasks = [
+        asyncio.create_task(JobWorker().run(stop), name=f"job-worker-{i}")
+        for i in range(count)
+    ]
+    if count:
+        tasks.append(
+            asyncio.create_task(sweep_deleted_workspaces(stop), name="workspace-sweep")
+        )
+    try:
+        yield
+    finally:
+        stop.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def main() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    count = max(JOB_WORKERS, 1)
+    logger.info("Starting %d job workers", count)
+    await asyncio.gather(
+        *(JobWorker().run(stop) for _ in range(count)), sweep_deleted_workspaces(stop)
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
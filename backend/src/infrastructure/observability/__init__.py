@@ -0,0 +1,36 @@
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from .engine import instrument_engine
+from .metrics import mark_worker_dead, record_cache_lookup, render_metrics
+from .queries import (
+    QueryCounter,
+    assert_max_queries,
+    count_queries,
+    instrumented,
+    statement_shape,
+)
+from .timing import (
+    RequestTimings,
+    begin_request,
+    current_timings,
+    end_request,
+    track,
+)
+
+__all__ = [
+    "CONTENT_TYPE_LATEST",
+    "QueryCounter",
+    "RequestTimings",
+    "assert_max_queries",
+    "begin_request",
+    "count_queries",
+    "current_timings",
+    "end_request",
+    "instrument_engine",
+    "instrumented",
+    "mark_worker_dead",
+    "record_cache_lookup",
+    "render_metrics",
+    "statement_shape",
+    "track",
+]
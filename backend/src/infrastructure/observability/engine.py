@@ -0,0 +1,57 @@
+import time
+
+from sqlalchemy import event
+
+from src.infrastructure.observability import slow_queries
+from src.infrastructure.observability.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUTS,
+    DB_POOL_CONNECTIONS,
+)
+from src.infrastructure.observability.queries import record_statement
+from src.infrastructure.observability.timing import current_timings
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._wiselab_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    record_statement(statement)
+    started_at = getattr(context, "_wiselab_started_at", None)
+    if started_at is None:
+        return
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    timings = current_timings()
+    if timings is not None:
+        timings.sql_ms += elapsed_ms
+        timings.sql_count += 1
+    slow_queries.slow_query_log.observe(
+        conn, statement, parameters, executemany, elapsed_ms
+    )
+
+
+def _on_connect(dbapi_connection, connection_record):
+    DB_POOL_CONNECTIONS.inc()
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    DB_POOL_CHECKOUTS.inc()
+    DB_POOL_CHECKED_OUT.inc()
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    DB_POOL_CHECKED_OUT.dec()
+
+
+def instrument_engine(engine) -> None:
+    """Attaches the statement and pool hooks to an Engine or AsyncEngine."""
+    target = getattr(engine, "sync_engine", engine)
+    if event.contains(target, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+    event.listen(target, "connect", _on_connect)
+    event.listen(target, "checkout", _on_checkout)
+    event.listen(target, "checkin", _on_checkin)
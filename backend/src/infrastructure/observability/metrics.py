@@ -0,0 +1,81 @@
+import os
+
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# When set (one shared directory per host), every uvicorn worker writes its
+# samples to mmap files there and /metrics aggregates all of them.
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+REQUEST_LATENCY = Histogram(
+    "wiselab_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "wiselab_http_requests_in_progress",
+    "HTTP requests currently being handled",
+    multiprocess_mode="livesum",
+)
+USE_CASE_LATENCY = Histogram(
+    "wiselab_use_case_duration_seconds",
+    "Use case execute latency",
+    ["use_case"],
+)
+DB_POOL_CHECKOUTS = Counter(
+    "wiselab_db_pool_checkouts_total",
+    "Connections checked out from the pool",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "wiselab_db_pool_checked_out",
+    "Connections currently checked out from the pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CONNECTIONS = Counter(
+    "wiselab_db_pool_connections_created_total",
+    "New DBAPI connections opened by the pool",
+)
+CACHE_LOOKUPS = Counter(
+    "wiselab_cache_lookups_total",
+    "Cache lookups by cache name and result (hit or miss)",
+    ["cache", "result"],
+)
+ARGON2_IN_PROGRESS = Gauge(
+    "wiselab_argon2_operations_in_progress",
+    "Argon2 hash or verify calls running or waiting to run",
+    multiprocess_mode="livesum",
+)
+RATE_LIMITED = Counter(
+    "wiselab_rate_limited_total",
+    "Requests rejected by a rate limiter",
+    ["limiter", "scope"],
+)
+AUDIT_EVENTS = Counter(
+    "wiselab_audit_events_total",
+    "Audit events leaving the in-memory buffer (written or dropped)",
+    ["outcome"],
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+def render_metrics() -> bytes:
+    if PROMETHEUS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
+
+
+def mark_worker_dead(pid: int) -> None:
+    """Drops live gauges of an exited worker from the shared directory."""
+    if PROMETHEUS_MULTIPROC_DIR:
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,78 @@
+import asyncio
+import sys
+import threading
+from collections import Counter
+from typing import List, Optional
+
+
+def _label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+
+
+def _task_frames(task: asyncio.Task, thread_frame) -> List:
+    """Returns the frames of ``task`` from its outermost coroutine inwards.
+
+    A suspended task is described by its ``cr_await`` chain alone. When the
+    task is the one currently running on the loop thread, the synchronous
+    frames above its innermost coroutine are appended as well.
+    """
+    frames = []
+    coro = task.get_coro()
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            break
+        frames.append(frame)
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+
+    if frames and thread_frame is not None:
+        innermost = frames[-1]
+        above = []
+        frame = thread_frame
+        while frame is not None and frame is not innermost:
+            above.append(frame)
+            frame = frame.f_back
+        if frame is innermost:
+            frames.extend(reversed(above))
+    return frames
+
+
+class TaskSampler:
+    """Wall-clock sampling profiler for a single asyncio task.
+
+    Samples are folded into ``frame;frame;frame count`` lines, the collapsed
+    stack format read by flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, task: asyncio.Task, interval: float = 0.005):
+        self._task = task
+        self._thread_id = threading.get_ident()
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stacks: Counter = Counter()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="wiselab-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def sample(self) -> None:
+        thread_frame = sys._current_frames().get(self._thread_id)
+        frames = _task_frames(self._task, thread_frame)
+        if frames:
+            self.stacks[";".join(_label(f) for f in frames)] += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self.sample()
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
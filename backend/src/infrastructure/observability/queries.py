@@ -0,0 +1,108 @@
+import functools
+import logging
+import os
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from src.infrastructure.observability.metrics import USE_CASE_LATENCY
+
+QUERY_DEBUG = os.getenv("QUERY_DEBUG", "false").lower() == "true"
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "3"))
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|:\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\?(?:, \?)+\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalizes a statement so repeated executions compare equal."""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PLACEHOLDER.sub("?", shape)
+    return _PLACEHOLDER_LIST.sub("(?...)", shape)
+
+
+class QueryCounter:
+    """Counts statements executed while the counter is active."""
+
+    def __init__(self, name: str, track_shapes: bool = False):
+        self.name = name
+        self.count = 0
+        self.shapes: Optional[Counter] = Counter() if track_shapes else None
+
+    def record(self, statement: str) -> None:
+        self.count += 1
+        if self.shapes is not None:
+            self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> List[Tuple[str, int]]:
+        if self.shapes is None:
+            return []
+        return [(s, n) for s, n in self.shapes.most_common() if n >= threshold]
+
+
+_active: ContextVar[Tuple[QueryCounter, ...]] = ContextVar(
+    "query_counters", default=()
+)
+
+
+def record_statement(statement: str) -> None:
+    for counter in _active.get():
+        counter.record(statement)
+
+
+@contextmanager
+def count_queries(
+    name: str = "block", track_shapes: Optional[bool] = None
+) -> Iterator[QueryCounter]:
+    """Counts every statement issued inside the block, nested scopes included.
+
+    With ``QUERY_DEBUG`` enabled the counter also keeps statement shapes and
+    logs a warning when the same shape repeats, which is the usual N+1 sign.
+    """
+    counter = QueryCounter(name, QUERY_DEBUG if track_shapes is None else track_shapes)
+    token = _active.set(_active.get() + (counter,))
+    try:
+        yield counter
+    finally:
+        _active.reset(token)
+        for shape, times in counter.repeated():
+            logger.warning(
+                "Possible N+1 in %s: statement executed %d times: %s",
+                name,
+                times,
+                shape,
+            )
+
+
+@contextmanager
+def assert_max_queries(limit: int, name: str = "block") -> Iterator[QueryCounter]:
+    """Fails when the block issues more than ``limit`` statements."""
+    with count_queries(name) as counter:
+        yield counter
+    if counter.count > limit:
+        raise AssertionError(
+            f"{name} executed {counter.count} queries, expected at most {limit}"
+        )
+
+
+def instrumented(execute):
+    """Wraps a use case ``execute`` so its queries and latency are recorded."""
+
+    @functools.wraps(execute)
+    async def wrapper(self, *args, **kwargs):
+        name = type(self).__name__
+        start = time.perf_counter()
+        try:
+            with count_queries(name) as counter:
+                return await execute(self, *args, **kwargs)
+        finally:
+            USE_CASE_LATENCY.labels(name).observe(time.perf_counter() - start)
+            logger.debug("%s executed %d queries", name, counter.count)
+
+    return wrapper
@@ -0,0 +1,121 @@
+import json
+import logging
+import os
+import random
+import time
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.infrastructure.observability.queries import statement_shape
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+SLOW_QUERY_LOG = os.getenv("SLOW_QUERY_LOG", "logs/slow_queries.log")
+SLOW_QUERY_EXPLAIN_RATE = float(os.getenv("SLOW_QUERY_EXPLAIN_RATE", "0.1"))
+SLOW_QUERY_EXPLAIN_INTERVAL = float(os.getenv("SLOW_QUERY_EXPLAIN_INTERVAL", "60"))
+
+logger = logging.getLogger(__name__)
+
+
+def parameter_shapes(parameters: Any, executemany: bool = False) -> Any:
+    """Describes bound parameters by type so values never reach the log."""
+    if executemany and parameters:
+        return {"rows": len(parameters), "row": parameter_shapes(parameters[0])}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _explainable(statement: str) -> bool:
+    head = statement.lstrip().upper()
+    return head.startswith("SELECT") and " FOR UPDATE" not in head
+
+
+class SlowQueryLog:
+    """Writes statements slower than ``threshold_ms`` to a rotating JSON log.
+
+    A negative threshold disables the log and zero records every statement.
+    A sampled instance of each slow SELECT shape is re-run under
+    ``EXPLAIN (ANALYZE, BUFFERS)`` on the same connection, inside a savepoint
+    so a failing EXPLAIN cannot abort the caller's transaction.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = SLOW_QUERY_MS,
+        path: str = SLOW_QUERY_LOG,
+        explain_rate: float = SLOW_QUERY_EXPLAIN_RATE,
+        explain_interval: float = SLOW_QUERY_EXPLAIN_INTERVAL,
+    ):
+        self.threshold_ms = threshold_ms
+        self._path = Path(path)
+        self._explain_rate = explain_rate
+        self._explain_interval = explain_interval
+        self._last_explained: Dict[str, float] = {}
+        self._logger: Optional[logging.Logger] = None
+
+    def _get_logger(self) -> logging.Logger:
+        if self._logger is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            handler = RotatingFileHandler(
+                self._path, maxBytes=10 * 1024 * 1024, backupCount=5
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            slow_logger = logging.getLogger(f"{__name__}.{self._path}")
+            slow_logger.setLevel(logging.INFO)
+            slow_logger.propagate = False
+            slow_logger.addHandler(handler)
+            self._logger = slow_logger
+        return self._logger
+
+    def _should_explain(self, conn, statement: str, shape: str) -> bool:
+        if conn.dialect.name != "postgresql" or not _explainable(statement):
+            return False
+        if random.random() >= self._explain_rate:
+            return False
+        now = time.monotonic()
+        if now - self._last_explained.get(shape, float("-inf")) < self._explain_interval:
+            return False
+        self._last_explained[shape] = now
+        return True
+
+    def _explain(self, conn, statement: str, parameters: Any) -> Optional[str]:
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute("SAVEPOINT wiselab_explain")
+            try:
+                cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+                plan = "\n".join(row[0] for row in cursor.fetchall())
+            except Exception as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT wiselab_explain")
+                logger.warning("EXPLAIN failed for slow query: %s", e)
+                return None
+            cursor.execute("RELEASE SAVEPOINT wiselab_explain")
+            return plan
+        except Exception as e:
+            logger.warning("Could not capture EXPLAIN for slow query: %s", e)
+            return None
+        finally:
+            cursor.close()
+
+    def observe(
+        self, conn, statement: str, parameters: Any, executemany: bool, elapsed_ms: float
+    ) -> None:
+        if self.threshold_ms < 0 or elapsed_ms < self.threshold_ms:
+            return
+        shape = statement_shape(statement)
+        entry = {
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(elapsed_ms, 2),
+            "statement": statement,
+            "params": parameter_shapes(parameters, executemany),
+        }
+        if not executemany and self._should_explain(conn, statement, shape):
+            entry["plan"] = self._explain(conn, statement, parameters)
+        self._get_logger().info(json.dumps(entry))
+
+
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,72 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Iterator, Optional
+
+
+class RequestTimings:
+    """Per-request accumulator for SQL and CPU-heavy phases."""
+
+    __slots__ = ("started_at", "sql_ms", "sql_count", "phases")
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.sql_ms = 0.0
+        self.sql_count = 0
+        self.phases: Dict[str, float] = {}
+
+    def add_phase(self, name: str, elapsed_ms: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + elapsed_ms
+
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    def server_timing(self, total_ms: float) -> str:
+        parts = [
+            f"total;dur={total_ms:.2f}",
+            f'db;dur={self.sql_ms:.2f};desc="{self.sql_count} queries"',
+        ]
+        for name, elapsed in self.phases.items():
+            parts.append(f"{name};dur={elapsed:.2f}")
+        return ", ".join(parts)
+
+    def as_log_fields(self, total_ms: float) -> Dict[str, float]:
+        fields = {
+            "duration_ms": round(total_ms, 2),
+            "db_ms": round(self.sql_ms, 2),
+            "db_queries": self.sql_count,
+        }
+        for name, elapsed in self.phases.items():
+            fields[f"{name}_ms"] = round(elapsed, 2)
+        return fields
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+def begin_request() -> Token:
+    return _current.set(RequestTimings())
+
+
+def end_request(token: Token) -> None:
+    _current.reset(token)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current.get()
+
+
+@contextmanager
+def track(phase: str) -> Iterator[None]:
+    """Adds the wall time of the block to the current request, if any."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add_phase(phase, (time.perf_counter() - start) * 1000)
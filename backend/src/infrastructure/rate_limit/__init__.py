@@ -0,0 +1,11 @@
+from .buckets import BucketStore, InMemoryBucketStore, RedisBucketStore, TokenBucket
+from .limiter import LoginRateLimiter, create_bucket_store
+
+__all__ = [
+    "BucketStore",
+    "InMemoryBucketStore",
+    "LoginRateLimiter",
+    "RedisBucketStore",
+    "TokenBucket",
+    "create_bucket_store",
+]
@@ -0,0 +1,98 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Tuple
+
+
+class TokenBucket:
+    """Bucket shape: ``capacity`` tokens, refilled at ``per_minute``."""
+
+    def __init__(self, capacity: float, per_minute: float):
+        if capacity < 1 or per_minute <= 0:
+            raise ValueError("A token bucket needs capacity >= 1 and a positive rate")
+        self.capacity = capacity
+        self.rate = per_minute / 60
+
+    def take(self, tokens: float, elapsed: float) -> Tuple[float, float]:
+        """Refills for ``elapsed`` seconds and takes one token.
+
+        Returns the tokens left and the seconds to wait, which is zero when
+        the token was granted.
+        """
+        tokens = min(self.capacity, tokens + max(elapsed, 0.0) * self.rate)
+        if tokens >= 1:
+            return tokens - 1, 0.0
+        return tokens, (1 - tokens) / self.rate
+
+
+class BucketStore(ABC):
+    @abstractmethod
+    async def take(self, key: str, bucket: TokenBucket) -> float:
+        """Takes a token from ``key``; returns seconds to wait, 0 if granted."""
+        pass
+
+
+class InMemoryBucketStore(BucketStore):
+    """Per-process buckets, least recently used evicted past ``max_keys``."""
+
+    def __init__(
+        self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic
+    ):
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._max_keys = max_keys
+        self._clock = clock
+
+    async def take(self, key: str, bucket: TokenBucket) -> float:
+        now = self._clock()
+        tokens, updated_at = self._buckets.pop(key, (bucket.capacity, now))
+        tokens, wait = bucket.take(tokens, now - updated_at)
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self._max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+# Same arithmetic as TokenBucket.take, run atomically inside Redis.
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(now - ts, 0) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return tostring(wait)
+"""
+
+
+class RedisBucketStore(BucketStore):
+    """Buckets shared by every worker through a Redis server.
+
+    ``client`` is a ``redis.asyncio.Redis``. Keys expire once their bucket
+    would be full again, so idle clients cost no memory.
+    """
+
+    def __init__(
+        self,
+        client,
+        prefix: str = "wiselab:ratelimit:",
+        clock: Callable[[], float] = time.time,
+    ):
+        self._script = client.register_script(_TAKE_SCRIPT)
+        self._prefix = prefix
+        self._clock = clock
+
+    async def take(self, key: str, bucket: TokenBucket) -> float:
+        wait = await self._script(
+            keys=[self._prefix + key],
+            args=[bucket.capacity, bucket.rate, self._clock()],
+        )
+        return float(wait)
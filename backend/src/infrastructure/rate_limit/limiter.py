@@ -0,0 +1,69 @@
+import hashlib
+import logging
+import os
+from typing import Optional
+
+from src.infrastructure.observability.metrics import RATE_LIMITED
+from src.infrastructure.rate_limit.buckets import (
+    BucketStore,
+    InMemoryBucketStore,
+    RedisBucketStore,
+    TokenBucket,
+)
+
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL")
+LOGIN_IP_BURST = float(os.getenv("LOGIN_IP_BURST", "20"))
+LOGIN_IP_PER_MINUTE = float(os.getenv("LOGIN_IP_PER_MINUTE", "10"))
+LOGIN_ACCOUNT_BURST = float(os.getenv("LOGIN_ACCOUNT_BURST", "5"))
+LOGIN_ACCOUNT_PER_MINUTE = float(os.getenv("LOGIN_ACCOUNT_PER_MINUTE", "2"))
+
+logger = logging.getLogger(__name__)
+
+
+def create_bucket_store(redis_url: Optional[str] = RATE_LIMIT_REDIS_URL) -> BucketStore:
+    """Shared Redis buckets when ``redis_url`` is set, per-process otherwise."""
+    if not redis_url:
+        return InMemoryBucketStore()
+    from redis.asyncio import Redis
+
+    return RedisBucketStore(Redis.from_url(redis_url))
+
+
+class LoginRateLimiter:
+    """Token buckets for login attempts, keyed by client IP and by account.
+
+    The account key is a digest of the normalized email, so unknown emails are
+    limited too and addresses are never written to the store. If the store is
+    unreachable attempts are allowed rather than locking everybody out.
+    """
+
+    def __init__(
+        self,
+        store: BucketStore,
+        per_ip: TokenBucket = TokenBucket(LOGIN_IP_BURST, LOGIN_IP_PER_MINUTE),
+        per_account: TokenBucket = TokenBucket(
+            LOGIN_ACCOUNT_BURST, LOGIN_ACCOUNT_PER_MINUTE
+        ),
+    ):
+        self._store = store
+        self._per_ip = per_ip
+        self._per_account = per_account
+
+    async def check(self, ip: str, email: str) -> float:
+        """Returns the seconds the caller must wait, or 0 if it may proceed."""
+        account = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+        try:
+            wait = await self._store.take(f"login:ip:{ip}", self._per_ip)
+            if wait:
+                RATE_LIMITED.labels("login", "ip").inc()
+                return wait
+            wait = await self._store.take(f"login:account:{account}", self._per_account)
+            if wait:
+                RATE_LIMITED.labels("login", "account").inc()
+            return wait
+        except Exception as e:
+            logger.warning("Login rate limiter unavailable, allowing attempt: %s", e)
+            return 0.0
+
+
+login_rate_limiter = LoginRateLimiter(create_bucket_store())
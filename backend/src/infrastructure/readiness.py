@@ -0,0 +1,182 @@
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Optional, Sequence
+
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.infrastructure.database import engine as default_engine, shard_engines
+from src.infrastructure.jobs.repositories import SQLJobRepository
+
+READY_CACHE_TTL = float(os.getenv("READY_CACHE_TTL", "2"))
+READY_TIMEOUT = float(os.getenv("READY_TIMEOUT", "2"))
+MIGRATIONS_DIR = os.getenv("MIGRATIONS_DIR")
+
+# The checks that decide readiness; the others are informational
+_GATES = ("database", "migrations", "shards")
+
+# backend/migrations inside the image, the repository root when run locally
+_MIGRATION_CANDIDATES = [
+    Path(__file__).resolve().parents[2] / "migrations",
+    Path(__file__).resolve().parents[3] / "migrations",
+]
+
+
+@lru_cache(maxsize=None)
+def migration_heads(directory: Optional[str] = MIGRATIONS_DIR) -> FrozenSet[str]:
+    """Revision ids the code expects; empty when no migration scripts ship."""
+    candidates = [Path(directory)] if directory else _MIGRATION_CANDIDATES
+    for path in candidates:
+        if (path / "versions").is_dir():
+            return frozenset(ScriptDirectory(str(path)).get_heads())
+    return frozenset()
+
+
+def _error(e: Exception) -> str:
+    # Only the type: the endpoint is public and messages name hosts
+    return "timed out" if isinstance(e, asyncio.TimeoutError) else type(e).__name__
+
+
+class ReadinessProbe:
+    """Checks whether this worker can serve traffic.
+
+    Reports database reachability, pool saturation, whether the database is
+    at the migration head the code expects, and how long the oldest due job
+    has been waiting; and the reachability and migrations of every shard in
+    ``shards`` other than the primary. Only the databases and the
+    migrations decide readiness:
+    a busy pool or a queue backlog would take every worker out of the load
+    balancer at once, so they are reported for monitoring only. A report is
+    reused for ``ttl`` seconds and concurrent callers share a single probe,
+    so however often a load balancer polls, each worker issues at most one
+    round of queries per ``ttl``.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine = default_engine,
+        ttl: float = READY_CACHE_TTL,
+        timeout: float = READY_TIMEOUT,
+        expected_heads: Callable[[], FrozenSet[str]] = migration_heads,
+        clock=time.monotonic,
+        shards: Sequence[AsyncEngine] = (),
+    ):
+        self._engine = engine
+        self._shards = shards
+        self._ttl = ttl
+        self._timeout = timeout
+        self._expected_heads = expected_heads
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._report: Optional[Dict[str, Any]] = None
+        self._checked_at = float("-inf")
+
+    def _fresh(self) -> bool:
+        return self._clock() - self._checked_at < self._ttl
+
+    async def report(self) -> Dict[str, Any]:
+        if self._report is not None and self._fresh():
+            return self._report
+        async with self._lock:
+            if self._report is None or not self._fresh():
+                self._report = await self._probe()
+                self._checked_at = self._clock()
+        return self._report
+
+    def _pool(self) -> Dict[str, Any]:
+        pool = self._engine.pool
+        size = getattr(pool, "size", lambda: 0)()
+        capacity = size + max(getattr(pool, "_max_overflow", 0), 0)
+        checked_out = getattr(pool, "checkedout", lambda: 0)()
+        saturation = checked_out / capacity if capacity else 0.0
+        return {
+            "checked_out": checked_out,
+            "capacity": capacity,
+            "saturation": round(saturation, 3),
+        }
+
+    async def _database(self, checks: Dict[str, Any]) -> None:
+        start = time.perf_counter()
+        async with self._engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            checks["database"] = {
+                "ok": True,
+                "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+            }
+
+            async with AsyncSession(bind=conn) as session:
+                lag = await SQLJobRepository(session).get_queue_lag()
+            checks["jobs"] = {"lag_seconds": round(lag, 1)}
+
+            checks["migrations"] = await self._migrations(conn)
+
+    async def _migrations(self, conn) -> Dict[str, Any]:
+        expected = self._expected_heads()
+        if not expected:
+            return {"ok": True, "detail": "no migration scripts found"}
+        # Last, since a missing alembic_version table aborts the transaction
+        try:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+            current = {row[0] for row in result}
+        except Exception:
+            current = set()
+        return {
+            "ok": current == set(expected),
+            "current": sorted(current),
+            "expected": sorted(expected),
+        }
+
+    async def _shard(self, engine: AsyncEngine) -> Dict[str, Any]:
+        start = time.perf_counter()
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            latency = round((time.perf_counter() - start) * 1000, 2)
+            migrations = await self._migrations(conn)
+        return {"ok": migrations["ok"], "latency_ms": latency, "migrations": migrations}
+
+    async def _shard_checks(self, checks: Dict[str, Any]) -> None:
+        # The primary is usually also shard 0, checked as the database
+        shards = {
+            str(index): engine
+            for index, engine in enumerate(self._shards)
+            if engine is not self._engine
+        }
+
+        async def check(engine: AsyncEngine) -> Dict[str, Any]:
+            try:
+                return await asyncio.wait_for(self._shard(engine), self._timeout)
+            except Exception as e:
+                return {"ok": False, "error": _error(e)}
+
+        results = await asyncio.gather(*(check(e) for e in shards.values()))
+        checks["shards"] = {
+            "ok": all(result["ok"] for result in results),
+            "by_shard": dict(zip(shards, results)),
+        }
+
+    async def _primary_checks(self, checks: Dict[str, Any]) -> None:
+        try:
+            await asyncio.wait_for(self._database(checks), self._timeout)
+        except Exception as e:
+            error = _error(e)
+            for name in ("database", "migrations"):
+                checks.setdefault(name, {"ok": False, "error": error})
+            checks.setdefault("jobs", {"error": error})
+
+    async def _probe(self) -> Dict[str, Any]:
+        checks: Dict[str, Any] = {"pool": self._pool()}
+        await asyncio.gather(self._primary_checks(checks), self._shard_checks(checks))
+        ready = all(checks[name]["ok"] for name in _GATES)
+        return {
+            "status": "ready" if ready else "not_ready",
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "checks": checks,
+        }
+
+
+readiness_probe = ReadinessProbe(shards=shard_engines)
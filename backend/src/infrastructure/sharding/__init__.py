@@ -0,0 +1,25 @@
+from .directory import ShardDirectory, WorkspaceShardORM, shard_directory
+from .router import (
+    CrossShardError,
+    ReplicatedUsers,
+    gather_shards,
+    place,
+    release,
+    replicate_users,
+    replicated_users,
+    route,
+)
+
+__all__ = [
+    "CrossShardError",
+    "ReplicatedUsers",
+    "ShardDirectory",
+    "WorkspaceShardORM",
+    "gather_shards",
+    "place",
+    "release",
+    "replicate_users",
+    "replicated_users",
+    "route",
+    "shard_directory",
+]
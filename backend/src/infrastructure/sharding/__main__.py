@@ -0,0 +1,40 @@
+"""Shard maintenance commands.
+
+    python -m src.infrastructure.sharding sync-defaults
+    python -m src.infrastructure.sharding move <workspace_id> <shard>
+"""
+
+import argparse
+import asyncio
+from uuid import UUID
+
+from src.infrastructure.database import close_pool
+from src.infrastructure.sharding.move import move_workspace, sync_default_categories
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Shard maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser(
+        "sync-defaults", help="copy the default categories to every shard"
+    )
+    move = commands.add_parser("move", help="move a workspace to another shard")
+    move.add_argument("workspace_id", type=UUID)
+    move.add_argument("shard", type=int)
+    args = parser.parse_args()
+
+    try:
+        if args.command == "sync-defaults":
+            print(f"{await sync_default_categories()} default categories written")
+        else:
+            copied = await move_workspace(args.workspace_id, args.shard)
+            if not copied:
+                print("Workspace is already on that shard")
+            for table, count in copied.items():
+                print(f"{table}: {count} rows")
+    finally:
+        await close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
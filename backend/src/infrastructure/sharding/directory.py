@@ -0,0 +1,96 @@
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, Tuple
+from uuid import UUID
+
+from sqlalchemy import Column, Integer, Uuid, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.database import Base, insert_for
+from src.infrastructure.observability import record_cache_lookup
+from src.infrastructure.types import UTCDateTime
+
+SHARD_DIRECTORY_TTL = float(os.getenv("SHARD_DIRECTORY_TTL", "30"))
+
+
+class WorkspaceShardORM(Base):
+    """Which shard holds each workspace; lives in the primary database."""
+
+    __tablename__ = "workspace_shards"
+
+    workspace_id = Column(Uuid, primary_key=True)
+    shard = Column(Integer, nullable=False)
+    updated_at = Column(
+        UTCDateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+    )
+
+
+class ShardDirectory:
+    """Per-process cache over the ``workspace_shards`` table.
+
+    New workspaces are placed by hashing their id, so a workspace missing
+    from the table (its row was never committed) still resolves to the
+    shard it was written to. Rows only disagree with the hash after a move.
+    Entries are reused for ``ttl`` seconds, which bounds how long another
+    process keeps routing a moved workspace to its old shard.
+    """
+
+    def __init__(self, ttl: float = SHARD_DIRECTORY_TTL, clock=time.monotonic):
+        self._ttl = ttl
+        self._clock = clock
+        # workspace_id -> (shard, cached at)
+        self._entries: Dict[UUID, Tuple[int, float]] = {}
+
+    @staticmethod
+    def default_shard(workspace_id: UUID, count: int) -> int:
+        return workspace_id.int % count
+
+    async def lookup(
+        self, session: AsyncSession, workspace_id: UUID, count: int
+    ) -> int:
+        entry = self._entries.get(workspace_id)
+        hit = entry is not None and self._clock() - entry[1] < self._ttl
+        record_cache_lookup("shard_directory", hit)
+        if hit:
+            return entry[0]
+        shard = await session.scalar(
+            select(WorkspaceShardORM.shard).where(
+                WorkspaceShardORM.workspace_id == workspace_id
+            )
+        )
+        if shard is None:
+            shard = self.default_shard(workspace_id, count)
+        self._entries[workspace_id] = (shard, self._clock())
+        return shard
+
+    async def assign(
+        self, session: AsyncSession, workspace_id: UUID, shard: int
+    ) -> None:
+        stmt = insert_for(session, WorkspaceShardORM).values(
+            workspace_id=workspace_id,
+            shard=shard,
+            updated_at=datetime.now(timezone.utc),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WorkspaceShardORM.workspace_id],
+            set_={"shard": stmt.excluded.shard, "updated_at": stmt.excluded.updated_at},
+        )
+        await session.execute(stmt)
+        self._entries[workspace_id] = (shard, self._clock())
+
+    async def release(self, session: AsyncSession, workspace_id: UUID) -> None:
+        await session.execute(
+            delete(WorkspaceShardORM).where(
+                WorkspaceShardORM.workspace_id == workspace_id
+            )
+        )
+        self.forget(workspace_id)
+
+    def forget(self, workspace_id: UUID) -> None:
+        self._entries.pop(workspace_id, None)
+
+
+shard_directory = ShardDirectory()
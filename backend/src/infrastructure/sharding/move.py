@@ -0,0 +1,139 @@
+import os
+from typing import Dict, Sequence, Set
+from uuid import UUID
+
+from sqlalchemy import Table, delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from src.infrastructure.auth.models import UserORM
+from src.infrastructure.budget.models import BudgetORM, CategoryORM
+from src.infrastructure.database import engine as primary_engine
+from src.infrastructure.database import shard_engines
+from src.infrastructure.sharding.directory import ShardDirectory, shard_directory
+from src.infrastructure.sharding.router import replicated_users
+from src.infrastructure.workspace.models import WorkspaceMemberORM, WorkspaceORM
+
+MOVE_BATCH_SIZE = int(os.getenv("MOVE_BATCH_SIZE", "1000"))
+
+# Parents first, so foreign keys hold on the way in; reversed on the way out
+_WORKSPACE_TABLES = [
+    (WorkspaceORM.__table__, "id"),
+    (CategoryORM.__table__, "workspace_id"),
+    (WorkspaceMemberORM.__table__, "workspace_id"),
+    (BudgetORM.__table__, "workspace_id"),
+]
+
+
+def _insertable(table: Table) -> list:
+    # Generated columns (budgets.period) are computed by the target
+    return [column for column in table.columns if column.computed is None]
+
+
+async def _copy(
+    source: AsyncConnection, target: AsyncConnection, table: Table, where
+) -> int:
+    result = await source.execute(select(*_insertable(table)).where(where))
+    rows = [dict(row) for row in result.mappings()]
+    for start in range(0, len(rows), MOVE_BATCH_SIZE):
+        # Re-running an interrupted move skips the rows already copied
+        await target.execute(
+            insert(table)
+            .values(rows[start : start + MOVE_BATCH_SIZE])
+            .on_conflict_do_nothing()
+        )
+    return len(rows)
+
+
+async def _copy_users(
+    target: AsyncConnection, user_ids: Set[UUID], primary: AsyncEngine
+) -> None:
+    if not user_ids:
+        return
+    async with primary.connect() as conn:
+        await _copy(conn, target, UserORM.__table__, UserORM.id.in_(user_ids))
+
+
+async def move_workspace(
+    workspace_id: UUID,
+    target: int,
+    shards: Sequence[AsyncEngine] = shard_engines,
+    primary: AsyncEngine = primary_engine,
+    directory: ShardDirectory = shard_directory,
+) -> Dict[str, int]:
+    """Moves a workspace and its rows to another shard.
+
+    Copies the rows in one transaction on the target, points the directory
+    at it and then deletes them from the source. Other processes keep their
+    cached placement for up to ``SHARD_DIRECTORY_TTL`` seconds, and writes
+    they make to the source meanwhile are lost, so move idle workspaces.
+    Returns the number of rows copied per table.
+    """
+    async with AsyncSession(primary) as session:
+        directory.forget(workspace_id)
+        source = await directory.lookup(session, workspace_id, len(shards))
+    if source == target:
+        return {}
+
+    copied: Dict[str, int] = {}
+    async with shards[source].connect() as src, shards[target].begin() as dst:
+        owner_id = await src.scalar(
+            select(WorkspaceORM.owner_id).where(WorkspaceORM.id == workspace_id)
+        )
+        if owner_id is None:
+            raise LookupError(f"Workspace {workspace_id} is not on shard {source}")
+        user_ids = {owner_id}
+        for table in (WorkspaceMemberORM.__table__, BudgetORM.__table__):
+            column = table.c.user_id if "user_id" in table.c else table.c.owner_id
+            result = await src.execute(
+                select(column).where(table.c.workspace_id == workspace_id).distinct()
+            )
+            user_ids.update(result.scalars())
+        await _copy_users(dst, user_ids, primary)
+        for table, key in _WORKSPACE_TABLES:
+            copied[table.name] = await _copy(
+                src, dst, table, table.c[key] == workspace_id
+            )
+
+    async with AsyncSession(primary) as session:
+        await directory.assign(session, workspace_id, target)
+        await session.commit()
+
+    async with shards[source].begin() as src:
+        for table, key in reversed(_WORKSPACE_TABLES):
+            await src.execute(delete(table).where(table.c[key] == workspace_id))
+    # The source's copies of these users may be cleaned up now; the target's
+    # were made here, outside ``replicate_users``
+    replicated_users.forget(user_ids, source)
+    return copied
+
+
+async def sync_default_categories(
+    shards: Sequence[AsyncEngine] = shard_engines,
+) -> int:
+    """Makes every shard hold shard 0's default categories, ids included.
+
+    Budgets reference default categories by id, so the ids must match for
+    a budget to be valid on any shard. Returns the number of rows written.
+    """
+    table = CategoryORM.__table__
+    async with shards[0].connect() as conn:
+        result = await conn.execute(
+            select(*_insertable(table)).where(table.c.is_default)
+        )
+        rows = [dict(row) for row in result.mappings()]
+    ids = [row["id"] for row in rows]
+
+    written = 0
+    for shard in shards[1:]:
+        async with shard.begin() as conn:
+            # Seeded by the shard's own migration, under other ids
+            await conn.execute(
+                delete(table).where(table.c.is_default, table.c.id.not_in(ids))
+            )
+            if rows:
+                result = await conn.execute(
+                    insert(table).values(rows).on_conflict_do_nothing()
+                )
+                written += result.rowcount
+    return written
@@ -0,0 +1,191 @@
+"""Routes a request's session to the shard of the workspace it works on.
+
+A session touches at most one shard besides the primary, which keeps users,
+jobs, the audit log and the shard directory. The two are not committed
+atomically: a write that spans them, such as a workspace deletion and its
+purge job, can land on one and not the other, so whatever depends on both
+has to be reconciled (see ``ReconcileWorkspacePurges``).
+"""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.auth.models import UserORM
+from src.infrastructure.database import RoutingSession
+from src.infrastructure.sharding.directory import shard_directory
+
+SHARD_REPLICATED_USERS = int(os.getenv("SHARD_REPLICATED_USERS", "100000"))
+SHARD_REPLICATED_TTL = float(os.getenv("SHARD_REPLICATED_TTL", "3600"))
+
+T = TypeVar("T")
+
+
+class ReplicatedUsers:
+    """(shard, user id) pairs this process has seen committed to a shard.
+
+    The least recently used pairs are dropped past ``max_entries``, and a
+    pair is trusted for ``ttl`` seconds only, so a copy deleted by another
+    process is made again eventually.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = SHARD_REPLICATED_USERS,
+        ttl: float = SHARD_REPLICATED_TTL,
+        clock=time.monotonic,
+    ):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        # (shard, user id) -> added at
+        self._entries: "OrderedDict[Tuple[int, UUID], float]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, pair: Tuple[int, UUID]) -> bool:
+        added = self._entries.get(pair)
+        if added is None:
+            return False
+        if self._clock() - added >= self._ttl:
+            del self._entries[pair]
+            return False
+        self._entries.move_to_end(pair)
+        return True
+
+    def add(self, pairs: Iterable[Tuple[int, UUID]]) -> None:
+        now = self._clock()
+        for pair in pairs:
+            self._entries[pair] = now
+            self._entries.move_to_end(pair)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def forget(self, user_ids: Iterable[UUID], shard: Optional[int] = None) -> None:
+        """Drops the users' pairs, on ``shard`` or on every shard."""
+        user_ids = set(user_ids)
+        for pair in [
+            pair
+            for pair in self._entries
+            if pair[1] in user_ids and (shard is None or pair[0] == shard)
+        ]:
+            del self._entries[pair]
+
+
+replicated_users = ReplicatedUsers()
+
+
+class CrossShardError(RuntimeError):
+    """Raised when one session is routed to two different shards."""
+
+
+def _routing(session: AsyncSession) -> Optional[RoutingSession]:
+    sync_session = session.sync_session
+    if isinstance(sync_session, RoutingSession) and sync_session.sharded:
+        return sync_session
+    return None
+
+
+def _set_shard(routing: RoutingSession, shard: int) -> None:
+    current = routing.info.get("shard")
+    if current is not None and current != shard:
+        raise CrossShardError(f"Session is routed to shard {current}, not {shard}")
+    routing.info["shard"] = shard
+
+
+async def route(session: AsyncSession, workspace_id: UUID) -> None:
+    """Points the session's workspace-scoped tables at the workspace's shard."""
+    routing = _routing(session)
+    if routing is None:
+        return
+    shard = await shard_directory.lookup(session, workspace_id, len(routing.shards))
+    _set_shard(routing, shard)
+
+
+async def place(session: AsyncSession, workspace_id: UUID) -> None:
+    """Chooses the shard of a new workspace, records it and routes to it.
+
+    The directory row is written with a single database too, so turning
+    sharding on later needs no backfill.
+    """
+    routing = _routing(session)
+    count = len(routing.shards) if routing else 1
+    shard = shard_directory.default_shard(workspace_id, count)
+    await shard_directory.assign(session, workspace_id, shard)
+    if routing is not None:
+        _set_shard(routing, shard)
+
+
+async def release(session: AsyncSession, workspace_id: UUID) -> None:
+    """Drops the directory row of a workspace that no longer exists."""
+    await shard_directory.release(session, workspace_id)
+
+
+async def replicate_users(session: AsyncSession, user_ids: Iterable[UUID]) -> None:
+    """Copies user rows into the routed shard so its foreign keys hold.
+
+    Users live in the primary database; a shard keeps a copy of those its
+    workspaces reference. Nothing to do when the shard is the primary.
+    """
+    routing = _routing(session)
+    if routing is None:
+        return
+    target = routing.shard_engine().sync_engine
+    if target is routing.bind:
+        return
+    shard = routing.info.get("shard", 0)
+    user_ids = {id for id in user_ids if (shard, id) not in replicated_users}
+    if not user_ids:
+        return
+    result = await session.execute(
+        select(UserORM.__table__).where(UserORM.id.in_(user_ids))
+    )
+    rows = [dict(row) for row in result.mappings()]
+    if rows:
+        await session.execute(
+            insert(UserORM.__table__).values(rows).on_conflict_do_nothing(),
+            bind_arguments={"bind": target},
+        )
+        # Remembered once committed: a rolled back copy may not exist
+        routing.info.setdefault("replicated", set()).update(
+            (shard, row["id"]) for row in rows
+        )
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _remember_replicated(session: RoutingSession) -> None:
+    replicated_users.add(session.info.pop("replicated", ()))
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _forget_replicated(session: RoutingSession) -> None:
+    session.info.pop("replicated", None)
+
+
+async def gather_shards(
+    session: AsyncSession, query: Callable[[AsyncSession], Awaitable[T]]
+) -> List[T]:
+    """Runs ``query`` on every shard concurrently, one session per shard.
+
+    Without sharding ``query`` runs once on ``session`` itself. The shard
+    sessions are read-only and closed before returning.
+    """
+    routing = _routing(session)
+    if routing is None:
+        return [await query(session)]
+
+    async def run(shard: int) -> T:
+        async with AsyncSession(
+            bind=routing.shard_engine(shard), expire_on_commit=False
+        ) as shard_session:
+            return await query(shard_session)
+
+    return list(await asyncio.gather(*(run(i) for i in range(len(routing.shards)))))
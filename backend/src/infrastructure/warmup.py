@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.infrastructure.auth.repositories import SQLUserRepository
+from src.infrastructure.budget.repositories import (
+    SQLBudgetRepository,
+    SQLCategoryRepository,
+)
+from src.infrastructure.database import engine as default_engine, shard_engines
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository
+
+DB_POOL_WARM = int(os.getenv("DB_POOL_WARM", "2"))
+
+logger = logging.getLogger(__name__)
+
+# Matches no row; the statements only need to run, not to return data
+_PROBE = uuid.UUID(int=0)
+
+
+async def run_hot_statements(session: AsyncSession) -> None:
+    """Executes the statements behind authentication and the list endpoints.
+
+    The first execution of each statement shape fills SQLAlchemy's compiled
+    cache for the engine; on every connection it runs on it also makes
+    asyncpg prepare the statement and introspect the column types.
+    """
+    await SQLUserRepository(session).get_by_id(_PROBE)
+
+    workspaces = SQLWorkspaceRepository(session)
+    await workspaces.get_by_id(_PROBE)
+    await workspaces.get_member(_PROBE, _PROBE)
+    await workspaces.list_by_user(_PROBE)
+    await workspaces.get_list_version(_PROBE)
+
+    budgets = SQLBudgetRepository(session)
+    await budgets.get_list_version(_PROBE)
+    await budgets.list_by_workspace(_PROBE)
+
+    categories = SQLCategoryRepository(session)
+    await categories.get_list_version()
+    await categories.list_defaults()
+
+
+async def _warm_engine(engine: AsyncEngine, connections: int) -> None:
+    size = getattr(engine.pool, "size", lambda: connections)()
+    connections = min(connections, size)
+    if connections <= 0:
+        return
+
+    async def warm_connection() -> None:
+        async with engine.connect() as conn:
+            async with AsyncSession(bind=conn) as session:
+                await run_hot_statements(session)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(warm_connection() for _ in range(connections)), return_exceptions=True
+    )
+    failures = [r for r in results if isinstance(r, Exception)]
+    if failures:
+        logger.warning(
+            "Warmed %d of %d connections to %s: %s",
+            connections - len(failures),
+            connections,
+            engine.url.database,
+            failures[0],
+        )
+    else:
+        logger.info(
+            "Warmed %d connections to %s in %.0f ms",
+            connections,
+            engine.url.database,
+            (time.perf_counter() - start) * 1000,
+        )
+
+
+async def warm_up(*engines: AsyncEngine, connections: int = DB_POOL_WARM) -> None:
+    """Opens ``connections`` pool connections per engine and runs the hot
+    statements on each; by default on the primary and on every shard.
+
+    Connections are checked out together so each one is distinct, and the
+    count is capped at the pool size since overflow connections are closed
+    as soon as they are returned. Failures are logged, never raised: a
+    worker that cannot warm up still serves, only slower at first.
+    """
+    engines = engines or (default_engine, *shard_engines)
+    # The primary is usually also shard 0
+    await asyncio.gather(
+        *(_warm_engine(engine, connections) for engine in dict.fromkeys(engines))
+    )
@@ -15,6 +15,7 @@ class WorkspaceMapper:
             is_active=orm.is_active,
             created_at=orm.created_at,
             updated_at=orm.updated_at,
+            deleted_at=orm.deleted_at,
         )
 
     @staticmethod
@@ -28,6 +29,7 @@ class WorkspaceMapper:
             is_active=domain.is_active,
             created_at=domain.created_at,
             updated_at=domain.updated_at,
+            deleted_at=domain.deleted_at,
         )
 
 
@@ -4,41 +4,43 @@ from datetime import datetime
 from sqlalchemy import (
     Boolean,
     Column,
-    DateTime,
     ForeignKey,
+    Index,
     String,
     UniqueConstraint,
+    Uuid,
     text,
 )
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from src.infrastructure.database import Base
+from src.infrastructure.types import UTCDateTime
 
 
 class WorkspaceORM(Base):
     __tablename__ = "workspaces"
 
     id = Column(
-        UUID(as_uuid=True),
+        Uuid,
         primary_key=True,
         index=True,
-        server_default=text("gen_random_uuid()"),
+        default=uuid.uuid4,
     )
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
     category = Column(String, nullable=True) # e.g., 'Personal', 'Business', 'Investment'
     owner_id = Column(
-        UUID(as_uuid=True),
+        Uuid,
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at = Column(UTCDateTime, default=datetime.utcnow)
     updated_at = Column(
-        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+        UTCDateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
+    deleted_at = Column(UTCDateTime, nullable=True)
 
     # Relationships
     owner = relationship("UserORM", backref="owned_workspaces")
@@ -46,26 +48,35 @@ class WorkspaceORM(Base):
         "WorkspaceMemberORM", back_populates="workspace", cascade="all, delete-orphan"
     )
 
+    # Names only need to be unique among live workspaces; a soft-deleted one
+    # must not block reusing its name while it waits to be purged.
     __table_args__ = (
-        UniqueConstraint("owner_id", "name", name="uq_workspace_owner_name"),
+        Index(
+            "uq_workspace_owner_name",
+            "owner_id",
+            "name",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
     )
 
 
 class WorkspaceMemberORM(Base):
     __tablename__ = "workspace_members"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     workspace_id = Column(
-        UUID(as_uuid=True),
+        Uuid,
         ForeignKey("workspaces.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     user_id = Column(
-        UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True
+        Uuid, ForeignKey("users.id"), nullable=False, index=True
     )
     role = Column(String, nullable=False)
-    joined_at = Column(DateTime(timezone=True), default=datetime.utcnow)
+    joined_at = Column(UTCDateTime, default=datetime.utcnow)
 
     # Relationships
     workspace = relationship("WorkspaceORM", back_populates="members")
@@ -1,12 +1,21 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.workspace.models import Workspace, WorkspaceMember
 from src.domain.workspace.repositories import WorkspaceRepository
 from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.database import insert_for
+from src.infrastructure.sharding import (
+    gather_shards,
+    place,
+    release,
+    replicate_users,
+    route,
+)
 from src.infrastructure.workspace.mappers import WorkspaceMapper, WorkspaceMemberMapper
 from src.infrastructure.workspace.models import WorkspaceMemberORM, WorkspaceORM
 
@@ -16,11 +25,19 @@ class SQLWorkspaceRepository(WorkspaceRepository):
         self._session = session
 
     async def add(self, workspace: Workspace) -> None:
+        await place(self._session, workspace.id)
+        await replicate_users(self._session, [workspace.owner_id])
         orm_workspace = WorkspaceMapper.to_orm(workspace)
         self._session.add(orm_workspace)
 
-    async def get_by_id(self, id: UUID) -> Optional[Workspace]:
-        result = await self._session.execute(select(WorkspaceORM).filter_by(id=id))
+    async def get_by_id(
+        self, id: UUID, include_deleted: bool = False
+    ) -> Optional[Workspace]:
+        await route(self._session, id)
+        stmt = select(WorkspaceORM).filter_by(id=id)
+        if not include_deleted:
+            stmt = stmt.where(WorkspaceORM.deleted_at.is_(None))
+        result = await self._session.execute(stmt)
         orm_workspace = result.scalar_one_or_none()
         if not orm_workspace:
             return None
@@ -37,38 +54,159 @@ class SQLWorkspaceRepository(WorkspaceRepository):
             )
             .where(
                 (WorkspaceORM.owner_id == user_id)
-                | (WorkspaceMemberORM.user_id == user_id)
+                | (WorkspaceMemberORM.user_id == user_id),
+                WorkspaceORM.deleted_at.is_(None),
             )
             .distinct()
         )
 
-        result = await self._session.execute(stmt)
+        async def query(session: AsyncSession) -> List[Workspace]:
+            result = await session.execute(stmt)
+            return [WorkspaceMapper.to_domain(orm) for orm in result.scalars()]
+
+        # A user's workspaces may live on any shard
+        return [
+            workspace
+            for shard in await gather_shards(self._session, query)
+            for workspace in shard
+        ]
+
+    async def get_list_version(self, user_id: UUID) -> Tuple[Optional[datetime], int]:
+        stmt = (
+            select(
+                func.max(WorkspaceORM.updated_at),
+                func.count(WorkspaceORM.id.distinct()),
+            )
+            .join(
+                WorkspaceMemberORM,
+                WorkspaceORM.id == WorkspaceMemberORM.workspace_id,
+                isouter=True,
+            )
+            .where(
+                (WorkspaceORM.owner_id == user_id)
+                | (WorkspaceMemberORM.user_id == user_id),
+                WorkspaceORM.deleted_at.is_(None),
+            )
+        )
 
-        return [WorkspaceMapper.to_domain(orm) for orm in result.scalars()]
+        async def query(session: AsyncSession) -> Tuple[Optional[datetime], int]:
+            result = await session.execute(stmt)
+            return result.one()
+
+        versions = await gather_shards(self._session, query)
+        updated = [last_updated for last_updated, _ in versions if last_updated]
+        return max(updated, default=None), sum(total or 0 for _, total in versions)
 
     async def get_by_name_and_owner(
         self, name: str, owner_id: UUID
     ) -> Optional[Workspace]:
-        stmt = select(WorkspaceORM).filter_by(name=name, owner_id=owner_id)
-        result = await self._session.execute(stmt)
-        orm_workspace = result.scalar_one_or_none()
-        if not orm_workspace:
-            return None
-        return WorkspaceMapper.to_domain(orm_workspace)
+        stmt = select(WorkspaceORM).filter_by(
+            name=name, owner_id=owner_id, deleted_at=None
+        )
+
+        async def query(session: AsyncSession) -> Optional[Workspace]:
+            result = await session.execute(stmt)
+            orm_workspace = result.scalar_one_or_none()
+            if not orm_workspace:
+                return None
+            return WorkspaceMapper.to_domain(orm_workspace)
+
+        found = [w for w in await gather_shards(self._session, query) if w]
+        return found[0] if found else None
 
     async def add_member(self, member: WorkspaceMember) -> None:
+        await route(self._session, member.workspace_id)
+        await replicate_users(self._session, [member.user_id])
         orm_member = WorkspaceMemberMapper.to_orm(member)
         self._session.add(orm_member)
 
+    async def add_members(self, members: List[WorkspaceMember]) -> Set[UUID]:
+        if not members:
+            return set()
+        # Callers add the members of a single workspace
+        await route(self._session, members[0].workspace_id)
+        await replicate_users(self._session, (member.user_id for member in members))
+        stmt = (
+            insert_for(self._session, WorkspaceMemberORM)
+            .values(
+                [
+                    {
+                        "id": member.id,
+                        "workspace_id": member.workspace_id,
+                        "user_id": member.user_id,
+                        "role": member.role.value,
+                        "joined_at": member.joined_at,
+                    }
+                    for member in members
+                ]
+            )
+            .on_conflict_do_nothing(
+                index_elements=[
+                    WorkspaceMemberORM.workspace_id,
+                    WorkspaceMemberORM.user_id,
+                ]
+            )
+            .returning(WorkspaceMemberORM.user_id)
+        )
+        result = await self._session.execute(stmt)
+        return set(result.scalars())
+
+    async def get_member_user_ids(
+        self, workspace_id: UUID, user_ids: Iterable[UUID]
+    ) -> Set[UUID]:
+        user_ids = set(user_ids)
+        if not user_ids:
+            return set()
+        await route(self._session, workspace_id)
+        stmt = select(WorkspaceMemberORM.user_id).where(
+            WorkspaceMemberORM.workspace_id == workspace_id,
+            WorkspaceMemberORM.user_id.in_(user_ids),
+        )
+        result = await self._session.execute(stmt)
+        return set(result.scalars())
+
+    async def get_accessible_workspace_ids(
+        self, user_id: UUID, workspace_ids: Iterable[UUID]
+    ) -> Set[UUID]:
+        workspace_ids = set(workspace_ids)
+        if not workspace_ids:
+            return set()
+        stmt = (
+            select(WorkspaceORM.id)
+            .join(
+                WorkspaceMemberORM,
+                (WorkspaceORM.id == WorkspaceMemberORM.workspace_id)
+                & (WorkspaceMemberORM.user_id == user_id),
+                isouter=True,
+            )
+            .where(
+                WorkspaceORM.id.in_(workspace_ids),
+                WorkspaceORM.deleted_at.is_(None),
+                (WorkspaceORM.owner_id == user_id)
+                | WorkspaceMemberORM.user_id.is_not(None),
+            )
+        )
+
+        async def query(session: AsyncSession) -> Set[UUID]:
+            result = await session.execute(stmt)
+            return set(result.scalars())
+
+        return set().union(*await gather_shards(self._session, query))
+
     async def get_member(
         self, workspace_id: UUID, user_id: UUID
     ) -> Optional[WorkspaceMember]:
+        await route(self._session, workspace_id)
         # First check if the user is the workspace owner
-        workspace_stmt = select(WorkspaceORM).filter_by(id=workspace_id)
+        workspace_stmt = select(WorkspaceORM).filter_by(id=workspace_id, deleted_at=None)
         workspace_result = await self._session.execute(workspace_stmt)
         workspace_orm = workspace_result.scalar_one_or_none()
 
-        if workspace_orm and workspace_orm.owner_id == user_id:
+        if not workspace_orm:
+            # Missing or soft-deleted workspaces have no members
+            return None
+
+        if workspace_orm.owner_id == user_id:
             # Owner is not in workspace_members table, create synthetic member
             return WorkspaceMember(
                 workspace_id=workspace_id,
@@ -89,32 +227,29 @@ class SQLWorkspaceRepository(WorkspaceRepository):
         return WorkspaceMemberMapper.to_domain(orm_member)
 
     async def list_members(self, workspace_id: UUID) -> List[WorkspaceMember]:
+        await route(self._session, workspace_id)
         # Get the workspace to access owner_id
-        workspace_stmt = select(WorkspaceORM).filter_by(id=workspace_id)
+        workspace_stmt = select(WorkspaceORM).filter_by(id=workspace_id, deleted_at=None)
         workspace_result = await self._session.execute(workspace_stmt)
         workspace_orm = workspace_result.scalar_one_or_none()
+        if not workspace_orm:
+            return []
 
-        members = []
-
-        # Add owner as first member if workspace exists
-        if workspace_orm:
-            owner_member = WorkspaceMember(
+        # Owner goes first as a synthetic member
+        members = [
+            WorkspaceMember(
                 workspace_id=workspace_id,
                 user_id=workspace_orm.owner_id,
                 role=WorkspaceRole.OWNER,
                 joined_at=workspace_orm.created_at,
                 id=None,  # Synthetic member has no ID
             )
-            members.append(owner_member)
+        ]
 
         # Get regular members from workspace_members table (exclude owner if already present)
         stmt = select(WorkspaceMemberORM).filter(
             WorkspaceMemberORM.workspace_id == workspace_id,
-            (
-                WorkspaceMemberORM.user_id != workspace_orm.owner_id
-                if workspace_orm
-                else True
-            ),
+            WorkspaceMemberORM.user_id != workspace_orm.owner_id,
         )
         result = await self._session.execute(stmt)
         members.extend([WorkspaceMemberMapper.to_domain(m) for m in result.scalars()])
@@ -122,6 +257,7 @@ class SQLWorkspaceRepository(WorkspaceRepository):
         return members
 
     async def update_member(self, member: WorkspaceMember) -> None:
+        await route(self._session, member.workspace_id)
         stmt = (
             update(WorkspaceMemberORM)
             .where(WorkspaceMemberORM.id == member.id)
@@ -130,6 +266,7 @@ class SQLWorkspaceRepository(WorkspaceRepository):
         await self._session.execute(stmt)
 
     async def remove_member(self, workspace_id: UUID, user_id: UUID) -> None:
+        await route(self._session, workspace_id)
         stmt = delete(WorkspaceMemberORM).where(
             WorkspaceMemberORM.workspace_id == workspace_id,
             WorkspaceMemberORM.user_id == user_id,
@@ -137,6 +274,7 @@ class SQLWorkspaceRepository(WorkspaceRepository):
         await self._session.execute(stmt)
 
     async def update(self, workspace: Workspace) -> None:
+        await route(self._session, workspace.id)
         stmt = (
             update(WorkspaceORM)
             .where(WorkspaceORM.id == workspace.id)
@@ -146,16 +284,57 @@ class SQLWorkspaceRepository(WorkspaceRepository):
                 category=workspace.category,
                 is_active=workspace.is_active,
                 updated_at=workspace.updated_at,
+                deleted_at=workspace.deleted_at,
             )
         )
         await self._session.execute(stmt)
 
     async def remove(self, workspace: Workspace) -> None:
-        """Deletes a workspace permanently. Consider soft-delete in future."""
+        """Deletes a workspace permanently.
+
+        Workspaces are soft-deleted first (see ``update``) and removed by the
+        purge job once their dependent rows are gone, so this delete does not
+        cascade through large tables.
+        """
+        await route(self._session, workspace.id)
         stmt = delete(WorkspaceORM).where(WorkspaceORM.id == workspace.id)
         await self._session.execute(stmt)
+        await release(self._session, workspace.id)
+
+    async def list_deleted_ids(self, deleted_before: datetime) -> List[UUID]:
+        stmt = select(WorkspaceORM.id).where(
+            WorkspaceORM.deleted_at.is_not(None),
+            WorkspaceORM.deleted_at < deleted_before,
+        )
+
+        async def query(session: AsyncSession) -> List[UUID]:
+            result = await session.execute(stmt)
+            return list(result.scalars())
+
+        return [id for shard in await gather_shards(self._session, query) for id in shard]
+
+    async def remove_members_batch(self, workspace_id: UUID, limit: int) -> int:
+        await route(self._session, workspace_id)
+        batch = (
+            select(WorkspaceMemberORM.id)
+            .filter_by(workspace_id=workspace_id)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        stmt = delete(WorkspaceMemberORM).where(WorkspaceMemberORM.id.in_(batch))
+        result = await self._session.execute(stmt)
+        return result.rowcount
 
     async def list(self) -> List[Workspace]:
         """List all workspaces (Administrative use)."""
-        result = await self._session.execute(select(WorkspaceORM))
-        return [WorkspaceMapper.to_domain(orm) for orm in result.scalars()]
+        stmt = select(WorkspaceORM).where(WorkspaceORM.deleted_at.is_(None))
+
+        async def query(session: AsyncSession) -> List[Workspace]:
+            result = await session.execute(stmt)
+            return [WorkspaceMapper.to_domain(orm) for orm in result.scalars()]
+
+        return [
+            workspace
+            for shard in await gather_shards(self._session, query)
+            for workspace in shard
+        ]
@@ -3,8 +3,8 @@ import pytest
 import pytest_asyncio
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from src.infrastructure.database import Base, DATABASE_URL
-from src.infrastructure.auth.models import UserORM
+from src.infrastructure.database import Base, DATABASE_URL, create_engine
+from src.infrastructure.auth.models import RevokedTokenORM, UserORM
 from src.infrastructure.workspace.models import WorkspaceORM, WorkspaceMemberORM
 
 # Use a test database URL
@@ -27,11 +27,30 @@ async def setup_test_db():
     await engine.dispose()
 
 from src.infrastructure.budget.models.category import CategoryORM
+from src.infrastructure.jobs.models import JobORM
+from src.infrastructure.audit.models import AuditEventORM
+from src.infrastructure.sharding import WorkspaceShardORM
 import uuid
 
+def pytest_generate_tests(metafunc):
+    """Runs tests marked ``backends("postgresql", "sqlite")`` once per backend."""
+    marker = metafunc.definition.get_closest_marker("backends")
+    if marker and "db_engine" in metafunc.fixturenames:
+        metafunc.parametrize("db_backend", marker.args, indirect=True)
+
+
+@pytest.fixture
+def db_backend(request):
+    return getattr(request, "param", "postgresql")
+
+
 @pytest_asyncio.fixture
-async def db_engine():
-    engine = create_async_engine(TEST_DATABASE_URL)
+async def db_engine(db_backend, tmp_path):
+    if db_backend == "sqlite":
+        # Same engine factory, and so the same pragmas, as the application
+        engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'wiselab_test.db'}")
+    else:
+        engine = create_async_engine(TEST_DATABASE_URL)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
@@ -54,3 +73,39 @@ async def db_session(db_engine):
     session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
     async with session_factory() as session:
         yield session
+
+
+@pytest.fixture(autouse=True)
+def fresh_login_rate_limiter(monkeypatch):
+    """Gives every test its own login buckets so logins don't add up."""
+    from src.infrastructure.rate_limit import InMemoryBucketStore, LoginRateLimiter
+    from src.infrastructure.rate_limit import limiter
+
+    monkeypatch.setattr(
+        limiter, "login_rate_limiter", LoginRateLimiter(InMemoryBucketStore())
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_revocation_list(monkeypatch):
+    """Gives every test an empty token revocation mirror."""
+    from src.infrastructure.auth.services import revocation
+
+    monkeypatch.setattr(revocation, "revocation_list", revocation.RevocationList())
+
+
+@pytest.fixture(autouse=True)
+def fresh_audit_buffer(monkeypatch):
+    """Gives every test an empty audit buffer that is never flushed on its own."""
+    from src.infrastructure.audit.services import buffer
+
+    monkeypatch.setattr(buffer, "audit_buffer", buffer.AuditBuffer())
+
+
+@pytest.fixture(autouse=True)
+def no_repository_cache(monkeypatch):
+    """Keeps the repository cache off; tests that want it install their own."""
+    from src.infrastructure.cache import repository
+
+    monkeypatch.setattr(repository, "repository_cache", None)
+    monkeypatch.setattr(repository, "invalidation_bus", None)
@@ -0,0 +1,98 @@
+import pytest
+import uuid
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.infrastructure.audit.services import buffer
+
+
+async def _login(client: AsyncClient, prefix: str):
+    user_data = {
+        "email": f"{prefix}_{uuid.uuid4().hex[:6]}@example.com",
+        "password": "Password123!",
+        "full_name": "Audit E2E User"
+    }
+    await client.post("/api/auth/register", json=user_data)
+    login_response = await client.post("/api/auth/login", json={
+        "email": user_data["email"],
+        "password": user_data["password"]
+    })
+    return user_data["email"], {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_audit_trail_flow(client: AsyncClient, db_engine, monkeypatch):
+    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(buffer, "audit_buffer", buffer.AuditBuffer(session_factory))
+
+    _, headers = await _login(client, "audit_owner")
+    member_email, member_headers = await _login(client, "audit_member")
+    ws_resp = await client.post("/api/workspaces", json={"name": "Audit WS"}, headers=headers)
+    workspace_id = ws_resp.json()["id"]
+    category_id = (await client.get("/api/budgets/categories", headers=headers)).json()[0]["id"]
+
+    # 1. Mutations record their events once committed
+    budget_data = {
+        "workspace_id": workspace_id,
+        "category_id": category_id,
+        "limit_amount": 100.0,
+        "month": 3,
+        "year": 2024
+    }
+    response = await client.post("/api/budgets", json=budget_data, headers=headers)
+    assert response.status_code == 201
+    budget_id = response.json()["id"]
+    await client.put(f"/api/budgets/{budget_id}", json={"limit_amount": 150.0}, headers=headers)
+    response = await client.post(
+        f"/api/workspaces/{workspace_id}/members",
+        json={"email": member_email, "role": "viewer"},
+        headers=headers,
+    )
+    member_id = response.json()["user_id"]
+    await client.put(
+        f"/api/workspaces/{workspace_id}/members/{member_id}", json={"role": "editor"}, headers=headers
+    )
+    await client.delete(f"/api/budgets/{budget_id}", headers=headers)
+
+    # 2. A rolled back request records nothing
+    response = await client.post(
+        "/api/budgets", json={**budget_data, "category_id": str(uuid.uuid4())}, headers=headers
+    )
+    assert response.status_code >= 400
+    assert len(buffer.audit_buffer) == 5
+
+    # 3. Nothing is written until the buffer flushes
+    response = await client.get(f"/api/workspaces/{workspace_id}/audit-events", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+    assert await buffer.audit_buffer.flush() == 5
+
+    # 4. Newest first, paged with the cursor
+    response = await client.get(
+        f"/api/workspaces/{workspace_id}/audit-events?limit=3", headers=headers
+    )
+    page = response.json()
+    assert [e["action"] for e in page["items"]] == [
+        "budget.deleted", "member.role_updated", "member.invited"
+    ]
+    assert page["items"][1]["details"] == {"previous_role": "viewer", "role": "editor"}
+    assert page["next_cursor"]
+
+    response = await client.get(
+        f"/api/workspaces/{workspace_id}/audit-events",
+        params={"limit": 3, "before": page["next_cursor"]},
+        headers=headers,
+    )
+    page = response.json()
+    assert [e["action"] for e in page["items"]] == ["budget.updated", "budget.created"]
+    assert page["items"][0]["details"] == {"previous_limit_amount": 100.0, "limit_amount": 150.0}
+    assert page["next_cursor"] is None
+
+    # 5. Only the owner and admins may read it
+    response = await client.get(f"/api/workspaces/{workspace_id}/audit-events", headers=member_headers)
+    assert response.status_code == 403
+
+    response = await client.get(
+        f"/api/workspaces/{workspace_id}/audit-events?before=garbage", headers=headers
+    )
+    assert response.status_code == 400
@@ -50,6 +50,27 @@ async def test_auth_full_flow(client: AsyncClient):
     assert new_tokens["access_token"] is not None
     assert "refresh_token" in new_tokens
 
+    # 4.1 A refresh token can be used again, e.g. from another tab
+    response = await client.post("/api/auth/refresh", json=refresh_data)
+    assert response.status_code == 200
+
+    # 4.2 Logout revokes the access token and the refresh token
+    headers = {"Authorization": f"Bearer {new_tokens['access_token']}"}
+    response = await client.get("/api/workspaces", headers=headers)
+    assert response.status_code == 200
+    response = await client.post(
+        "/api/auth/logout",
+        json={"refresh_token": new_tokens["refresh_token"]},
+        headers=headers,
+    )
+    assert response.status_code == 204
+    response = await client.get("/api/workspaces", headers=headers)
+    assert response.status_code == 401
+    response = await client.post(
+        "/api/auth/refresh", json={"refresh_token": new_tokens["refresh_token"]}
+    )
+    assert response.status_code == 401
+
     # 5. Login with wrong password (should fail)
     login_data["password"] = "wrongpassword"
     response = await client.post("/api/auth/login", json=login_data)
@@ -0,0 +1,78 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+
+async def _login(client: AsyncClient) -> dict:
+    email = f"etag_e2e_{uuid.uuid4().hex[:6]}@example.com"
+    await client.post(
+        "/api/auth/register",
+        json={"email": email, "password": "Password123!", "full_name": "ETag User"},
+    )
+    response = await client.post(
+        "/api/auth/login", json={"email": email, "password": "Password123!"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_list_endpoints_honor_if_none_match(client: AsyncClient):
+    headers = await _login(client)
+
+    ws_resp = await client.post("/api/workspaces", json={"name": "ETag WS"}, headers=headers)
+    workspace_id = ws_resp.json()["id"]
+
+    # Workspaces: unchanged list revalidates, a new workspace changes the tag
+    response = await client.get("/api/workspaces", headers=headers)
+    etag = response.headers["ETag"]
+    response = await client.get("/api/workspaces", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    await client.post("/api/workspaces", json={"name": "ETag WS 2"}, headers=headers)
+    response = await client.get("/api/workspaces", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+    # Default catalog is cacheable
+    response = await client.get("/api/budgets/categories", headers=headers)
+    assert response.headers["Cache-Control"].startswith("public")
+    category_id = response.json()[0]["id"]
+    response = await client.get(
+        "/api/budgets/categories",
+        headers={**headers, "If-None-Match": response.headers["ETag"]},
+    )
+    assert response.status_code == 304
+
+    # Budgets: updates and soft deletes both change the tag
+    budget = (
+        await client.post(
+            "/api/budgets",
+            json={
+                "workspace_id": workspace_id,
+                "category_id": category_id,
+                "limit_amount": 500.0,
+                "month": 3,
+                "year": 2024,
+            },
+            headers=headers,
+        )
+    ).json()
+    url = f"/api/budgets?workspace_id={workspace_id}"
+    etag = (await client.get(url, headers=headers)).headers["ETag"]
+    response = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    await client.put(f"/api/budgets/{budget['id']}", json={"limit_amount": 600.0}, headers=headers)
+    response = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    await client.delete(f"/api/budgets/{budget['id']}", headers=headers)
+    response = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["total"] == 0
+
+    # No access, no 304
+    other = await _login(client)
+    response = await client.get(url, headers={**other, "If-None-Match": etag})
+    assert response.status_code == 403
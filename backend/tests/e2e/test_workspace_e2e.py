@@ -1,10 +1,12 @@
 import pytest
 import uuid
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from src.infrastructure.auth.services.jwt import JWTService
+from src.infrastructure.jobs.worker import JobWorker
 
 @pytest.mark.asyncio
-async def test_workspace_full_flow(client: AsyncClient):
+async def test_workspace_full_flow(client: AsyncClient, db_engine):
     # 1. Setup: Register and Login to get access token
     user_data = {
         "email": f"workspace_e2e_{uuid.uuid4().hex[:6]}@example.com",
@@ -85,9 +87,20 @@ async def test_workspace_full_flow(client: AsyncClient):
     response = await client.delete(f"/api/workspaces/{workspace_id}/members/{other_user_id}", headers=headers)
     assert response.status_code == 204
     
-    # 10. Delete Workspace
+    # 10. Delete Workspace: queued, then carried out by a job worker
     response = await client.delete(f"/api/workspaces/{workspace_id}", headers=headers)
-    assert response.status_code == 204
+    assert response.status_code == 202
+    job_url = response.headers["Location"]
+    response = await client.get(job_url, headers=headers)
+    assert response.json()["status"] == "queued"
+    # Soft-deleted: hidden before the worker has purged anything
+    response = await client.get(f"/api/workspaces/{workspace_id}", headers=headers)
+    assert response.status_code == 404
+
+    worker = JobWorker(async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False))
+    assert await worker.run_once()
+    response = await client.get(job_url, headers=headers)
+    assert response.json()["status"] == "succeeded"
     
     # Verify deletion
     response = await client.get(f"/api/workspaces/{workspace_id}", headers=headers)
@@ -0,0 +1,255 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.auth.models import User
+from src.domain.auth.value_objects import Email
+from src.domain.budget.models import Budget, Category
+from src.domain.budget.value_objects import BudgetSort, period_key
+from src.domain.errors import ArchivedError
+from src.domain.workspace.models import Workspace
+from src.infrastructure.auth.repositories import SQLUserRepository
+from src.infrastructure.budget import archive as archive_module
+from src.infrastructure.budget.archive import BudgetArchive, archive_budgets
+from src.infrastructure.budget.models import BudgetORM
+from src.infrastructure.budget.partitions import ensure_partitions, partition_years
+from src.infrastructure.budget.repositories import (
+    SQLBudgetRepository,
+    SQLCategoryRepository,
+)
+from src.infrastructure.cache import InMemoryCacheBackend
+from src.infrastructure.cache import repository as cache_module
+from src.infrastructure.workspace.models import WorkspaceORM
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository
+
+
+@pytest_asyncio.fixture
+async def seeded(db_session: AsyncSession, tmp_path):
+    """One budget per month from 2022-01 to 2024-12 and an empty archive."""
+    user = User(email=Email("archive@example.com"), password_hash="hash")
+    await SQLUserRepository(db_session).add(user)
+    workspace = Workspace(name="Archive", owner_id=user.id)
+    await SQLWorkspaceRepository(db_session).add(workspace)
+    category = Category(name="Archive", is_default=True)
+    await SQLCategoryRepository(db_session).add(category)
+    await db_session.flush()
+
+    archive = BudgetArchive(str(tmp_path / "archive"))
+    repo = SQLBudgetRepository(db_session, archive)
+    for i in range(36):
+        await repo.add(
+            Budget(
+                workspace_id=workspace.id,
+                owner_id=user.id,
+                category_id=category.id,
+                limit_amount=100.0 + i,
+                month=i % 12 + 1,
+                year=2022 + i // 12,
+            )
+        )
+    await ensure_partitions(await db_session.connection(), [2022])
+    await db_session.commit()
+    return repo, archive, workspace, user
+
+
+@pytest.mark.asyncio
+async def test_archival_moves_old_years_out_of_the_database(
+    seeded, db_session, db_engine, monkeypatch
+):
+    _, archive, workspace, _ = seeded
+    cache = InMemoryCacheBackend()
+    monkeypatch.setattr(cache_module, "repository_cache", cache)
+    await cache.set("list", b"stale", ttl=60, tags=[f"budgets:{workspace.id}"])
+
+    archived = await archive_budgets(2024, archive, [db_engine])
+
+    assert archived == {2022: 12, 2023: 12}
+    assert archive.years() == {2022, 2023}
+    assert await db_session.scalar(select(func.count()).select_from(BudgetORM)) == 12
+    assert 2022 not in await partition_years(await db_session.connection())
+    assert [row["month"] for row in archive.read(workspace.id, [2023])] == list(
+        range(1, 13)
+    )
+    # Cached lists of the workspace no longer hold the moved rows
+    assert await cache.get("list") is None
+    # Nothing left to move
+    assert await archive_budgets(2024, archive, [db_engine]) == {}
+
+
+@pytest.mark.asyncio
+async def test_reads_fall_back_to_the_archive(seeded, db_session, db_engine):
+    repo, archive, workspace, _ = seeded
+    version = await repo.get_list_version(workspace.id)
+    before, _ = await repo.list_by_workspace(
+        workspace.id, limit=36, sort=BudgetSort("-limit_amount")
+    )
+    await db_session.commit()
+
+    await archive_budgets(2024, archive, [db_engine])
+
+    assert await repo.get_list_version(workspace.id) == version
+    after, total = await repo.list_by_workspace(
+        workspace.id, limit=36, sort=BudgetSort("-limit_amount")
+    )
+    assert total == 36
+    assert [b.id for b in after] == [b.id for b in before]
+    assert after[-1].year == 2022 and after[-1].limit_amount == 100.0
+
+    page, total = await repo.list_by_workspace(
+        workspace.id,
+        limit=4,
+        offset=2,
+        period_from=period_key(2023, 11),
+        sort=BudgetSort("period"),
+    )
+    assert total == 14
+    assert [(b.year, b.month) for b in page] == [
+        (2024, 1),
+        (2024, 2),
+        (2024, 3),
+        (2024, 4),
+    ]
+
+    # Unsorted pages put the database rows first
+    page, total = await repo.list_by_workspace(workspace.id, limit=10, offset=8)
+    assert total == 36
+    assert [b.year for b in page] == [2024] * 4 + [2022] * 6
+
+    rows, total = await repo.list_columns_by_workspace(
+        workspace.id, ["month", "limit_amount"], year=2022, min_limit=110.0
+    )
+    assert total == 2
+    assert rows == [
+        {"month": 11, "limit_amount": 110.0},
+        {"month": 12, "limit_amount": 111.0},
+    ]
+
+    archived = await repo.get_by_category_period(
+        workspace.id, page[-1].category_id, 6, 2022
+    )
+    assert archived is not None and archived.limit_amount == 105.0
+    found = await repo.get_by_id(archived.id)
+    assert (found.id, found.limit_amount) == (archived.id, 105.0)
+    both = await repo.get_by_ids([archived.id, page[0].id])
+    assert {b.id for b in both} == {archived.id, page[0].id}
+
+
+@pytest.mark.asyncio
+async def test_archived_budgets_are_read_only(seeded, db_session, db_engine):
+    repo, archive, workspace, _ = seeded
+    await archive_budgets(2024, archive, [db_engine])
+    budget = (await repo.list_by_workspace(workspace.id, year=2023))[0][0]
+
+    budget.update_limit(1.0)
+    with pytest.raises(ArchivedError):
+        await repo.update(budget)
+    budget.delete()
+    with pytest.raises(ArchivedError):
+        await repo.remove(budget)
+    await db_session.rollback()
+    assert (await repo.get_by_id(budget.id)).limit_amount == 112.0
+
+
+@pytest.mark.asyncio
+async def test_archive_reads_are_indexed_and_cached(
+    seeded, db_session, db_engine, monkeypatch
+):
+    repo, archive, workspace, user = seeded
+    await archive_budgets(2024, archive, [db_engine])
+    other = Workspace(name="Unarchived", owner_id=user.id)
+    await SQLWorkspaceRepository(db_session).add(other)
+    await db_session.commit()
+
+    assert archive.years(workspace.id) == {2022, 2023}
+    opened = []
+    read_table = archive_module.pq.read_table
+
+    def counting_read_table(*args, **kwargs):
+        opened.append(kwargs.get("columns"))
+        return read_table(*args, **kwargs)
+
+    monkeypatch.setattr(archive_module.pq, "read_table", counting_read_table)
+
+    # A workspace without archived rows never opens a file
+    assert await repo.get_list_version(other.id) == (None, 0)
+    assert await repo.list_by_workspace(other.id) == ([], 0)
+    assert opened == []
+
+    # Each year is read once for the version and the list
+    await repo.get_list_version(workspace.id)
+    _, total = await repo.list_by_workspace(workspace.id)
+    assert total == 36
+    assert opened == [None, None]
+
+    # A year rewritten here is indexed as it is written and read again
+    archive.write(2022, archive.load(2022)[:6])
+    opened.clear()
+    _, total = await repo.list_by_workspace(workspace.id)
+    assert total == 30
+    assert opened == [None]
+
+    # One rewritten by another process is indexed again, alone
+    BudgetArchive(str(archive.path(2022).parent)).write(2023, [])
+    opened.clear()
+    _, total = await repo.list_by_workspace(workspace.id)
+    assert total == 18
+    assert opened == []
+    BudgetArchive(str(archive.path(2022).parent)).write(2022, archive.load(2022)[:3])
+    opened.clear()
+    _, total = await repo.list_by_workspace(workspace.id)
+    assert total == 15
+    assert opened == [["workspace_id"], None]
+
+
+@pytest.mark.asyncio
+async def test_rerun_merges_late_writes_and_drops_deleted_workspaces(
+    seeded, db_session, db_engine
+):
+    repo, archive, workspace, user = seeded
+    await archive_budgets(2024, archive, [db_engine])
+
+    other = Workspace(name="Gone", owner_id=user.id)
+    await SQLWorkspaceRepository(db_session).add(other)
+    for target in (workspace, other):
+        category = Category(name=f"Late {target.name}", workspace_id=target.id)
+        await SQLCategoryRepository(db_session).add(category)
+        await db_session.flush()
+        await repo.add(
+            Budget(
+                workspace_id=target.id,
+                owner_id=user.id,
+                category_id=category.id,
+                limit_amount=1.0,
+                month=1,
+                year=2022,
+            )
+        )
+    await db_session.commit()
+    _, total = await repo.list_by_workspace(workspace.id, year=2022)
+    assert total == 13
+    await db_session.commit()
+
+    assert await archive_budgets(2024, archive, [db_engine]) == {2022: 14}
+    await db_session.execute(delete(WorkspaceORM).where(WorkspaceORM.id == other.id))
+    await db_session.commit()
+    # Another late write makes the next run rewrite 2022 without "Gone"
+    category = Category(name="Later", workspace_id=workspace.id)
+    await SQLCategoryRepository(db_session).add(category)
+    await db_session.flush()
+    await repo.add(
+        Budget(
+            workspace_id=workspace.id,
+            owner_id=user.id,
+            category_id=category.id,
+            limit_amount=2.0,
+            month=2,
+            year=2022,
+        )
+    )
+    await db_session.commit()
+
+    assert await archive_budgets(2024, archive, [db_engine]) == {2022: 14}
+    assert len(archive.load(2022)) == 14
+    _, total = await repo.list_by_workspace(workspace.id, year=2022)
+    assert total == 14
@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import and_, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.auth.models import User
+from src.domain.auth.value_objects import Email
+from src.domain.budget.models import Budget, Category
+from src.domain.budget.value_objects import period_key
+from src.domain.workspace.models import Workspace
+from src.infrastructure.auth.repositories import SQLUserRepository
+from src.infrastructure.budget.models import BudgetORM
+from src.infrastructure.budget.partitions import (
+    BUDGET_PARTITIONS_AHEAD,
+    ensure_partitions,
+    partition_years,
+)
+from src.infrastructure.budget.repositories import (
+    SQLBudgetRepository,
+    SQLCategoryRepository,
+)
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository
+
+
+@pytest_asyncio.fixture
+async def seeded(db_session: AsyncSession):
+    """One budget per month from 2022-01 to 2024-12, all in the default partition."""
+    user = User(email=Email("partitions@example.com"), password_hash="hash")
+    await SQLUserRepository(db_session).add(user)
+    workspace = Workspace(name="Partitions", owner_id=user.id)
+    await SQLWorkspaceRepository(db_session).add(workspace)
+    category = Category(name="Partitions", is_default=True)
+    await SQLCategoryRepository(db_session).add(category)
+    await db_session.flush()
+
+    repo = SQLBudgetRepository(db_session)
+    for i in range(36):
+        await repo.add(
+            Budget(
+                workspace_id=workspace.id,
+                owner_id=user.id,
+                category_id=category.id,
+                limit_amount=100.0 + i,
+                month=i % 12 + 1,
+                year=2022 + i // 12,
+            )
+        )
+    await db_session.commit()
+    return repo, workspace
+
+
+async def _count(session: AsyncSession, table: str) -> int:
+    return await session.scalar(text(f"SELECT count(*) FROM {table}"))
+
+
+@pytest.mark.asyncio
+async def test_new_partition_takes_its_rows_from_the_default(seeded, db_session):
+    repo, workspace = seeded
+    conn = await db_session.connection()
+
+    assert await ensure_partitions(conn, [2023]) == [2023]
+    assert await ensure_partitions(conn, [2023]) == []
+    assert await _count(db_session, "budgets_y2023") == 12
+    assert await _count(db_session, "budgets_default") == 24
+    assert await db_session.scalar(select(func.count()).select_from(BudgetORM)) == 36
+
+    # Rows keep working through the parent after the move
+    budgets, total = await repo.list_by_workspace(workspace.id, year=2023, limit=12)
+    assert total == 12
+    budget = budgets[0]
+    budget.update_limit(1.0)
+    await repo.update(budget)
+    assert (await repo.get_by_id(budget.id)).limit_amount == 1.0
+
+
+@pytest.mark.asyncio
+async def test_default_years_cover_ahead_and_stranded_rows(seeded, db_session):
+    conn = await db_session.connection()
+    current = datetime.now(timezone.utc).year
+
+    created = await ensure_partitions(conn)
+
+    assert set(created) == {2022, 2023, 2024} | set(
+        range(current, current + BUDGET_PARTITIONS_AHEAD + 1)
+    )
+    assert set(created) <= await partition_years(conn)
+    assert await _count(db_session, "budgets_default") == 0
+
+
+async def _scanned(session: AsyncSession, workspace_id, **scope) -> str:
+    filters = SQLBudgetRepository._list_filters(
+        workspace_id,
+        None,
+        scope.get("month"),
+        scope.get("year"),
+        scope.get("period_from"),
+        scope.get("period_to"),
+        None,
+        None,
+    )
+    compiled = (
+        select(BudgetORM.id)
+        .where(and_(*filters))
+        .compile(dialect=session.bind.dialect, compile_kwargs={"literal_binds": True})
+    )
+    return "\n".join(
+        row[0] for row in await session.execute(text(f"EXPLAIN {compiled}"))
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_queries_prune_partitions(seeded, db_session):
+    _, workspace = seeded
+    await ensure_partitions(await db_session.connection(), [2022, 2023, 2024])
+
+    plan = await _scanned(db_session, workspace.id, year=2023)
+    assert "budgets_y2023" in plan
+    assert "budgets_y2022" not in plan and "budgets_y2024" not in plan
+    assert "budgets_default" not in plan
+
+    plan = await _scanned(
+        db_session,
+        workspace.id,
+        period_from=period_key(2023, 11),
+        period_to=period_key(2024, 2),
+    )
+    assert "budgets_y2023" in plan and "budgets_y2024" in plan
+    assert "budgets_y2022" not in plan
+
+    plan = await _scanned(db_session, workspace.id, year=2023, month=12)
+    assert "budgets_y2023" in plan and "budgets_y2024" not in plan
@@ -9,6 +9,8 @@ from src.domain.workspace.models import Workspace
 from src.domain.auth.models import User
 from src.domain.auth.value_objects import Email
 
+pytestmark = pytest.mark.backends("postgresql", "sqlite")
+
 @pytest.mark.asyncio
 async def test_budget_repository_flow(db_session: AsyncSession):
     budget_repo = SQLBudgetRepository(db_session)
@@ -55,11 +57,20 @@ async def test_budget_repository_flow(db_session: AsyncSession):
     assert found_period is not None
     assert found_period.id == budget.id
 
+    assert [b.id for b in await budget_repo.get_by_ids([budget.id, uuid.uuid4()])] == [budget.id]
+    assert await budget_repo.get_by_ids([]) == []
+
     # 5. List budgets
     items, total = await budget_repo.list_by_workspace(workspace.id)
     assert total == 1
     assert items[0].id == budget.id
 
+    rows, total = await budget_repo.list_columns_by_workspace(
+        workspace.id, ["id", "limit_amount"]
+    )
+    assert total == 1
+    assert rows == [{"id": budget.id, "limit_amount": 300.0}]
+
     # 6. Update budget
     budget.update_limit(400.0)
     await budget_repo.update(budget)
@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.auth.models import User
+from src.domain.auth.value_objects import Email
+from src.domain.workspace.models import Workspace, WorkspaceMember
+from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.auth.repositories import SQLUserRepository
+from src.infrastructure.cache import (
+    WORKSPACE_POLICY,
+    CachedRepository,
+    InMemoryCacheBackend,
+    InvalidationBus,
+    running_cache_invalidation,
+)
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository
+
+
+async def eventually(condition, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not await condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.02)
+
+
+@pytest_asyncio.fixture
+async def worker(db_engine):
+    """A listening worker's cache and a second worker's bus to publish with."""
+    url = db_engine.url.render_as_string(hide_password=False)
+    backend = InMemoryCacheBackend()
+    bus = InvalidationBus(backend, url, ping_interval=0.1, retry_delay=0.05)
+    other = InvalidationBus(InMemoryCacheBackend(), url)
+    async with running_cache_invalidation(bus):
+        await asyncio.wait_for(bus.listening.wait(), 5)
+        yield backend, bus, other
+
+
+@pytest.mark.asyncio
+async def test_invalidations_are_delivered_on_commit_only(worker, db_engine):
+    backend, _, other = worker
+    sessions = async_sessionmaker(db_engine, class_=AsyncSession)
+    await backend.set("a", b"1", ttl=60, tags=["t"])
+    await backend.set("b", b"2", ttl=60)
+    await backend.set("c", b"3", ttl=60)
+
+    async with sessions() as session:
+        await other.publish(session, ["b"], ["t"])
+        await session.rollback()
+    async with sessions() as session:
+        await other.publish(session, ["c"], [])
+        await asyncio.sleep(0.1)
+        assert await backend.get("c") == b"3"
+        await session.commit()
+
+    await eventually(lambda: _missing(backend, "c"))
+    # Published before, so it would have been applied by now
+    assert await backend.get("a") == b"1"
+    assert await backend.get("b") == b"2"
+
+    async with sessions() as session:
+        await other.publish(session, [f"key-{i}" for i in range(1000)], [])
+        await session.commit()
+    await eventually(lambda: _empty(backend))
+
+
+async def _missing(backend, key):
+    return await backend.get(key) is None
+
+
+async def _empty(backend):
+    return len(backend) == 0
+
+
+@pytest.mark.asyncio
+async def test_listener_reconnects_and_resyncs(worker, db_engine):
+    backend, bus, _ = worker
+    await backend.set("a", b"1", ttl=60)
+
+    async with db_engine.connect() as conn:
+        await conn.execute(
+            text(
+                "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+                "WHERE application_name = 'wiselab-cache-listener'"
+            )
+        )
+        await conn.commit()
+    await eventually(lambda: _not_listening(bus))
+    await backend.set("b", b"2", ttl=60)
+    await asyncio.wait_for(bus.listening.wait(), 5)
+
+    # Whatever was cached while the listener was down is dropped
+    assert len(backend) == 0
+
+
+async def _not_listening(bus):
+    return not bus.listening.is_set()
+
+
+@pytest.mark.asyncio
+async def test_writes_on_another_worker_evict_cached_reads(worker, db_engine):
+    backend, _, other = worker
+    sessions = async_sessionmaker(db_engine, class_=AsyncSession)
+    async with sessions() as session:
+        owner = User(email=Email("bus-owner@example.com"), password_hash="hash")
+        member = User(email=Email("bus-member@example.com"), password_hash="hash")
+        await SQLUserRepository(session).add(owner)
+        await SQLUserRepository(session).add(member)
+        await session.flush()
+        workspace = Workspace(name="Bus", owner_id=owner.id)
+        await SQLWorkspaceRepository(session).add(workspace)
+        await session.commit()
+
+    async with sessions() as session:
+        reader = CachedRepository(
+            SQLWorkspaceRepository(session), WORKSPACE_POLICY, backend, session
+        )
+        assert await reader.get_member(workspace.id, member.id) is None
+    assert len(backend) == 1
+
+    async with sessions() as session:
+        writer = CachedRepository(
+            SQLWorkspaceRepository(session),
+            WORKSPACE_POLICY,
+            InMemoryCacheBackend(),
+            session,
+            other,
+        )
+        await writer.add_member(
+            WorkspaceMember(
+                workspace_id=workspace.id,
+                user_id=member.id,
+                role=WorkspaceRole.VIEWER,
+            )
+        )
+        await session.commit()
+
+    await eventually(lambda: _empty(backend))
+    async with sessions() as session:
+        reader = CachedRepository(
+            SQLWorkspaceRepository(session), WORKSPACE_POLICY, backend, session
+        )
+        assert await reader.get_member(workspace.id, member.id) is not None
@@ -0,0 +1,107 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select, text
+
+from src.infrastructure.auth.models import RevokedTokenORM
+from src.infrastructure.budget.models import CategoryORM
+from src.infrastructure.database import create_engine
+from src.infrastructure.embedded import (
+    DEFAULT_CATEGORIES,
+    EmbeddedSchemaError,
+    create_embedded_schema,
+)
+from src.infrastructure.readiness import migration_heads
+
+
+@pytest_asyncio.fixture
+async def sqlite_engine(tmp_path):
+    engine = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'embedded.db'}")
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_schema_is_created_once_and_stamped(sqlite_engine):
+    assert await create_embedded_schema(sqlite_engine)
+    assert not await create_embedded_schema(sqlite_engine)
+
+    async with sqlite_engine.connect() as conn:
+        defaults = await conn.scalar(
+            select(func.count()).select_from(CategoryORM).where(CategoryORM.is_default)
+        )
+        assert defaults == len(DEFAULT_CATEGORIES)
+        versions = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        assert set(versions.scalars()) == set(migration_heads())
+
+
+async def _stamp(engine, revision: str) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text("UPDATE alembic_version SET version_num = :v"), {"v": revision})
+
+
+async def _versions(engine) -> set:
+    async with engine.connect() as conn:
+        result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        return set(result.scalars())
+
+
+@pytest.mark.asyncio
+async def test_stale_schema_gets_what_it_is_missing(sqlite_engine):
+    await create_embedded_schema(sqlite_engine)
+    # What an install made before the audit log and the job errors looked like
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(text("DROP TABLE audit_events"))
+        await conn.execute(text("ALTER TABLE jobs DROP COLUMN last_error"))
+    await _stamp(sqlite_engine, "older")
+
+    assert await create_embedded_schema(sqlite_engine)
+    assert not await create_embedded_schema(sqlite_engine)
+
+    assert await _versions(sqlite_engine) == set(migration_heads())
+    async with sqlite_engine.connect() as conn:
+        await conn.execute(text("SELECT last_error FROM jobs"))
+        await conn.execute(text("SELECT count(*) FROM audit_events"))
+
+
+@pytest.mark.asyncio
+async def test_stale_schema_that_cannot_be_upgraded_stops_startup(sqlite_engine):
+    await create_embedded_schema(sqlite_engine)
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(text("ALTER TABLE jobs ADD COLUMN retired TEXT"))
+    await _stamp(sqlite_engine, "older")
+
+    with pytest.raises(EmbeddedSchemaError, match="remove_column jobs.retired"):
+        await create_embedded_schema(sqlite_engine)
+    assert await _versions(sqlite_engine) == {"older"}
+
+
+@pytest.mark.asyncio
+async def test_connections_get_the_pragmas(sqlite_engine):
+    async with sqlite_engine.connect() as conn:
+        assert await conn.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert await conn.scalar(text("PRAGMA synchronous")) == 1  # NORMAL
+        assert await conn.scalar(text("PRAGMA foreign_keys")) == 1
+        assert await conn.scalar(text("PRAGMA busy_timeout")) == 5000
+
+
+@pytest.mark.asyncio
+async def test_timestamps_come_back_aware_in_utc(sqlite_engine):
+    await create_embedded_schema(sqlite_engine)
+    expires = datetime.now(timezone(timedelta(hours=-5))).replace(microsecond=0)
+    async with sqlite_engine.begin() as conn:
+        await conn.execute(
+            RevokedTokenORM.__table__.insert(),
+            {"jti": uuid.uuid4(), "expires_at": expires},
+        )
+        stored = await conn.scalar(select(RevokedTokenORM.expires_at))
+
+    assert stored == expires
+    assert stored.utcoffset() == timedelta(0)
+
+
+@pytest.mark.asyncio
+async def test_postgres_is_left_to_migrations(db_engine):
+    assert not await create_embedded_schema(db_engine)
@@ -0,0 +1,178 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.jobs.models import Job
+from src.domain.jobs.value_objects import JobKind, JobStatus
+from src.infrastructure.jobs.models import JobORM
+from src.infrastructure.jobs.repositories import SQLJobRepository
+from src.infrastructure.jobs.worker import JobWorker, sweep_once
+
+pytestmark = pytest.mark.backends("postgresql", "sqlite")
+
+
+@pytest_asyncio.fixture
+async def session_factory(db_engine):
+    return async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _enqueue(session_factory, max_attempts: int = 5) -> Job:
+    job = Job(kind=JobKind.DELETE_WORKSPACE, payload={"n": 1}, max_attempts=max_attempts)
+    async with session_factory() as session:
+        await SQLJobRepository(session).add(job)
+        await session.commit()
+    return job
+
+
+async def _get(session_factory, job: Job) -> Job:
+    async with session_factory() as session:
+        return await SQLJobRepository(session).get_by_id(job.id)
+
+
+async def _make_available(session_factory, job: Job) -> None:
+    async with session_factory() as session:
+        await session.execute(
+            update(JobORM).where(JobORM.id == job.id).values(available_at=JobORM.created_at)
+        )
+        await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_worker_runs_handler_and_completes(session_factory):
+    seen = []
+
+    async def handler(session, payload):
+        seen.append(payload)
+
+    job = await _enqueue(session_factory)
+    worker = JobWorker(session_factory, {JobKind.DELETE_WORKSPACE: handler})
+
+    assert await worker.run_once()
+    assert not await worker.run_once()
+
+    stored = await _get(session_factory, job)
+    assert seen == [{"n": 1}]
+    assert stored.status == JobStatus.SUCCEEDED
+    assert stored.attempts == 1
+    assert stored.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_worker_retries_then_fails(session_factory):
+    async def handler(session, payload):
+        raise RuntimeError("boom")
+
+    job = await _enqueue(session_factory, max_attempts=2)
+    worker = JobWorker(session_factory, {JobKind.DELETE_WORKSPACE: handler}, retry_backoff=60)
+
+    assert await worker.run_once()
+    stored = await _get(session_factory, job)
+    assert stored.status == JobStatus.QUEUED
+    assert stored.last_error == "RuntimeError: boom"
+    # Backed off: not claimable yet
+    assert not await worker.run_once()
+
+    await _make_available(session_factory, job)
+    assert await worker.run_once()
+    stored = await _get(session_factory, job)
+    assert stored.status == JobStatus.FAILED
+    assert stored.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_lease_is_renewed_while_the_handler_runs(session_factory):
+    claims = []
+
+    async def handler(session, payload):
+        # Well past the lease: without renewals another worker would take it
+        for _ in range(3):
+            await asyncio.sleep(0.3)
+            async with session_factory() as other:
+                claims.append(await SQLJobRepository(other).claim(visibility_timeout=0.3))
+                await other.commit()
+
+    job = await _enqueue(session_factory)
+    worker = JobWorker(
+        session_factory,
+        {JobKind.DELETE_WORKSPACE: handler},
+        visibility_timeout=0.3,
+        heartbeat_interval=0.05,
+    )
+
+    assert await worker.run_once()
+    assert claims == [None, None, None]
+    stored = await _get(session_factory, job)
+    assert stored.status == JobStatus.SUCCEEDED
+    assert stored.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_reclaimed(session_factory):
+    job = await _enqueue(session_factory, max_attempts=1)
+
+    async with session_factory() as session:
+        first = await SQLJobRepository(session).claim(visibility_timeout=300)
+        await session.commit()
+    assert first.id == job.id
+
+    # Still leased
+    async with session_factory() as session:
+        assert await SQLJobRepository(session).claim(visibility_timeout=300) is None
+
+    # The first worker died; its lease runs out and the job is claimed again.
+    # That was the last allowed attempt, so the worker gives up on it.
+    await _make_available(session_factory, job)
+    worker = JobWorker(session_factory, {})
+    assert await worker.run_once()
+    stored = await _get(session_factory, job)
+    assert stored.status == JobStatus.FAILED
+    assert stored.last_error == "Lease expired on the last attempt"
+
+    # The original worker lost its lease and cannot complete the job
+    async with session_factory() as session:
+        assert not await SQLJobRepository(session).complete(first)
+
+
+@pytest.mark.asyncio
+# SQLite has a single writer: the second claim would wait for the first commit
+@pytest.mark.backends("postgresql")
+async def test_concurrent_claims_take_different_jobs(session_factory):
+    first = await _enqueue(session_factory)
+    second = await _enqueue(session_factory)
+
+    async with session_factory() as a, session_factory() as b:
+        claimed_a = await SQLJobRepository(a).claim(visibility_timeout=60)
+        claimed_b = await SQLJobRepository(b).claim(visibility_timeout=60)
+        await a.commit()
+        await b.commit()
+
+    assert {claimed_a.id, claimed_b.id} == {first.id, second.id}
+
+
+@pytest.mark.asyncio
+async def test_unknown_kind_fails_without_retry(session_factory):
+    job = await _enqueue(session_factory)
+
+    assert await JobWorker(session_factory, {}).run_once()
+
+    stored = await _get(session_factory, job)
+    assert stored.status == JobStatus.FAILED
+    assert stored.attempts == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.backends("postgresql")
+async def test_sweep_is_skipped_while_another_process_runs_it(
+    session_factory, db_engine
+):
+    async with db_engine.connect() as conn:
+        await conn.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"), {"key": 4_206_513_718}
+        )
+        assert await sweep_once(session_factory) is None
+        await conn.rollback()
+
+    assert await sweep_once(session_factory) == []
@@ -0,0 +1,178 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.use_cases.budget.access import check_workspace_access
+from src.application.use_cases.budget.get_many.index import GetBudgets
+from src.application.use_cases.budget.list.index import ListBudgets
+from src.application.use_cases.budget.list_fields.index import ListBudgetFields
+from src.application.use_cases.budget.movement_service import MockMovementService
+from src.application.use_cases.workspace.members.bulk_invite.dtos import (
+    BulkInviteMembersRequestDto,
+    BulkInviteStatus,
+)
+from src.application.use_cases.workspace.members.bulk_invite.index import (
+    BulkInviteMembers,
+)
+from src.application.use_cases.workspace.members.invite.dtos import (
+    InviteMemberRequestDto,
+)
+from src.application.use_cases.workspace.members.invite.index import InviteMember
+from src.application.use_cases.workspace.members.list.index import ListMembers
+from src.domain.auth.models import User
+from src.domain.auth.value_objects import Email
+from src.domain.budget.models import Budget, Category
+from src.domain.workspace.models import Workspace, WorkspaceMember
+from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.auth.repositories import SQLUserRepository
+from src.infrastructure.budget.repositories import (
+    SQLBudgetRepository,
+    SQLCategoryRepository,
+)
+from src.infrastructure.observability import assert_max_queries, instrument_engine
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository
+
+pytestmark = pytest.mark.backends("postgresql", "sqlite")
+
+
+@pytest.mark.asyncio
+async def test_use_case_query_budgets(db_engine, db_session: AsyncSession):
+    instrument_engine(db_engine)
+    user_repo = SQLUserRepository(db_session)
+    workspace_repo = SQLWorkspaceRepository(db_session)
+    budget_repo = SQLBudgetRepository(db_session)
+    category_repo = SQLCategoryRepository(db_session)
+
+    owner = User(email=Email("budget_owner@example.com"), password_hash="hash")
+    guest = User(email=Email("budget_guest@example.com"), password_hash="hash")
+    await user_repo.add(owner)
+    await user_repo.add(guest)
+    workspace = Workspace(name="Query Budgets", owner_id=owner.id)
+    await workspace_repo.add(workspace)
+    category = Category(name="Queries", is_default=True)
+    await category_repo.add(category)
+    await db_session.commit()
+
+    for month in range(1, 6):
+        await budget_repo.add(
+            Budget(
+                workspace_id=workspace.id,
+                owner_id=owner.id,
+                category_id=category.id,
+                limit_amount=100.0,
+                month=month,
+                year=2024,
+            )
+        )
+    await db_session.commit()
+
+    with assert_max_queries(2, "check_workspace_access"):
+        access = await check_workspace_access(workspace_repo, owner, workspace.id)
+
+    with assert_max_queries(2, "ListBudgets"):
+        results, total = await ListBudgets(
+            budget_repo, MockMovementService()
+        ).execute(access)
+    assert total == 5
+
+    with assert_max_queries(2, "ListBudgetFields"):
+        rows, total = await ListBudgetFields(
+            budget_repo, MockMovementService()
+        ).execute(access, ("id", "spent_amount"))
+    assert total == 5
+    assert set(rows[0]) == {"id", "spent_amount"}
+
+    with assert_max_queries(4, "InviteMember"):
+        await InviteMember(workspace_repo, user_repo).execute(
+            workspace.id, owner, InviteMemberRequestDto(email=str(guest.email))
+        )
+    await db_session.commit()
+
+    with assert_max_queries(3, "ListMembers"):
+        members = await ListMembers(workspace_repo).execute(workspace.id, owner)
+    assert len(members) == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_invite_query_budget(db_engine, db_session: AsyncSession):
+    instrument_engine(db_engine)
+    user_repo = SQLUserRepository(db_session)
+    workspace_repo = SQLWorkspaceRepository(db_session)
+
+    owner = User(email=Email("bulk_owner@example.com"), password_hash="hash")
+    await user_repo.add(owner)
+    guests = [User(email=Email(f"bulk_{i}@example.com"), password_hash="hash") for i in range(20)]
+    for guest in guests:
+        await user_repo.add(guest)
+    workspace = Workspace(name="Bulk Invite", owner_id=owner.id)
+    await workspace_repo.add(workspace)
+    await db_session.commit()
+
+    emails = [str(guest.email) for guest in guests] + ["bulk_missing@example.com"]
+    use_case = BulkInviteMembers(workspace_repo, user_repo)
+    with assert_max_queries(4, "BulkInviteMembers"):
+        result = await use_case.execute(
+            workspace.id, owner, BulkInviteMembersRequestDto(emails=emails)
+        )
+    await db_session.commit()
+    statuses = [r.status for r in result.results]
+    assert statuses == [BulkInviteStatus.INVITED] * 20 + [BulkInviteStatus.NOT_FOUND]
+    assert len(await workspace_repo.list_members(workspace.id)) == 21
+
+    # Re-inviting is idempotent and still a constant number of queries
+    with assert_max_queries(4, "BulkInviteMembers"):
+        result = await use_case.execute(
+            workspace.id, owner, BulkInviteMembersRequestDto(emails=emails[:5])
+        )
+    assert {r.status for r in result.results} == {BulkInviteStatus.ALREADY_MEMBER}
+
+    # Rows that appear between the lookup and the insert are skipped, not errors
+    late = await workspace_repo.get_member(workspace.id, guests[0].id)
+    assert await workspace_repo.add_members([late]) == set()
+
+
+@pytest.mark.asyncio
+async def test_get_budgets_query_budget(db_engine, db_session: AsyncSession):
+    instrument_engine(db_engine)
+    user_repo = SQLUserRepository(db_session)
+    workspace_repo = SQLWorkspaceRepository(db_session)
+    budget_repo = SQLBudgetRepository(db_session)
+
+    owner = User(email=Email("batch_owner@example.com"), password_hash="hash")
+    other = User(email=Email("batch_other@example.com"), password_hash="hash")
+    await user_repo.add(owner)
+    await user_repo.add(other)
+    owned = Workspace(name="Batch Owned", owner_id=owner.id)
+    shared = Workspace(name="Batch Shared", owner_id=other.id)
+    hidden = Workspace(name="Batch Hidden", owner_id=other.id)
+    for workspace in (owned, shared, hidden):
+        await workspace_repo.add(workspace)
+    await db_session.flush()
+    await workspace_repo.add_member(
+        WorkspaceMember(workspace_id=shared.id, user_id=owner.id, role=WorkspaceRole.VIEWER)
+    )
+    category = Category(name="Batch", is_default=True)
+    await SQLCategoryRepository(db_session).add(category)
+    await db_session.flush()
+
+    budgets = []
+    for workspace in (owned, shared, hidden):
+        for month in range(1, 11):
+            budget = Budget(
+                workspace_id=workspace.id,
+                owner_id=workspace.owner_id,
+                category_id=category.id,
+                limit_amount=100.0,
+                month=month,
+                year=2024,
+            )
+            await budget_repo.add(budget)
+            budgets.append(budget)
+    await db_session.commit()
+
+    ids = [budget.id for budget in budgets]
+    with assert_max_queries(2, "GetBudgets"):
+        results, missing = await GetBudgets(
+            budget_repo, workspace_repo, MockMovementService()
+        ).execute(ids, owner)
+    assert [budget.id for budget, _, _ in results] == ids[:20]
+    assert missing == ids[20:]
@@ -5,6 +5,8 @@ from src.infrastructure.auth.repositories import SQLUserRepository
 from src.domain.auth.models import User
 from src.domain.auth.value_objects import Email
 
+pytestmark = pytest.mark.backends("postgresql", "sqlite")
+
 @pytest.mark.asyncio
 async def test_repository_full_coverage(db_session: AsyncSession):
     repo = SQLUserRepository(db_session)
@@ -0,0 +1,162 @@
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.auth.models import User
+from src.domain.auth.value_objects import Email
+from src.domain.budget.models import Budget, Category
+from src.domain.budget.value_objects import BudgetSort
+from src.domain.workspace.models import Workspace, WorkspaceMember
+from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.auth.repositories import SQLUserRepository
+from src.infrastructure.budget.repositories import (
+    SQLBudgetRepository,
+    SQLCategoryRepository,
+)
+from src.infrastructure.cache import (
+    BUDGET_POLICY,
+    CATEGORY_POLICY,
+    USER_POLICY,
+    WORKSPACE_POLICY,
+    CachedRepository,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+)
+from src.infrastructure.observability import count_queries, instrument_engine
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository
+
+pytestmark = pytest.mark.backends("postgresql", "sqlite")
+
+
+@pytest_asyncio.fixture(params=["memory", "redis"])
+async def cache(request, db_session: AsyncSession, db_engine):
+    """A cache and a factory of cached repositories, one per simulated request.
+
+    Every repository gets its own write flag in place of a session's, since
+    the test runs all of them on one session. The Redis backend runs every
+    cached value through the domain codec.
+    """
+    instrument_engine(db_engine)
+    if request.param == "redis":
+        backend = RedisCacheBackend(FakeAsyncRedis())
+    else:
+        backend = InMemoryCacheBackend()
+
+    def repository(cls, policy):
+        return CachedRepository(cls(db_session), policy, backend)
+
+    return backend, repository
+
+
+@pytest_asyncio.fixture
+async def workspace(db_session: AsyncSession):
+    owner = User(email=Email("cache-owner@example.com"), password_hash="hash")
+    member = User(email=Email("cache-member@example.com"), password_hash="hash")
+    users = SQLUserRepository(db_session)
+    await users.add(owner)
+    await users.add(member)
+    await db_session.flush()
+    workspace = Workspace(name="Cached", owner_id=owner.id)
+    await SQLWorkspaceRepository(db_session).add(workspace)
+    await db_session.commit()
+    return workspace, owner, member
+
+
+@pytest.mark.asyncio
+async def test_membership_reads_are_cached_until_a_write(cache, workspace):
+    _, repository = cache
+    workspace, owner, member = workspace
+    reader = repository(SQLWorkspaceRepository, WORKSPACE_POLICY)
+
+    assert await reader.get_member(workspace.id, member.id) is None
+    assert [w.id for w in await reader.list_by_user(owner.id)] == [workspace.id]
+    with count_queries() as counter:
+        assert await reader.get_member(workspace.id, member.id) is None
+        assert await reader.get_by_id(workspace.id) is not None
+        assert await reader.get_by_id(workspace.id) is not None
+        assert await reader.list_by_user(owner.id)
+    assert counter.count == 1
+
+    writer = repository(SQLWorkspaceRepository, WORKSPACE_POLICY)
+    await writer.add_member(
+        WorkspaceMember(
+            workspace_id=workspace.id, user_id=member.id, role=WorkspaceRole.VIEWER
+        )
+    )
+    found = await reader.get_member(workspace.id, member.id)
+    assert found.role == WorkspaceRole.VIEWER
+    assert [w.id for w in await reader.list_by_user(member.id)] == [workspace.id]
+
+    found.change_role(WorkspaceRole.EDITOR)
+    await repository(SQLWorkspaceRepository, WORKSPACE_POLICY).update_member(found)
+    assert (await reader.get_member(workspace.id, member.id)).role == (
+        WorkspaceRole.EDITOR
+    )
+
+    workspace.update_details(name="Renamed")
+    await repository(SQLWorkspaceRepository, WORKSPACE_POLICY).update(workspace)
+    assert [w.name for w in await reader.list_by_user(owner.id)] == ["Renamed"]
+
+
+@pytest.mark.asyncio
+async def test_users_are_invalidated_by_key(cache, workspace):
+    _, repository = cache
+    _, owner, _ = workspace
+    reader = repository(SQLUserRepository, USER_POLICY)
+    email = Email("cache-new@example.com")
+
+    assert await reader.get_by_email(email) is None
+    assert (await reader.get_by_id(owner.id)).email == owner.email
+    user = User(email=email, password_hash="hash")
+    await repository(SQLUserRepository, USER_POLICY).add(user)
+    assert (await reader.get_by_email(email)).id == user.id
+    with count_queries() as counter:
+        assert (await reader.get_by_email(email)).id == user.id
+        assert await reader.get_by_id(owner.id) is not None
+    assert counter.count == 0
+
+
+@pytest.mark.asyncio
+async def test_budget_and_category_writes_invalidate_the_workspace_tag(
+    cache, workspace, db_session
+):
+    _, repository = cache
+    workspace, owner, _ = workspace
+    categories = repository(SQLCategoryRepository, CATEGORY_POLICY)
+    budgets = repository(SQLBudgetRepository, BUDGET_POLICY)
+
+    defaults = {c.id for c in await categories.list_by_workspace(workspace.id)}
+    category = Category(name="Cached", workspace_id=workspace.id)
+    await repository(SQLCategoryRepository, CATEGORY_POLICY).add(category)
+    await db_session.flush()
+    listed = {c.id for c in await categories.list_by_workspace(workspace.id)}
+    assert listed == defaults | {category.id}
+
+    sort = BudgetSort("-limit_amount")
+    assert await budgets.list_by_workspace(workspace.id, sort=sort) == ([], 0)
+    version = await budgets.get_list_version(workspace.id)
+    budget = Budget(
+        workspace_id=workspace.id,
+        owner_id=owner.id,
+        category_id=category.id,
+        limit_amount=50.0,
+        month=3,
+        year=2025,
+    )
+    writer = repository(SQLBudgetRepository, BUDGET_POLICY)
+    await writer.add(budget)
+    await db_session.flush()
+
+    page, total = await budgets.list_by_workspace(workspace.id, sort=sort)
+    assert total == 1 and page[0].id == budget.id
+    assert await budgets.get_list_version(workspace.id) != version
+    with count_queries() as counter:
+        await budgets.list_by_workspace(workspace.id, sort=BudgetSort("-limit_amount"))
+        assert (await budgets.get_by_id(budget.id)).limit_amount == 50.0
+        assert (await budgets.get_by_id(budget.id)).limit_amount == 50.0
+    assert counter.count == 1
+
+    budget.update_limit(75.0)
+    await writer.update(budget)
+    assert (await budgets.get_by_id(budget.id)).limit_amount == 75.0
@@ -0,0 +1,64 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.auth.models import RevokedToken
+from src.infrastructure.auth.repositories import SQLRevokedTokenRepository
+from src.infrastructure.auth.services.revocation import RevocationList
+
+pytestmark = pytest.mark.backends("postgresql", "sqlite")
+
+
+def _token(expires_in: float = 3600, revoked_ago: float = 0) -> RevokedToken:
+    now = datetime.now(timezone.utc)
+    return RevokedToken(
+        id=uuid.uuid4(),
+        expires_at=now + timedelta(seconds=expires_in),
+        revoked_at=now - timedelta(seconds=revoked_ago),
+    )
+
+
+@pytest.mark.asyncio
+async def test_revoked_token_repository(db_session: AsyncSession):
+    repo = SQLRevokedTokenRepository(db_session)
+    old, recent, expired = _token(revoked_ago=600), _token(), _token(expires_in=-1)
+    for token in (old, recent, expired):
+        assert await repo.revoke(token)
+    # Revoking twice is a no-op that reports the token was already revoked
+    assert not await repo.revoke(recent)
+    assert await repo.is_revoked(recent.id)
+    assert not await repo.is_revoked(_token().id)
+    await db_session.commit()
+
+    assert {t.id for t in await repo.list_revoked()} == {old.id, recent.id}
+    since = datetime.now(timezone.utc) - timedelta(seconds=60)
+    assert [t.id for t in await repo.list_revoked(since)] == [recent.id]
+
+    assert await repo.remove_expired() == 1
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_revocation_list_syncs_incrementally(db_engine):
+    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    revocations = RevocationList(session_factory, lookback=5)
+
+    async def revoke(token: RevokedToken) -> None:
+        async with session_factory() as session:
+            await SQLRevokedTokenRepository(session).revoke(token)
+            await session.commit()
+
+    first = _token()
+    await revoke(first)
+    await revocations.sync()
+    assert revocations.is_revoked(str(first.id))
+
+    # A revocation committed late with a slightly older timestamp is still
+    # picked up thanks to the lookback window
+    late = _token(revoked_ago=2)
+    await revoke(late)
+    await revocations.sync()
+    assert revocations.is_revoked(str(late.id))
+    assert len(revocations) == 2
@@ -0,0 +1,347 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.application.use_cases.workspace.reconcile.index import (
+    ReconcileWorkspacePurges,
+)
+from src.domain.auth.models import User
+from src.domain.auth.value_objects import Email
+from src.domain.budget.models import Budget
+from src.domain.workspace.models import Workspace, WorkspaceMember
+from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.auth.models import UserORM
+from src.infrastructure.auth.repositories import SQLUserRepository
+from src.infrastructure.budget.models import BudgetORM, CategoryORM
+from src.infrastructure.budget.repositories import (
+    SQLBudgetRepository,
+    SQLCategoryRepository,
+)
+from src.domain.jobs.models import Job
+from src.domain.jobs.value_objects import JobKind, JobStatus
+from src.infrastructure.database import Base, RoutingSession
+from src.infrastructure.jobs.models import JobORM
+from src.infrastructure.jobs.repositories import SQLJobRepository
+from src.infrastructure.observability import count_queries, instrument_engine
+from src.infrastructure.sharding import (
+    CrossShardError,
+    ReplicatedUsers,
+    WorkspaceShardORM,
+    replicated_users,
+    router,
+)
+from src.infrastructure.sharding.move import move_workspace, sync_default_categories
+from src.infrastructure.workspace.models import WorkspaceORM
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository
+from tests.conftest import ADMIN_DATABASE_URL, TEST_DATABASE_URL
+
+SHARD_DATABASE = "wiselab_test_shard1"
+
+
+@pytest_asyncio.fixture
+async def shards(db_engine):
+    admin = create_async_engine(ADMIN_DATABASE_URL, isolation_level="AUTOCOMMIT")
+    async with admin.connect() as conn:
+        exists = await conn.scalar(
+            text(f"SELECT 1 FROM pg_database WHERE datname='{SHARD_DATABASE}'")
+        )
+        if not exists:
+            await conn.execute(text(f"CREATE DATABASE {SHARD_DATABASE}"))
+    await admin.dispose()
+
+    shard = create_async_engine(
+        TEST_DATABASE_URL.rsplit("/", 1)[0] + f"/{SHARD_DATABASE}"
+    )
+    async with shard.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    engines = [db_engine, shard]
+    await sync_default_categories(engines)
+    yield engines
+    await shard.dispose()
+
+
+@pytest.fixture
+def session_factory(shards):
+    return async_sessionmaker(
+        shards[0],
+        class_=AsyncSession,
+        expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        shards=shards,
+    )
+
+
+def _id_on(shard: int) -> uuid.UUID:
+    while True:
+        candidate = uuid.uuid4()
+        if candidate.int % 2 == shard:
+            return candidate
+
+
+async def _user(session_factory, name: str) -> User:
+    user = User(
+        email=Email(f"{name}_{uuid.uuid4().hex[:6]}@example.com"), password_hash="hash"
+    )
+    async with session_factory() as session:
+        await SQLUserRepository(session).add(user)
+        await session.commit()
+    return user
+
+
+async def _workspace(session_factory, owner: User, shard: int) -> Workspace:
+    workspace = Workspace(name=f"Shard {shard}", owner_id=owner.id, id=_id_on(shard))
+    async with session_factory() as session:
+        await SQLWorkspaceRepository(session).add(workspace)
+        await session.commit()
+    return workspace
+
+
+async def _ids(engine, column) -> set:
+    async with engine.connect() as conn:
+        return set((await conn.execute(select(column))).scalars())
+
+
+@pytest.mark.asyncio
+async def test_workspaces_are_placed_and_read_across_shards(shards, session_factory):
+    owner = await _user(session_factory, "shard_owner")
+    local = await _workspace(session_factory, owner, 0)
+    remote = await _workspace(session_factory, owner, 1)
+
+    assert await _ids(shards[0], WorkspaceORM.id) == {local.id}
+    assert await _ids(shards[1], WorkspaceORM.id) == {remote.id}
+    # The owner row is copied so the shard's foreign keys hold
+    assert await _ids(shards[1], UserORM.id) == {owner.id}
+    async with shards[0].connect() as conn:
+        placement = dict(
+            (
+                await conn.execute(
+                    select(WorkspaceShardORM.workspace_id, WorkspaceShardORM.shard)
+                )
+            ).all()
+        )
+    assert placement == {local.id: 0, remote.id: 1}
+
+    async with session_factory() as session:
+        repo = SQLWorkspaceRepository(session)
+        assert {w.id for w in await repo.list_by_user(owner.id)} == {
+            local.id,
+            remote.id,
+        }
+        assert (await repo.get_list_version(owner.id))[1] == 2
+        assert await repo.get_accessible_workspace_ids(
+            owner.id, [local.id, remote.id, uuid.uuid4()]
+        ) == {local.id, remote.id}
+
+    async with session_factory() as session:
+        assert (
+            await SQLWorkspaceRepository(session).get_by_id(remote.id)
+        ).id == remote.id
+        category = (await SQLCategoryRepository(session).list_by_workspace(remote.id))[
+            0
+        ]
+        budget = Budget(
+            workspace_id=remote.id,
+            owner_id=owner.id,
+            category_id=category.id,
+            limit_amount=10.0,
+            month=1,
+            year=2026,
+        )
+        await SQLBudgetRepository(session).add(budget)
+        await session.commit()
+
+    assert await _ids(shards[1], BudgetORM.id) == {budget.id}
+    async with session_factory() as session:
+        # Looked up by id alone: every shard is asked
+        assert (await SQLBudgetRepository(session).get_by_id(budget.id)).id == budget.id
+
+
+@pytest.mark.asyncio
+async def test_session_cannot_span_shards(session_factory):
+    owner = await _user(session_factory, "shard_span")
+    local = await _workspace(session_factory, owner, 0)
+    remote = await _workspace(session_factory, owner, 1)
+
+    async with session_factory() as session:
+        repo = SQLWorkspaceRepository(session)
+        await repo.get_by_id(local.id)
+        with pytest.raises(CrossShardError):
+            await repo.get_by_id(remote.id)
+
+
+@pytest.mark.asyncio
+async def test_move_workspace_copies_rows_and_flips_the_directory(
+    shards, session_factory
+):
+    owner = await _user(session_factory, "move_owner")
+    editor = await _user(session_factory, "move_editor")
+    workspace = await _workspace(session_factory, owner, 1)
+    async with session_factory() as session:
+        repo = SQLWorkspaceRepository(session)
+        await repo.add_member(
+            WorkspaceMember(
+                workspace_id=workspace.id, user_id=editor.id, role=WorkspaceRole.EDITOR
+            )
+        )
+        category = (
+            await SQLCategoryRepository(session).list_by_workspace(workspace.id)
+        )[0]
+        await SQLBudgetRepository(session).add(
+            Budget(
+                workspace_id=workspace.id,
+                owner_id=editor.id,
+                category_id=category.id,
+                limit_amount=5.0,
+                month=2,
+                year=2026,
+            )
+        )
+        await session.commit()
+
+    assert (1, owner.id) in replicated_users
+    copied = await move_workspace(workspace.id, 0, shards=shards, primary=shards[0])
+    # The copies left behind on the source were deleted
+    assert (1, owner.id) not in replicated_users
+    assert copied == {
+        "workspaces": 1,
+        "categories": 0,
+        "workspace_members": 1,
+        "budgets": 1,
+    }
+    assert await move_workspace(workspace.id, 0, shards=shards, primary=shards[0]) == {}
+
+    assert await _ids(shards[1], WorkspaceORM.id) == set()
+    assert await _ids(shards[1], BudgetORM.id) == set()
+    async with session_factory() as session:
+        members = await SQLWorkspaceRepository(session).list_members(workspace.id)
+        assert {m.user_id for m in members} == {owner.id, editor.id}
+        budgets, total = await SQLBudgetRepository(session).list_by_workspace(
+            workspace.id
+        )
+        assert total == 1 and budgets[0].category_id == category.id
+
+
+@pytest.mark.asyncio
+async def test_sync_default_categories_aligns_ids(shards):
+    assert await sync_default_categories(shards) == 0
+    assert await _ids(shards[1], CategoryORM.id) == await _ids(
+        shards[0], CategoryORM.id
+    )
+
+
+@pytest.mark.asyncio
+async def test_owner_is_replicated_once_committed(shards, session_factory):
+    for engine in shards:
+        instrument_engine(engine)
+    owner = await _user(session_factory, "replica_owner")
+    workspace = await _workspace(session_factory, owner, 1)
+    assert (1, owner.id) in router.replicated_users
+
+    async with session_factory() as session:
+        category = (
+            await SQLCategoryRepository(session).list_by_workspace(workspace.id)
+        )[0]
+        with count_queries() as counter:
+            await SQLBudgetRepository(session).add(
+                Budget(
+                    workspace_id=workspace.id,
+                    owner_id=owner.id,
+                    category_id=category.id,
+                    limit_amount=1.0,
+                    month=1,
+                    year=2026,
+                )
+            )
+        assert counter.count == 0
+        await session.commit()
+
+    # A copy that was rolled back is not remembered
+    editor = await _user(session_factory, "replica_editor")
+    async with session_factory() as session:
+        await SQLWorkspaceRepository(session).add_member(
+            WorkspaceMember(
+                workspace_id=workspace.id, user_id=editor.id, role=WorkspaceRole.EDITOR
+            )
+        )
+        await session.rollback()
+    assert (1, editor.id) not in router.replicated_users
+
+
+@pytest.mark.asyncio
+async def test_deleted_workspace_without_a_purge_job_is_requeued(
+    shards, session_factory
+):
+    owner = await _user(session_factory, "reconcile_owner")
+    lost = await _workspace(session_factory, owner, 1)
+    queued = await _workspace(session_factory, owner, 0)
+    async with session_factory() as session:
+        lost.delete()
+        await SQLWorkspaceRepository(session).update(lost)
+        await session.commit()
+    async with session_factory() as session:
+        queued.delete()
+        await SQLWorkspaceRepository(session).update(queued)
+        await session.commit()
+    # Only the deletion of "queued" got its job
+    async with session_factory() as session:
+        await SQLJobRepository(session).add(
+            Job(kind=JobKind.DELETE_WORKSPACE, payload={"workspace_id": str(queued.id)})
+        )
+        await session.commit()
+
+    # Deleted "before" a second from now: past the grace period
+    later = datetime.now(timezone.utc) + timedelta(seconds=1)
+    async with session_factory() as session:
+        use_case = ReconcileWorkspacePurges(
+            SQLWorkspaceRepository(session), SQLJobRepository(session)
+        )
+        jobs = await use_case.execute(later)
+        await session.commit()
+    assert [job.payload for job in jobs] == [{"workspace_id": str(lost.id)}]
+
+    async with session_factory() as session:
+        use_case = ReconcileWorkspacePurges(
+            SQLWorkspaceRepository(session), SQLJobRepository(session)
+        )
+        assert await use_case.execute(later) == []
+
+    # A purge that ran out of attempts is not queued again
+    async with session_factory() as session:
+        await session.execute(
+            update(JobORM)
+            .where(JobORM.id == jobs[0].id)
+            .values(status=JobStatus.FAILED.value)
+        )
+        await session.commit()
+    async with session_factory() as session:
+        use_case = ReconcileWorkspacePurges(
+            SQLWorkspaceRepository(session), SQLJobRepository(session)
+        )
+        assert await use_case.execute(later) == []
+
+
+def test_replicated_users_are_bounded():
+    now = [0.0]
+    replicated = ReplicatedUsers(max_entries=2, ttl=10, clock=lambda: now[0])
+    a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    replicated.add([(1, a), (1, b)])
+    assert (1, a) in replicated
+    replicated.add([(1, c)])
+    # "a" was used last, so "b" is evicted
+    assert len(replicated) == 2
+    assert (1, b) not in replicated and (1, a) in replicated
+
+    now[0] = 11
+    assert (1, a) not in replicated and (1, c) not in replicated
+    assert len(replicated) == 0
+
+    replicated.add([(1, a), (2, a)])
+    replicated.forget([a], shard=1)
+    assert (1, a) not in replicated and (2, a) in replicated
+    replicated.forget([a])
+    assert len(replicated) == 0
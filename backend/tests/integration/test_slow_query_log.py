@@ -0,0 +1,42 @@
+import json
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.auth.models import User
+from src.domain.auth.value_objects import Email
+from src.domain.workspace.models import Workspace
+from src.infrastructure.auth.repositories import SQLUserRepository
+from src.infrastructure.observability import instrument_engine, slow_queries
+from src.infrastructure.observability.slow_queries import SlowQueryLog
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository
+
+
+@pytest.mark.asyncio
+async def test_slow_select_captures_explain(
+    db_engine, db_session: AsyncSession, tmp_path, monkeypatch
+):
+    instrument_engine(db_engine)
+    user = User(email=Email("slow_query@example.com"), password_hash="hash")
+    await SQLUserRepository(db_session).add(user)
+    await SQLWorkspaceRepository(db_session).add(Workspace(name="Slow", owner_id=user.id))
+    await db_session.commit()
+
+    log_path = tmp_path / "slow.log"
+    monkeypatch.setattr(
+        slow_queries,
+        "slow_query_log",
+        SlowQueryLog(threshold_ms=0, path=str(log_path), explain_rate=1.0),
+    )
+    workspaces = await SQLWorkspaceRepository(db_session).list_by_user(user.id)
+    assert len(workspaces) == 1
+
+    entries = [json.loads(line) for line in log_path.read_text().splitlines()]
+    explained = [e for e in entries if e.get("plan")]
+    assert explained
+    assert "workspaces" in explained[0]["statement"]
+    assert "Execution Time" in explained[0]["plan"]
+    assert explained[0]["params"] == ["UUID", "UUID"]
+
+    # The request transaction is still usable after the EXPLAIN.
+    assert await SQLWorkspaceRepository(db_session).get_by_id(workspaces[0].id)
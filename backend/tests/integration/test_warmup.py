@@ -0,0 +1,45 @@
+import logging
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.infrastructure import warmup
+from src.infrastructure.warmup import warm_up
+from tests.conftest import TEST_DATABASE_URL
+
+
+@pytest.mark.asyncio
+async def test_warm_up_opens_pool_connections(db_engine):
+    await db_engine.dispose()
+    await warm_up(db_engine, connections=3)
+    assert db_engine.pool.checkedin() == 3
+
+    # Capped at the pool size: overflow connections would be closed on return
+    await warm_up(db_engine, connections=db_engine.pool.size() + 4)
+    assert db_engine.pool.checkedin() == db_engine.pool.size()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_failure_is_logged(db_engine, monkeypatch, caplog):
+    async def broken(session):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("src.infrastructure.warmup.run_hot_statements", broken)
+    with caplog.at_level(logging.WARNING, logger="src.infrastructure.warmup"):
+        await warm_up(db_engine, connections=2)
+    assert f"Warmed 0 of 2 connections to {db_engine.url.database}: boom" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_warm_up_covers_every_shard_once(db_engine, monkeypatch):
+    shard = create_async_engine(TEST_DATABASE_URL)
+    # The primary is also shard 0
+    monkeypatch.setattr(warmup, "default_engine", db_engine)
+    monkeypatch.setattr(warmup, "shard_engines", [db_engine, shard])
+    await db_engine.dispose()
+    try:
+        await warm_up(connections=2)
+        assert db_engine.pool.checkedin() == 2
+        assert shard.pool.checkedin() == 2
+    finally:
+        await shard.dispose()
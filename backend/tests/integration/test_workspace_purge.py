@@ -0,0 +1,84 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.auth.models import User
+from src.domain.auth.value_objects import Email
+from src.domain.budget.models import Budget, Category
+from src.domain.workspace.models import Workspace, WorkspaceMember
+from src.domain.workspace.value_objects import WorkspaceRole
+from src.infrastructure.auth.repositories import SQLUserRepository
+from src.infrastructure.budget.models import BudgetORM, CategoryORM
+from src.infrastructure.budget.repositories import SQLBudgetRepository, SQLCategoryRepository
+from src.infrastructure.jobs import handlers
+from src.infrastructure.workspace.models import WorkspaceMemberORM
+from src.infrastructure.workspace.repositories import SQLWorkspaceRepository
+
+pytestmark = pytest.mark.backends("postgresql", "sqlite")
+
+
+async def _count(session: AsyncSession, orm, workspace_id) -> int:
+    result = await session.execute(
+        select(func.count()).select_from(orm).where(orm.workspace_id == workspace_id)
+    )
+    return result.scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_soft_deleted_workspace_is_hidden_and_purged(db_session: AsyncSession, monkeypatch):
+    workspace_repo = SQLWorkspaceRepository(db_session)
+    owner = User(email=Email("purge_owner@example.com"), password_hash="hash", full_name="Owner")
+    viewer = User(email=Email("purge_viewer@example.com"), password_hash="hash", full_name="Viewer")
+    for user in (owner, viewer):
+        await SQLUserRepository(db_session).add(user)
+    workspace = Workspace(name="Household", owner_id=owner.id)
+    await workspace_repo.add(workspace)
+    await db_session.commit()
+
+    await workspace_repo.add_member(
+        WorkspaceMember(workspace_id=workspace.id, user_id=viewer.id, role=WorkspaceRole.VIEWER)
+    )
+    categories = [Category(name=f"Custom {i}", workspace_id=workspace.id) for i in range(3)]
+    for category in categories:
+        await SQLCategoryRepository(db_session).add(category)
+    await db_session.commit()
+    for month in range(1, 6):
+        await SQLBudgetRepository(db_session).add(
+            Budget(
+                workspace_id=workspace.id,
+                owner_id=owner.id,
+                category_id=categories[month % 3].id,
+                limit_amount=100.0,
+                month=month,
+                year=2024,
+            )
+        )
+    await db_session.commit()
+
+    # Soft delete: gone from every read path right away
+    workspace.delete()
+    await workspace_repo.update(workspace)
+    await db_session.commit()
+    assert await workspace_repo.get_by_id(workspace.id) is None
+    assert await workspace_repo.list_by_user(owner.id) == []
+    assert await workspace_repo.get_member(workspace.id, viewer.id) is None
+    assert await workspace_repo.get_by_name_and_owner("Household", owner.id) is None
+    assert (await workspace_repo.get_by_id(workspace.id, include_deleted=True)).deleted_at
+
+    # The name is free again while the old workspace waits to be purged
+    replacement = Workspace(name="Household", owner_id=owner.id)
+    await workspace_repo.add(replacement)
+    await db_session.commit()
+
+    monkeypatch.setattr(handlers, "PURGE_BATCH_SIZE", 2)
+    monkeypatch.setattr(handlers, "PURGE_BATCH_PAUSE", 0)
+    await handlers.delete_workspace(db_session, {"workspace_id": str(workspace.id)})
+    await db_session.commit()
+
+    assert await workspace_repo.get_by_id(workspace.id, include_deleted=True) is None
+    for orm in (BudgetORM, CategoryORM, WorkspaceMemberORM):
+        assert await _count(db_session, orm, workspace.id) == 0
+    assert await workspace_repo.get_by_id(replacement.id) is not None
+
+    # A retried job finds nothing left to do
+    await handlers.delete_workspace(db_session, {"workspace_id": str(workspace.id)})
@@ -8,6 +8,8 @@ from src.domain.workspace.value_objects import WorkspaceRole
 from src.domain.auth.models import User
 from src.domain.auth.value_objects import Email
 
+pytestmark = pytest.mark.backends("postgresql", "sqlite")
+
 @pytest.mark.asyncio
 async def test_workspace_repository_flow(db_session: AsyncSession):
     workspace_repo = SQLWorkspaceRepository(db_session)
@@ -14,6 +14,13 @@ def mock_repo():
     repo.add = AsyncMock()
     return repo
 
+@pytest.fixture
+def revoked_repo():
+    repo = MagicMock()
+    repo.revoke = AsyncMock(return_value=True)
+    repo.is_revoked = AsyncMock(return_value=False)
+    return repo
+
 @pytest.fixture
 def mock_session():
     return AsyncMock()
@@ -60,3 +60,28 @@ async def test_auth_route_unhandled_exceptions():
             })
             assert response.status_code == 500
             assert "Login fail" in response.json()["detail"]
+
+@pytest.mark.asyncio
+async def test_login_rate_limited_before_lookup():
+    """Over-budget attempts get 429 without touching the login use case"""
+    from src.api.main import app
+    from src.api.dependencies.rate_limit import get_login_rate_limiter
+    from src.infrastructure.rate_limit import InMemoryBucketStore, LoginRateLimiter, TokenBucket
+
+    limiter = LoginRateLimiter(
+        InMemoryBucketStore(), per_ip=TokenBucket(10, 1), per_account=TokenBucket(1, 1)
+    )
+    app.dependency_overrides[get_login_rate_limiter] = lambda: limiter
+    payload = {"email": "limited@example.com", "password": "Password123!"}
+    try:
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            with patch("src.api.routes.auth.LoginUser.execute", side_effect=UnauthorizedError("Invalid credentials")) as execute:
+                response = await client.post("/api/auth/login", json=payload)
+                assert response.status_code == 401
+
+                response = await client.post("/api/auth/login", json=payload)
+                assert response.status_code == 429
+                assert int(response.headers["Retry-After"]) > 0
+                assert execute.call_count == 1
+    finally:
+        app.dependency_overrides = {}
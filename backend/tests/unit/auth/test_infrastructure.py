@@ -60,6 +60,7 @@ async def test_abstract_repository_coverage():
 
     class DummyUserRepo(UserRepository):
         async def get_by_email(self, email): return await super().get_by_email(email)
+        async def list_by_emails(self, emails): return await super().list_by_emails(emails)
         async def add(self, user): pass
         async def get_by_id(self, id): pass
         async def list(self): pass
@@ -67,3 +68,4 @@ async def test_abstract_repository_coverage():
 
     dur = DummyUserRepo()
     await dur.get_by_email(None)
+    await dur.list_by_emails([])
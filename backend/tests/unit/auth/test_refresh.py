@@ -11,11 +11,12 @@ from src.domain.errors import UnauthorizedError
 from src.api.routes.auth import refresh
 from jose import JWTError
 
+
 @pytest.mark.asyncio
-async def test_refresh_token_success(mock_repo, mock_user):
+async def test_refresh_token_success(mock_repo, mock_user, revoked_repo):
     """Test successful token refresh flow"""
     mock_repo.get_by_id = AsyncMock(return_value=mock_user)
-    use_case = RefreshToken(mock_repo)
+    use_case = RefreshToken(mock_repo, revoked_repo)
     
     token = JWTService.create_token({"sub": str(mock_user.id)}, token_type="refresh")
     result = await use_case.execute(RefreshTokenRequestDto(refresh_token=token))
@@ -23,12 +24,28 @@ async def test_refresh_token_success(mock_repo, mock_user):
     assert result.user.email == str(mock_user.email)
     assert result.access_token is not None
     assert result.refresh_token is not None
+    # The presented refresh token is checked, not used up
+    checked = revoked_repo.is_revoked.await_args.args[0]
+    assert str(checked) == JWTService.decode_token(token)["jti"]
+    revoked_repo.revoke.assert_not_awaited()
+    assert result.refresh_token != token
+
+@pytest.mark.asyncio
+async def test_refresh_token_revoked(mock_repo, mock_user, revoked_repo):
+    """Test a refresh token is rejected once it has been revoked by a logout"""
+    mock_repo.get_by_id = AsyncMock(return_value=mock_user)
+    revoked_repo.is_revoked.return_value = True
+    use_case = RefreshToken(mock_repo, revoked_repo)
+
+    token = JWTService.create_token({"sub": str(mock_user.id)}, token_type="refresh")
+    with pytest.raises(UnauthorizedError, match="Refresh token has been revoked"):
+        await use_case.execute(RefreshTokenRequestDto(refresh_token=token))
 
 @pytest.mark.asyncio
-async def test_refresh_token_user_not_found(mock_repo):
+async def test_refresh_token_user_not_found(mock_repo, revoked_repo):
     """Test error when user from token doesn't exist"""
     mock_repo.get_by_id = AsyncMock(return_value=None)
-    use_case = RefreshToken(mock_repo)
+    use_case = RefreshToken(mock_repo, revoked_repo)
     
     token = JWTService.create_token({"sub": str(uuid.uuid4())}, token_type="refresh")
     
@@ -36,11 +53,11 @@ async def test_refresh_token_user_not_found(mock_repo):
         await use_case.execute(RefreshTokenRequestDto(refresh_token=token))
 
 @pytest.mark.asyncio
-async def test_refresh_token_user_inactive(mock_repo, mock_user):
+async def test_refresh_token_user_inactive(mock_repo, mock_user, revoked_repo):
     """Test error when user is inactive"""
     mock_user.is_active = False
     mock_repo.get_by_id = AsyncMock(return_value=mock_user)
-    use_case = RefreshToken(mock_repo)
+    use_case = RefreshToken(mock_repo, revoked_repo)
     
     token = JWTService.create_token({"sub": str(mock_user.id)}, token_type="refresh")
     
@@ -48,18 +65,18 @@ async def test_refresh_token_user_inactive(mock_repo, mock_user):
         await use_case.execute(RefreshTokenRequestDto(refresh_token=token))
 
 @pytest.mark.asyncio
-async def test_refresh_token_wrong_type(mock_repo):
+async def test_refresh_token_wrong_type(mock_repo, revoked_repo):
     """Test error when verifying access token as refresh token"""
-    use_case = RefreshToken(mock_repo)
+    use_case = RefreshToken(mock_repo, revoked_repo)
     token = JWTService.create_token({"sub": str(uuid.uuid4())}, token_type="access")
     
     with pytest.raises(UnauthorizedError, match="Invalid refresh token"):
         await use_case.execute(RefreshTokenRequestDto(refresh_token=token))
 
 @pytest.mark.asyncio
-async def test_refresh_token_expired(mock_repo):
+async def test_refresh_token_expired(mock_repo, revoked_repo):
     """Test error when verifying expired refresh token"""
-    use_case = RefreshToken(mock_repo)
+    use_case = RefreshToken(mock_repo, revoked_repo)
     token = JWTService.create_token(
         {"sub": str(uuid.uuid4())}, 
         expires_delta=timedelta(seconds=-1), 
@@ -70,9 +87,9 @@ async def test_refresh_token_expired(mock_repo):
         await use_case.execute(RefreshTokenRequestDto(refresh_token=token))
 
 @pytest.mark.asyncio
-async def test_refresh_token_jwt_error(mock_repo):
+async def test_refresh_token_jwt_error(mock_repo, revoked_repo):
     """Test error when JWT decoding fails unexpectedly"""
-    use_case = RefreshToken(mock_repo)
+    use_case = RefreshToken(mock_repo, revoked_repo)
     with patch("src.infrastructure.auth.services.jwt.JWTService.decode_token", side_effect=JWTError()):
         with pytest.raises(UnauthorizedError, match="Invalid refresh token"):
             await use_case.execute(RefreshTokenRequestDto(refresh_token="invalid"))
@@ -88,7 +105,7 @@ async def test_refresh_endpoint_exception_handlers(mock_repo):
         mock_use_case.execute.side_effect = UnauthorizedError("Invalid token")
         
         try:
-            await refresh(mock_data, user_repo=mock_repo)
+            await refresh(mock_data, user_repo=mock_repo, revoked_token_repo=AsyncMock())
             assert False, "Should raise HTTPException"
         except HTTPException as e:
             assert e.status_code == 401
@@ -97,7 +114,7 @@ async def test_refresh_endpoint_exception_handlers(mock_repo):
     # Test 500 mapping
     with patch("src.api.routes.auth.RefreshToken.execute", side_effect=Exception("Crash")):
         try:
-            await refresh(mock_data, user_repo=mock_repo)
+            await refresh(mock_data, user_repo=mock_repo, revoked_token_repo=AsyncMock())
             assert False, "Should raise HTTPException"
         except HTTPException as e:
             assert e.status_code == 500
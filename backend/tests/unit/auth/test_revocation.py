@@ -0,0 +1,102 @@
+import pytest
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.api.dependencies.auth import get_access_token_claims, get_current_user, get_revocation_list
+from src.application.use_cases.auth.logout.dtos import LogoutRequestDto
+from src.application.use_cases.auth.logout.index import Logout
+from src.application.use_cases.auth.tokens import revoked_token_from_claims
+from src.domain.auth.models import RevokedToken
+from src.domain.errors import UnauthorizedError
+from src.infrastructure.auth.services.jwt import JWTService
+from src.infrastructure.auth.services.revocation import RevocationList
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime.now(timezone.utc).timestamp()
+
+    def __call__(self):
+        return self.now
+
+
+def _revoked(expires_in: float = 60) -> RevokedToken:
+    return RevokedToken(
+        id=uuid.uuid4(),
+        expires_at=datetime.now(timezone.utc) + timedelta(seconds=expires_in),
+    )
+
+
+def test_revocation_list_lookup_and_prune():
+    clock = FakeClock()
+    revocations = RevocationList(clock=clock)
+    short, long = _revoked(10), _revoked(100)
+    revocations.add([short, long])
+
+    assert revocations.is_revoked(str(short.id))
+    assert not revocations.is_revoked(str(uuid.uuid4()))
+    assert not revocations.is_revoked(None)
+
+    clock.now += 50
+    revocations.prune()
+    assert not revocations.is_revoked(str(short.id))
+    assert revocations.is_revoked(str(long.id))
+    assert len(revocations) == 1
+
+
+def test_revoked_token_from_claims():
+    token = JWTService.create_token({"sub": "x"}, token_type="access")
+    claims = JWTService.decode_token(token)
+    revoked = revoked_token_from_claims(claims)
+    assert str(revoked.id) == claims["jti"]
+    assert revoked.expires_at == datetime.fromtimestamp(claims["exp"], tz=timezone.utc)
+    # Tokens minted before jti existed cannot be revoked
+    assert revoked_token_from_claims({"sub": "x", "exp": claims["exp"]}) is None
+
+
+@pytest.mark.asyncio
+async def test_revoked_access_token_is_rejected(mock_repo, mock_user, mock_session):
+    mock_repo.get_by_id = AsyncMock(return_value=mock_user)
+    token = JWTService.create_token({"sub": str(mock_user.id)}, token_type="access")
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    get_revocation_list().add([revoked_token_from_claims(JWTService.decode_token(token))])
+
+    with patch("src.api.dependencies.auth.SQLUserRepository", return_value=mock_repo):
+        with pytest.raises(HTTPException) as exc:
+            await get_current_user(credentials=credentials, session=mock_session)
+    assert exc.value.status_code == 401
+    mock_repo.get_by_id.assert_not_called()
+    with pytest.raises(HTTPException):
+        await get_access_token_claims(credentials=credentials)
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_access_and_refresh(revoked_repo):
+    sub = str(uuid.uuid4())
+    access = JWTService.decode_token(JWTService.create_token({"sub": sub}, token_type="access"))
+    refresh = JWTService.create_token({"sub": sub}, token_type="refresh")
+
+    revoked = await Logout(revoked_repo).execute(access, LogoutRequestDto(refresh_token=refresh))
+
+    assert [str(t.id) for t in revoked] == [access["jti"], JWTService.decode_token(refresh)["jti"]]
+    assert revoked_repo.revoke.await_count == 2
+
+    revoked_repo.revoke.reset_mock()
+    assert len(await Logout(revoked_repo).execute(access, LogoutRequestDto())) == 1
+
+
+@pytest.mark.asyncio
+async def test_logout_rejects_foreign_refresh_token(revoked_repo):
+    access = JWTService.decode_token(JWTService.create_token({"sub": "me"}, token_type="access"))
+    for refresh in [
+        JWTService.create_token({"sub": "someone-else"}, token_type="refresh"),
+        JWTService.create_token({"sub": "me"}, token_type="access"),
+        "not-a-token",
+    ]:
+        with pytest.raises(UnauthorizedError):
+            await Logout(revoked_repo).execute(access, LogoutRequestDto(refresh_token=refresh))
+    revoked_repo.revoke.assert_not_called()
@@ -43,7 +43,7 @@ async def test_login_user_success():
     from src.infrastructure.auth.services.hasher import Hasher
     
     password = "Password123!"
-    hashed = Hasher.get_password_hash(password)
+    hashed = await Hasher.get_password_hash(password)
     
     mock_user = MagicMock(spec=User)
     mock_user.id = uuid.uuid4()
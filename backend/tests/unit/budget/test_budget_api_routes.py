@@ -8,7 +8,7 @@ from src.api.main import app
 from src.api.dependencies.auth import get_current_user
 from src.domain.auth.models import User
 from src.domain.budget.models import Budget
-from src.domain.errors import NotFoundError, UnauthorizedError, ConflictError, ValidationError
+from src.domain.errors import ArchivedError, NotFoundError, UnauthorizedError, ConflictError, ValidationError
 
 @pytest.fixture
 def user():
@@ -28,11 +28,15 @@ import pytest_asyncio
 
 @pytest.fixture
 def mock_budget_repo():
-    return AsyncMock()
+    mock = AsyncMock()
+    mock.get_list_version.return_value = (None, 0)
+    return mock
 
 @pytest.fixture
 def mock_category_repo():
-    return AsyncMock()
+    mock = AsyncMock()
+    mock.get_list_version.return_value = (None, 0)
+    return mock
 
 @pytest.fixture
 def mock_workspace_repo():
@@ -60,6 +64,11 @@ async def client(user, mock_db_session, mock_budget_repo, mock_category_repo, mo
     app.dependency_overrides[get_category_repository] = lambda: mock_category_repo
     app.dependency_overrides[get_workspace_repository] = lambda: mock_workspace_repo
     app.dependency_overrides[get_movement_service] = lambda: mock_movement_service
+    # The mocked session never commits, so there is nothing to audit
+    from src.api.dependencies.audit import get_audit_recorder
+    from src.application.use_cases.audit.recorder import NullAuditRecorder
+
+    app.dependency_overrides[get_audit_recorder] = NullAuditRecorder
 
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
@@ -367,6 +376,11 @@ async def test_update_budget_errors(client):
         response = await client.put(f"/api/budgets/{budget_id}", json=payload)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+        # Archived
+        mock_instance.execute = AsyncMock(side_effect=ArchivedError("Archived"))
+        response = await client.put(f"/api/budgets/{budget_id}", json=payload)
+        assert response.status_code == status.HTTP_409_CONFLICT
+
 @pytest.mark.asyncio
 async def test_delete_budget_errors(client):
     budget_id = str(uuid4())
@@ -384,6 +398,11 @@ async def test_delete_budget_errors(client):
         response = await client.delete(f"/api/budgets/{budget_id}")
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
+        # Archived
+        mock_instance.execute = AsyncMock(side_effect=ArchivedError("Archived"))
+        response = await client.delete(f"/api/budgets/{budget_id}")
+        assert response.status_code == status.HTTP_409_CONFLICT
+
 @pytest.mark.asyncio
 async def test_internal_server_errors_all_routes(client):
     budget_id = str(uuid4())
@@ -423,3 +442,187 @@ async def test_list_categories_internal_error(client, mock_category_repo):
     mock_category_repo.list_defaults.side_effect = Exception("Repo fail")
     response = await client.get("/api/budgets/categories")
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+
+@pytest.mark.asyncio
+async def test_list_budgets_not_modified(client, mock_budget_repo):
+    workspace_id = uuid4()
+    mock_budget_repo.get_list_version.return_value = (datetime(2024, 5, 1), 1)
+
+    with patch("src.api.routes.budget.ListBudgets") as MockUseClass:
+        MockUseClass.return_value.execute = AsyncMock(return_value=([], 0))
+        response = await client.get(f"/api/budgets?workspace_id={workspace_id}")
+        etag = response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "private, no-cache"
+
+        response = await client.get(
+            f"/api/budgets?workspace_id={workspace_id}",
+            headers={"If-None-Match": etag},
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+        assert MockUseClass.return_value.execute.await_count == 1
+
+@pytest.mark.asyncio
+async def test_list_categories_defaults_cacheable(client, mock_category_repo):
+    mock_category_repo.list_defaults.return_value = []
+
+    response = await client.get("/api/budgets/categories")
+    assert response.headers["Cache-Control"].startswith("public, max-age=")
+
+    response = await client.get(
+        "/api/budgets/categories",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["Cache-Control"].startswith("public, max-age=")
+    assert mock_category_repo.list_defaults.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_list_budgets_sparse_fields(client, mock_budget_repo):
+    workspace_id = uuid4()
+    budget_id = uuid4()
+
+    with patch("src.api.routes.budget.ListBudgetFields") as MockFields, patch(
+        "src.api.routes.budget.ListBudgets"
+    ) as MockFull:
+        MockFull.return_value.execute = AsyncMock(return_value=([], 0))
+        MockFields.return_value.execute = AsyncMock(
+            return_value=([{"id": budget_id, "limit_amount": 10.0}], 1)
+        )
+        full = await client.get(f"/api/budgets?workspace_id={workspace_id}")
+        response = await client.get(
+            f"/api/budgets?workspace_id={workspace_id}&fields=limit_amount, id"
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "items": [{"id": str(budget_id), "limit_amount": 10.0}],
+        "total": 1,
+        "page": 1,
+        "size": 20,
+    }
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert response.headers["ETag"] != full.headers["ETag"]
+    # Requested in any order, passed on in the response model's order
+    assert MockFields.return_value.execute.await_args.args[1] == ("id", "limit_amount")
+    assert MockFull.return_value.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_list_budgets_unknown_fields(client):
+    response = await client.get(f"/api/budgets?workspace_id={uuid4()}&fields=id,secret")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["detail"] == "Unknown fields: secret"
+
+    response = await client.get(f"/api/budgets?workspace_id={uuid4()}&fields=,")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio
+async def test_list_budgets_msgpack(client):
+    import msgpack
+
+    workspace_id = uuid4()
+    budget_id = uuid4()
+    with patch("src.api.routes.budget.ListBudgets") as MockFull, patch(
+        "src.api.routes.budget.ListBudgetFields"
+    ) as MockFields:
+        MockFull.return_value.execute = AsyncMock(return_value=([], 0))
+        MockFields.return_value.execute = AsyncMock(
+            return_value=([{"id": budget_id, "month": 4}], 1)
+        )
+        headers = {"Accept": "application/msgpack"}
+        full = await client.get(f"/api/budgets?workspace_id={workspace_id}", headers=headers)
+        sparse = await client.get(
+            f"/api/budgets?workspace_id={workspace_id}&fields=id,month", headers=headers
+        )
+
+    assert full.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(full.content) == {"items": [], "total": 0, "page": 1, "size": 20}
+    assert "ETag" in full.headers
+    assert sparse.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(sparse.content)["items"] == [{"id": str(budget_id), "month": 4}]
+
+
+@pytest.mark.asyncio
+async def test_get_budgets_batch(client):
+    budget = MagicMock(spec=Budget)
+    budget.id = uuid4()
+    budget.limit_amount = 100.0
+    budget.year = 2024
+    budget.month = 3
+    budget.workspace_id = uuid4()
+    budget.owner_id = uuid4()
+    budget.category_id = uuid4()
+    budget.created_at = datetime.now()
+    budget.updated_at = datetime.now()
+    missing = uuid4()
+
+    with patch("src.api.routes.budget.GetBudgets") as MockUseClass:
+        execute = MockUseClass.return_value.execute = AsyncMock(
+            return_value=([(budget, 25.0, 25.0)], [missing])
+        )
+        response = await client.get(f"/api/budgets/batch?ids={budget.id}&ids={missing}")
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [str(budget.id)]
+    assert data["items"][0]["spent_amount"] == 25.0
+    assert data["missing"] == [str(missing)]
+    assert execute.await_args.args[0] == [budget.id, missing]
+
+
+@pytest.mark.asyncio
+async def test_get_budgets_batch_validation(client):
+    from src.application.use_cases.budget.get_many.dtos import BUDGET_BATCH_MAX_IDS
+
+    assert (await client.get("/api/budgets/batch")).status_code == 422
+    assert (await client.get("/api/budgets/batch?ids=nope")).status_code == 422
+    too_many = "&".join(f"ids={uuid4()}" for _ in range(BUDGET_BATCH_MAX_IDS + 1))
+    assert (await client.get(f"/api/budgets/batch?{too_many}")).status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_list_budgets_period_and_limit_filters(client, mock_budget_repo):
+    from src.domain.budget.value_objects import BudgetSort
+
+    workspace_id = uuid4()
+    with patch("src.api.routes.budget.ListBudgets") as MockUseClass:
+        execute = MockUseClass.return_value.execute = AsyncMock(return_value=([], 0))
+        response = await client.get(
+            f"/api/budgets?workspace_id={workspace_id}&from=2023-11&to=2024-02"
+            "&min_limit=10&max_limit=500&sort=-period"
+        )
+        unfiltered = await client.get(f"/api/budgets?workspace_id={workspace_id}")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert execute.await_args_list[0].kwargs == {
+        "period_from": 2023 * 12 + 11,
+        "period_to": 2024 * 12 + 2,
+        "min_limit": 10.0,
+        "max_limit": 500.0,
+        "sort": BudgetSort.PERIOD_DESC,
+    }
+    assert mock_budget_repo.get_list_version.await_args_list[0].kwargs == {
+        "period_from": 2023 * 12 + 11,
+        "period_to": 2024 * 12 + 2,
+    }
+    assert response.headers["ETag"] != unfiltered.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_list_budgets_invalid_ranges(client):
+    base = f"/api/budgets?workspace_id={uuid4()}"
+
+    assert (await client.get(f"{base}&from=2024-13")).status_code == 422
+    assert (await client.get(f"{base}&to=24-01")).status_code == 422
+    assert (await client.get(f"{base}&sort=owner_id")).status_code == 422
+    response = await client.get(f"{base}&from=2024-05&to=2024-01")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = await client.get(f"{base}&min_limit=50&max_limit=10")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -8,7 +8,10 @@ from src.application.use_cases.budget.create.dtos import CreateBudgetRequestDto
 from src.application.use_cases.budget.update.index import UpdateBudget
 from src.application.use_cases.budget.delete.index import DeleteBudget
 from src.application.use_cases.budget.get.index import GetBudget
+from src.application.use_cases.budget.get_many.index import GetBudgets
+from src.application.use_cases.budget.access import WorkspaceAccess, check_workspace_access
 from src.application.use_cases.budget.list.index import ListBudgets
+from src.application.use_cases.budget.list_fields.index import ListBudgetFields
 from src.domain.errors import NotFoundError, UnauthorizedError, ConflictError
 from src.domain.workspace.value_objects import WorkspaceRole
 from src.domain.budget.models import Budget
@@ -231,29 +234,100 @@ class TestGetBudget:
             await use_case.execute(uuid4(), user)
 
 @pytest.mark.asyncio
-class TestListBudgets:
-    async def test_list_budgets_success(self, mock_budget_repo, mock_workspace_repo, mock_movement_service, user, workspace_id):
-        use_case = ListBudgets(mock_budget_repo, mock_workspace_repo, mock_movement_service)
-        
+class TestCheckWorkspaceAccess:
+    async def test_member_has_access(self, mock_workspace_repo, user, workspace_id):
         mock_workspace_repo.get_member.return_value = MagicMock()
+
+        access = await check_workspace_access(mock_workspace_repo, user, workspace_id)
+
+        assert (access.workspace_id, access.user_id) == (workspace_id, user.id)
+        mock_workspace_repo.get_by_id.assert_not_called()
+
+    async def test_owner_has_access(self, mock_workspace_repo, user, workspace_id):
+        mock_workspace_repo.get_member.return_value = None
+        mock_workspace_repo.get_by_id.return_value = MagicMock(owner_id=user.id)
+
+        access = await check_workspace_access(mock_workspace_repo, user, workspace_id)
+
+        assert access.workspace_id == workspace_id
+
+    async def test_unauthorized(self, mock_workspace_repo, user, workspace_id):
+        mock_workspace_repo.get_member.return_value = None
+        mock_workspace_repo.get_by_id.return_value = MagicMock(owner_id=uuid4()) # Not owner
+
+        with pytest.raises(UnauthorizedError):
+            await check_workspace_access(mock_workspace_repo, user, workspace_id)
+
+@pytest.mark.asyncio
+class TestListBudgets:
+    async def test_list_budgets_success(self, mock_budget_repo, mock_movement_service, user, workspace_id):
+        use_case = ListBudgets(mock_budget_repo, mock_movement_service)
         
         budget1 = MagicMock(limit_amount=100.0)
         budget2 = MagicMock(limit_amount=200.0)
         mock_budget_repo.list_by_workspace.return_value = ([budget1, budget2], 2)
         mock_movement_service.get_spent_amount.side_effect = [50.0, 20.0]
 
-        results, total = await use_case.execute(user, workspace_id)
+        results, total = await use_case.execute(WorkspaceAccess(workspace_id, user.id))
 
         assert total == 2
         assert len(results) == 2
         assert results[0][1] == 50.0 # spent 1
+        assert mock_budget_repo.list_by_workspace.await_args.args[0] == workspace_id
 
-    async def test_list_budgets_unauthorized(self, mock_budget_repo, mock_workspace_repo, mock_movement_service, user, workspace_id):
-        use_case = ListBudgets(mock_budget_repo, mock_workspace_repo, mock_movement_service)
-        
-        mock_workspace_repo.get_member.return_value = None
-        workspace = MagicMock(owner_id=uuid4()) # Not owner
-        mock_workspace_repo.get_by_id.return_value = workspace
-        
-        with pytest.raises(UnauthorizedError):
-            await use_case.execute(user, workspace_id)
+@pytest.mark.asyncio
+class TestListBudgetFields:
+    async def test_plain_fields_skip_movements(self, mock_budget_repo, mock_movement_service, user, workspace_id):
+        use_case = ListBudgetFields(mock_budget_repo, mock_movement_service)
+        budget_id = uuid4()
+        mock_budget_repo.list_columns_by_workspace.return_value = ([{"id": budget_id, "month": 3}], 1)
+
+        rows, total = await use_case.execute(WorkspaceAccess(workspace_id, user.id), ("id", "month"), page=2, size=10)
+
+        assert (rows, total) == ([{"id": budget_id, "month": 3}], 1)
+        mock_budget_repo.list_columns_by_workspace.assert_awaited_once_with(
+            workspace_id, ["id", "month"], None, None, None, 10, 10,
+            period_from=None, period_to=None, min_limit=None, max_limit=None, sort=None,
+        )
+        mock_movement_service.get_spent_amounts.assert_not_called()
+
+    async def test_computed_fields_load_their_inputs(self, mock_budget_repo, mock_movement_service, user, workspace_id, category_id):
+        use_case = ListBudgetFields(mock_budget_repo, mock_movement_service)
+        row = {"id": uuid4(), "workspace_id": workspace_id, "category_id": category_id, "limit_amount": 200.0, "month": 5, "year": 2024}
+        other = dict(row, id=uuid4(), limit_amount=100.0)
+        mock_budget_repo.list_columns_by_workspace.return_value = ([row, other], 2)
+        mock_movement_service.get_spent_amounts.return_value = {(workspace_id, category_id, 5, 2024): 50.0}
+
+        rows, _ = await use_case.execute(WorkspaceAccess(workspace_id, user.id), ("id", "progress_percentage"))
+
+        assert rows == [{"id": row["id"], "progress_percentage": 25.0}, {"id": other["id"], "progress_percentage": 50.0}]
+        columns = mock_budget_repo.list_columns_by_workspace.await_args.args[1]
+        assert columns == ["id", "workspace_id", "category_id", "limit_amount", "month", "year"]
+        # One lookup for the whole page
+        mock_movement_service.get_spent_amounts.assert_awaited_once_with({(workspace_id, category_id, 5, 2024)})
+        mock_movement_service.get_spent_amount.assert_not_called()
+
+@pytest.mark.asyncio
+class TestGetBudgets:
+    async def test_batch_checks_access_once(self, mock_budget_repo, mock_workspace_repo, mock_movement_service, user, category_id):
+        use_case = GetBudgets(mock_budget_repo, mock_workspace_repo, mock_movement_service)
+        visible, hidden = uuid4(), uuid4()
+        b1 = Budget(workspace_id=visible, owner_id=user.id, category_id=category_id, limit_amount=200.0, month=1, year=2024)
+        b2 = Budget(workspace_id=visible, owner_id=user.id, category_id=category_id, limit_amount=100.0, month=2, year=2024)
+        b3 = Budget(workspace_id=hidden, owner_id=uuid4(), category_id=category_id, limit_amount=100.0, month=1, year=2024)
+        mock_budget_repo.get_by_ids.return_value = [b3, b2, b1]
+        mock_workspace_repo.get_accessible_workspace_ids.return_value = {visible}
+        mock_movement_service.get_spent_amounts.return_value = {
+            (visible, category_id, 1, 2024): 50.0,
+            (visible, category_id, 2, 2024): 0.0,
+        }
+        unknown = uuid4()
+
+        results, missing = await use_case.execute([b1.id, unknown, b3.id, b2.id, b1.id], user)
+
+        assert [(b.id, spent, progress) for b, spent, progress in results] == [(b1.id, 50.0, 25.0), (b2.id, 0.0, 0.0)]
+        assert missing == [unknown, b3.id]
+        mock_budget_repo.get_by_ids.assert_awaited_once_with([b1.id, unknown, b3.id, b2.id])
+        mock_workspace_repo.get_accessible_workspace_ids.assert_awaited_once_with(user.id, {visible, hidden})
+        mock_movement_service.get_spent_amounts.assert_awaited_once()
+        mock_movement_service.get_spent_amount.assert_not_called()
@@ -0,0 +1,60 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+from src.api.main import app
+from src.infrastructure.auth.services import hasher
+from src.infrastructure.auth.services.hasher import Hasher
+from src.infrastructure.observability import record_cache_lookup, render_metrics
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_request_latency():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        await ac.get("/health")
+        await ac.get("/does-not-exist")
+        response = await ac.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert (
+        'wiselab_http_request_duration_seconds_count{method="GET",route="/health",status="200"}'
+        in body
+    )
+    assert 'route="unmatched",status="404"' in body
+    assert "wiselab_http_requests_in_progress" in body
+    assert "wiselab_db_pool_checked_out" in body
+
+
+@pytest.mark.asyncio
+async def test_cache_and_argon2_metrics():
+    record_cache_lookup("categories", hit=True)
+    record_cache_lookup("categories", hit=False)
+    assert await Hasher.verify_password("secret", "not-a-hash") is False
+
+    body = render_metrics().decode()
+    assert 'wiselab_cache_lookups_total{cache="categories",result="hit"}' in body
+    assert "wiselab_argon2_operations_in_progress 0.0" in body
+
+
+@pytest.mark.asyncio
+async def test_argon2_gauge_counts_calls_waiting_for_a_thread(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(hasher, "_executor", ThreadPoolExecutor(max_workers=1))
+    monkeypatch.setattr(hasher.pwd_context, "verify", lambda *_: release.wait(5))
+
+    calls = [
+        asyncio.create_task(Hasher.verify_password("secret", "hash")) for _ in range(3)
+    ]
+    await asyncio.sleep(0.05)
+    # One running, two queued behind it
+    assert REGISTRY.get_sample_value("wiselab_argon2_operations_in_progress") == 3
+    release.set()
+
+    assert await asyncio.gather(*calls) == [True, True, True]
+    assert REGISTRY.get_sample_value("wiselab_argon2_operations_in_progress") == 0
@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from src.api.middleware import ProfilingMiddleware
+from src.infrastructure.observability.profiler import TaskSampler
+
+
+def busy_repository_call():
+    end = time.perf_counter() + 0.03
+    while time.perf_counter() < end:
+        pass
+
+
+async def slow_use_case():
+    await asyncio.sleep(0.03)
+    busy_repository_call()
+    return {"ok": True}
+
+
+@pytest.fixture
+def profiled_app(tmp_path):
+    app = FastAPI()
+
+    @app.get("/slow")
+    async def slow():
+        return await slow_use_case()
+
+    return ProfilingMiddleware(
+        app, token="secret", output_dir=str(tmp_path), max_per_minute=1, interval_ms=1
+    )
+
+
+@pytest.mark.asyncio
+async def test_task_sampler_captures_suspended_and_running_frames():
+    sampler = TaskSampler(asyncio.current_task(), interval=0.001)
+    sampler.start()
+    await slow_use_case()
+    sampler.stop()
+
+    folded = sampler.folded()
+    assert "slow_use_case" in folded
+    assert "busy_repository_call" in folded
+    for line in folded.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) >= 1
+
+
+@pytest.mark.asyncio
+async def test_profiling_requires_token_and_is_rate_limited(profiled_app, tmp_path):
+    async with AsyncClient(app=profiled_app, base_url="http://test") as ac:
+        response = await ac.get("/slow")
+        assert "x-profile-file" not in response.headers
+
+        response = await ac.get("/slow", headers={"X-Profile-Token": "wrong"})
+        assert "x-profile-file" not in response.headers
+
+        response = await ac.get("/slow", headers={"X-Profile-Token": "secret"})
+        assert response.status_code == 200
+        filename = response.headers["x-profile-file"]
+        assert "slow_use_case" in (tmp_path / filename).read_text()
+
+        response = await ac.get("/slow", headers={"X-Profile-Token": "secret"})
+        assert response.status_code == 200
+        assert "x-profile-file" not in response.headers
+
+    assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,72 @@
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.observability import (
+    assert_max_queries,
+    count_queries,
+    instrument_engine,
+    instrumented,
+    statement_shape,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    return engine
+
+
+def test_statement_shape_normalizes_placeholders():
+    a = statement_shape("SELECT * FROM budgets WHERE id = $1")
+    b = statement_shape("SELECT *\n  FROM budgets WHERE id = $7")
+    assert a == b == "SELECT * FROM budgets WHERE id = ?"
+    assert statement_shape("SELECT 1 WHERE id IN ($1, $2, $3)").endswith("(?...)")
+
+
+def test_count_queries_nested_scopes(engine):
+    with engine.connect() as conn:
+        with count_queries("outer") as outer:
+            conn.execute(text("SELECT 1"))
+            with count_queries("inner") as inner:
+                conn.execute(text("SELECT 2"))
+    assert outer.count == 2
+    assert inner.count == 1
+
+
+def test_assert_max_queries_fails_over_budget(engine):
+    with engine.connect() as conn:
+        with assert_max_queries(2):
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+        with pytest.raises(AssertionError, match="executed 3 queries"):
+            with assert_max_queries(2):
+                for _ in range(3):
+                    conn.execute(text("SELECT 1"))
+
+
+def test_repeated_shape_logs_warning(engine, caplog):
+    with caplog.at_level(logging.WARNING):
+        with engine.connect() as conn:
+            with count_queries("loop", track_shapes=True) as counter:
+                for i in range(4):
+                    conn.execute(text("SELECT :value"), {"value": i})
+    assert counter.repeated() == [("SELECT ?", 4)]
+    assert "Possible N+1 in loop" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_instrumented_use_case_counts_its_queries(engine):
+    class DummyUseCase:
+        @instrumented
+        async def execute(self):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return "done"
+
+    with count_queries() as counter:
+        assert await DummyUseCase().execute() == "done"
+    assert counter.count == 1
@@ -0,0 +1,49 @@
+import json
+
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.observability import instrument_engine, slow_queries
+from src.infrastructure.observability.slow_queries import SlowQueryLog, parameter_shapes
+
+
+def read_entries(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_parameter_shapes_hide_values():
+    assert parameter_shapes(("a@b.com", 3)) == ["str", "int"]
+    assert parameter_shapes({"id": 1}) == {"id": "int"}
+    assert parameter_shapes([(1, "x"), (2, "y")], executemany=True) == {
+        "rows": 2,
+        "row": ["int", "str"],
+    }
+
+
+def test_statements_over_threshold_are_logged(tmp_path, monkeypatch):
+    log_path = tmp_path / "slow.log"
+    monkeypatch.setattr(
+        slow_queries, "slow_query_log", SlowQueryLog(threshold_ms=0, path=str(log_path))
+    )
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT :email"), {"email": "secret@example.com"})
+
+    entries = read_entries(log_path)
+    assert entries[-1]["statement"] == "SELECT ?"
+    assert entries[-1]["params"] == ["str"]
+    assert "secret@example.com" not in log_path.read_text()
+    # EXPLAIN is only captured on PostgreSQL
+    assert "plan" not in entries[-1]
+
+
+def test_negative_threshold_disables_log(tmp_path, monkeypatch):
+    log_path = tmp_path / "slow.log"
+    monkeypatch.setattr(
+        slow_queries, "slow_query_log", SlowQueryLog(threshold_ms=-1, path=str(log_path))
+    )
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert not log_path.exists()
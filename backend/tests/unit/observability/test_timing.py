@@ -0,0 +1,63 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import create_engine, text
+
+from src.api.main import app
+from src.infrastructure.observability import (
+    begin_request,
+    current_timings,
+    end_request,
+    instrument_engine,
+    track,
+)
+
+
+def test_track_is_noop_outside_request():
+    with track("hash"):
+        pass
+    assert current_timings() is None
+
+
+def test_track_accumulates_phases():
+    token = begin_request()
+    try:
+        with track("hash"):
+            pass
+        with track("hash"):
+            pass
+        timings = current_timings()
+        assert "hash" in timings.phases
+        header = timings.server_timing(12.5)
+        assert header.startswith("total;dur=12.50")
+        assert "hash;dur=" in header
+    finally:
+        end_request(token)
+
+
+def test_instrument_engine_counts_statements():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    instrument_engine(engine)  # idempotent
+
+    token = begin_request()
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        timings = current_timings()
+        assert timings.sql_count == 2
+        assert timings.sql_ms >= 0
+        fields = timings.as_log_fields(1.0)
+        assert fields["db_queries"] == 2
+    finally:
+        end_request(token)
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_on_response():
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        response = await ac.get("/health")
+    assert response.status_code == 200
+    server_timing = response.headers["server-timing"]
+    assert "total;dur=" in server_timing
+    assert "db;dur=" in server_timing
@@ -0,0 +1,96 @@
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from src.infrastructure.rate_limit import (
+    InMemoryBucketStore,
+    LoginRateLimiter,
+    RedisBucketStore,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_rejects_invalid_shape():
+    with pytest.raises(ValueError):
+        TokenBucket(0, 10)
+    with pytest.raises(ValueError):
+        TokenBucket(5, 0)
+
+
+@pytest.mark.asyncio
+async def test_in_memory_bucket_refills_over_time():
+    clock = FakeClock()
+    store = InMemoryBucketStore(clock=clock)
+    bucket = TokenBucket(capacity=2, per_minute=60)
+
+    assert await store.take("k", bucket) == 0
+    assert await store.take("k", bucket) == 0
+    assert await store.take("k", bucket) == pytest.approx(1.0)
+
+    clock.now += 1
+    assert await store.take("k", bucket) == 0
+    assert await store.take("other", bucket) == 0
+
+
+@pytest.mark.asyncio
+async def test_in_memory_bucket_evicts_least_recently_used():
+    store = InMemoryBucketStore(max_keys=2, clock=FakeClock())
+    bucket = TokenBucket(capacity=1, per_minute=1)
+
+    await store.take("a", bucket)
+    await store.take("b", bucket)
+    await store.take("c", bucket)
+
+    # "a" was evicted and starts again with a full bucket
+    assert await store.take("a", bucket) == 0
+    assert await store.take("c", bucket) > 0
+
+
+@pytest.mark.asyncio
+async def test_redis_bucket_is_shared_between_stores():
+    client = FakeAsyncRedis()
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=2, per_minute=60)
+    worker_a = RedisBucketStore(client, clock=clock)
+    worker_b = RedisBucketStore(client, clock=clock)
+
+    assert await worker_a.take("k", bucket) == 0
+    assert await worker_b.take("k", bucket) == 0
+    assert await worker_a.take("k", bucket) == pytest.approx(1.0)
+
+    clock.now += 1
+    assert await worker_b.take("k", bucket) == 0
+    assert 0 < await client.pttl("wiselab:ratelimit:k") <= 2000
+
+
+@pytest.mark.asyncio
+async def test_login_limiter_limits_ip_and_account_separately():
+    limiter = LoginRateLimiter(
+        InMemoryBucketStore(clock=FakeClock()),
+        per_ip=TokenBucket(3, 1),
+        per_account=TokenBucket(1, 1),
+    )
+
+    assert await limiter.check("10.0.0.1", "a@example.com") == 0
+    assert await limiter.check("10.0.0.2", " A@Example.com ") > 0
+    assert await limiter.check("10.0.0.1", "b@example.com") == 0
+    assert await limiter.check("10.0.0.1", "c@example.com") == 0
+    assert await limiter.check("10.0.0.1", "d@example.com") > 0
+
+
+@pytest.mark.asyncio
+async def test_login_limiter_allows_when_store_fails():
+    class BrokenStore(InMemoryBucketStore):
+        async def take(self, key, bucket):
+            raise ConnectionError("redis down")
+
+    limiter = LoginRateLimiter(BrokenStore())
+
+    assert await limiter.check("10.0.0.1", "a@example.com") == 0
@@ -0,0 +1,37 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from src.api.conditional import etag_matches, weak_etag
+
+
+def test_weak_etag_is_stable_for_same_version():
+    stamp = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    workspace_id = uuid4()
+
+    etag = weak_etag(stamp, 3, workspace_id)
+
+    assert etag.startswith('W/"')
+    assert etag == weak_etag(stamp, 3, workspace_id)
+
+
+def test_weak_etag_changes_with_version_and_scope():
+    stamp = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    later = datetime(2024, 5, 1, 12, 0, 1, tzinfo=timezone.utc)
+    etag = weak_etag(stamp, 3, "a")
+
+    assert etag != weak_etag(later, 3, "a")
+    assert etag != weak_etag(stamp, 2, "a")
+    assert etag != weak_etag(stamp, 3, "b")
+    assert weak_etag(None, 0) != weak_etag(stamp, 0)
+
+
+def test_etag_matches_uses_weak_comparison():
+    etag = weak_etag(None, 0, "scope")
+    opaque = etag[2:]
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(opaque, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('W/"other"', etag)
@@ -17,3 +17,27 @@ async def test_health_check():
         response = await ac.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+
+class _StubProbe:
+    def __init__(self, status):
+        self.status = status
+
+    async def report(self):
+        return {"status": self.status, "checked_at": "now", "checks": {}}
+
+
+@pytest.mark.asyncio
+async def test_ready_check(monkeypatch):
+    from src.infrastructure import readiness
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        monkeypatch.setattr(readiness, "readiness_probe", _StubProbe("ready"))
+        response = await ac.get("/ready")
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-store"
+
+        monkeypatch.setattr(readiness, "readiness_probe", _StubProbe("not_ready"))
+        response = await ac.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "not_ready"
@@ -0,0 +1,91 @@
+import gzip
+
+import brotli
+import msgpack
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from src.api.middleware import CompressionMiddleware, ContentNegotiationMiddleware
+from src.api.middleware.compression import choose_encoding
+from src.api.negotiation import NegotiatedResponse, wants_msgpack
+
+ITEMS = [{"id": i, "name": f"Budget {i}", "limit_amount": 100.0} for i in range(50)]
+
+
+@pytest.fixture
+def negotiating_app():
+    app = FastAPI()
+
+    @app.get("/items", response_class=NegotiatedResponse)
+    async def items():
+        return ITEMS
+
+    @app.get("/small", response_class=NegotiatedResponse)
+    async def small():
+        return {"ok": True}
+
+    return ContentNegotiationMiddleware(CompressionMiddleware(app, minimum_size=200))
+
+
+def test_wants_msgpack():
+    assert wants_msgpack("application/msgpack")
+    assert wants_msgpack("application/x-msgpack, application/json")
+    assert wants_msgpack("application/json;q=0.5, application/msgpack")
+    assert not wants_msgpack(None)
+    assert not wants_msgpack("*/*")
+    assert not wants_msgpack("application/json, application/msgpack;q=0.9")
+    assert not wants_msgpack("application/msgpack;q=0")
+
+
+def test_choose_encoding():
+    assert choose_encoding("gzip, deflate, br") == "br"
+    assert choose_encoding("gzip, br;q=0.5") == "gzip"
+    assert choose_encoding("gzip") == "gzip"
+    assert choose_encoding("*") == "br"
+    assert choose_encoding("br;q=0, *;q=0.1") == "gzip"
+    assert choose_encoding("deflate, identity") is None
+    assert choose_encoding(None) is None
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_compressed(negotiating_app):
+    async with AsyncClient(app=negotiating_app, base_url="http://test") as ac:
+        plain = await ac.get("/items", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+
+        for encoding, decompress in (("br", brotli.decompress), ("gzip", gzip.decompress)):
+            async with ac.stream(
+                "GET", "/items", headers={"Accept-Encoding": encoding}
+            ) as response:
+                body = b"".join([chunk async for chunk in response.aiter_raw()])
+            assert response.headers["content-encoding"] == encoding
+            assert "Accept-Encoding" in response.headers["vary"]
+            assert int(response.headers["content-length"]) == len(body)
+            assert len(body) < len(plain.content)
+            assert decompress(body) == plain.content
+
+
+@pytest.mark.asyncio
+async def test_small_responses_skip_compression(negotiating_app):
+    async with AsyncClient(app=negotiating_app, base_url="http://test") as ac:
+        response = await ac.get("/small", headers={"Accept-Encoding": "gzip, br"})
+
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_msgpack_negotiation(negotiating_app):
+    async with AsyncClient(app=negotiating_app, base_url="http://test") as ac:
+        response = await ac.get(
+            "/items",
+            headers={"Accept": "application/msgpack", "Accept-Encoding": "gzip"},
+        )
+        assert response.headers["content-type"] == "application/msgpack"
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept" in response.headers["vary"]
+        assert msgpack.unpackb(response.content) == ITEMS
+
+        response = await ac.get("/small", headers={"Accept": "*/*"})
+        assert response.headers["content-type"] == "application/json"
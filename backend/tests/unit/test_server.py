@@ -0,0 +1,60 @@
+import os
+import runpy
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+
+from src.api.main import lifespan
+from src.api.server import ProductionWorker
+
+CONFIG = str(Path(__file__).resolve().parents[2] / "gunicorn.conf.py")
+
+
+def test_gunicorn_config_defaults(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "")
+    config = runpy.run_path(CONFIG)
+    assert config["workers"] == len(os.sched_getaffinity(0))
+    assert config["worker_class"] == "src.api.server.ProductionWorker"
+    assert config["graceful_timeout"] > 0
+    assert ProductionWorker.CONFIG_KWARGS["loop"] == "uvloop"
+    assert ProductionWorker.CONFIG_KWARGS["http"] == "httptools"
+
+
+def test_gunicorn_config_overrides_and_child_exit(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "3")
+    monkeypatch.setenv("SERVER_BACKLOG", "128")
+    config = runpy.run_path(CONFIG)
+    assert config["workers"] == 3
+    assert config["backlog"] == 128
+
+    with patch.dict(config["child_exit"].__globals__, {"mark_worker_dead": MagicMock()}) as hooks:
+        config["child_exit"](None, MagicMock(pid=1234))
+        hooks["mark_worker_dead"].assert_called_once_with(1234)
+
+
+@pytest.mark.asyncio
+async def test_lifespan_warms_and_closes_pool(monkeypatch):
+    calls = []
+
+    async def record(name):
+        calls.append(name)
+
+    monkeypatch.setattr("src.api.main.open_pool", lambda: record("open"))
+    monkeypatch.setattr("src.api.main.close_pool", lambda: record("close"))
+    monkeypatch.setattr("src.api.main.warm_up", lambda: record("warm"))
+    monkeypatch.setattr("src.api.main.running_workers", lambda: _noop())
+    monkeypatch.setattr("src.api.main.running_revocation_sync", lambda: _noop())
+
+    async with lifespan(FastAPI()):
+        assert calls == ["open", "warm"]
+    assert calls == ["open", "warm", "close"]
+
+
+class _noop:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *exc):
+        return False
@@ -9,8 +9,20 @@ from src.domain.workspace.models import Workspace, WorkspaceMember
 from src.domain.workspace.value_objects import WorkspaceRole
 from datetime import datetime
 from src.api.dependencies.auth import get_current_user, get_user_repository
+from src.api.dependencies.jobs import get_job_repository
 from src.api.dependencies.workspace import get_workspace_repository
 from src.infrastructure.database import get_db
+from src.api.dependencies.audit import get_audit_recorder
+from src.application.use_cases.audit.recorder import NullAuditRecorder
+
+@pytest.fixture(autouse=True)
+def null_audit_recorder():
+    # The mocked sessions never commit, so there is nothing to audit
+    from src.api.main import app
+
+    app.dependency_overrides[get_audit_recorder] = NullAuditRecorder
+    yield
+    app.dependency_overrides.pop(get_audit_recorder, None)
 
 @pytest.fixture
 def mock_user_obj():
@@ -46,6 +58,7 @@ async def test_list_workspaces_route(mock_user_obj):
     from src.api.main import app
     mock_repo = AsyncMock()
     mock_repo.list_by_user = AsyncMock(return_value=[])
+    mock_repo.get_list_version = AsyncMock(return_value=(None, 0))
 
     app.dependency_overrides[get_current_user] = lambda: mock_user_obj
     app.dependency_overrides[get_workspace_repository] = lambda: mock_repo
@@ -57,6 +70,36 @@ async def test_list_workspaces_route(mock_user_obj):
 
     app.dependency_overrides = {}
 
+
+@pytest.mark.asyncio
+async def test_list_workspaces_and_members_sparse_fields(mock_user_obj):
+    from src.api.main import app
+    workspace = Workspace(name="Sparse", owner_id=mock_user_obj.id, description="Long text")
+    member = WorkspaceMember(workspace_id=workspace.id, user_id=uuid.uuid4(), role=WorkspaceRole.EDITOR, id=uuid.uuid4())
+    mock_repo = AsyncMock()
+    mock_repo.list_by_user = AsyncMock(return_value=[workspace])
+    mock_repo.get_list_version = AsyncMock(return_value=(None, 1))
+    mock_repo.get_by_id = AsyncMock(return_value=workspace)
+    mock_repo.list_members = AsyncMock(return_value=[member])
+
+    app.dependency_overrides[get_current_user] = lambda: mock_user_obj
+    app.dependency_overrides[get_workspace_repository] = lambda: mock_repo
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        resp = await client.get("/api/workspaces?fields=name,id")
+        assert resp.status_code == 200
+        assert resp.json() == [{"id": str(workspace.id), "name": "Sparse"}]
+        assert "ETag" in resp.headers
+
+        resp = await client.get(f"/api/workspaces/{workspace.id}/members?fields=role")
+        assert resp.status_code == 200
+        assert resp.json() == [{"role": "editor"}]
+
+        resp = await client.get("/api/workspaces?fields=password")
+        assert resp.status_code == 400
+
+    app.dependency_overrides = {}
+
 @pytest.mark.asyncio
 async def test_get_workspace_route(mock_user_obj):
     from src.api.main import app
@@ -115,14 +158,22 @@ async def test_delete_workspace_route(mock_user_obj):
     ws_real = Workspace(name="Del", owner_id=mock_user_obj.id, id=wid)
     mock_repo.get_by_id.return_value = ws_real
     mock_repo.remove = AsyncMock()
+    mock_job_repo = AsyncMock()
 
     app.dependency_overrides[get_current_user] = lambda: mock_user_obj
     app.dependency_overrides[get_workspace_repository] = lambda: mock_repo
+    app.dependency_overrides[get_job_repository] = lambda: mock_job_repo
     app.dependency_overrides[get_db] = lambda: AsyncMock()
 
     async with AsyncClient(app=app, base_url="http://test") as client:
         resp = await client.delete(f"/api/workspaces/{wid}")
-        assert resp.status_code == 204
+        assert resp.status_code == 202
+        body = resp.json()
+        assert body["kind"] == "workspace.delete"
+        assert body["status"] == "queued"
+        assert resp.headers["Location"] == f"/api/jobs/{body['id']}"
+        assert mock_job_repo.add.await_count == 1
+        assert not mock_repo.remove.called
 
     app.dependency_overrides = {}
 
@@ -308,3 +359,64 @@ async def test_api_exception_handling(mock_user_obj):
             assert resp.status_code == 500
 
     app.dependency_overrides = {}
+
+@pytest.mark.asyncio
+async def test_list_workspaces_not_modified(mock_user_obj):
+    from src.api.main import app
+    mock_repo = AsyncMock()
+    mock_repo.list_by_user = AsyncMock(return_value=[])
+    mock_repo.get_list_version = AsyncMock(return_value=(datetime(2024, 5, 1), 2))
+
+    app.dependency_overrides[get_current_user] = lambda: mock_user_obj
+    app.dependency_overrides[get_workspace_repository] = lambda: mock_repo
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        resp = await client.get("/api/workspaces")
+        etag = resp.headers["ETag"]
+
+        resp = await client.get("/api/workspaces", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert mock_repo.list_by_user.await_count == 1
+
+        mock_repo.get_list_version.return_value = (datetime(2024, 5, 2), 2)
+        resp = await client.get("/api/workspaces", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["ETag"] != etag
+
+    app.dependency_overrides = {}
+
+@pytest.mark.asyncio
+async def test_bulk_invite_route(mock_user_obj):
+    from src.api.main import app
+    from src.application.use_cases.workspace.members.bulk_invite.dtos import (
+        BulkInviteMembersResponseDto, BulkInviteResultDto, BulkInviteStatus
+    )
+    wid = uuid.uuid4()
+    app.dependency_overrides[get_current_user] = lambda: mock_user_obj
+    app.dependency_overrides[get_workspace_repository] = lambda: AsyncMock()
+    app.dependency_overrides[get_user_repository] = lambda: AsyncMock()
+    app.dependency_overrides[get_db] = lambda: AsyncMock()
+    target = "src.application.use_cases.workspace.members.bulk_invite.index.BulkInviteMembers.execute"
+    result = BulkInviteMembersResponseDto(
+        results=[BulkInviteResultDto(email="a@test.com", status=BulkInviteStatus.NOT_FOUND)]
+    )
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        url = f"/api/workspaces/{wid}/members/bulk"
+        with patch(target, return_value=result):
+            resp = await client.post(url, json={"emails": ["a@test.com"]})
+            assert resp.status_code == 200
+            assert resp.json()["results"] == [{"email": "a@test.com", "status": "not_found", "user_id": None}]
+        resp = await client.post(url, json={"emails": []})
+        assert resp.status_code == 422
+        for error, code in [
+            (WorkspaceNotFoundError("No WS"), 404),
+            (UnauthorizedError("No"), 403),
+            (ValidationError("Bad"), 400),
+            (Exception("Boom"), 500),
+        ]:
+            with patch(target, side_effect=error):
+                resp = await client.post(url, json={"emails": ["a@test.com"]})
+                assert resp.status_code == code
+
+    app.dependency_overrides = {}
@@ -73,9 +73,11 @@ async def test_repo_member_operations():
     # Get Member Success (mock both workspace and member queries)
     session.execute = AsyncMock()
     
-    # First call returns None for workspace (not owner check)
+    # First call returns the workspace, owned by someone else
     workspace_res = MagicMock()
-    workspace_res.scalar_one_or_none.return_value = None
+    workspace_res.scalar_one_or_none.return_value = WorkspaceORM(
+        id=member.workspace_id, owner_id=uuid4(), name="Other"
+    )
     
     # Second call returns member
     member_res = MagicMock()
@@ -6,7 +6,13 @@ from src.application.use_cases.workspace.list.index import ListWorkspaces
 from src.application.use_cases.workspace.get.index import GetWorkspace
 from src.application.use_cases.workspace.update.index import UpdateWorkspace
 from src.application.use_cases.workspace.delete.index import DeleteWorkspace
+from src.application.use_cases.workspace.purge.index import PurgeWorkspace
 from src.application.use_cases.workspace.members.invite.index import InviteMember
+from src.application.use_cases.workspace.members.bulk_invite.index import BulkInviteMembers
+from src.application.use_cases.workspace.members.bulk_invite.dtos import (
+    BulkInviteMembersRequestDto,
+    BulkInviteStatus,
+)
 from src.application.use_cases.workspace.members.list.index import ListMembers
 from src.application.use_cases.workspace.members.update.index import UpdateMemberRole
 from src.application.use_cases.workspace.members.remove.index import RemoveMember
@@ -14,6 +20,7 @@ from src.application.use_cases.workspace.create.dtos import CreateWorkspaceReque
 from src.application.use_cases.workspace.update.dtos import UpdateWorkspaceRequestDto
 from src.application.use_cases.workspace.members.invite.dtos import InviteMemberRequestDto
 from src.application.use_cases.workspace.members.update.dtos import UpdateMemberRoleRequestDto
+from src.domain.jobs.value_objects import JobKind
 from src.domain.workspace.models import Workspace, WorkspaceMember
 from src.domain.workspace.value_objects import WorkspaceRole
 from src.domain.auth.models import User
@@ -195,25 +202,68 @@ async def test_update_workspace_not_found(mock_workspace_repo, mock_user_entity)
 @pytest.mark.asyncio
 async def test_delete_workspace_success(mock_workspace_repo, mock_user_entity, mock_workspace_entity):
     mock_workspace_repo.get_by_id = AsyncMock(return_value=mock_workspace_entity)
-    use_case = DeleteWorkspace(mock_workspace_repo)
-    await use_case.execute(mock_workspace_entity.id, mock_user_entity)
-    assert mock_workspace_repo.remove.called
+    job_repo = AsyncMock()
+    use_case = DeleteWorkspace(mock_workspace_repo, job_repo)
+    job = await use_case.execute(mock_workspace_entity.id, mock_user_entity)
+    assert job.kind == JobKind.DELETE_WORKSPACE
+    assert job.payload == {"workspace_id": str(mock_workspace_entity.id)}
+    assert job.created_by == mock_user_entity.id
+    job_repo.add.assert_awaited_once_with(job)
+    assert not mock_workspace_repo.remove.called
 
 @pytest.mark.asyncio
 async def test_delete_workspace_unauthorized(mock_workspace_repo, mock_user_entity):
     ws = Workspace(name="Test", owner_id=uuid4(), id=uuid4())
     mock_workspace_repo.get_by_id = AsyncMock(return_value=ws)
-    use_case = DeleteWorkspace(mock_workspace_repo)
+    use_case = DeleteWorkspace(mock_workspace_repo, AsyncMock())
     with pytest.raises(UnauthorizedError):
         await use_case.execute(ws.id, mock_user_entity)
 
 @pytest.mark.asyncio
 async def test_delete_workspace_not_found(mock_workspace_repo, mock_user_entity):
     mock_workspace_repo.get_by_id.return_value = None
-    use_case = DeleteWorkspace(mock_workspace_repo)
+    use_case = DeleteWorkspace(mock_workspace_repo, AsyncMock())
     with pytest.raises(WorkspaceNotFoundError):
         await use_case.execute(uuid4(), mock_user_entity)
 
+@pytest.mark.asyncio
+async def test_delete_workspace_soft_deletes(mock_workspace_repo, mock_user_entity, mock_workspace_entity):
+    mock_workspace_repo.get_by_id = AsyncMock(return_value=mock_workspace_entity)
+    await DeleteWorkspace(mock_workspace_repo, AsyncMock()).execute(mock_workspace_entity.id, mock_user_entity)
+    assert mock_workspace_entity.deleted_at is not None
+    mock_workspace_repo.update.assert_awaited_once_with(mock_workspace_entity)
+
+@pytest.mark.asyncio
+async def test_purge_workspace_in_batches(mock_workspace_repo, mock_workspace_entity):
+    budget_repo, category_repo = AsyncMock(), AsyncMock()
+    mock_workspace_entity.delete()
+    mock_workspace_repo.get_by_id.return_value = mock_workspace_entity
+    budget_repo.remove_by_workspace_batch.side_effect = [2, 0, 0]
+    category_repo.remove_by_workspace_batch.side_effect = [1, 0]
+    mock_workspace_repo.remove_members_batch = AsyncMock(return_value=0)
+    use_case = PurgeWorkspace(mock_workspace_repo, budget_repo, category_repo)
+
+    assert await use_case.execute(mock_workspace_entity.id, 2) is False
+    assert await use_case.execute(mock_workspace_entity.id, 2) is False
+    assert not mock_workspace_repo.remove.called
+    assert await use_case.execute(mock_workspace_entity.id, 2) is True
+    mock_workspace_repo.remove.assert_awaited_once_with(mock_workspace_entity)
+    mock_workspace_repo.get_by_id.assert_awaited_with(mock_workspace_entity.id, include_deleted=True)
+
+@pytest.mark.asyncio
+async def test_purge_workspace_missing_or_live(mock_workspace_repo, mock_workspace_entity):
+    use_case = PurgeWorkspace(mock_workspace_repo, AsyncMock(), AsyncMock())
+
+    # Already gone: nothing to do, so a retried job still succeeds
+    mock_workspace_repo.get_by_id.return_value = None
+    assert await use_case.execute(uuid4(), 100) is True
+
+    # Never purge a workspace that was not deleted
+    mock_workspace_repo.get_by_id.return_value = mock_workspace_entity
+    with pytest.raises(ValidationError):
+        await use_case.execute(mock_workspace_entity.id, 100)
+    assert not mock_workspace_repo.remove.called
+
 @pytest.mark.asyncio
 async def test_invite_member_full_logic(mock_workspace_repo, mock_user_repo, mock_user_entity, mock_workspace_entity):
     # Success Case
@@ -438,3 +488,62 @@ async def test_remove_member_logic(mock_workspace_repo, mock_user_entity, mock_w
     mock_workspace_repo.get_member.return_value = None
     with pytest.raises(MemberNotFoundError):
         await use_case.execute(mock_workspace_entity.id, member_id, mock_user_entity)
+
+@pytest.mark.asyncio
+async def test_bulk_invite_members(mock_workspace_repo, mock_user_repo, mock_user_entity, mock_workspace_entity):
+    mock_workspace_repo.get_by_id.return_value = mock_workspace_entity
+    new_user = User(email=Email("new@example.com"), password_hash="h", full_name="New")
+    member = User(email=Email("member@example.com"), password_hash="h", full_name="Member")
+    racer = User(email=Email("racer@example.com"), password_hash="h", full_name="Racer")
+    owner = User(email=Email("owner@example.com"), password_hash="h", full_name="Owner", id=mock_workspace_entity.owner_id)
+    mock_user_repo.list_by_emails = AsyncMock(return_value=[new_user, member, racer, owner])
+    mock_workspace_repo.get_member_user_ids = AsyncMock(return_value={member.id})
+    # racer was invited concurrently, so the insert skips it
+    mock_workspace_repo.add_members = AsyncMock(return_value={new_user.id})
+
+    data = BulkInviteMembersRequestDto(
+        emails=["new@example.com", "member@example.com", "racer@example.com", "owner@example.com",
+                "ghost@example.com", "not-an-email", "new@example.com"],
+        role=WorkspaceRole.EDITOR,
+    )
+    result = await BulkInviteMembers(mock_workspace_repo, mock_user_repo).execute(
+        mock_workspace_entity.id, mock_user_entity, data
+    )
+
+    assert [(r.email, r.status) for r in result.results] == [
+        ("new@example.com", BulkInviteStatus.INVITED),
+        ("member@example.com", BulkInviteStatus.ALREADY_MEMBER),
+        ("racer@example.com", BulkInviteStatus.ALREADY_MEMBER),
+        ("owner@example.com", BulkInviteStatus.OWNER),
+        ("ghost@example.com", BulkInviteStatus.NOT_FOUND),
+        ("not-an-email", BulkInviteStatus.INVALID_EMAIL),
+    ]
+    assert result.results[0].user_id == new_user.id
+    assert [e.value for e in mock_user_repo.list_by_emails.await_args.args[0]] == [
+        "new@example.com", "member@example.com", "racer@example.com", "owner@example.com", "ghost@example.com"
+    ]
+    candidates = mock_workspace_repo.add_members.await_args.args[0]
+    assert {m.user_id for m in candidates} == {new_user.id, racer.id}
+    assert all(m.role == WorkspaceRole.EDITOR for m in candidates)
+
+@pytest.mark.asyncio
+async def test_bulk_invite_members_errors(mock_workspace_repo, mock_user_repo, mock_user_entity):
+    use_case = BulkInviteMembers(mock_workspace_repo, mock_user_repo)
+    data = BulkInviteMembersRequestDto(emails=["a@example.com"])
+
+    with pytest.raises(WorkspaceNotFoundError):
+        await use_case.execute(uuid4(), mock_user_entity, data)
+
+    ws_other = Workspace(name="Other", owner_id=uuid4(), id=uuid4())
+    mock_workspace_repo.get_by_id.return_value = ws_other
+    viewer = MagicMock(spec=WorkspaceMember)
+    viewer.role = WorkspaceRole.VIEWER
+    mock_workspace_repo.get_member.return_value = viewer
+    with pytest.raises(UnauthorizedError):
+        await use_case.execute(ws_other.id, mock_user_entity, data)
+
+    with pytest.raises(ValidationError):
+        await use_case.execute(
+            ws_other.id, mock_user_entity,
+            BulkInviteMembersRequestDto(emails=["a@example.com"], role=WorkspaceRole.OWNER),
+        )
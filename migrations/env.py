@@ -10,9 +10,12 @@ from alembic import context
 # Import the database configuration from the application
 from src.infrastructure.database import Base, DATABASE_URL
 # Import all models to ensure they are registered with Base.metadata
-from src.infrastructure.auth.models import UserORM
+from src.infrastructure.auth.models import RevokedTokenORM, UserORM
 from src.infrastructure.workspace.models import WorkspaceORM, WorkspaceMemberORM
 from src.infrastructure.budget.models import BudgetORM
+from src.infrastructure.jobs.models import JobORM
+from src.infrastructure.audit.models import AuditEventORM
+from src.infrastructure.sharding import WorkspaceShardORM
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -30,6 +33,13 @@ target_metadata = Base.metadata
 config.set_main_option("sqlalchemy.url", DATABASE_URL)
 
 
+def include_name(name, type_, parent_names) -> bool:
+    # Budget partitions are managed by src.infrastructure.budget.partitions
+    if type_ == "table":
+        return not name.startswith(("budgets_y", "budgets_default"))
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -46,6 +56,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -55,7 +66,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
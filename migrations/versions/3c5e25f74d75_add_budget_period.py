@@ -0,0 +1,42 @@
+"""add_budget_period
+
+Revision ID: 3c5e25f74d75
+Revises: 5c1e7d0b92f4
+Create Date: 2026-10-19 18:02:11.284617
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c5e25f74d75'
+down_revision: Union[str, None] = '5c1e7d0b92f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'budgets',
+        sa.Column(
+            'period',
+            sa.Integer(),
+            sa.Computed('year * 12 + month', persisted=True),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        'ix_budgets_workspace_period',
+        'budgets',
+        ['workspace_id', 'period'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_budgets_workspace_period', table_name='budgets')
+    op.drop_column('budgets', 'period')
@@ -0,0 +1,36 @@
+"""create_workspace_shards_table
+
+Revision ID: 5b7e0c9d3a12
+Revises: 8f3a6d2c41b9
+Create Date: 2026-10-19 21:02:44.183920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e0c9d3a12'
+down_revision: Union[str, None] = '8f3a6d2c41b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('workspace_shards',
+    sa.Column('workspace_id', sa.UUID(), nullable=False),
+    sa.Column('shard', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('workspace_id', name=op.f('pk_workspace_shards'))
+    )
+    # Existing workspaces stay where they are: the primary, shard 0
+    op.execute(
+        "INSERT INTO workspace_shards (workspace_id, shard, updated_at) "
+        "SELECT id, 0, now() FROM workspaces"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('workspace_shards')
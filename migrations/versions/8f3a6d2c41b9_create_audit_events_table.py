@@ -0,0 +1,38 @@
+"""create_audit_events_table
+
+Revision ID: 8f3a6d2c41b9
+Revises: 3c5e25f74d75
+Create Date: 2026-10-19 19:24:08.517302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3a6d2c41b9'
+down_revision: Union[str, None] = '3c5e25f74d75'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('audit_events',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('workspace_id', sa.UUID(), nullable=False),
+    sa.Column('actor_id', sa.UUID(), nullable=True),
+    sa.Column('action', sa.String(length=64), nullable=False),
+    sa.Column('target_id', sa.UUID(), nullable=False),
+    sa.Column('details', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('occurred_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_audit_events'))
+    )
+    op.create_index('ix_audit_events_workspace_occurred_at', 'audit_events', ['workspace_id', 'occurred_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_audit_events_workspace_occurred_at', table_name='audit_events')
+    op.drop_table('audit_events')
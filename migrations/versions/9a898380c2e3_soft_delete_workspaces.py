@@ -0,0 +1,37 @@
+"""soft_delete_workspaces
+
+Revision ID: 9a898380c2e3
+Revises: aa205333cc77
+Create Date: 2026-10-19 11:03:27.551930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a898380c2e3'
+down_revision: Union[str, None] = 'aa205333cc77'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('workspaces', sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+    op.drop_constraint('uq_workspace_owner_name', 'workspaces', type_='unique')
+    op.create_index(
+        'uq_workspace_owner_name',
+        'workspaces',
+        ['owner_id', 'name'],
+        unique=True,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_workspace_owner_name', table_name='workspaces')
+    op.execute('DELETE FROM workspaces WHERE deleted_at IS NOT NULL')
+    op.create_unique_constraint('uq_workspace_owner_name', 'workspaces', ['owner_id', 'name'])
+    op.drop_column('workspaces', 'deleted_at')
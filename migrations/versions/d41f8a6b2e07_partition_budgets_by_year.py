@@ -0,0 +1,92 @@
+"""partition_budgets_by_year
+
+Revision ID: d41f8a6b2e07
+Revises: 5b7e0c9d3a12
+Create Date: 2026-10-19 22:14:37.602155
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f8a6b2e07'
+down_revision: Union[str, None] = '5b7e0c9d3a12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions created up front beyond the current year; the API creates the
+# following ones at startup (BUDGET_PARTITIONS_AHEAD)
+PARTITIONS_AHEAD = 2
+
+COLUMNS = (
+    "id, workspace_id, owner_id, category_id, limit_amount, month, year, "
+    "created_at, updated_at, deleted_at"
+)
+
+
+def _create_budgets(name: str, partitioned: bool) -> None:
+    op.execute(
+        f"""
+        CREATE TABLE {name} (
+            id UUID NOT NULL,
+            workspace_id UUID NOT NULL,
+            owner_id UUID NOT NULL,
+            category_id UUID NOT NULL,
+            limit_amount FLOAT NOT NULL,
+            month INTEGER NOT NULL,
+            year INTEGER NOT NULL,
+            period INTEGER GENERATED ALWAYS AS (year * 12 + month) STORED NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE,
+            updated_at TIMESTAMP WITH TIME ZONE,
+            deleted_at TIMESTAMP WITH TIME ZONE
+        ){' PARTITION BY RANGE (year)' if partitioned else ''}
+        """
+    )
+
+
+def _replace_budgets(new_table: str, primary_key: list) -> None:
+    # Constraints and indexes are built once, after the copy
+    op.execute(f"INSERT INTO {new_table} ({COLUMNS}) SELECT {COLUMNS} FROM budgets")
+    op.drop_table('budgets')
+    op.rename_table(new_table, 'budgets')
+    op.create_primary_key(op.f('pk_budgets'), 'budgets', primary_key)
+    op.create_unique_constraint('uq_budget_workspace_category_period', 'budgets', ['workspace_id', 'category_id', 'month', 'year'])
+    op.create_foreign_key(op.f('fk_budgets_owner_id_users'), 'budgets', 'users', ['owner_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key(op.f('fk_budgets_workspace_id_workspaces'), 'budgets', 'workspaces', ['workspace_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key(op.f('fk_budgets_category_id_categories'), 'budgets', 'categories', ['category_id'], ['id'], ondelete='RESTRICT')
+    op.create_index(op.f('ix_budgets_owner_id'), 'budgets', ['owner_id'], unique=False)
+    op.create_index(op.f('ix_budgets_workspace_id'), 'budgets', ['workspace_id'], unique=False)
+    op.create_index(op.f('ix_budgets_category_id'), 'budgets', ['category_id'], unique=False)
+    op.create_index(
+        'ix_budgets_workspace_period',
+        'budgets',
+        ['workspace_id', 'period'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def upgrade() -> None:
+    first, last = op.get_bind().execute(sa.text("SELECT min(year), max(year) FROM budgets")).one()
+    current = datetime.now(timezone.utc).year
+    first = min(first or current, current)
+    last = max(last or current, current + PARTITIONS_AHEAD)
+
+    _create_budgets('budgets_partitioned', partitioned=True)
+    for year in range(first, last + 1):
+        op.execute(
+            f"CREATE TABLE budgets_y{year} PARTITION OF budgets_partitioned "
+            f"FOR VALUES FROM ({year}) TO ({year + 1})"
+        )
+    op.execute("CREATE TABLE budgets_default PARTITION OF budgets_partitioned DEFAULT")
+    _replace_budgets('budgets_partitioned', ['id', 'year'])
+
+
+def downgrade() -> None:
+    _create_budgets('budgets_unpartitioned', partitioned=False)
+    # Dropping the partitioned table drops its partitions
+    _replace_budgets('budgets_unpartitioned', ['id'])